@@ -0,0 +1,104 @@
+# coercion.py
+#
+# Row throughput of turning Redfin CSV rows into Listings. The per-field
+# is_float/is_int checks the Listing setters used to run are timed against
+# RFAPI.SCHEMA, on its own and through dataset_to_listings, over dense rows
+# and sparse rows with most numeric fields empty. Also checks that both give
+# the same values.
+#
+# Usage: python benchmarks/coercion.py [rows] [repeat]
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from househunt import RFAPI
+from redfin_stub import HEADERS, region_row
+
+NUMERIC = [name for name, header, coerce in RFAPI.SCHEMA.fields if coerce is not None]
+SPARSE_HEADERS = ('SQFT', 'LOT SIZE', 'PARKING SPOTS', 'DAYS ON MARKET', 'ORIGINAL LIST PRICE')
+
+
+def is_int(i):
+    try:
+        int(i)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def is_float(f):
+    try:
+        float(f)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def legacy_field(value):
+    # What each numeric setter did before RFAPI.SCHEMA
+    if is_float(value):
+        value = float(value)
+    elif is_int(value):
+        value = int(value)
+    return value
+
+
+def legacy_rows(rows):
+    out = []
+    for rs in rows:
+        values = dict((name, rs[header]) for name, header, coerce in RFAPI.SCHEMA.fields)
+        for name in NUMERIC:
+            values[name] = legacy_field(values[name])
+        out.append(values)
+    return out
+
+
+def schema_rows(rows):
+    return list(RFAPI.SCHEMA.coerce_rows(rows))
+
+
+def listings(rows):
+    rf_api = RFAPI()
+    rf_api.result_sets = rows
+    rf_api.dataset_to_listings()
+    return rf_api.listings
+
+
+def listing_values(listing):
+    values = listing.as_dict()
+    values.update(values.pop('house'))
+    return values
+
+
+def make_rows(count, sparse):
+    rows = []
+    for i in range(count):
+        row = dict(zip(HEADERS, region_row(9000 + i // 500, i % 500)))
+        if sparse:
+            for header in SPARSE_HEADERS:
+                row[header] = ''
+        rows.append(row)
+    return rows
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print("%-8s %-20s %12s %10s" % ('rows', 'coercion', 'rows/s', 'same'))
+    for label, sparse in (('dense', False), ('sparse', True)):
+        rows = make_rows(count, sparse)
+        expected = legacy_rows(rows)
+        for name, func in (('is_float/is_int', legacy_rows), ('FieldSchema', schema_rows), ('dataset_to_listings', listings)):
+            result = func(rows)
+            if func is listings:
+                result = [listing_values(listing) for listing in result]
+            same = all(all(values[k] == e[k] for k in e) for values, e in zip(result, expected))
+            best = min(timeit.repeat(lambda: func(rows), number=1, repeat=repeat))
+            print("%-8s %-20s %12.0f %10s" % (label, name, count / best, same))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# download.py
+#
+# Wall time of RFAPI.retrieve_dls over many regions, sequential against
+# parallel, using the local Redfin stub with a fixed per-request latency.
+# One region fails, to show the parallel mode keeps the others, and dense
+# regions are paged past num_homes.
+#
+# Usage: python benchmarks/download.py [regions] [delay_ms]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from househunt import RFAPI
+from househunt.httppool import default_pool
+from redfin_stub import RedfinStub
+
+RANDOM_USER_AGENT = RFAPI.random_user_agent
+
+
+def retrieve(stub, region_ids, workers):
+    rf_api = RFAPI(workers=workers, host_limit=workers)
+    rf_api.DL_URL = stub.url
+    rf_api.region_ids = list(region_ids)
+    rf_api.build_dl_urls()
+    start = time.time()
+    try:
+        rf_api.retrieve_dls()
+    except Exception as e:
+        return time.time() - start, None, e
+    return time.time() - start, rf_api, None
+
+
+def main():
+    num_regions = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    delay = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000.0
+    region_ids = range(9000, 9000 + num_regions)
+    # fake_useragent may need the network; the stub does not care
+    RFAPI.random_user_agent = staticmethod(lambda: 'househunt-benchmark')
+    try:
+        with RedfinStub(delay=delay) as stub:
+            print("%d regions, %d ms per request" % (num_regions, delay * 1000))
+            seq_time, seq_api, _ = retrieve(stub, region_ids, 1)
+            print("%-14s %8.3f s %8d rows" % ('sequential', seq_time, len(seq_api.result_sets)))
+            for workers in (4, 8, 16):
+                stub.max_in_flight = 0
+                par_time, par_api, _ = retrieve(stub, region_ids, workers)
+                print("%-14s %8.3f s %8d rows  same order: %s  peak in flight: %d" % (
+                    "workers=%d" % workers, par_time, len(par_api.result_sets),
+                    par_api.result_sets == seq_api.result_sets, stub.max_in_flight))
+        with RedfinStub(delay=delay, fail_regions=[region_ids[1]]) as stub:
+            _, _, error = retrieve(stub, region_ids, 1)
+            print("sequential with a failing region: %s" % type(error).__name__)
+            _, par_api, _ = retrieve(stub, region_ids, 8)
+            print("workers=8 with a failing region: %d rows, errors: %s" % (
+                len(par_api.result_sets), [type(e).__name__ for e in par_api.errors.values()]))
+        # Dense regions: 2300 listings each, served 500 per page
+        with RedfinStub(rows_per_region=2300, delay=delay, page_overlap=10) as stub:
+            for workers in (1, 8):
+                elapsed, rf_api, _ = retrieve(stub, region_ids[:8], workers)
+                print("%-14s %8.3f s %8d rows from %d regions of 2300, %d requests" % (
+                    "paged, w=%d" % workers, elapsed, len(rf_api.result_sets), 8, stub.requests))
+                stub.requests = 0
+    finally:
+        RFAPI.random_user_agent = RANDOM_USER_AGENT
+        # Drop the keep-alive connections before the stub's threads go away
+        default_pool().close()
+
+
+if __name__ == '__main__':
+    main()
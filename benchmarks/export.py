@@ -0,0 +1,62 @@
+# export.py
+#
+# Throughput of the generated export() writing straight to a file, against
+# searchresults.exportBuffered, over parsed GetSearchResults responses of
+# increasing size. Also checks that both produce the same bytes.
+#
+# Usage: python benchmarks/export.py [repeat]
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import househunt.searchresults
+from zillow_docs import document
+
+# househunt.searchresults is the root binding class; the module is here
+searchresults = sys.modules['househunt.searchresults']
+
+SIZES = (1, 10, 100, 500)
+
+
+def export_plain(sr, path):
+    with open(path, 'wb') as f:
+        sr.export(f, 0, name_='searchresults')
+
+
+def export_buffered(sr, path):
+    with open(path, 'wb') as f:
+        searchresults.exportBuffered(sr, f, name_='searchresults')
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    fd, path = tempfile.mkstemp(suffix='.xml')
+    os.close(fd)
+    try:
+        print("%-10s %8s %10s %12s %10s" % ('export', 'results', 'ms', 'MB/s', 'identical'))
+        for size in SIZES:
+            sr = searchresults.parseBytes(document(size), silence=True)
+            export_plain(sr, path)
+            expected = read(path)
+            for name, func in (('export', export_plain), ('buffered', export_buffered)):
+                func(sr, path)
+                identical = read(path) == expected
+                number = max(1, 500 // size)
+                best = min(timeit.repeat(lambda: func(sr, path), number=number, repeat=repeat)) / number
+                print("%-10s %8d %10.3f %12.2f %10s" % (
+                    name, size, best * 1000, len(expected) / best / 1e6, identical))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
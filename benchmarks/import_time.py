@@ -0,0 +1,44 @@
+# import_time.py
+#
+# Cold import time of the package, of the generated Zillow bindings and of
+# ZestimateFrame (lxml and numpy), each measured in a fresh interpreter.
+#
+# Usage: python benchmarks/import_time.py [runs]
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+CASES = (
+    ('import househunt', 'import househunt'),
+    ('+ searchresults', 'import househunt.searchresults'),
+    ('+ calculators', 'import househunt.calculators'),
+    ('+ ZestimateFrame', 'from househunt import ZestimateFrame'),
+)
+
+TIMER = (
+    "import time; t = time.time(); %s; "
+    "import sys; sys.stdout.write('%%f' %% (time.time() - t))"
+)
+
+
+def time_import(statement, runs):
+    times = []
+    for i in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', TIMER % statement], cwd=ROOT)
+        times.append(float(out))
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print("median of %d runs" % runs)
+    for name, statement in CASES:
+        print("%-20s %7.1f ms" % (name, time_import(statement, runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# memory.py
+#
+# Bytes per listing for the slotted House/Listing records, compared with the
+# old __dict__ backed layout.
+#
+# Usage: python benchmarks/memory.py [num_listings]
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from househunt.househunt import House, Listing
+
+
+def dict_layout(cls):
+    """
+    Standalone copy of a slotted class with a per-instance __dict__, as
+    before __slots__. Subclassing would keep the inherited slots and leave
+    the __dict__ empty.
+    """
+    namespace = dict((name, value) for name, value in vars(cls).items()
+                     if name not in cls.__slots__ + ('__slots__',))
+    return type('Dict' + cls.__name__, (object,), namespace)
+
+
+DictHouse = dict_layout(House)
+DictListing = dict_layout(Listing)
+
+
+def sample_row(i):
+    return {
+        'street_address': "%d Wallaby Way" % i,
+        'city': 'Sydney',
+        'state': 'MA',
+        'zip_code': '02134',
+        'beds': '3',
+        'baths': '1.5',
+        'sq_ft': '1450',
+        'parking': '2',
+        'parking_type': 'Garage',
+        'lot_size': '5000',
+        'home_type': 'Single Family Residential',
+        'list_price': '450000',
+        'days_on_market': '12',
+        'original_list_price': '475000',
+        'status': 'Active',
+        'mls_id': "7%06d" % i,
+        'open_house_date': '',
+        'open_house_start_time': '',
+        'open_house_end_time': ''
+    }
+
+
+def build(house_cls, listing_cls, row):
+    h = house_cls(
+        street_address=row['street_address'],
+        city=row['city'],
+        state=row['state'],
+        zip_code=row['zip_code'],
+        beds=row['beds'],
+        baths=row['baths'],
+        parking=row['parking'],
+        parking_type=row['parking_type'],
+        sq_ft=row['sq_ft'],
+        lot_size=row['lot_size'],
+        home_type=row['home_type']
+    )
+    return listing_cls(
+        house=h,
+        list_price=row['list_price'],
+        days_on_market=row['days_on_market'],
+        original_list_price=row['original_list_price'],
+        status=row['status'],
+        mls_id=row['mls_id'],
+        open_house_date=row['open_house_date'],
+        open_house_start_time=row['open_house_start_time'],
+        open_house_end_time=row['open_house_end_time']
+    )
+
+
+def record_size(obj):
+    # Only the record overhead is counted; field values are shared between
+    # both layouts and would only add noise.
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def bytes_per_listing(house_cls, listing_cls, num_listings):
+    total = 0
+    for i in range(num_listings):
+        l = build(house_cls, listing_cls, sample_row(i))
+        total += record_size(l) + record_size(l.house)
+    return float(total) / num_listings
+
+
+def main():
+    num_listings = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    before = bytes_per_listing(DictHouse, DictListing, num_listings)
+    after = bytes_per_listing(House, Listing, num_listings)
+    print("listings:                  %d" % num_listings)
+    print("bytes/listing (__dict__):  %.1f" % before)
+    print("bytes/listing (__slots__): %.1f" % after)
+    print("saved:                     %.1f%%" % (100.0 * (before - after) / before))
+
+
+if __name__ == '__main__':
+    main()
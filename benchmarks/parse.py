@@ -0,0 +1,205 @@
+# parse.py
+#
+# Parser benchmark suite for the generated searchresults bindings and the
+# zillowparse fast path. Each case (parser, number of results, document
+# variant) runs in a fresh interpreter against a synthetic GetSearchResults
+# response, so the peak memory reported belongs to that case alone. Nothing
+# touches the network.
+#
+# Usage: python benchmarks/parse.py [--repeat N] [--sizes 1,10,100,500]
+#            [--parsers parse,parseString,...] [--variants full,bare,...]
+#            [--format json|table] [--output FILE]
+#
+# The JSON output is sorted and stable, so results from two versions can be
+# compared with diff.
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+sys.path.insert(0, ROOT)
+
+from zillow_docs import document
+
+SIZES = (1, 10, 100, 500)
+
+PARSERS = ('parse', 'parseString', 'parseEtree', 'parseBytes', 'parseBytes_novalidate', 'fastpath')
+
+# name: (links, local_real_estate)
+VARIANTS = {
+    'full': (True, True),
+    'no_links': (False, True),
+    'no_local_real_estate': (True, False),
+    'bare': (False, False)
+}
+
+VARIANT_ORDER = ('full', 'no_links', 'no_local_real_estate', 'bare')
+
+
+def parse_function(name, doc):
+    """
+    A no-argument callable running the named parser over doc
+    """
+    if name == 'fastpath':
+        from househunt import zillowparse
+        return lambda: zillowparse.parse_results(doc)
+    import househunt.searchresults
+    # househunt.searchresults is the root binding class; the module is here
+    searchresults = sys.modules['househunt.searchresults']
+    if name == 'parseBytes_novalidate':
+        return lambda: searchresults.parseBytes(doc, silence=True, validate=False)
+    parse = getattr(searchresults, name)
+    if name in ('parse', 'parseEtree'):
+        # These read from a file, as they would for a saved response
+        fd, path = tempfile.mkstemp(suffix='.xml')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(doc)
+        atexit.register(os.remove, path)
+        return lambda: parse(path, silence=True)
+    return lambda: parse(doc, silence=True)
+
+
+def reset_peak():
+    """
+    Reset the peak RSS to the current RSS, where the platform allows it
+    (Linux), so imports and setup do not mask the peak of a single parse
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except (IOError, OSError):
+        return False
+
+
+def max_rss_kb():
+    if sys.platform.startswith('linux'):
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    if sys.platform == 'darwin':
+        usage //= 1024
+    return usage
+
+
+def run_case(parser, size, variant, repeat):
+    links, local_real_estate = VARIANTS[variant]
+    doc = document(size, links=links, local_real_estate=local_real_estate)
+    case = {
+        'parser': parser,
+        'results': size,
+        'variant': variant,
+        'bytes': len(doc)
+    }
+    func = parse_function(parser, doc)
+    reset_peak()
+    baseline = max_rss_kb()
+    try:
+        func()
+    except Exception as e:
+        # e.g. parseEtree, whose bindings were generated without to_etree
+        case['error'] = "%s: %s" % (type(e).__name__, e)
+        return case
+    peak = max_rss_kb()
+    number = max(1, 500 // size)
+    times = sorted(t / number for t in timeit.repeat(func, number=number, repeat=repeat))
+    case.update({
+        'best_ms': round(times[0] * 1000, 4),
+        'median_ms': round(times[len(times) // 2] * 1000, 4),
+        'us_per_result': round(times[0] * 1e6 / size, 2),
+        'peak_rss_kb': peak,
+        'peak_delta_kb': peak - baseline
+    })
+    return case
+
+
+def spawn_case(parser, size, variant, repeat):
+    out = subprocess.check_output([
+        sys.executable, os.path.abspath(__file__),
+        '--case', "%s:%d:%s" % (parser, size, variant),
+        '--repeat', str(repeat)
+    ], cwd=ROOT)
+    return json.loads(out)
+
+
+def metadata():
+    from lxml import etree
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'lxml': etree.__version__,
+        'platform': platform.platform()
+    }
+
+
+def print_table(report):
+    print("%-22s %-22s %8s %10s %10s %12s %12s" % (
+        'parser', 'variant', 'results', 'best ms', 'us/result', 'peak KB', 'delta KB'))
+    for r in report['results']:
+        if 'error' in r:
+            print("%-22s %-22s %8d %s" % (r['parser'], r['variant'], r['results'], r['error']))
+            continue
+        print("%-22s %-22s %8d %10.3f %10.1f %12d %12d" % (
+            r['parser'], r['variant'], r['results'], r['best_ms'], r['us_per_result'],
+            r['peak_rss_kb'], r['peak_delta_kb']))
+
+
+def split_list(value):
+    return [v for v in value.split(',') if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Zillow response parsers")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--sizes', default=','.join(str(s) for s in SIZES))
+    parser.add_argument('--parsers', default=','.join(PARSERS))
+    parser.add_argument('--variants', default=','.join(VARIANT_ORDER))
+    parser.add_argument('--format', choices=('json', 'table'), default='json')
+    parser.add_argument('--output')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        name, size, variant = args.case.split(':')
+        sys.stdout.write(json.dumps(run_case(name, int(size), variant, args.repeat), sort_keys=True))
+        return
+
+    for name in split_list(args.parsers):
+        if name not in PARSERS:
+            parser.error("unknown parser %s" % name)
+    for variant in split_list(args.variants):
+        if variant not in VARIANTS:
+            parser.error("unknown variant %s" % variant)
+
+    results = []
+    for name in split_list(args.parsers):
+        for variant in split_list(args.variants):
+            for size in split_list(args.sizes):
+                results.append(spawn_case(name, int(size), variant, args.repeat))
+    report = {'meta': metadata(), 'repeat': args.repeat, 'results': results}
+
+    if args.format == 'table':
+        print_table(report)
+    else:
+        out = json.dumps(report, sort_keys=True, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(out + '\n')
+        else:
+            print(out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# redfin_stub.py
+#
+# Local stand-in for the Redfin gis-search CSV download, serving canned CSVs
+# per region_id with optional latency, failing regions and paging by
+# num_homes/page_number, so RFAPI can be exercised without touching the
+# network. Point a client at it with `rf_api.DL_URL = stub.url` before
+# building the download URLs.
+
+import csv
+import hashlib
+import StringIO
+
+from stub_server import StubServer
+
+HEADERS = [
+    'SALE TYPE', 'HOME TYPE', 'ADDRESS', 'CITY', 'STATE', 'ZIP', 'LIST PRICE', 'BEDS', 'BATHS',
+    'LOCATION', 'SQFT', 'LOT SIZE', 'YEAR BUILT', 'PARKING SPOTS', 'PARKING TYPE', 'DAYS ON MARKET',
+    'STATUS', 'NEXT OPEN HOUSE DATE', 'NEXT OPEN HOUSE START TIME', 'NEXT OPEN HOUSE END TIME',
+    'RECENT REDUCTION DATE', 'ORIGINAL LIST PRICE', 'LAST SALE DATE', 'LAST SALE PRICE', 'URL',
+    'SOURCE', 'LISTING ID', 'ORIGINAL SOURCE', 'FAVORITE', 'INTERESTED', 'LATITUDE', 'LONGITUDE',
+    'IS SHORT SALE'
+]
+
+
+def region_row(region_id, i):
+    row = dict((header, '') for header in HEADERS)
+    row.update({
+        'SALE TYPE': 'MLS Listing',
+        'HOME TYPE': ('Single Family Residential', 'Condo/Co-op', 'Townhouse')[i % 3],
+        'ADDRESS': "%d Region %d St" % (i + 1, region_id),
+        'CITY': 'Boston',
+        'STATE': 'MA',
+        'ZIP': "02%03d" % (region_id % 1000),
+        'LIST PRICE': str(300000 + 2500 * i),
+        'BEDS': str(1 + i % 5),
+        'BATHS': str(1 + (i % 4) * 0.5),
+        'SQFT': str(800 + 15 * i),
+        'LOT SIZE': str(2000 + 40 * i),
+        'PARKING SPOTS': str(i % 3),
+        'PARKING TYPE': 'Garage' if i % 2 else '',
+        'DAYS ON MARKET': str(i % 90),
+        'STATUS': 'Active',
+        'ORIGINAL LIST PRICE': str(310000 + 2500 * i),
+        'LISTING ID': "%d-%05d" % (region_id, i)
+    })
+    return [row[header] for header in HEADERS]
+
+
+def region_csv(region_id, start, stop):
+    out = StringIO.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(HEADERS)
+    for i in range(start, stop):
+        writer.writerow(region_row(region_id, i))
+    return out.getvalue()
+
+
+class RedfinStub(StubServer):
+    """
+    Stub gis-search answering requests for the requested region_id after
+    delay seconds. A region holds rows_per_region listings, served num_homes
+    per page; each page after the first repeats the last page_overlap rows
+    of the page before, and with paging=False every page is the first.
+    Responses carry an ETag and conditional requests for an unchanged body
+    answer 304. Regions in fail_regions answer 500.
+    """
+    PATH = '/stingray/do/gis-search'
+
+    def __init__(self, rows_per_region=50, delay=0, fail_regions=(), page_overlap=0, paging=True):
+        StubServer.__init__(self, delay)
+        self.rows_per_region = rows_per_region
+        self.fail_regions = set(fail_regions)
+        self.page_overlap = page_overlap
+        self.paging = paging
+        self.not_modified = 0
+
+    def body(self, params):
+        num_homes = int(params.get('num_homes', [500])[0])
+        page_number = int(params.get('page_number', [1])[0]) if self.paging else 1
+        start = max(0, (page_number - 1) * num_homes - (page_number > 1 and self.page_overlap or 0))
+        stop = min(self.rows_per_region, start + num_homes)
+        return region_csv(int(params['region_id'][0]), min(start, stop), stop)
+
+    def reply(self, params, handler):
+        if int(params['region_id'][0]) in self.fail_regions:
+            return 500, [], 'region unavailable'
+        data = self.body(params)
+        etag = '"%s"' % hashlib.sha1(data).hexdigest()
+        if handler.headers.get('If-None-Match') == etag:
+            with self._lock:
+                self.not_modified += 1
+            return 304, [('ETag', etag)], ''
+        return 200, [('Content-Type', 'text/csv'), ('ETag', etag)], data
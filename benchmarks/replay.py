@@ -0,0 +1,105 @@
+# replay.py
+#
+# Records the Redfin downloads of many regions from the local stub into a
+# ResponseArchive, then replays them with no server at all, comparing wall
+# time, rows and the archive's size on disk against the raw bytes. Zillow
+# GetSearchResults bodies are archived and replayed the same way.
+#
+# Usage: python benchmarks/replay.py [regions] [delay_ms]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from househunt import House, RFAPI, ZillAPI
+from househunt.archive import ResponseArchive
+from househunt.httppool import default_pool
+from redfin_stub import RedfinStub
+from zillow_docs import document
+
+RANDOM_USER_AGENT = RFAPI.random_user_agent
+
+
+def load(dl_url, region_ids, archive):
+    rf_api = RFAPI(workers=8, host_limit=8, archive=archive)
+    rf_api.DL_URL = dl_url
+    rf_api.region_ids = list(region_ids)
+    rf_api.build_dl_urls()
+    start = time.time()
+    rf_api.retrieve_dls()
+    return time.time() - start, rf_api
+
+
+def archive_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+class _Response(object):
+    def __init__(self, content):
+        self.content = content
+
+
+class _ZillowStub(object):
+    """
+    Stands in for the HTTP pool, answering every request with one document
+    """
+    def __init__(self, content):
+        self.content = content
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return _Response(self.content)
+
+
+def main():
+    num_regions = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    delay = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000.0
+    region_ids = range(9000, 9000 + num_regions)
+    directory = tempfile.mkdtemp(prefix='househunt-archive-')
+    # fake_useragent may need the network; the stub does not care
+    RFAPI.random_user_agent = staticmethod(lambda: 'househunt-benchmark')
+    try:
+        with RedfinStub(rows_per_region=2300, delay=delay) as stub:
+            dl_url = stub.url
+            with ResponseArchive(directory, mode='record') as archive:
+                live_time, live_api = load(dl_url, region_ids, archive)
+                requests = stub.requests
+        default_pool().close()
+        with ResponseArchive(directory) as archive:
+            raw = sum(entry['size'] for entry in archive.entries(ResponseArchive.REDFIN))
+        print("%d regions of 2300 rows, %d ms per request" % (num_regions, delay * 1000))
+        print("%-10s %8.3f s %8d rows %6d requests" % ('record', live_time, len(live_api.result_sets), requests))
+        # The stub is gone; everything below comes from the archive
+        with ResponseArchive(directory) as archive:
+            replay_time, replay_api = load(dl_url, region_ids, archive)
+            print("%-10s %8.3f s %8d rows  identical: %s" % (
+                'replay', replay_time, len(replay_api.result_sets), replay_api.result_sets == live_api.result_sets))
+            print("archive: %d responses, %.1f MB raw, %.1f MB on disk" % (
+                len(archive), raw / 1e6, archive_size(directory) / 1e6))
+            # With workers > 1, a failing region lands in errors
+            _, missing_api = load(dl_url, [region_ids[-1] + 1], archive)
+            print("unrecorded region: %s" % [type(e).__name__ for e in missing_api.errors.values()])
+
+        h = House(street_address='2114 Bigelow Ave', zip_code='98109')
+        zillow = _ZillowStub(document(10))
+        with ResponseArchive(directory, mode='record') as archive:
+            ZillAPI(zwsid='X1-benchmark', http_pool=zillow, archive=archive).get_results(h)
+        with ResponseArchive(directory) as archive:
+            z_api = ZillAPI(zwsid='X1-benchmark', archive=archive)
+            results = z_api.get_results(h)
+            leaked = any('X1-benchmark' in entry['url'] for entry in archive.entries())
+            print("zillow replay: %d results, %d request(s) recorded, zws-id in index: %s" % (
+                len(results), zillow.requests, leaked))
+    finally:
+        RFAPI.random_user_agent = RANDOM_USER_AGENT
+        default_pool().close()
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
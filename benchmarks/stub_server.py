@@ -0,0 +1,114 @@
+# stub_server.py
+#
+# Threaded local HTTP server for the Redfin and Zillow stubs: counts
+# requests and how many were in flight at once, and adds a fixed latency.
+
+import BaseHTTPServer
+import socket
+import SocketServer
+import sys
+import threading
+import time
+import urlparse
+
+
+class _Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 makes concurrent clients wait for a SYN retry
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # A client that timed out has already closed the connection
+        if not isinstance(sys.exc_info()[1], socket.error):
+            BaseHTTPServer.HTTPServer.handle_error(self, request, client_address)
+
+
+class StubServer(object):
+    """
+    Threaded HTTP server answering GET requests for PATH after delay
+    seconds; subclasses implement reply(params, handler), returning the
+    status, headers and body
+    """
+    PATH = '/'
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        # Handlers still running, waited for by stop()
+        self._active = 0
+        self._idle = threading.Condition(self._lock)
+        self._server = _Server(('127.0.0.1', 0), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d%s" % (self._server.server_address[1], self.PATH)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                stub.respond(self)
+
+            def log_message(self, *args):
+                pass
+        return Handler
+
+    def reply(self, params, handler):
+        raise NotImplementedError
+
+    def respond(self, handler):
+        with self._lock:
+            self._active += 1
+        try:
+            self._respond(handler)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._idle.notify_all()
+
+    def _respond(self, handler):
+        params = urlparse.parse_qs(urlparse.urlsplit(handler.path).query)
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            status, headers, data = self.reply(params, handler)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        handler.send_response(status)
+        for name, value in headers:
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            deadline = time.time() + self.delay + 5
+            while self._active and time.time() < deadline:
+                self._idle.wait(deadline - time.time())
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
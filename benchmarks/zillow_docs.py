@@ -0,0 +1,87 @@
+# zillow_docs.py
+#
+# Synthetic GetSearchResults responses conforming to SearchResults.xsd, for
+# the parser benchmarks.
+
+RESPONSE = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<SearchResults:searchresults'
+    ' xsi:schemaLocation="http://www.zillow.com/static/xsd/SearchResults.xsd'
+    ' http://www.zillowstatic.com/vstatic/LATEST/static/xsd/SearchResults.xsd"'
+    ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    ' xmlns:SearchResults="http://www.zillow.com/static/xsd/SearchResults.xsd">'
+    '<request><address>%(street)s</address><citystatezip>02134</citystatezip></request>'
+    '<message><text>Request successfully processed</text><code>0</code></message>'
+    '<response><results>%(results)s</results></response>'
+    '</SearchResults:searchresults>\n'
+)
+
+LINKS = (
+    '<links>'
+    '<homedetails>http://www.zillow.com/homedetails/%(zpid)d_zpid/</homedetails>'
+    '<graphsanddata>http://www.zillow.com/homedetails/charts/%(zpid)d_zpid/</graphsanddata>'
+    '<mapthishome>http://www.zillow.com/homes/%(zpid)d_zpid/</mapthishome>'
+    '<comparables>http://www.zillow.com/homes/comps/%(zpid)d_zpid/</comparables>'
+    '</links>'
+)
+
+ADDRESS = (
+    '<address>'
+    '<street>%(street)s</street><zipcode>02134</zipcode><city>Boston</city><state>MA</state>'
+    '<latitude>42.35%(i)04d</latitude><longitude>-71.13%(i)04d</longitude>'
+    '</address>'
+)
+
+ZESTIMATE = (
+    '<zestimate>'
+    '<amount currency="USD">%(amount)d</amount>'
+    '<last-updated>11/03/2016</last-updated>'
+    '<oneWeekChange deprecated="true"></oneWeekChange>'
+    '<valueChange duration="30" currency="USD">%(change)d</valueChange>'
+    '<valuationRange><low currency="USD">%(low)d</low><high currency="USD">%(high)d</high></valuationRange>'
+    '<percentile>%(percentile)d</percentile>'
+    '</zestimate>'
+)
+
+LOCAL_REAL_ESTATE = (
+    '<localRealEstate>'
+    '<region name="Allston" id="274560" type="neighborhood">'
+    '<zindexValue>512,300</zindexValue>'
+    '<links>'
+    '<overview>http://www.zillow.com/local-info/MA-Boston/Allston/r_274560/</overview>'
+    '<forSaleByOwner>http://www.zillow.com/allston-boston-ma/fsbo/</forSaleByOwner>'
+    '<forSale>http://www.zillow.com/allston-boston-ma/</forSale>'
+    '</links>'
+    '</region>'
+    '</localRealEstate>'
+)
+
+
+def result(i, links=True, local_real_estate=True):
+    values = {
+        'i': i,
+        'zpid': 59000000 + i,
+        'street': "%d Wallaby Way" % (i + 1),
+        'amount': 400000 + 1000 * i,
+        'change': -500 * (i % 7),
+        'low': 380000 + 1000 * i,
+        'high': 430000 + 1000 * i,
+        'percentile': i % 100
+    }
+    parts = ['<result><zpid>%(zpid)d</zpid>']
+    if links:
+        parts.append(LINKS)
+    parts.append(ADDRESS)
+    parts.append(ZESTIMATE)
+    if local_real_estate:
+        parts.append(LOCAL_REAL_ESTATE)
+    parts.append('</result>')
+    return ''.join(parts) % values
+
+
+def document(num_results, links=True, local_real_estate=True):
+    """
+    A GetSearchResults response with num_results results, as bytes
+    """
+    results = ''.join(result(i, links, local_real_estate) for i in range(num_results))
+    return RESPONSE % {'street': '1 Wallaby Way', 'results': results}
@@ -0,0 +1,40 @@
+# zillow_stub.py
+#
+# Local stand-in for the Zillow GetSearchResults API, so ZillAPI and
+# AsyncZillAPI can be exercised over real sockets without the network. Point
+# a client at it with `z_api.ZIL_URL = stub.url`.
+
+from stub_server import StubServer
+from zillow_docs import RESPONSE, result
+
+
+def zestimate(street_address):
+    """
+    Zestimate the stub gives the house at street_address
+    """
+    return 400000.0 + 1000 * house_number(street_address)
+
+
+def house_number(street_address):
+    number = street_address.split()[0] if street_address else ''
+    return int(number) if number.isdigit() else 0
+
+
+class ZillowStub(StubServer):
+    """
+    Stub GetSearchResults answering after delay seconds with one result
+    whose zestimate is zestimate(address). Addresses in fail_addresses
+    answer 500.
+    """
+    PATH = '/webservice/GetSearchResults.htm'
+
+    def __init__(self, delay=0, fail_addresses=()):
+        StubServer.__init__(self, delay)
+        self.fail_addresses = set(fail_addresses)
+
+    def reply(self, params, handler):
+        address = params.get('address', [''])[0]
+        if address in self.fail_addresses:
+            return 500, [], 'Error'
+        data = RESPONSE % {'street': address, 'results': result(house_number(address))}
+        return 200, [('Content-Type', 'text/xml')], data
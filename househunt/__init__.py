@@ -1,2 +1,18 @@
-from .househunt import House, Listing, ListCache, RFAPI, ZillAPI
-from .searchresults import searchresults
+from .househunt import House, Listing, ListingFrame, ListCache, ListingDelta, EnrichmentSession, RFAPI, ZillAPI
+from .asyncapi import AsyncZillAPI, AsyncRFAPI
+from .ratelimit import RateLimiter, QuotaExceeded
+from .lazy import lazy_attributes
+
+
+def _load_searchresults():
+    from .searchresults import searchresults
+    return searchresults
+
+
+def _load_zestimate_frame():
+    from .zestimates import ZestimateFrame
+    return ZestimateFrame
+
+# The generated Zillow bindings, and ZestimateFrame with lxml and numpy, are
+# only imported when first used
+lazy_attributes(__name__, {'searchresults': _load_searchresults, 'ZestimateFrame': _load_zestimate_frame})
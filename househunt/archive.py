@@ -0,0 +1,230 @@
+# archive.py
+#
+# Record and replay of raw Redfin CSV and Zillow XML responses. Each response
+# is compressed on its own and appended to one data file; an index of JSON
+# lines maps the normalized request URL to its place in the data file, so a
+# replay can seek straight to any response.
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib
+import urlparse
+import zlib
+
+try:
+    import lzma
+except ImportError:
+    # Not in the Python 2 standard library
+    lzma = None
+
+from httpcache import ResponseCache
+
+
+class ArchiveMiss(KeyError):
+    """
+    Raised when replaying a request that was not recorded
+    """
+    pass
+
+
+class ResponseArchive(object):
+    """
+    Archive of raw responses in directory, opened in 'record' or 'replay'
+    mode
+
+    Recording appends to what the archive already holds. compression is
+    'gzip', or 'lzma' where the lzma module is available.
+    """
+    REDFIN = 'redfin'
+    ZILLOW = 'zillow'
+    DATA_FILE = 'responses.dat'
+    INDEX_FILE = 'index.jsonl'
+    MODES = ('record', 'replay')
+    CHUNK_SIZE = 64 * 1024
+    # Query parameters left out of keys and of the index, e.g. API keys
+    PRIVATE_PARAMS = ('zws-id',)
+
+    def __init__(self, directory, mode='replay', compression='gzip'):
+        if mode not in ResponseArchive.MODES:
+            raise ValueError("Unknown ResponseArchive mode %s, expected one of %s" % (mode, ', '.join(ResponseArchive.MODES)))
+        if compression == 'lzma' and lzma is None:
+            raise ValueError("lzma compression is not available on this Python")
+        if compression not in ('gzip', 'lzma'):
+            raise ValueError("Unknown compression %s, expected gzip or lzma" % compression)
+        self.directory = directory
+        self.mode = mode
+        self.compression = compression
+        self._lock = threading.Lock()
+        if mode == 'record' and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.index = self._load_index()
+        data_path = os.path.join(directory, ResponseArchive.DATA_FILE)
+        if mode == 'record':
+            self.data = open(data_path, 'ab')
+            self.index_file = open(os.path.join(directory, ResponseArchive.INDEX_FILE), 'a')
+        else:
+            if not os.path.exists(data_path):
+                raise IOError("No response archive in %s" % self.directory)
+            self.data = None
+            self.index_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def _load_index(self):
+        index = {}
+        path = os.path.join(self.directory, ResponseArchive.INDEX_FILE)
+        if not os.path.exists(path):
+            if self.mode == 'replay':
+                raise IOError("No response archive in %s" % self.directory)
+            return index
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # A later recording of the same request wins
+                index[(entry['kind'], entry['key'])] = entry
+        return index
+
+    @staticmethod
+    def public_url(url):
+        parts = urlparse.urlsplit(url)
+        params = [(k, v) for k, v in urlparse.parse_qsl(parts.query, keep_blank_values=True)
+                  if k not in ResponseArchive.PRIVATE_PARAMS]
+        return urlparse.urlunsplit(parts._replace(query=urllib.urlencode(params)))
+
+    @staticmethod
+    def key(url):
+        return ResponseCache.normalize_url(ResponseArchive.public_url(url))
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, kind_url):
+        kind, url = kind_url
+        return (kind, ResponseArchive.key(url)) in self.index
+
+    def entries(self, kind=None):
+        return [entry for (k, key), entry in sorted(self.index.items()) if kind is None or k == kind]
+
+    def _compressor(self):
+        if self.compression == 'lzma':
+            return lzma.LZMACompressor()
+        # gzip framing, as written by the gzip module
+        return zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    @staticmethod
+    def _decompressor(compression):
+        if compression == 'lzma':
+            return lzma.LZMADecompressor()
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def _append(self, kind, url, tmp_path, size):
+        """
+        Append the compressed response in tmp_path to the data file and
+        index it
+        """
+        with self._lock:
+            self.data.seek(0, os.SEEK_END)
+            offset = self.data.tell()
+            with open(tmp_path, 'rb') as tmp:
+                shutil.copyfileobj(tmp, self.data, ResponseArchive.CHUNK_SIZE)
+            self.data.flush()
+            entry = {
+                'kind': kind,
+                'key': ResponseArchive.key(url),
+                'url': ResponseArchive.public_url(url),
+                'offset': offset,
+                'length': self.data.tell() - offset,
+                'size': size,
+                'compression': self.compression,
+                'recorded': time.time()
+            }
+            self.index_file.write(json.dumps(entry, sort_keys=True) + '\n')
+            self.index_file.flush()
+            self.index[(kind, entry['key'])] = entry
+
+    def record(self, kind, url, chunks):
+        """
+        Yield chunks, compressing them into a temporary file as they arrive;
+        the response is added to the archive once every chunk has been read
+        """
+        if self.replaying:
+            raise IOError("ResponseArchive is open for replay")
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                compressor = self._compressor()
+                size = 0
+                try:
+                    for chunk in chunks:
+                        tmp.write(compressor.compress(chunk))
+                        size += len(chunk)
+                        yield chunk
+                finally:
+                    close = getattr(chunks, 'close', None)
+                    if close is not None:
+                        close()
+                tmp.write(compressor.flush())
+            self._append(kind, url, tmp_path, size)
+        finally:
+            os.remove(tmp_path)
+
+    def add(self, kind, url, body):
+        """
+        Record the body of a response to url
+        """
+        for chunk in self.record(kind, url, [body]):
+            pass
+
+    def entry(self, kind, url):
+        entry = self.index.get((kind, ResponseArchive.key(url)))
+        if entry is None:
+            raise ArchiveMiss(url)
+        return entry
+
+    def _read(self, entry):
+        decompressor = ResponseArchive._decompressor(entry['compression'])
+        remaining = entry['length']
+        # A handle of its own, so concurrent replays do not share a position
+        with open(os.path.join(self.directory, ResponseArchive.DATA_FILE), 'rb') as f:
+            f.seek(entry['offset'])
+            while remaining:
+                data = f.read(min(ResponseArchive.CHUNK_SIZE, remaining))
+                if not data:
+                    raise IOError("Response archive %s is truncated" % self.directory)
+                remaining -= len(data)
+                chunk = decompressor.decompress(data)
+                if chunk:
+                    yield chunk
+
+    def get(self, kind, url):
+        """
+        The recorded body of the response to url
+        """
+        return ''.join(self._read(self.entry(kind, url)))
+
+    def chunks(self, kind, url):
+        """
+        The recorded body of the response to url, as a generator of chunks
+        decompressed as they are read
+        """
+        return self._read(self.entry(kind, url))
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+        if self.index_file is not None:
+            self.index_file.close()
@@ -0,0 +1,146 @@
+# asyncapi.py
+#
+# Non-blocking counterparts of ZillAPI and RFAPI. Requests are multiplexed on
+# a bounded pool of worker threads (asyncio is not available on Python 2) and
+# every call returns an AsyncResult immediately; use .get(timeout) or a
+# callback to collect the result.
+
+from multiprocessing.pool import ThreadPool
+
+from househunt import ZillAPI, RFAPI
+
+
+class AsyncZillAPI(ZillAPI):
+    """
+    ZillAPI running up to max_in_flight requests at once, each with a timeout
+
+    Each request in flight holds one of max_in_flight pool threads, blocked
+    on its socket until the response or the timeout.
+    """
+    def __init__(self, zwsid=None, zwsid_filename=None, max_in_flight=8, timeout=30, http_pool=None, validate=True, archive=None):
+        ZillAPI.__init__(
+            self,
+            zwsid=zwsid,
+            zwsid_filename=zwsid_filename,
+            timeout=timeout,
+            http_pool=http_pool,
+            validate=validate,
+            archive=archive
+        )
+        self.max_in_flight = max_in_flight
+        self.pool = ThreadPool(max_in_flight)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_from_zillow_async(self, h, callback=None):
+        return self.pool.apply_async(self.get_from_zillow, (h,), callback=callback)
+
+    def get_zestimate_async(self, listing, callback=None):
+        """
+        Look up the zestimate of a listing, set it on the listing and return
+        the listing
+        """
+        def fetch():
+            listing.zestimate = self.zestimate_from_results(self.get_results(listing.house))
+            return listing
+        return self.pool.apply_async(fetch, callback=callback)
+
+    def get_zestimates_async(self, listings, callback=None):
+        """
+        Look up the zestimates of many listings; the result is the list of
+        listings, in order
+        """
+        def fetch(listing):
+            listing.zestimate = self.zestimate_from_results(self.get_results(listing.house))
+            return listing
+        return self.pool.map_async(fetch, listings, callback=callback)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        ZillAPI.close(self)
+
+
+class AsyncRFAPI(RFAPI):
+    """
+    RFAPI downloading up to max_in_flight region CSVs at once, each with a timeout
+
+    Each region in flight holds one of max_in_flight pool threads, blocked
+    on its socket. With paginate, a region whose first page is full fetches
+    the pages after it on page_workers threads of its own, so a download
+    runs on at most max_in_flight * (1 + page_workers) threads; host_limit
+    still caps the requests in flight per host.
+    """
+    def __init__(
+        self,
+        region_ids=[],
+        load_listings=False,
+        get_zestimates=False,
+        columnar=False,
+        max_in_flight=8,
+        timeout=30,
+        http_pool=None,
+        host_limit=4,
+        paginate=True,
+        page_workers=4,
+        response_cache=None,
+        archive=None
+    ):
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.pool = ThreadPool(max_in_flight)
+        # Loading waits on the download workers, so it runs on its own thread
+        self.loader = ThreadPool(1)
+        RFAPI.__init__(
+            self,
+            region_ids=region_ids,
+            load_listings=load_listings,
+            get_zestimates=get_zestimates,
+            columnar=columnar,
+            http_pool=http_pool,
+            host_limit=host_limit,
+            paginate=paginate,
+            page_workers=page_workers,
+            response_cache=response_cache,
+            archive=archive
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def retrieve_dls_async(self, callback=None):
+        """
+        Download every region CSV; the result is a (rows, error) pair per
+        region, in dl_urls order, so one failing region does not fail the rest
+        """
+        user_agent = RFAPI.random_user_agent()
+
+        def fetch(dl_url):
+            return self.fetch_region(dl_url, user_agent, timeout=self.timeout)
+        return self.pool.map_async(fetch, self.dl_urls, callback=callback)
+
+    def retrieve_dls(self):
+        self.merge_regions(self.retrieve_dls_async().get())
+
+    def load_listings_async(self, callback=None):
+        """
+        Download and build the listings (or frame) in the background; the
+        result is this AsyncRFAPI
+        """
+        def load():
+            self.load_listings()
+            return self
+        return self.loader.apply_async(load, callback=callback)
+
+    def close(self):
+        self.loader.close()
+        self.loader.join()
+        self.pool.close()
+        self.pool.join()
@@ -0,0 +1,7417 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Mortgage, refinance and rent vs buy calculator bindings split out of
+# searchresults.py (generated by generateDS.py version 2.22a from
+# SearchResults.xsd). GetSearchResults never uses them, so they are only
+# imported when one of them is needed.
+#
+
+import searchresults as searchresults_
+from searchresults import (
+    GeneratedsSuper,
+    getSubclassFromModule_,
+    LocalNames_,
+    local_name_,
+    showIndent,
+    quote_xml,
+    quote_attrib,
+    get_all_text_,
+    find_attr_value_,
+    raise_parse_error,
+    _cast
+)
+
+
+#
+# Data representation classes.
+#
+
+
+class MortgageInterestRate(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, loanType=None, count=None, valueOf_=None):
+        self.original_tagname_ = None
+        self.loanType = _cast(None, loanType)
+        self.count = _cast(int, count)
+        self.valueOf_ = valueOf_
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MortgageInterestRate)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MortgageInterestRate.subclass:
+            return MortgageInterestRate.subclass(*args_, **kwargs_)
+        else:
+            return MortgageInterestRate(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_loanType(self): return self.loanType
+    def set_loanType(self, loanType): self.loanType = loanType
+    def get_count(self): return self.count
+    def set_count(self, count): self.count = count
+    def get_valueOf_(self): return self.valueOf_
+    def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
+    def hasContent_(self):
+        if (
+            1 if type(self.valueOf_) in [int,float] else self.valueOf_
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MortgageInterestRate', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageInterestRate')
+        if self.hasContent_():
+            outfile.write('>')
+            outfile.write((quote_xml(self.valueOf_) if type(self.valueOf_) is str else self.gds_encode(str(self.valueOf_))))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageInterestRate', pretty_print=pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageInterestRate'):
+        if self.loanType is not None and 'loanType' not in already_processed:
+            already_processed.add('loanType')
+            outfile.write(' loanType=%s' % (quote_attrib(self.loanType), ))
+        if self.count is not None and 'count' not in already_processed:
+            already_processed.add('count')
+            outfile.write(' count="%s"' % self.gds_format_integer(self.count, input_name='count'))
+    def exportChildren(self, outfile, level, namespace_='', name_='MortgageInterestRate', fromsubclass_=False, pretty_print=True):
+        pass
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        self.valueOf_ = get_all_text_(node)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('loanType', node)
+        if value is not None and 'loanType' not in already_processed:
+            already_processed.add('loanType')
+            self.loanType = value
+        value = find_attr_value_('count', node)
+        if value is not None and 'count' not in already_processed:
+            already_processed.add('count')
+            try:
+                self.count = int(value)
+            except ValueError as exp:
+                raise_parse_error(node, 'Bad integer attribute: %s' % exp)
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        pass
+# end class MortgageInterestRate
+
+
+class MortgageRateList(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, rate=None):
+        self.original_tagname_ = None
+        if rate is None:
+            self.rate = []
+        else:
+            self.rate = rate
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MortgageRateList)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MortgageRateList.subclass:
+            return MortgageRateList.subclass(*args_, **kwargs_)
+        else:
+            return MortgageRateList(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_rate(self): return self.rate
+    def set_rate(self, rate): self.rate = rate
+    def add_rate(self, value): self.rate.append(value)
+    def insert_rate_at(self, index, value): self.rate.insert(index, value)
+    def replace_rate_at(self, index, value): self.rate[index] = value
+    def hasContent_(self):
+        if (
+            self.rate
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MortgageRateList', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageRateList')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageRateList', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageRateList'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='MortgageRateList', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for rate_ in self.rate:
+            rate_.export(outfile, level, namespace_, name_='rate', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MortgageRateList.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_rate(self, child_, node, nodeName_):
+        obj_ = MortgageInterestRate.factory()
+        obj_.build(child_)
+        self.rate.append(obj_)
+        obj_.original_tagname_ = 'rate'
+    childBuilders_ = {
+        'rate': buildChild_rate
+    }
+# end class MortgageRateList
+
+
+class MortgageRateSummary(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, today=None, lastWeek=None):
+        self.original_tagname_ = None
+        self.today = today
+        self.lastWeek = lastWeek
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MortgageRateSummary)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MortgageRateSummary.subclass:
+            return MortgageRateSummary.subclass(*args_, **kwargs_)
+        else:
+            return MortgageRateSummary(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_today(self): return self.today
+    def set_today(self, today): self.today = today
+    def get_lastWeek(self): return self.lastWeek
+    def set_lastWeek(self, lastWeek): self.lastWeek = lastWeek
+    def hasContent_(self):
+        if (
+            self.today is not None or
+            self.lastWeek is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MortgageRateSummary', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageRateSummary')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageRateSummary', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageRateSummary'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='MortgageRateSummary', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.today is not None:
+            self.today.export(outfile, level, namespace_, name_='today', pretty_print=pretty_print)
+        if self.lastWeek is not None:
+            self.lastWeek.export(outfile, level, namespace_, name_='lastWeek', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MortgageRateSummary.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_today(self, child_, node, nodeName_):
+        obj_ = MortgageRateList.factory()
+        obj_.build(child_)
+        self.today = obj_
+        obj_.original_tagname_ = 'today'
+    def buildChild_lastWeek(self, child_, node, nodeName_):
+        obj_ = MortgageRateList.factory()
+        obj_.build(child_)
+        self.lastWeek = obj_
+        obj_.original_tagname_ = 'lastWeek'
+    childBuilders_ = {
+        'today': buildChild_today,
+        'lastWeek': buildChild_lastWeek
+    }
+# end class MortgageRateSummary
+
+
+class MonthlyPaymentData(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, loanType=None, rate=None, monthlyPrincipalAndInterest=None, monthlyMortgageInsurance=None):
+        self.original_tagname_ = None
+        self.loanType = _cast(None, loanType)
+        self.rate = rate
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyMortgageInsurance = monthlyMortgageInsurance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MonthlyPaymentData)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MonthlyPaymentData.subclass:
+            return MonthlyPaymentData.subclass(*args_, **kwargs_)
+        else:
+            return MonthlyPaymentData(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_rate(self): return self.rate
+    def set_rate(self, rate): self.rate = rate
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyMortgageInsurance(self): return self.monthlyMortgageInsurance
+    def set_monthlyMortgageInsurance(self, monthlyMortgageInsurance): self.monthlyMortgageInsurance = monthlyMortgageInsurance
+    def get_loanType(self): return self.loanType
+    def set_loanType(self, loanType): self.loanType = loanType
+    def hasContent_(self):
+        if (
+            self.rate is not None or
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyMortgageInsurance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentData', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentData')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentData', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentData'):
+        if self.loanType is not None and 'loanType' not in already_processed:
+            already_processed.add('loanType')
+            outfile.write(' loanType=%s' % (quote_attrib(self.loanType), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentData', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.rate is not None:
+            self.rate.export(outfile, level, namespace_, name_='rate', pretty_print=pretty_print)
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyMortgageInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyMortgageInsurance>%s</%smonthlyMortgageInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyMortgageInsurance, input_name='monthlyMortgageInsurance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('loanType', node)
+        if value is not None and 'loanType' not in already_processed:
+            already_processed.add('loanType')
+            self.loanType = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MonthlyPaymentData.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_rate(self, child_, node, nodeName_):
+        obj_ = MortgageInterestRate.factory()
+        obj_.build(child_)
+        self.rate = obj_
+        obj_.original_tagname_ = 'rate'
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyMortgageInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyMortgageInsurance')
+        self.monthlyMortgageInsurance = ival_
+    childBuilders_ = {
+        'rate': buildChild_rate,
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyMortgageInsurance': buildChild_monthlyMortgageInsurance
+    }
+# end class MonthlyPaymentData
+
+
+class MonthlyPaymentsSummary(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, payment=None, downPayment=None, monthlyPropertyTaxes=None, monthlyHazardInsurance=None):
+        self.original_tagname_ = None
+        if payment is None:
+            self.payment = []
+        else:
+            self.payment = payment
+        self.downPayment = downPayment
+        self.monthlyPropertyTaxes = monthlyPropertyTaxes
+        self.monthlyHazardInsurance = monthlyHazardInsurance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MonthlyPaymentsSummary)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MonthlyPaymentsSummary.subclass:
+            return MonthlyPaymentsSummary.subclass(*args_, **kwargs_)
+        else:
+            return MonthlyPaymentsSummary(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def add_payment(self, value): self.payment.append(value)
+    def insert_payment_at(self, index, value): self.payment.insert(index, value)
+    def replace_payment_at(self, index, value): self.payment[index] = value
+    def get_downPayment(self): return self.downPayment
+    def set_downPayment(self, downPayment): self.downPayment = downPayment
+    def get_monthlyPropertyTaxes(self): return self.monthlyPropertyTaxes
+    def set_monthlyPropertyTaxes(self, monthlyPropertyTaxes): self.monthlyPropertyTaxes = monthlyPropertyTaxes
+    def get_monthlyHazardInsurance(self): return self.monthlyHazardInsurance
+    def set_monthlyHazardInsurance(self, monthlyHazardInsurance): self.monthlyHazardInsurance = monthlyHazardInsurance
+    def hasContent_(self):
+        if (
+            self.payment or
+            self.downPayment is not None or
+            self.monthlyPropertyTaxes is not None or
+            self.monthlyHazardInsurance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentsSummary', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentsSummary')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentsSummary', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentsSummary'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentsSummary', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for payment_ in self.payment:
+            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
+        if self.downPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
+        if self.monthlyPropertyTaxes is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPropertyTaxes>%s</%smonthlyPropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.monthlyPropertyTaxes, input_name='monthlyPropertyTaxes'), namespace_, eol_))
+        if self.monthlyHazardInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyHazardInsurance>%s</%smonthlyHazardInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyHazardInsurance, input_name='monthlyHazardInsurance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MonthlyPaymentsSummary.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_payment(self, child_, node, nodeName_):
+        obj_ = MonthlyPaymentData.factory()
+        obj_.build(child_)
+        self.payment.append(obj_)
+        obj_.original_tagname_ = 'payment'
+    def buildChild_downPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
+        self.downPayment = ival_
+    def buildChild_monthlyPropertyTaxes(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPropertyTaxes')
+        self.monthlyPropertyTaxes = ival_
+    def buildChild_monthlyHazardInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyHazardInsurance')
+        self.monthlyHazardInsurance = ival_
+    childBuilders_ = {
+        'payment': buildChild_payment,
+        'downPayment': buildChild_downPayment,
+        'monthlyPropertyTaxes': buildChild_monthlyPropertyTaxes,
+        'monthlyHazardInsurance': buildChild_monthlyHazardInsurance
+    }
+# end class MonthlyPaymentsSummary
+
+
+class MonthlyPaymentsDetails(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPropertyTaxes=None, monthlyHazardInsurance=None, monthlyPmi=None, monthlyHoaDues=None, totalMonthlyPayment=None, totalPayments=None, totalInterest=None, totalPrincipal=None, totalTaxesFeesAndInsurance=None, amortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPropertyTaxes = monthlyPropertyTaxes
+        self.monthlyHazardInsurance = monthlyHazardInsurance
+        self.monthlyPmi = monthlyPmi
+        self.monthlyHoaDues = monthlyHoaDues
+        self.totalMonthlyPayment = totalMonthlyPayment
+        self.totalPayments = totalPayments
+        self.totalInterest = totalInterest
+        self.totalPrincipal = totalPrincipal
+        self.totalTaxesFeesAndInsurance = totalTaxesFeesAndInsurance
+        if amortizationSchedule is None:
+            self.amortizationSchedule = []
+        else:
+            self.amortizationSchedule = amortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MonthlyPaymentsDetails)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MonthlyPaymentsDetails.subclass:
+            return MonthlyPaymentsDetails.subclass(*args_, **kwargs_)
+        else:
+            return MonthlyPaymentsDetails(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPropertyTaxes(self): return self.monthlyPropertyTaxes
+    def set_monthlyPropertyTaxes(self, monthlyPropertyTaxes): self.monthlyPropertyTaxes = monthlyPropertyTaxes
+    def get_monthlyHazardInsurance(self): return self.monthlyHazardInsurance
+    def set_monthlyHazardInsurance(self, monthlyHazardInsurance): self.monthlyHazardInsurance = monthlyHazardInsurance
+    def get_monthlyPmi(self): return self.monthlyPmi
+    def set_monthlyPmi(self, monthlyPmi): self.monthlyPmi = monthlyPmi
+    def get_monthlyHoaDues(self): return self.monthlyHoaDues
+    def set_monthlyHoaDues(self, monthlyHoaDues): self.monthlyHoaDues = monthlyHoaDues
+    def get_totalMonthlyPayment(self): return self.totalMonthlyPayment
+    def set_totalMonthlyPayment(self, totalMonthlyPayment): self.totalMonthlyPayment = totalMonthlyPayment
+    def get_totalPayments(self): return self.totalPayments
+    def set_totalPayments(self, totalPayments): self.totalPayments = totalPayments
+    def get_totalInterest(self): return self.totalInterest
+    def set_totalInterest(self, totalInterest): self.totalInterest = totalInterest
+    def get_totalPrincipal(self): return self.totalPrincipal
+    def set_totalPrincipal(self, totalPrincipal): self.totalPrincipal = totalPrincipal
+    def get_totalTaxesFeesAndInsurance(self): return self.totalTaxesFeesAndInsurance
+    def set_totalTaxesFeesAndInsurance(self, totalTaxesFeesAndInsurance): self.totalTaxesFeesAndInsurance = totalTaxesFeesAndInsurance
+    def get_amortizationSchedule(self): return self.amortizationSchedule
+    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
+    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
+    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
+    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPropertyTaxes is not None or
+            self.monthlyHazardInsurance is not None or
+            self.monthlyPmi is not None or
+            self.monthlyHoaDues is not None or
+            self.totalMonthlyPayment is not None or
+            self.totalPayments is not None or
+            self.totalInterest is not None or
+            self.totalPrincipal is not None or
+            self.totalTaxesFeesAndInsurance is not None or
+            self.amortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentsDetails', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentsDetails')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentsDetails', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentsDetails'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentsDetails', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPropertyTaxes is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPropertyTaxes>%s</%smonthlyPropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.monthlyPropertyTaxes, input_name='monthlyPropertyTaxes'), namespace_, eol_))
+        if self.monthlyHazardInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyHazardInsurance>%s</%smonthlyHazardInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyHazardInsurance, input_name='monthlyHazardInsurance'), namespace_, eol_))
+        if self.monthlyPmi is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPmi>%s</%smonthlyPmi>%s' % (namespace_, self.gds_format_integer(self.monthlyPmi, input_name='monthlyPmi'), namespace_, eol_))
+        if self.monthlyHoaDues is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyHoaDues>%s</%smonthlyHoaDues>%s' % (namespace_, self.gds_format_integer(self.monthlyHoaDues, input_name='monthlyHoaDues'), namespace_, eol_))
+        if self.totalMonthlyPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalMonthlyPayment>%s</%stotalMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.totalMonthlyPayment, input_name='totalMonthlyPayment'), namespace_, eol_))
+        if self.totalPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalPayments>%s</%stotalPayments>%s' % (namespace_, self.gds_format_integer(self.totalPayments, input_name='totalPayments'), namespace_, eol_))
+        if self.totalInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalInterest>%s</%stotalInterest>%s' % (namespace_, self.gds_format_integer(self.totalInterest, input_name='totalInterest'), namespace_, eol_))
+        if self.totalPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalPrincipal>%s</%stotalPrincipal>%s' % (namespace_, self.gds_format_integer(self.totalPrincipal, input_name='totalPrincipal'), namespace_, eol_))
+        if self.totalTaxesFeesAndInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalTaxesFeesAndInsurance>%s</%stotalTaxesFeesAndInsurance>%s' % (namespace_, self.gds_format_integer(self.totalTaxesFeesAndInsurance, input_name='totalTaxesFeesAndInsurance'), namespace_, eol_))
+        for amortizationSchedule_ in self.amortizationSchedule:
+            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MonthlyPaymentsDetails.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPropertyTaxes(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPropertyTaxes')
+        self.monthlyPropertyTaxes = ival_
+    def buildChild_monthlyHazardInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyHazardInsurance')
+        self.monthlyHazardInsurance = ival_
+    def buildChild_monthlyPmi(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPmi')
+        self.monthlyPmi = ival_
+    def buildChild_monthlyHoaDues(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyHoaDues')
+        self.monthlyHoaDues = ival_
+    def buildChild_totalMonthlyPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalMonthlyPayment')
+        self.totalMonthlyPayment = ival_
+    def buildChild_totalPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalPayments')
+        self.totalPayments = ival_
+    def buildChild_totalInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalInterest')
+        self.totalInterest = ival_
+    def buildChild_totalPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalPrincipal')
+        self.totalPrincipal = ival_
+    def buildChild_totalTaxesFeesAndInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalTaxesFeesAndInsurance')
+        self.totalTaxesFeesAndInsurance = ival_
+    def buildChild_amortizationSchedule(self, child_, node, nodeName_):
+        obj_ = AmortizationSchedule.factory()
+        obj_.build(child_)
+        self.amortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'amortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPropertyTaxes': buildChild_monthlyPropertyTaxes,
+        'monthlyHazardInsurance': buildChild_monthlyHazardInsurance,
+        'monthlyPmi': buildChild_monthlyPmi,
+        'monthlyHoaDues': buildChild_monthlyHoaDues,
+        'totalMonthlyPayment': buildChild_totalMonthlyPayment,
+        'totalPayments': buildChild_totalPayments,
+        'totalInterest': buildChild_totalInterest,
+        'totalPrincipal': buildChild_totalPrincipal,
+        'totalTaxesFeesAndInsurance': buildChild_totalTaxesFeesAndInsurance,
+        'amortizationSchedule': buildChild_amortizationSchedule
+    }
+# end class MonthlyPaymentsDetails
+
+
+class AmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if payment is None:
+            self.payment = []
+        else:
+            self.payment = payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, AmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AmortizationSchedule.subclass:
+            return AmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return AmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def add_payment(self, value): self.payment.append(value)
+    def insert_payment_at(self, index, value): self.payment.insert(index, value)
+    def replace_payment_at(self, index, value): self.payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='AmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='AmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='AmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for payment_ in self.payment:
+            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = AmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_payment(self, child_, node, nodeName_):
+        obj_ = paymentType.factory()
+        obj_.build(child_)
+        self.payment.append(obj_)
+        obj_.original_tagname_ = 'payment'
+    childBuilders_ = {
+        'payment': buildChild_payment
+    }
+# end class AmortizationSchedule
+
+
+class Refinance(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, totalMonthlySavings=None, currentMonthlyPayment=None, newMonthlyPayment=None, breakEven=None, lifetimeSavings=None, savingsTableSchedule=None):
+        self.original_tagname_ = None
+        self.totalMonthlySavings = totalMonthlySavings
+        self.currentMonthlyPayment = currentMonthlyPayment
+        self.newMonthlyPayment = newMonthlyPayment
+        self.breakEven = breakEven
+        self.lifetimeSavings = lifetimeSavings
+        if savingsTableSchedule is None:
+            self.savingsTableSchedule = []
+        else:
+            self.savingsTableSchedule = savingsTableSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, Refinance)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if Refinance.subclass:
+            return Refinance.subclass(*args_, **kwargs_)
+        else:
+            return Refinance(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_totalMonthlySavings(self): return self.totalMonthlySavings
+    def set_totalMonthlySavings(self, totalMonthlySavings): self.totalMonthlySavings = totalMonthlySavings
+    def get_currentMonthlyPayment(self): return self.currentMonthlyPayment
+    def set_currentMonthlyPayment(self, currentMonthlyPayment): self.currentMonthlyPayment = currentMonthlyPayment
+    def get_newMonthlyPayment(self): return self.newMonthlyPayment
+    def set_newMonthlyPayment(self, newMonthlyPayment): self.newMonthlyPayment = newMonthlyPayment
+    def get_breakEven(self): return self.breakEven
+    def set_breakEven(self, breakEven): self.breakEven = breakEven
+    def get_lifetimeSavings(self): return self.lifetimeSavings
+    def set_lifetimeSavings(self, lifetimeSavings): self.lifetimeSavings = lifetimeSavings
+    def get_savingsTableSchedule(self): return self.savingsTableSchedule
+    def set_savingsTableSchedule(self, savingsTableSchedule): self.savingsTableSchedule = savingsTableSchedule
+    def add_savingsTableSchedule(self, value): self.savingsTableSchedule.append(value)
+    def insert_savingsTableSchedule_at(self, index, value): self.savingsTableSchedule.insert(index, value)
+    def replace_savingsTableSchedule_at(self, index, value): self.savingsTableSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.totalMonthlySavings is not None or
+            self.currentMonthlyPayment is not None or
+            self.newMonthlyPayment is not None or
+            self.breakEven is not None or
+            self.lifetimeSavings is not None or
+            self.savingsTableSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='Refinance', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Refinance')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='Refinance', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Refinance'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='Refinance', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.totalMonthlySavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalMonthlySavings>%s</%stotalMonthlySavings>%s' % (namespace_, self.gds_format_integer(self.totalMonthlySavings, input_name='totalMonthlySavings'), namespace_, eol_))
+        if self.currentMonthlyPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%scurrentMonthlyPayment>%s</%scurrentMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.currentMonthlyPayment, input_name='currentMonthlyPayment'), namespace_, eol_))
+        if self.newMonthlyPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%snewMonthlyPayment>%s</%snewMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.newMonthlyPayment, input_name='newMonthlyPayment'), namespace_, eol_))
+        if self.breakEven is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
+        if self.lifetimeSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%slifetimeSavings>%s</%slifetimeSavings>%s' % (namespace_, self.gds_format_integer(self.lifetimeSavings, input_name='lifetimeSavings'), namespace_, eol_))
+        for savingsTableSchedule_ in self.savingsTableSchedule:
+            savingsTableSchedule_.export(outfile, level, namespace_, name_='savingsTableSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = Refinance.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_totalMonthlySavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalMonthlySavings')
+        self.totalMonthlySavings = ival_
+    def buildChild_currentMonthlyPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'currentMonthlyPayment')
+        self.currentMonthlyPayment = ival_
+    def buildChild_newMonthlyPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'newMonthlyPayment')
+        self.newMonthlyPayment = ival_
+    def buildChild_breakEven(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
+        self.breakEven = ival_
+    def buildChild_lifetimeSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'lifetimeSavings')
+        self.lifetimeSavings = ival_
+    def buildChild_savingsTableSchedule(self, child_, node, nodeName_):
+        obj_ = SavingsTableSchedule.factory()
+        obj_.build(child_)
+        self.savingsTableSchedule.append(obj_)
+        obj_.original_tagname_ = 'savingsTableSchedule'
+    childBuilders_ = {
+        'totalMonthlySavings': buildChild_totalMonthlySavings,
+        'currentMonthlyPayment': buildChild_currentMonthlyPayment,
+        'newMonthlyPayment': buildChild_newMonthlyPayment,
+        'breakEven': buildChild_breakEven,
+        'lifetimeSavings': buildChild_lifetimeSavings,
+        'savingsTableSchedule': buildChild_savingsTableSchedule
+    }
+# end class Refinance
+
+
+class SavingsTableSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if payment is None:
+            self.payment = []
+        else:
+            self.payment = payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, SavingsTableSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if SavingsTableSchedule.subclass:
+            return SavingsTableSchedule.subclass(*args_, **kwargs_)
+        else:
+            return SavingsTableSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def add_payment(self, value): self.payment.append(value)
+    def insert_payment_at(self, index, value): self.payment.insert(index, value)
+    def replace_payment_at(self, index, value): self.payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='SavingsTableSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='SavingsTableSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='SavingsTableSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SavingsTableSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='SavingsTableSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for payment_ in self.payment:
+            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = SavingsTableSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_payment(self, child_, node, nodeName_):
+        obj_ = paymentType2.factory()
+        obj_.build(child_)
+        self.payment.append(obj_)
+        obj_.original_tagname_ = 'payment'
+    childBuilders_ = {
+        'payment': buildChild_payment
+    }
+# end class SavingsTableSchedule
+
+
+class LenderAccountStatus(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, balance=None):
+        self.original_tagname_ = None
+        self.balance = balance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, LenderAccountStatus)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LenderAccountStatus.subclass:
+            return LenderAccountStatus.subclass(*args_, **kwargs_)
+        else:
+            return LenderAccountStatus(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_balance(self): return self.balance
+    def set_balance(self, balance): self.balance = balance
+    def hasContent_(self):
+        if (
+            self.balance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='LenderAccountStatus', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='LenderAccountStatus')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='LenderAccountStatus', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='LenderAccountStatus'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='LenderAccountStatus', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.balance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbalance>%s</%sbalance>%s' % (namespace_, self.gds_format_float(self.balance, input_name='balance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = LenderAccountStatus.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_balance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'balance')
+        self.balance = fval_
+    childBuilders_ = {
+        'balance': buildChild_balance
+    }
+# end class LenderAccountStatus
+
+
+class DiscountPoints(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterest2=None, costOfPoints=None, costOfPoints2=None, monthlySavings=None, result=None, breakEven=None, totalSavings=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
+        self.costOfPoints = costOfPoints
+        self.costOfPoints2 = costOfPoints2
+        self.monthlySavings = monthlySavings
+        self.result = result
+        self.breakEven = breakEven
+        self.totalSavings = totalSavings
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, DiscountPoints)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DiscountPoints.subclass:
+            return DiscountPoints.subclass(*args_, **kwargs_)
+        else:
+            return DiscountPoints(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterest2(self): return self.monthlyPrincipalAndInterest2
+    def set_monthlyPrincipalAndInterest2(self, monthlyPrincipalAndInterest2): self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
+    def get_costOfPoints(self): return self.costOfPoints
+    def set_costOfPoints(self, costOfPoints): self.costOfPoints = costOfPoints
+    def get_costOfPoints2(self): return self.costOfPoints2
+    def set_costOfPoints2(self, costOfPoints2): self.costOfPoints2 = costOfPoints2
+    def get_monthlySavings(self): return self.monthlySavings
+    def set_monthlySavings(self, monthlySavings): self.monthlySavings = monthlySavings
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_breakEven(self): return self.breakEven
+    def set_breakEven(self, breakEven): self.breakEven = breakEven
+    def get_totalSavings(self): return self.totalSavings
+    def set_totalSavings(self, totalSavings): self.totalSavings = totalSavings
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterest2 is not None or
+            self.costOfPoints is not None or
+            self.costOfPoints2 is not None or
+            self.monthlySavings is not None or
+            self.result is not None or
+            self.breakEven is not None or
+            self.totalSavings is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='DiscountPoints', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='DiscountPoints')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='DiscountPoints', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='DiscountPoints'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='DiscountPoints', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterest2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest2>%s</%smonthlyPrincipalAndInterest2>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest2, input_name='monthlyPrincipalAndInterest2'), namespace_, eol_))
+        if self.costOfPoints is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%scostOfPoints>%s</%scostOfPoints>%s' % (namespace_, self.gds_format_integer(self.costOfPoints, input_name='costOfPoints'), namespace_, eol_))
+        if self.costOfPoints2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%scostOfPoints2>%s</%scostOfPoints2>%s' % (namespace_, self.gds_format_integer(self.costOfPoints2, input_name='costOfPoints2'), namespace_, eol_))
+        if self.monthlySavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlySavings>%s</%smonthlySavings>%s' % (namespace_, self.gds_format_integer(self.monthlySavings, input_name='monthlySavings'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        if self.breakEven is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
+        if self.totalSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalSavings>%s</%stotalSavings>%s' % (namespace_, self.gds_format_integer(self.totalSavings, input_name='totalSavings'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = DiscountPoints.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterest2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest2')
+        self.monthlyPrincipalAndInterest2 = ival_
+    def buildChild_costOfPoints(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'costOfPoints')
+        self.costOfPoints = ival_
+    def buildChild_costOfPoints2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'costOfPoints2')
+        self.costOfPoints2 = ival_
+    def buildChild_monthlySavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlySavings')
+        self.monthlySavings = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_breakEven(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
+        self.breakEven = ival_
+    def buildChild_totalSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalSavings')
+        self.totalSavings = ival_
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterest2': buildChild_monthlyPrincipalAndInterest2,
+        'costOfPoints': buildChild_costOfPoints,
+        'costOfPoints2': buildChild_costOfPoints2,
+        'monthlySavings': buildChild_monthlySavings,
+        'result': buildChild_result,
+        'breakEven': buildChild_breakEven,
+        'totalSavings': buildChild_totalSavings
+    }
+# end class DiscountPoints
+
+
+class FixedVsAdjustableRate(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestAdjustable=None, fixedDiscountedPayments=None, adjustableDiscountedPayments=None, fixedRemainingPrincipal=None, adjustableRemainingPrincipal=None, fixedTaxSavings=None, adjustableTaxSavings=None, fixedTotalCost=None, adjustableTotalCost=None, result=None, amortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterestAdjustable = monthlyPrincipalAndInterestAdjustable
+        self.fixedDiscountedPayments = fixedDiscountedPayments
+        self.adjustableDiscountedPayments = adjustableDiscountedPayments
+        self.fixedRemainingPrincipal = fixedRemainingPrincipal
+        self.adjustableRemainingPrincipal = adjustableRemainingPrincipal
+        self.fixedTaxSavings = fixedTaxSavings
+        self.adjustableTaxSavings = adjustableTaxSavings
+        self.fixedTotalCost = fixedTotalCost
+        self.adjustableTotalCost = adjustableTotalCost
+        self.result = result
+        if amortizationSchedule is None:
+            self.amortizationSchedule = []
+        else:
+            self.amortizationSchedule = amortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, FixedVsAdjustableRate)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if FixedVsAdjustableRate.subclass:
+            return FixedVsAdjustableRate.subclass(*args_, **kwargs_)
+        else:
+            return FixedVsAdjustableRate(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterestAdjustable(self): return self.monthlyPrincipalAndInterestAdjustable
+    def set_monthlyPrincipalAndInterestAdjustable(self, monthlyPrincipalAndInterestAdjustable): self.monthlyPrincipalAndInterestAdjustable = monthlyPrincipalAndInterestAdjustable
+    def get_fixedDiscountedPayments(self): return self.fixedDiscountedPayments
+    def set_fixedDiscountedPayments(self, fixedDiscountedPayments): self.fixedDiscountedPayments = fixedDiscountedPayments
+    def get_adjustableDiscountedPayments(self): return self.adjustableDiscountedPayments
+    def set_adjustableDiscountedPayments(self, adjustableDiscountedPayments): self.adjustableDiscountedPayments = adjustableDiscountedPayments
+    def get_fixedRemainingPrincipal(self): return self.fixedRemainingPrincipal
+    def set_fixedRemainingPrincipal(self, fixedRemainingPrincipal): self.fixedRemainingPrincipal = fixedRemainingPrincipal
+    def get_adjustableRemainingPrincipal(self): return self.adjustableRemainingPrincipal
+    def set_adjustableRemainingPrincipal(self, adjustableRemainingPrincipal): self.adjustableRemainingPrincipal = adjustableRemainingPrincipal
+    def get_fixedTaxSavings(self): return self.fixedTaxSavings
+    def set_fixedTaxSavings(self, fixedTaxSavings): self.fixedTaxSavings = fixedTaxSavings
+    def get_adjustableTaxSavings(self): return self.adjustableTaxSavings
+    def set_adjustableTaxSavings(self, adjustableTaxSavings): self.adjustableTaxSavings = adjustableTaxSavings
+    def get_fixedTotalCost(self): return self.fixedTotalCost
+    def set_fixedTotalCost(self, fixedTotalCost): self.fixedTotalCost = fixedTotalCost
+    def get_adjustableTotalCost(self): return self.adjustableTotalCost
+    def set_adjustableTotalCost(self, adjustableTotalCost): self.adjustableTotalCost = adjustableTotalCost
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_amortizationSchedule(self): return self.amortizationSchedule
+    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
+    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
+    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
+    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterestAdjustable is not None or
+            self.fixedDiscountedPayments is not None or
+            self.adjustableDiscountedPayments is not None or
+            self.fixedRemainingPrincipal is not None or
+            self.adjustableRemainingPrincipal is not None or
+            self.fixedTaxSavings is not None or
+            self.adjustableTaxSavings is not None or
+            self.fixedTotalCost is not None or
+            self.adjustableTotalCost is not None or
+            self.result is not None or
+            self.amortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='FixedVsAdjustableRate', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='FixedVsAdjustableRate')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='FixedVsAdjustableRate', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='FixedVsAdjustableRate'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='FixedVsAdjustableRate', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterestAdjustable is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterestAdjustable>%s</%smonthlyPrincipalAndInterestAdjustable>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjustable, input_name='monthlyPrincipalAndInterestAdjustable'), namespace_, eol_))
+        if self.fixedDiscountedPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedDiscountedPayments>%s</%sfixedDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.fixedDiscountedPayments, input_name='fixedDiscountedPayments'), namespace_, eol_))
+        if self.adjustableDiscountedPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableDiscountedPayments>%s</%sadjustableDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.adjustableDiscountedPayments, input_name='adjustableDiscountedPayments'), namespace_, eol_))
+        if self.fixedRemainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedRemainingPrincipal>%s</%sfixedRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.fixedRemainingPrincipal, input_name='fixedRemainingPrincipal'), namespace_, eol_))
+        if self.adjustableRemainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableRemainingPrincipal>%s</%sadjustableRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.adjustableRemainingPrincipal, input_name='adjustableRemainingPrincipal'), namespace_, eol_))
+        if self.fixedTaxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedTaxSavings>%s</%sfixedTaxSavings>%s' % (namespace_, self.gds_format_integer(self.fixedTaxSavings, input_name='fixedTaxSavings'), namespace_, eol_))
+        if self.adjustableTaxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableTaxSavings>%s</%sadjustableTaxSavings>%s' % (namespace_, self.gds_format_integer(self.adjustableTaxSavings, input_name='adjustableTaxSavings'), namespace_, eol_))
+        if self.fixedTotalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedTotalCost>%s</%sfixedTotalCost>%s' % (namespace_, self.gds_format_integer(self.fixedTotalCost, input_name='fixedTotalCost'), namespace_, eol_))
+        if self.adjustableTotalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableTotalCost>%s</%sadjustableTotalCost>%s' % (namespace_, self.gds_format_integer(self.adjustableTotalCost, input_name='adjustableTotalCost'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        for amortizationSchedule_ in self.amortizationSchedule:
+            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = FixedVsAdjustableRate.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterestAdjustable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjustable')
+        self.monthlyPrincipalAndInterestAdjustable = ival_
+    def buildChild_fixedDiscountedPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedDiscountedPayments')
+        self.fixedDiscountedPayments = ival_
+    def buildChild_adjustableDiscountedPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableDiscountedPayments')
+        self.adjustableDiscountedPayments = ival_
+    def buildChild_fixedRemainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedRemainingPrincipal')
+        self.fixedRemainingPrincipal = ival_
+    def buildChild_adjustableRemainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableRemainingPrincipal')
+        self.adjustableRemainingPrincipal = ival_
+    def buildChild_fixedTaxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedTaxSavings')
+        self.fixedTaxSavings = ival_
+    def buildChild_adjustableTaxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableTaxSavings')
+        self.adjustableTaxSavings = ival_
+    def buildChild_fixedTotalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedTotalCost')
+        self.fixedTotalCost = ival_
+    def buildChild_adjustableTotalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableTotalCost')
+        self.adjustableTotalCost = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_amortizationSchedule(self, child_, node, nodeName_):
+        obj_ = FixedVsAdjustableRateAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.amortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'amortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterestAdjustable': buildChild_monthlyPrincipalAndInterestAdjustable,
+        'fixedDiscountedPayments': buildChild_fixedDiscountedPayments,
+        'adjustableDiscountedPayments': buildChild_adjustableDiscountedPayments,
+        'fixedRemainingPrincipal': buildChild_fixedRemainingPrincipal,
+        'adjustableRemainingPrincipal': buildChild_adjustableRemainingPrincipal,
+        'fixedTaxSavings': buildChild_fixedTaxSavings,
+        'adjustableTaxSavings': buildChild_adjustableTaxSavings,
+        'fixedTotalCost': buildChild_fixedTotalCost,
+        'adjustableTotalCost': buildChild_adjustableTotalCost,
+        'result': buildChild_result,
+        'amortizationSchedule': buildChild_amortizationSchedule
+    }
+# end class FixedVsAdjustableRate
+
+
+class FixedVsAdjustableRateAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, FixedVsAdjustableRateAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if FixedVsAdjustableRateAmortizationSchedule.subclass:
+            return FixedVsAdjustableRateAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return FixedVsAdjustableRateAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='FixedVsAdjustableRateAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = FixedVsAdjustableRateAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class FixedVsAdjustableRateAmortizationSchedule
+
+
+class AdjustableMortgage(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestAdjusted=None, maximumPayment=None, totalPayments=None, totalInterestPayments=None, amortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
+        self.maximumPayment = maximumPayment
+        self.totalPayments = totalPayments
+        self.totalInterestPayments = totalInterestPayments
+        if amortizationSchedule is None:
+            self.amortizationSchedule = []
+        else:
+            self.amortizationSchedule = amortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, AdjustableMortgage)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AdjustableMortgage.subclass:
+            return AdjustableMortgage.subclass(*args_, **kwargs_)
+        else:
+            return AdjustableMortgage(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterestAdjusted(self): return self.monthlyPrincipalAndInterestAdjusted
+    def set_monthlyPrincipalAndInterestAdjusted(self, monthlyPrincipalAndInterestAdjusted): self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
+    def get_maximumPayment(self): return self.maximumPayment
+    def set_maximumPayment(self, maximumPayment): self.maximumPayment = maximumPayment
+    def get_totalPayments(self): return self.totalPayments
+    def set_totalPayments(self, totalPayments): self.totalPayments = totalPayments
+    def get_totalInterestPayments(self): return self.totalInterestPayments
+    def set_totalInterestPayments(self, totalInterestPayments): self.totalInterestPayments = totalInterestPayments
+    def get_amortizationSchedule(self): return self.amortizationSchedule
+    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
+    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
+    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
+    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterestAdjusted is not None or
+            self.maximumPayment is not None or
+            self.totalPayments is not None or
+            self.totalInterestPayments is not None or
+            self.amortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='AdjustableMortgage', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AdjustableMortgage')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='AdjustableMortgage', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AdjustableMortgage'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='AdjustableMortgage', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterestAdjusted is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterestAdjusted>%s</%smonthlyPrincipalAndInterestAdjusted>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjusted, input_name='monthlyPrincipalAndInterestAdjusted'), namespace_, eol_))
+        if self.maximumPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smaximumPayment>%s</%smaximumPayment>%s' % (namespace_, self.gds_format_integer(self.maximumPayment, input_name='maximumPayment'), namespace_, eol_))
+        if self.totalPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalPayments>%s</%stotalPayments>%s' % (namespace_, self.gds_format_integer(self.totalPayments, input_name='totalPayments'), namespace_, eol_))
+        if self.totalInterestPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalInterestPayments>%s</%stotalInterestPayments>%s' % (namespace_, self.gds_format_integer(self.totalInterestPayments, input_name='totalInterestPayments'), namespace_, eol_))
+        for amortizationSchedule_ in self.amortizationSchedule:
+            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = AdjustableMortgage.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterestAdjusted(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjusted')
+        self.monthlyPrincipalAndInterestAdjusted = ival_
+    def buildChild_maximumPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'maximumPayment')
+        self.maximumPayment = ival_
+    def buildChild_totalPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalPayments')
+        self.totalPayments = ival_
+    def buildChild_totalInterestPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPayments')
+        self.totalInterestPayments = ival_
+    def buildChild_amortizationSchedule(self, child_, node, nodeName_):
+        obj_ = AdjustableMortgageAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.amortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'amortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterestAdjusted': buildChild_monthlyPrincipalAndInterestAdjusted,
+        'maximumPayment': buildChild_maximumPayment,
+        'totalPayments': buildChild_totalPayments,
+        'totalInterestPayments': buildChild_totalInterestPayments,
+        'amortizationSchedule': buildChild_amortizationSchedule
+    }
+# end class AdjustableMortgage
+
+
+class AdjustableMortgageAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, AdjustableMortgageAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AdjustableMortgageAmortizationSchedule.subclass:
+            return AdjustableMortgageAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return AdjustableMortgageAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='AdjustableMortgageAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AdjustableMortgageAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='AdjustableMortgageAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AdjustableMortgageAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='AdjustableMortgageAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = AdjustableMortgageAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType3.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class AdjustableMortgageAmortizationSchedule
+
+
+class MortgageTerms(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterest2=None, monthlyPrincipalAndInterest3=None, discountedCost=None, discountedCost2=None, discountedCost3=None, remainingPrincipal=None, remainingPrincipal2=None, remainingPrincipal3=None, taxSavings=None, taxSavings2=None, taxSavings3=None, totalCost=None, totalCost2=None, totalCost3=None, result=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
+        self.monthlyPrincipalAndInterest3 = monthlyPrincipalAndInterest3
+        self.discountedCost = discountedCost
+        self.discountedCost2 = discountedCost2
+        self.discountedCost3 = discountedCost3
+        self.remainingPrincipal = remainingPrincipal
+        self.remainingPrincipal2 = remainingPrincipal2
+        self.remainingPrincipal3 = remainingPrincipal3
+        self.taxSavings = taxSavings
+        self.taxSavings2 = taxSavings2
+        self.taxSavings3 = taxSavings3
+        self.totalCost = totalCost
+        self.totalCost2 = totalCost2
+        self.totalCost3 = totalCost3
+        self.result = result
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, MortgageTerms)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if MortgageTerms.subclass:
+            return MortgageTerms.subclass(*args_, **kwargs_)
+        else:
+            return MortgageTerms(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterest2(self): return self.monthlyPrincipalAndInterest2
+    def set_monthlyPrincipalAndInterest2(self, monthlyPrincipalAndInterest2): self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
+    def get_monthlyPrincipalAndInterest3(self): return self.monthlyPrincipalAndInterest3
+    def set_monthlyPrincipalAndInterest3(self, monthlyPrincipalAndInterest3): self.monthlyPrincipalAndInterest3 = monthlyPrincipalAndInterest3
+    def get_discountedCost(self): return self.discountedCost
+    def set_discountedCost(self, discountedCost): self.discountedCost = discountedCost
+    def get_discountedCost2(self): return self.discountedCost2
+    def set_discountedCost2(self, discountedCost2): self.discountedCost2 = discountedCost2
+    def get_discountedCost3(self): return self.discountedCost3
+    def set_discountedCost3(self, discountedCost3): self.discountedCost3 = discountedCost3
+    def get_remainingPrincipal(self): return self.remainingPrincipal
+    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
+    def get_remainingPrincipal2(self): return self.remainingPrincipal2
+    def set_remainingPrincipal2(self, remainingPrincipal2): self.remainingPrincipal2 = remainingPrincipal2
+    def get_remainingPrincipal3(self): return self.remainingPrincipal3
+    def set_remainingPrincipal3(self, remainingPrincipal3): self.remainingPrincipal3 = remainingPrincipal3
+    def get_taxSavings(self): return self.taxSavings
+    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
+    def get_taxSavings2(self): return self.taxSavings2
+    def set_taxSavings2(self, taxSavings2): self.taxSavings2 = taxSavings2
+    def get_taxSavings3(self): return self.taxSavings3
+    def set_taxSavings3(self, taxSavings3): self.taxSavings3 = taxSavings3
+    def get_totalCost(self): return self.totalCost
+    def set_totalCost(self, totalCost): self.totalCost = totalCost
+    def get_totalCost2(self): return self.totalCost2
+    def set_totalCost2(self, totalCost2): self.totalCost2 = totalCost2
+    def get_totalCost3(self): return self.totalCost3
+    def set_totalCost3(self, totalCost3): self.totalCost3 = totalCost3
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterest2 is not None or
+            self.monthlyPrincipalAndInterest3 is not None or
+            self.discountedCost is not None or
+            self.discountedCost2 is not None or
+            self.discountedCost3 is not None or
+            self.remainingPrincipal is not None or
+            self.remainingPrincipal2 is not None or
+            self.remainingPrincipal3 is not None or
+            self.taxSavings is not None or
+            self.taxSavings2 is not None or
+            self.taxSavings3 is not None or
+            self.totalCost is not None or
+            self.totalCost2 is not None or
+            self.totalCost3 is not None or
+            self.result is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='MortgageTerms', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageTerms')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageTerms', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageTerms'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='MortgageTerms', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterest2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest2>%s</%smonthlyPrincipalAndInterest2>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest2, input_name='monthlyPrincipalAndInterest2'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterest3 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest3>%s</%smonthlyPrincipalAndInterest3>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest3, input_name='monthlyPrincipalAndInterest3'), namespace_, eol_))
+        if self.discountedCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdiscountedCost>%s</%sdiscountedCost>%s' % (namespace_, self.gds_format_integer(self.discountedCost, input_name='discountedCost'), namespace_, eol_))
+        if self.discountedCost2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdiscountedCost2>%s</%sdiscountedCost2>%s' % (namespace_, self.gds_format_integer(self.discountedCost2, input_name='discountedCost2'), namespace_, eol_))
+        if self.discountedCost3 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdiscountedCost3>%s</%sdiscountedCost3>%s' % (namespace_, self.gds_format_integer(self.discountedCost3, input_name='discountedCost3'), namespace_, eol_))
+        if self.remainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
+        if self.remainingPrincipal2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sremainingPrincipal2>%s</%sremainingPrincipal2>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal2, input_name='remainingPrincipal2'), namespace_, eol_))
+        if self.remainingPrincipal3 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sremainingPrincipal3>%s</%sremainingPrincipal3>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal3, input_name='remainingPrincipal3'), namespace_, eol_))
+        if self.taxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
+        if self.taxSavings2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings2>%s</%staxSavings2>%s' % (namespace_, self.gds_format_integer(self.taxSavings2, input_name='taxSavings2'), namespace_, eol_))
+        if self.taxSavings3 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings3>%s</%staxSavings3>%s' % (namespace_, self.gds_format_integer(self.taxSavings3, input_name='taxSavings3'), namespace_, eol_))
+        if self.totalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
+        if self.totalCost2 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost2>%s</%stotalCost2>%s' % (namespace_, self.gds_format_integer(self.totalCost2, input_name='totalCost2'), namespace_, eol_))
+        if self.totalCost3 is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost3>%s</%stotalCost3>%s' % (namespace_, self.gds_format_integer(self.totalCost3, input_name='totalCost3'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = MortgageTerms.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterest2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest2')
+        self.monthlyPrincipalAndInterest2 = ival_
+    def buildChild_monthlyPrincipalAndInterest3(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest3')
+        self.monthlyPrincipalAndInterest3 = ival_
+    def buildChild_discountedCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'discountedCost')
+        self.discountedCost = ival_
+    def buildChild_discountedCost2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'discountedCost2')
+        self.discountedCost2 = ival_
+    def buildChild_discountedCost3(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'discountedCost3')
+        self.discountedCost3 = ival_
+    def buildChild_remainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
+        self.remainingPrincipal = ival_
+    def buildChild_remainingPrincipal2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal2')
+        self.remainingPrincipal2 = ival_
+    def buildChild_remainingPrincipal3(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal3')
+        self.remainingPrincipal3 = ival_
+    def buildChild_taxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
+        self.taxSavings = ival_
+    def buildChild_taxSavings2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings2')
+        self.taxSavings2 = ival_
+    def buildChild_taxSavings3(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings3')
+        self.taxSavings3 = ival_
+    def buildChild_totalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
+        self.totalCost = ival_
+    def buildChild_totalCost2(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost2')
+        self.totalCost2 = ival_
+    def buildChild_totalCost3(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost3')
+        self.totalCost3 = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterest2': buildChild_monthlyPrincipalAndInterest2,
+        'monthlyPrincipalAndInterest3': buildChild_monthlyPrincipalAndInterest3,
+        'discountedCost': buildChild_discountedCost,
+        'discountedCost2': buildChild_discountedCost2,
+        'discountedCost3': buildChild_discountedCost3,
+        'remainingPrincipal': buildChild_remainingPrincipal,
+        'remainingPrincipal2': buildChild_remainingPrincipal2,
+        'remainingPrincipal3': buildChild_remainingPrincipal3,
+        'taxSavings': buildChild_taxSavings,
+        'taxSavings2': buildChild_taxSavings2,
+        'taxSavings3': buildChild_taxSavings3,
+        'totalCost': buildChild_totalCost,
+        'totalCost2': buildChild_totalCost2,
+        'totalCost3': buildChild_totalCost3,
+        'result': buildChild_result
+    }
+# end class MortgageTerms
+
+
+class BiWeeklyPayment(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, interestSavings=None, payOffInYears=None, result=None, amortizationSchedule=None, biWeeklyAmortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.interestSavings = interestSavings
+        self.payOffInYears = payOffInYears
+        self.result = result
+        if amortizationSchedule is None:
+            self.amortizationSchedule = []
+        else:
+            self.amortizationSchedule = amortizationSchedule
+        if biWeeklyAmortizationSchedule is None:
+            self.biWeeklyAmortizationSchedule = []
+        else:
+            self.biWeeklyAmortizationSchedule = biWeeklyAmortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, BiWeeklyPayment)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if BiWeeklyPayment.subclass:
+            return BiWeeklyPayment.subclass(*args_, **kwargs_)
+        else:
+            return BiWeeklyPayment(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_interestSavings(self): return self.interestSavings
+    def set_interestSavings(self, interestSavings): self.interestSavings = interestSavings
+    def get_payOffInYears(self): return self.payOffInYears
+    def set_payOffInYears(self, payOffInYears): self.payOffInYears = payOffInYears
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_amortizationSchedule(self): return self.amortizationSchedule
+    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
+    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
+    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
+    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def get_biWeeklyAmortizationSchedule(self): return self.biWeeklyAmortizationSchedule
+    def set_biWeeklyAmortizationSchedule(self, biWeeklyAmortizationSchedule): self.biWeeklyAmortizationSchedule = biWeeklyAmortizationSchedule
+    def add_biWeeklyAmortizationSchedule(self, value): self.biWeeklyAmortizationSchedule.append(value)
+    def insert_biWeeklyAmortizationSchedule_at(self, index, value): self.biWeeklyAmortizationSchedule.insert(index, value)
+    def replace_biWeeklyAmortizationSchedule_at(self, index, value): self.biWeeklyAmortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.interestSavings is not None or
+            self.payOffInYears is not None or
+            self.result is not None or
+            self.amortizationSchedule or
+            self.biWeeklyAmortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='BiWeeklyPayment', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPayment')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPayment', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPayment'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPayment', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.interestSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterestSavings>%s</%sinterestSavings>%s' % (namespace_, self.gds_format_integer(self.interestSavings, input_name='interestSavings'), namespace_, eol_))
+        if self.payOffInYears is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayOffInYears>%s</%spayOffInYears>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.payOffInYears), input_name='payOffInYears')), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        for amortizationSchedule_ in self.amortizationSchedule:
+            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
+        for biWeeklyAmortizationSchedule_ in self.biWeeklyAmortizationSchedule:
+            biWeeklyAmortizationSchedule_.export(outfile, level, namespace_, name_='biWeeklyAmortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = BiWeeklyPayment.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_interestSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interestSavings')
+        self.interestSavings = ival_
+    def buildChild_payOffInYears(self, child_, node, nodeName_):
+        payOffInYears_ = child_.text
+        payOffInYears_ = self.gds_validate_string(payOffInYears_, node, 'payOffInYears')
+        self.payOffInYears = payOffInYears_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_amortizationSchedule(self, child_, node, nodeName_):
+        obj_ = BiWeeklyPaymentAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.amortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'amortizationSchedule'
+    def buildChild_biWeeklyAmortizationSchedule(self, child_, node, nodeName_):
+        obj_ = BiWeeklyPaymentAmortizationSchedule2.factory()
+        obj_.build(child_)
+        self.biWeeklyAmortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'biWeeklyAmortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'interestSavings': buildChild_interestSavings,
+        'payOffInYears': buildChild_payOffInYears,
+        'result': buildChild_result,
+        'amortizationSchedule': buildChild_amortizationSchedule,
+        'biWeeklyAmortizationSchedule': buildChild_biWeeklyAmortizationSchedule
+    }
+# end class BiWeeklyPayment
+
+
+class BiWeeklyPaymentAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, BiWeeklyPaymentAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if BiWeeklyPaymentAmortizationSchedule.subclass:
+            return BiWeeklyPaymentAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return BiWeeklyPaymentAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPaymentAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = BiWeeklyPaymentAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType4.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class BiWeeklyPaymentAmortizationSchedule
+
+
+class BiWeeklyPaymentAmortizationSchedule2(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, BiWeeklyPaymentAmortizationSchedule2)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if BiWeeklyPaymentAmortizationSchedule2.subclass:
+            return BiWeeklyPaymentAmortizationSchedule2.subclass(*args_, **kwargs_)
+        else:
+            return BiWeeklyPaymentAmortizationSchedule2(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPaymentAmortizationSchedule2')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = BiWeeklyPaymentAmortizationSchedule2.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType5.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class BiWeeklyPaymentAmortizationSchedule2
+
+
+class TaxSavings(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, taxSavings=None, result=None, amortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.taxSavings = taxSavings
+        self.result = result
+        if amortizationSchedule is None:
+            self.amortizationSchedule = []
+        else:
+            self.amortizationSchedule = amortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, TaxSavings)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if TaxSavings.subclass:
+            return TaxSavings.subclass(*args_, **kwargs_)
+        else:
+            return TaxSavings(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_taxSavings(self): return self.taxSavings
+    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_amortizationSchedule(self): return self.amortizationSchedule
+    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
+    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
+    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
+    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.taxSavings is not None or
+            self.result is not None or
+            self.amortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='TaxSavings', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='TaxSavings')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='TaxSavings', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TaxSavings'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='TaxSavings', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.taxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        for amortizationSchedule_ in self.amortizationSchedule:
+            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = TaxSavings.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_taxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
+        self.taxSavings = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_amortizationSchedule(self, child_, node, nodeName_):
+        obj_ = TaxSavingsAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.amortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'amortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'taxSavings': buildChild_taxSavings,
+        'result': buildChild_result,
+        'amortizationSchedule': buildChild_amortizationSchedule
+    }
+# end class TaxSavings
+
+
+class TaxSavingsAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, TaxSavingsAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if TaxSavingsAmortizationSchedule.subclass:
+            return TaxSavingsAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return TaxSavingsAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='TaxSavingsAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='TaxSavingsAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='TaxSavingsAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TaxSavingsAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='TaxSavingsAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = TaxSavingsAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType6.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class TaxSavingsAmortizationSchedule
+
+
+class InterstOnlyVsTraditional(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestInterestOnly=None, monthlyPrincipalAndInterestAdjusted=None, totalInterestPayments=None, totalInterestPaymentsInterestOnly=None, result=None, AmortizationSchedule=None, InterestOnlyAmortizationSchedule=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterestInterestOnly = monthlyPrincipalAndInterestInterestOnly
+        self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
+        self.totalInterestPayments = totalInterestPayments
+        self.totalInterestPaymentsInterestOnly = totalInterestPaymentsInterestOnly
+        self.result = result
+        if AmortizationSchedule is None:
+            self.AmortizationSchedule = []
+        else:
+            self.AmortizationSchedule = AmortizationSchedule
+        if InterestOnlyAmortizationSchedule is None:
+            self.InterestOnlyAmortizationSchedule = []
+        else:
+            self.InterestOnlyAmortizationSchedule = InterestOnlyAmortizationSchedule
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, InterstOnlyVsTraditional)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if InterstOnlyVsTraditional.subclass:
+            return InterstOnlyVsTraditional.subclass(*args_, **kwargs_)
+        else:
+            return InterstOnlyVsTraditional(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterestInterestOnly(self): return self.monthlyPrincipalAndInterestInterestOnly
+    def set_monthlyPrincipalAndInterestInterestOnly(self, monthlyPrincipalAndInterestInterestOnly): self.monthlyPrincipalAndInterestInterestOnly = monthlyPrincipalAndInterestInterestOnly
+    def get_monthlyPrincipalAndInterestAdjusted(self): return self.monthlyPrincipalAndInterestAdjusted
+    def set_monthlyPrincipalAndInterestAdjusted(self, monthlyPrincipalAndInterestAdjusted): self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
+    def get_totalInterestPayments(self): return self.totalInterestPayments
+    def set_totalInterestPayments(self, totalInterestPayments): self.totalInterestPayments = totalInterestPayments
+    def get_totalInterestPaymentsInterestOnly(self): return self.totalInterestPaymentsInterestOnly
+    def set_totalInterestPaymentsInterestOnly(self, totalInterestPaymentsInterestOnly): self.totalInterestPaymentsInterestOnly = totalInterestPaymentsInterestOnly
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_AmortizationSchedule(self): return self.AmortizationSchedule
+    def set_AmortizationSchedule(self, AmortizationSchedule): self.AmortizationSchedule = AmortizationSchedule
+    def add_AmortizationSchedule(self, value): self.AmortizationSchedule.append(value)
+    def insert_AmortizationSchedule_at(self, index, value): self.AmortizationSchedule.insert(index, value)
+    def replace_AmortizationSchedule_at(self, index, value): self.AmortizationSchedule[index] = value
+    def get_InterestOnlyAmortizationSchedule(self): return self.InterestOnlyAmortizationSchedule
+    def set_InterestOnlyAmortizationSchedule(self, InterestOnlyAmortizationSchedule): self.InterestOnlyAmortizationSchedule = InterestOnlyAmortizationSchedule
+    def add_InterestOnlyAmortizationSchedule(self, value): self.InterestOnlyAmortizationSchedule.append(value)
+    def insert_InterestOnlyAmortizationSchedule_at(self, index, value): self.InterestOnlyAmortizationSchedule.insert(index, value)
+    def replace_InterestOnlyAmortizationSchedule_at(self, index, value): self.InterestOnlyAmortizationSchedule[index] = value
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterestInterestOnly is not None or
+            self.monthlyPrincipalAndInterestAdjusted is not None or
+            self.totalInterestPayments is not None or
+            self.totalInterestPaymentsInterestOnly is not None or
+            self.result is not None or
+            self.AmortizationSchedule or
+            self.InterestOnlyAmortizationSchedule
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='InterstOnlyVsTraditional', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='InterstOnlyVsTraditional')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='InterstOnlyVsTraditional', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='InterstOnlyVsTraditional'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='InterstOnlyVsTraditional', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterestInterestOnly is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterestInterestOnly>%s</%smonthlyPrincipalAndInterestInterestOnly>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestInterestOnly, input_name='monthlyPrincipalAndInterestInterestOnly'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterestAdjusted is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterestAdjusted>%s</%smonthlyPrincipalAndInterestAdjusted>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjusted, input_name='monthlyPrincipalAndInterestAdjusted'), namespace_, eol_))
+        if self.totalInterestPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalInterestPayments>%s</%stotalInterestPayments>%s' % (namespace_, self.gds_format_integer(self.totalInterestPayments, input_name='totalInterestPayments'), namespace_, eol_))
+        if self.totalInterestPaymentsInterestOnly is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalInterestPaymentsInterestOnly>%s</%stotalInterestPaymentsInterestOnly>%s' % (namespace_, self.gds_format_integer(self.totalInterestPaymentsInterestOnly, input_name='totalInterestPaymentsInterestOnly'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        for AmortizationSchedule_ in self.AmortizationSchedule:
+            AmortizationSchedule_.export(outfile, level, namespace_, name_='AmortizationSchedule', pretty_print=pretty_print)
+        for InterestOnlyAmortizationSchedule_ in self.InterestOnlyAmortizationSchedule:
+            InterestOnlyAmortizationSchedule_.export(outfile, level, namespace_, name_='InterestOnlyAmortizationSchedule', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = InterstOnlyVsTraditional.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterestInterestOnly(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestInterestOnly')
+        self.monthlyPrincipalAndInterestInterestOnly = ival_
+    def buildChild_monthlyPrincipalAndInterestAdjusted(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjusted')
+        self.monthlyPrincipalAndInterestAdjusted = ival_
+    def buildChild_totalInterestPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPayments')
+        self.totalInterestPayments = ival_
+    def buildChild_totalInterestPaymentsInterestOnly(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPaymentsInterestOnly')
+        self.totalInterestPaymentsInterestOnly = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_AmortizationSchedule(self, child_, node, nodeName_):
+        obj_ = annualAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.AmortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'AmortizationSchedule'
+    def buildChild_InterestOnlyAmortizationSchedule(self, child_, node, nodeName_):
+        obj_ = annualInterestOnlyAmortizationSchedule.factory()
+        obj_.build(child_)
+        self.InterestOnlyAmortizationSchedule.append(obj_)
+        obj_.original_tagname_ = 'InterestOnlyAmortizationSchedule'
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterestInterestOnly': buildChild_monthlyPrincipalAndInterestInterestOnly,
+        'monthlyPrincipalAndInterestAdjusted': buildChild_monthlyPrincipalAndInterestAdjusted,
+        'totalInterestPayments': buildChild_totalInterestPayments,
+        'totalInterestPaymentsInterestOnly': buildChild_totalInterestPaymentsInterestOnly,
+        'result': buildChild_result,
+        'AmortizationSchedule': buildChild_AmortizationSchedule,
+        'InterestOnlyAmortizationSchedule': buildChild_InterestOnlyAmortizationSchedule
+    }
+# end class InterstOnlyVsTraditional
+
+
+class annualAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, annualAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if annualAmortizationSchedule.subclass:
+            return annualAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return annualAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='annualAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='annualAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='annualAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='annualAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='annualAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = annualAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType7.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class annualAmortizationSchedule
+
+
+class annualInterestOnlyAmortizationSchedule(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, frequency=None, Payment=None):
+        self.original_tagname_ = None
+        self.frequency = _cast(None, frequency)
+        if Payment is None:
+            self.Payment = []
+        else:
+            self.Payment = Payment
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, annualInterestOnlyAmortizationSchedule)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if annualInterestOnlyAmortizationSchedule.subclass:
+            return annualInterestOnlyAmortizationSchedule.subclass(*args_, **kwargs_)
+        else:
+            return annualInterestOnlyAmortizationSchedule(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_Payment(self): return self.Payment
+    def set_Payment(self, Payment): self.Payment = Payment
+    def add_Payment(self, value): self.Payment.append(value)
+    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
+    def replace_Payment_at(self, index, value): self.Payment[index] = value
+    def get_frequency(self): return self.frequency
+    def set_frequency(self, frequency): self.frequency = frequency
+    def hasContent_(self):
+        if (
+            self.Payment
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='annualInterestOnlyAmortizationSchedule', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='annualInterestOnlyAmortizationSchedule')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='annualInterestOnlyAmortizationSchedule', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='annualInterestOnlyAmortizationSchedule'):
+        if self.frequency is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
+    def exportChildren(self, outfile, level, namespace_='', name_='annualInterestOnlyAmortizationSchedule', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for Payment_ in self.Payment:
+            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_('frequency', node)
+        if value is not None and 'frequency' not in already_processed:
+            already_processed.add('frequency')
+            self.frequency = value
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = annualInterestOnlyAmortizationSchedule.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_Payment(self, child_, node, nodeName_):
+        obj_ = PaymentType8.factory()
+        obj_.build(child_)
+        self.Payment.append(obj_)
+        obj_.original_tagname_ = 'Payment'
+    childBuilders_ = {
+        'Payment': buildChild_Payment
+    }
+# end class annualInterestOnlyAmortizationSchedule
+
+
+class NoCostVsTraditional(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestNoCost=None, discountedPayments=None, noCostDiscountedPayments=None, remainingPrincipal=None, noCostRemainingPrincipal=None, taxSavings=None, noCostTaxSavings=None, paidAtClose=None, totalCost=None, noCostTotalCost=None, result=None):
+        self.original_tagname_ = None
+        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+        self.monthlyPrincipalAndInterestNoCost = monthlyPrincipalAndInterestNoCost
+        self.discountedPayments = discountedPayments
+        self.noCostDiscountedPayments = noCostDiscountedPayments
+        self.remainingPrincipal = remainingPrincipal
+        self.noCostRemainingPrincipal = noCostRemainingPrincipal
+        self.taxSavings = taxSavings
+        self.noCostTaxSavings = noCostTaxSavings
+        self.paidAtClose = paidAtClose
+        self.totalCost = totalCost
+        self.noCostTotalCost = noCostTotalCost
+        self.result = result
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, NoCostVsTraditional)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NoCostVsTraditional.subclass:
+            return NoCostVsTraditional.subclass(*args_, **kwargs_)
+        else:
+            return NoCostVsTraditional(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
+    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
+    def get_monthlyPrincipalAndInterestNoCost(self): return self.monthlyPrincipalAndInterestNoCost
+    def set_monthlyPrincipalAndInterestNoCost(self, monthlyPrincipalAndInterestNoCost): self.monthlyPrincipalAndInterestNoCost = monthlyPrincipalAndInterestNoCost
+    def get_discountedPayments(self): return self.discountedPayments
+    def set_discountedPayments(self, discountedPayments): self.discountedPayments = discountedPayments
+    def get_noCostDiscountedPayments(self): return self.noCostDiscountedPayments
+    def set_noCostDiscountedPayments(self, noCostDiscountedPayments): self.noCostDiscountedPayments = noCostDiscountedPayments
+    def get_remainingPrincipal(self): return self.remainingPrincipal
+    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
+    def get_noCostRemainingPrincipal(self): return self.noCostRemainingPrincipal
+    def set_noCostRemainingPrincipal(self, noCostRemainingPrincipal): self.noCostRemainingPrincipal = noCostRemainingPrincipal
+    def get_taxSavings(self): return self.taxSavings
+    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
+    def get_noCostTaxSavings(self): return self.noCostTaxSavings
+    def set_noCostTaxSavings(self, noCostTaxSavings): self.noCostTaxSavings = noCostTaxSavings
+    def get_paidAtClose(self): return self.paidAtClose
+    def set_paidAtClose(self, paidAtClose): self.paidAtClose = paidAtClose
+    def get_totalCost(self): return self.totalCost
+    def set_totalCost(self, totalCost): self.totalCost = totalCost
+    def get_noCostTotalCost(self): return self.noCostTotalCost
+    def set_noCostTotalCost(self, noCostTotalCost): self.noCostTotalCost = noCostTotalCost
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def hasContent_(self):
+        if (
+            self.monthlyPrincipalAndInterest is not None or
+            self.monthlyPrincipalAndInterestNoCost is not None or
+            self.discountedPayments is not None or
+            self.noCostDiscountedPayments is not None or
+            self.remainingPrincipal is not None or
+            self.noCostRemainingPrincipal is not None or
+            self.taxSavings is not None or
+            self.noCostTaxSavings is not None or
+            self.paidAtClose is not None or
+            self.totalCost is not None or
+            self.noCostTotalCost is not None or
+            self.result is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='NoCostVsTraditional', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='NoCostVsTraditional')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='NoCostVsTraditional', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='NoCostVsTraditional'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='NoCostVsTraditional', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.monthlyPrincipalAndInterest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
+        if self.monthlyPrincipalAndInterestNoCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlyPrincipalAndInterestNoCost>%s</%smonthlyPrincipalAndInterestNoCost>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestNoCost, input_name='monthlyPrincipalAndInterestNoCost'), namespace_, eol_))
+        if self.discountedPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdiscountedPayments>%s</%sdiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.discountedPayments, input_name='discountedPayments'), namespace_, eol_))
+        if self.noCostDiscountedPayments is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%snoCostDiscountedPayments>%s</%snoCostDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.noCostDiscountedPayments, input_name='noCostDiscountedPayments'), namespace_, eol_))
+        if self.remainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
+        if self.noCostRemainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%snoCostRemainingPrincipal>%s</%snoCostRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.noCostRemainingPrincipal, input_name='noCostRemainingPrincipal'), namespace_, eol_))
+        if self.taxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
+        if self.noCostTaxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%snoCostTaxSavings>%s</%snoCostTaxSavings>%s' % (namespace_, self.gds_format_integer(self.noCostTaxSavings, input_name='noCostTaxSavings'), namespace_, eol_))
+        if self.paidAtClose is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spaidAtClose>%s</%spaidAtClose>%s' % (namespace_, self.gds_format_integer(self.paidAtClose, input_name='paidAtClose'), namespace_, eol_))
+        if self.totalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
+        if self.noCostTotalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%snoCostTotalCost>%s</%snoCostTotalCost>%s' % (namespace_, self.gds_format_integer(self.noCostTotalCost, input_name='noCostTotalCost'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = NoCostVsTraditional.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_monthlyPrincipalAndInterest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
+        self.monthlyPrincipalAndInterest = ival_
+    def buildChild_monthlyPrincipalAndInterestNoCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestNoCost')
+        self.monthlyPrincipalAndInterestNoCost = ival_
+    def buildChild_discountedPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'discountedPayments')
+        self.discountedPayments = ival_
+    def buildChild_noCostDiscountedPayments(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'noCostDiscountedPayments')
+        self.noCostDiscountedPayments = ival_
+    def buildChild_remainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
+        self.remainingPrincipal = ival_
+    def buildChild_noCostRemainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'noCostRemainingPrincipal')
+        self.noCostRemainingPrincipal = ival_
+    def buildChild_taxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
+        self.taxSavings = ival_
+    def buildChild_noCostTaxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'noCostTaxSavings')
+        self.noCostTaxSavings = ival_
+    def buildChild_paidAtClose(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'paidAtClose')
+        self.paidAtClose = ival_
+    def buildChild_totalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
+        self.totalCost = ival_
+    def buildChild_noCostTotalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'noCostTotalCost')
+        self.noCostTotalCost = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    childBuilders_ = {
+        'monthlyPrincipalAndInterest': buildChild_monthlyPrincipalAndInterest,
+        'monthlyPrincipalAndInterestNoCost': buildChild_monthlyPrincipalAndInterestNoCost,
+        'discountedPayments': buildChild_discountedPayments,
+        'noCostDiscountedPayments': buildChild_noCostDiscountedPayments,
+        'remainingPrincipal': buildChild_remainingPrincipal,
+        'noCostRemainingPrincipal': buildChild_noCostRemainingPrincipal,
+        'taxSavings': buildChild_taxSavings,
+        'noCostTaxSavings': buildChild_noCostTaxSavings,
+        'paidAtClose': buildChild_paidAtClose,
+        'totalCost': buildChild_totalCost,
+        'noCostTotalCost': buildChild_noCostTotalCost,
+        'result': buildChild_result
+    }
+# end class NoCostVsTraditional
+
+
+class Heloc(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, loanAmount=None, result=None, loanAmountPairs=None):
+        self.original_tagname_ = None
+        self.loanAmount = loanAmount
+        self.result = result
+        if loanAmountPairs is None:
+            self.loanAmountPairs = []
+        else:
+            self.loanAmountPairs = loanAmountPairs
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, Heloc)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if Heloc.subclass:
+            return Heloc.subclass(*args_, **kwargs_)
+        else:
+            return Heloc(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_loanAmount(self): return self.loanAmount
+    def set_loanAmount(self, loanAmount): self.loanAmount = loanAmount
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_loanAmountPairs(self): return self.loanAmountPairs
+    def set_loanAmountPairs(self, loanAmountPairs): self.loanAmountPairs = loanAmountPairs
+    def add_loanAmountPairs(self, value): self.loanAmountPairs.append(value)
+    def insert_loanAmountPairs_at(self, index, value): self.loanAmountPairs.insert(index, value)
+    def replace_loanAmountPairs_at(self, index, value): self.loanAmountPairs[index] = value
+    def hasContent_(self):
+        if (
+            self.loanAmount is not None or
+            self.result is not None or
+            self.loanAmountPairs
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='Heloc', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Heloc')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='Heloc', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Heloc'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='Heloc', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.loanAmount is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sloanAmount>%s</%sloanAmount>%s' % (namespace_, self.gds_format_integer(self.loanAmount, input_name='loanAmount'), namespace_, eol_))
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        for loanAmountPairs_ in self.loanAmountPairs:
+            loanAmountPairs_.export(outfile, level, namespace_, name_='loanAmountPairs', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = Heloc.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_loanAmount(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'loanAmount')
+        self.loanAmount = ival_
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_loanAmountPairs(self, child_, node, nodeName_):
+        obj_ = loanAmountPairs.factory()
+        obj_.build(child_)
+        self.loanAmountPairs.append(obj_)
+        obj_.original_tagname_ = 'loanAmountPairs'
+    childBuilders_ = {
+        'loanAmount': buildChild_loanAmount,
+        'result': buildChild_result,
+        'loanAmountPairs': buildChild_loanAmountPairs
+    }
+# end class Heloc
+
+
+class loanAmountPairs(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, pairs=None):
+        self.original_tagname_ = None
+        if pairs is None:
+            self.pairs = []
+        else:
+            self.pairs = pairs
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, loanAmountPairs)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if loanAmountPairs.subclass:
+            return loanAmountPairs.subclass(*args_, **kwargs_)
+        else:
+            return loanAmountPairs(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_pairs(self): return self.pairs
+    def set_pairs(self, pairs): self.pairs = pairs
+    def add_pairs(self, value): self.pairs.append(value)
+    def insert_pairs_at(self, index, value): self.pairs.insert(index, value)
+    def replace_pairs_at(self, index, value): self.pairs[index] = value
+    def hasContent_(self):
+        if (
+            self.pairs
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='loanAmountPairs', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='loanAmountPairs')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='loanAmountPairs', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='loanAmountPairs'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='loanAmountPairs', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for pairs_ in self.pairs:
+            pairs_.export(outfile, level, namespace_, name_='pairs', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = loanAmountPairs.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_pairs(self, child_, node, nodeName_):
+        obj_ = pairsType.factory()
+        obj_.build(child_)
+        self.pairs.append(obj_)
+        obj_.original_tagname_ = 'pairs'
+    childBuilders_ = {
+        'pairs': buildChild_pairs
+    }
+# end class loanAmountPairs
+
+
+class RentVsBuy(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, result=None, breakEven=None, totalSavings=None, downPayment=None, closingCosts=None, rentDeposit=None, rentDepositReturn=None, rentBrokerFee=None, yearlyCostsTable=None, cumulativeYearlyCostsTable=None):
+        self.original_tagname_ = None
+        self.result = result
+        self.breakEven = breakEven
+        self.totalSavings = totalSavings
+        self.downPayment = downPayment
+        self.closingCosts = closingCosts
+        self.rentDeposit = rentDeposit
+        self.rentDepositReturn = rentDepositReturn
+        self.rentBrokerFee = rentBrokerFee
+        if yearlyCostsTable is None:
+            self.yearlyCostsTable = []
+        else:
+            self.yearlyCostsTable = yearlyCostsTable
+        if cumulativeYearlyCostsTable is None:
+            self.cumulativeYearlyCostsTable = []
+        else:
+            self.cumulativeYearlyCostsTable = cumulativeYearlyCostsTable
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, RentVsBuy)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if RentVsBuy.subclass:
+            return RentVsBuy.subclass(*args_, **kwargs_)
+        else:
+            return RentVsBuy(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_breakEven(self): return self.breakEven
+    def set_breakEven(self, breakEven): self.breakEven = breakEven
+    def get_totalSavings(self): return self.totalSavings
+    def set_totalSavings(self, totalSavings): self.totalSavings = totalSavings
+    def get_downPayment(self): return self.downPayment
+    def set_downPayment(self, downPayment): self.downPayment = downPayment
+    def get_closingCosts(self): return self.closingCosts
+    def set_closingCosts(self, closingCosts): self.closingCosts = closingCosts
+    def get_rentDeposit(self): return self.rentDeposit
+    def set_rentDeposit(self, rentDeposit): self.rentDeposit = rentDeposit
+    def get_rentDepositReturn(self): return self.rentDepositReturn
+    def set_rentDepositReturn(self, rentDepositReturn): self.rentDepositReturn = rentDepositReturn
+    def get_rentBrokerFee(self): return self.rentBrokerFee
+    def set_rentBrokerFee(self, rentBrokerFee): self.rentBrokerFee = rentBrokerFee
+    def get_yearlyCostsTable(self): return self.yearlyCostsTable
+    def set_yearlyCostsTable(self, yearlyCostsTable): self.yearlyCostsTable = yearlyCostsTable
+    def add_yearlyCostsTable(self, value): self.yearlyCostsTable.append(value)
+    def insert_yearlyCostsTable_at(self, index, value): self.yearlyCostsTable.insert(index, value)
+    def replace_yearlyCostsTable_at(self, index, value): self.yearlyCostsTable[index] = value
+    def get_cumulativeYearlyCostsTable(self): return self.cumulativeYearlyCostsTable
+    def set_cumulativeYearlyCostsTable(self, cumulativeYearlyCostsTable): self.cumulativeYearlyCostsTable = cumulativeYearlyCostsTable
+    def add_cumulativeYearlyCostsTable(self, value): self.cumulativeYearlyCostsTable.append(value)
+    def insert_cumulativeYearlyCostsTable_at(self, index, value): self.cumulativeYearlyCostsTable.insert(index, value)
+    def replace_cumulativeYearlyCostsTable_at(self, index, value): self.cumulativeYearlyCostsTable[index] = value
+    def hasContent_(self):
+        if (
+            self.result is not None or
+            self.breakEven is not None or
+            self.totalSavings is not None or
+            self.downPayment is not None or
+            self.closingCosts is not None or
+            self.rentDeposit is not None or
+            self.rentDepositReturn is not None or
+            self.rentBrokerFee is not None or
+            self.yearlyCostsTable or
+            self.cumulativeYearlyCostsTable
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='RentVsBuy', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='RentVsBuy')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='RentVsBuy', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='RentVsBuy'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='RentVsBuy', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        if self.breakEven is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
+        if self.totalSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalSavings>%s</%stotalSavings>%s' % (namespace_, self.gds_format_integer(self.totalSavings, input_name='totalSavings'), namespace_, eol_))
+        if self.downPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
+        if self.closingCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sclosingCosts>%s</%sclosingCosts>%s' % (namespace_, self.gds_format_integer(self.closingCosts, input_name='closingCosts'), namespace_, eol_))
+        if self.rentDeposit is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srentDeposit>%s</%srentDeposit>%s' % (namespace_, self.gds_format_integer(self.rentDeposit, input_name='rentDeposit'), namespace_, eol_))
+        if self.rentDepositReturn is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srentDepositReturn>%s</%srentDepositReturn>%s' % (namespace_, self.gds_format_integer(self.rentDepositReturn, input_name='rentDepositReturn'), namespace_, eol_))
+        if self.rentBrokerFee is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srentBrokerFee>%s</%srentBrokerFee>%s' % (namespace_, self.gds_format_integer(self.rentBrokerFee, input_name='rentBrokerFee'), namespace_, eol_))
+        for yearlyCostsTable_ in self.yearlyCostsTable:
+            yearlyCostsTable_.export(outfile, level, namespace_, name_='yearlyCostsTable', pretty_print=pretty_print)
+        for cumulativeYearlyCostsTable_ in self.cumulativeYearlyCostsTable:
+            cumulativeYearlyCostsTable_.export(outfile, level, namespace_, name_='cumulativeYearlyCostsTable', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = RentVsBuy.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_breakEven(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
+        self.breakEven = ival_
+    def buildChild_totalSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalSavings')
+        self.totalSavings = ival_
+    def buildChild_downPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
+        self.downPayment = ival_
+    def buildChild_closingCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'closingCosts')
+        self.closingCosts = ival_
+    def buildChild_rentDeposit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rentDeposit')
+        self.rentDeposit = ival_
+    def buildChild_rentDepositReturn(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rentDepositReturn')
+        self.rentDepositReturn = ival_
+    def buildChild_rentBrokerFee(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rentBrokerFee')
+        self.rentBrokerFee = ival_
+    def buildChild_yearlyCostsTable(self, child_, node, nodeName_):
+        obj_ = yearlyCostsTable.factory()
+        obj_.build(child_)
+        self.yearlyCostsTable.append(obj_)
+        obj_.original_tagname_ = 'yearlyCostsTable'
+    def buildChild_cumulativeYearlyCostsTable(self, child_, node, nodeName_):
+        obj_ = cumulativeYearlyCostsTable.factory()
+        obj_.build(child_)
+        self.cumulativeYearlyCostsTable.append(obj_)
+        obj_.original_tagname_ = 'cumulativeYearlyCostsTable'
+    childBuilders_ = {
+        'result': buildChild_result,
+        'breakEven': buildChild_breakEven,
+        'totalSavings': buildChild_totalSavings,
+        'downPayment': buildChild_downPayment,
+        'closingCosts': buildChild_closingCosts,
+        'rentDeposit': buildChild_rentDeposit,
+        'rentDepositReturn': buildChild_rentDepositReturn,
+        'rentBrokerFee': buildChild_rentBrokerFee,
+        'yearlyCostsTable': buildChild_yearlyCostsTable,
+        'cumulativeYearlyCostsTable': buildChild_cumulativeYearlyCostsTable
+    }
+# end class RentVsBuy
+
+
+class yearlyCostsTable(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, year=None, buyingBlock=None, rentingBlock=None):
+        self.original_tagname_ = None
+        self.year = year
+        if buyingBlock is None:
+            self.buyingBlock = []
+        else:
+            self.buyingBlock = buyingBlock
+        if rentingBlock is None:
+            self.rentingBlock = []
+        else:
+            self.rentingBlock = rentingBlock
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, yearlyCostsTable)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if yearlyCostsTable.subclass:
+            return yearlyCostsTable.subclass(*args_, **kwargs_)
+        else:
+            return yearlyCostsTable(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_year(self): return self.year
+    def set_year(self, year): self.year = year
+    def get_buyingBlock(self): return self.buyingBlock
+    def set_buyingBlock(self, buyingBlock): self.buyingBlock = buyingBlock
+    def add_buyingBlock(self, value): self.buyingBlock.append(value)
+    def insert_buyingBlock_at(self, index, value): self.buyingBlock.insert(index, value)
+    def replace_buyingBlock_at(self, index, value): self.buyingBlock[index] = value
+    def get_rentingBlock(self): return self.rentingBlock
+    def set_rentingBlock(self, rentingBlock): self.rentingBlock = rentingBlock
+    def add_rentingBlock(self, value): self.rentingBlock.append(value)
+    def insert_rentingBlock_at(self, index, value): self.rentingBlock.insert(index, value)
+    def replace_rentingBlock_at(self, index, value): self.rentingBlock[index] = value
+    def hasContent_(self):
+        if (
+            self.year is not None or
+            self.buyingBlock or
+            self.rentingBlock
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='yearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='yearlyCostsTable')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='yearlyCostsTable', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='yearlyCostsTable'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='yearlyCostsTable', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.year is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
+        for buyingBlock_ in self.buyingBlock:
+            buyingBlock_.export(outfile, level, namespace_, name_='buyingBlock', pretty_print=pretty_print)
+        for rentingBlock_ in self.rentingBlock:
+            rentingBlock_.export(outfile, level, namespace_, name_='rentingBlock', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = yearlyCostsTable.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_year(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'year')
+        self.year = ival_
+    def buildChild_buyingBlock(self, child_, node, nodeName_):
+        obj_ = buyingBlock.factory()
+        obj_.build(child_)
+        self.buyingBlock.append(obj_)
+        obj_.original_tagname_ = 'buyingBlock'
+    def buildChild_rentingBlock(self, child_, node, nodeName_):
+        obj_ = rentingBlock.factory()
+        obj_.build(child_)
+        self.rentingBlock.append(obj_)
+        obj_.original_tagname_ = 'rentingBlock'
+    childBuilders_ = {
+        'year': buildChild_year,
+        'buyingBlock': buildChild_buyingBlock,
+        'rentingBlock': buildChild_rentingBlock
+    }
+# end class yearlyCostsTable
+
+
+class cumulativeYearlyCostsTable(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, year=None, savings=None, buyingBlock=None, sellingBlock=None, rentingBlock=None):
+        self.original_tagname_ = None
+        self.year = year
+        self.savings = savings
+        if buyingBlock is None:
+            self.buyingBlock = []
+        else:
+            self.buyingBlock = buyingBlock
+        if sellingBlock is None:
+            self.sellingBlock = []
+        else:
+            self.sellingBlock = sellingBlock
+        if rentingBlock is None:
+            self.rentingBlock = []
+        else:
+            self.rentingBlock = rentingBlock
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, cumulativeYearlyCostsTable)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if cumulativeYearlyCostsTable.subclass:
+            return cumulativeYearlyCostsTable.subclass(*args_, **kwargs_)
+        else:
+            return cumulativeYearlyCostsTable(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_year(self): return self.year
+    def set_year(self, year): self.year = year
+    def get_savings(self): return self.savings
+    def set_savings(self, savings): self.savings = savings
+    def get_buyingBlock(self): return self.buyingBlock
+    def set_buyingBlock(self, buyingBlock): self.buyingBlock = buyingBlock
+    def add_buyingBlock(self, value): self.buyingBlock.append(value)
+    def insert_buyingBlock_at(self, index, value): self.buyingBlock.insert(index, value)
+    def replace_buyingBlock_at(self, index, value): self.buyingBlock[index] = value
+    def get_sellingBlock(self): return self.sellingBlock
+    def set_sellingBlock(self, sellingBlock): self.sellingBlock = sellingBlock
+    def add_sellingBlock(self, value): self.sellingBlock.append(value)
+    def insert_sellingBlock_at(self, index, value): self.sellingBlock.insert(index, value)
+    def replace_sellingBlock_at(self, index, value): self.sellingBlock[index] = value
+    def get_rentingBlock(self): return self.rentingBlock
+    def set_rentingBlock(self, rentingBlock): self.rentingBlock = rentingBlock
+    def add_rentingBlock(self, value): self.rentingBlock.append(value)
+    def insert_rentingBlock_at(self, index, value): self.rentingBlock.insert(index, value)
+    def replace_rentingBlock_at(self, index, value): self.rentingBlock[index] = value
+    def hasContent_(self):
+        if (
+            self.year is not None or
+            self.savings is not None or
+            self.buyingBlock or
+            self.sellingBlock or
+            self.rentingBlock
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='cumulativeYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='cumulativeYearlyCostsTable')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='cumulativeYearlyCostsTable', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='cumulativeYearlyCostsTable'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='cumulativeYearlyCostsTable', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.year is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
+        if self.savings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%ssavings>%s</%ssavings>%s' % (namespace_, self.gds_format_integer(self.savings, input_name='savings'), namespace_, eol_))
+        for buyingBlock_ in self.buyingBlock:
+            buyingBlock_.export(outfile, level, namespace_, name_='buyingBlock', pretty_print=pretty_print)
+        for sellingBlock_ in self.sellingBlock:
+            sellingBlock_.export(outfile, level, namespace_, name_='sellingBlock', pretty_print=pretty_print)
+        for rentingBlock_ in self.rentingBlock:
+            rentingBlock_.export(outfile, level, namespace_, name_='rentingBlock', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = cumulativeYearlyCostsTable.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_year(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'year')
+        self.year = ival_
+    def buildChild_savings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'savings')
+        self.savings = ival_
+    def buildChild_buyingBlock(self, child_, node, nodeName_):
+        obj_ = buyingBlock.factory()
+        obj_.build(child_)
+        self.buyingBlock.append(obj_)
+        obj_.original_tagname_ = 'buyingBlock'
+    def buildChild_sellingBlock(self, child_, node, nodeName_):
+        obj_ = sellingBlock.factory()
+        obj_.build(child_)
+        self.sellingBlock.append(obj_)
+        obj_.original_tagname_ = 'sellingBlock'
+    def buildChild_rentingBlock(self, child_, node, nodeName_):
+        obj_ = rentingBlock.factory()
+        obj_.build(child_)
+        self.rentingBlock.append(obj_)
+        obj_.original_tagname_ = 'rentingBlock'
+    childBuilders_ = {
+        'year': buildChild_year,
+        'savings': buildChild_savings,
+        'buyingBlock': buildChild_buyingBlock,
+        'sellingBlock': buildChild_sellingBlock,
+        'rentingBlock': buildChild_rentingBlock
+    }
+# end class cumulativeYearlyCostsTable
+
+
+class buyingBlock(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, buying=None):
+        self.original_tagname_ = None
+        if buying is None:
+            self.buying = []
+        else:
+            self.buying = buying
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, buyingBlock)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if buyingBlock.subclass:
+            return buyingBlock.subclass(*args_, **kwargs_)
+        else:
+            return buyingBlock(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_buying(self): return self.buying
+    def set_buying(self, buying): self.buying = buying
+    def add_buying(self, value): self.buying.append(value)
+    def insert_buying_at(self, index, value): self.buying.insert(index, value)
+    def replace_buying_at(self, index, value): self.buying[index] = value
+    def hasContent_(self):
+        if (
+            self.buying
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='buyingBlock', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buyingBlock')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='buyingBlock', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buyingBlock'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='buyingBlock', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for buying_ in self.buying:
+            buying_.export(outfile, level, namespace_, name_='buying', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = buyingBlock.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_buying(self, child_, node, nodeName_):
+        obj_ = buyingType.factory()
+        obj_.build(child_)
+        self.buying.append(obj_)
+        obj_.original_tagname_ = 'buying'
+    childBuilders_ = {
+        'buying': buildChild_buying
+    }
+# end class buyingBlock
+
+
+class rentingBlock(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, renting=None):
+        self.original_tagname_ = None
+        if renting is None:
+            self.renting = []
+        else:
+            self.renting = renting
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, rentingBlock)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if rentingBlock.subclass:
+            return rentingBlock.subclass(*args_, **kwargs_)
+        else:
+            return rentingBlock(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_renting(self): return self.renting
+    def set_renting(self, renting): self.renting = renting
+    def add_renting(self, value): self.renting.append(value)
+    def insert_renting_at(self, index, value): self.renting.insert(index, value)
+    def replace_renting_at(self, index, value): self.renting[index] = value
+    def hasContent_(self):
+        if (
+            self.renting
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='rentingBlock', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='rentingBlock')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='rentingBlock', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='rentingBlock'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='rentingBlock', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for renting_ in self.renting:
+            renting_.export(outfile, level, namespace_, name_='renting', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = rentingBlock.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_renting(self, child_, node, nodeName_):
+        obj_ = rentingType.factory()
+        obj_.build(child_)
+        self.renting.append(obj_)
+        obj_.original_tagname_ = 'renting'
+    childBuilders_ = {
+        'renting': buildChild_renting
+    }
+# end class rentingBlock
+
+
+class sellingBlock(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, selling=None):
+        self.original_tagname_ = None
+        if selling is None:
+            self.selling = []
+        else:
+            self.selling = selling
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, sellingBlock)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if sellingBlock.subclass:
+            return sellingBlock.subclass(*args_, **kwargs_)
+        else:
+            return sellingBlock(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_selling(self): return self.selling
+    def set_selling(self, selling): self.selling = selling
+    def add_selling(self, value): self.selling.append(value)
+    def insert_selling_at(self, index, value): self.selling.insert(index, value)
+    def replace_selling_at(self, index, value): self.selling[index] = value
+    def hasContent_(self):
+        if (
+            self.selling
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='sellingBlock', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='sellingBlock')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='sellingBlock', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='sellingBlock'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='sellingBlock', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for selling_ in self.selling:
+            selling_.export(outfile, level, namespace_, name_='selling', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = sellingBlock.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_selling(self, child_, node, nodeName_):
+        obj_ = sellingType.factory()
+        obj_.build(child_)
+        self.selling.append(obj_)
+        obj_.original_tagname_ = 'selling'
+    childBuilders_ = {
+        'selling': buildChild_selling
+    }
+# end class sellingBlock
+
+
+class Investment(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, result=None, breakEven=None, totalProfitLoss=None, downPayment=None, closingCosts=None, InvestmentYearlyCostsTable=None, InvestmentcumulativeYearlyCostsTable=None):
+        self.original_tagname_ = None
+        self.result = result
+        self.breakEven = breakEven
+        self.totalProfitLoss = totalProfitLoss
+        self.downPayment = downPayment
+        self.closingCosts = closingCosts
+        if InvestmentYearlyCostsTable is None:
+            self.InvestmentYearlyCostsTable = []
+        else:
+            self.InvestmentYearlyCostsTable = InvestmentYearlyCostsTable
+        if InvestmentcumulativeYearlyCostsTable is None:
+            self.InvestmentcumulativeYearlyCostsTable = []
+        else:
+            self.InvestmentcumulativeYearlyCostsTable = InvestmentcumulativeYearlyCostsTable
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, Investment)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if Investment.subclass:
+            return Investment.subclass(*args_, **kwargs_)
+        else:
+            return Investment(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def get_breakEven(self): return self.breakEven
+    def set_breakEven(self, breakEven): self.breakEven = breakEven
+    def get_totalProfitLoss(self): return self.totalProfitLoss
+    def set_totalProfitLoss(self, totalProfitLoss): self.totalProfitLoss = totalProfitLoss
+    def get_downPayment(self): return self.downPayment
+    def set_downPayment(self, downPayment): self.downPayment = downPayment
+    def get_closingCosts(self): return self.closingCosts
+    def set_closingCosts(self, closingCosts): self.closingCosts = closingCosts
+    def get_InvestmentYearlyCostsTable(self): return self.InvestmentYearlyCostsTable
+    def set_InvestmentYearlyCostsTable(self, InvestmentYearlyCostsTable): self.InvestmentYearlyCostsTable = InvestmentYearlyCostsTable
+    def add_InvestmentYearlyCostsTable(self, value): self.InvestmentYearlyCostsTable.append(value)
+    def insert_InvestmentYearlyCostsTable_at(self, index, value): self.InvestmentYearlyCostsTable.insert(index, value)
+    def replace_InvestmentYearlyCostsTable_at(self, index, value): self.InvestmentYearlyCostsTable[index] = value
+    def get_InvestmentcumulativeYearlyCostsTable(self): return self.InvestmentcumulativeYearlyCostsTable
+    def set_InvestmentcumulativeYearlyCostsTable(self, InvestmentcumulativeYearlyCostsTable): self.InvestmentcumulativeYearlyCostsTable = InvestmentcumulativeYearlyCostsTable
+    def add_InvestmentcumulativeYearlyCostsTable(self, value): self.InvestmentcumulativeYearlyCostsTable.append(value)
+    def insert_InvestmentcumulativeYearlyCostsTable_at(self, index, value): self.InvestmentcumulativeYearlyCostsTable.insert(index, value)
+    def replace_InvestmentcumulativeYearlyCostsTable_at(self, index, value): self.InvestmentcumulativeYearlyCostsTable[index] = value
+    def hasContent_(self):
+        if (
+            self.result is not None or
+            self.breakEven is not None or
+            self.totalProfitLoss is not None or
+            self.downPayment is not None or
+            self.closingCosts is not None or
+            self.InvestmentYearlyCostsTable or
+            self.InvestmentcumulativeYearlyCostsTable
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='Investment', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Investment')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='Investment', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Investment'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='Investment', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.result is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
+        if self.breakEven is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
+        if self.totalProfitLoss is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalProfitLoss>%s</%stotalProfitLoss>%s' % (namespace_, self.gds_format_integer(self.totalProfitLoss, input_name='totalProfitLoss'), namespace_, eol_))
+        if self.downPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
+        if self.closingCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sclosingCosts>%s</%sclosingCosts>%s' % (namespace_, self.gds_format_integer(self.closingCosts, input_name='closingCosts'), namespace_, eol_))
+        for InvestmentYearlyCostsTable_ in self.InvestmentYearlyCostsTable:
+            InvestmentYearlyCostsTable_.export(outfile, level, namespace_, name_='InvestmentYearlyCostsTable', pretty_print=pretty_print)
+        for InvestmentcumulativeYearlyCostsTable_ in self.InvestmentcumulativeYearlyCostsTable:
+            InvestmentcumulativeYearlyCostsTable_.export(outfile, level, namespace_, name_='InvestmentcumulativeYearlyCostsTable', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = Investment.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_result(self, child_, node, nodeName_):
+        result_ = child_.text
+        result_ = self.gds_validate_string(result_, node, 'result')
+        self.result = result_
+    def buildChild_breakEven(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
+        self.breakEven = ival_
+    def buildChild_totalProfitLoss(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalProfitLoss')
+        self.totalProfitLoss = ival_
+    def buildChild_downPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
+        self.downPayment = ival_
+    def buildChild_closingCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'closingCosts')
+        self.closingCosts = ival_
+    def buildChild_InvestmentYearlyCostsTable(self, child_, node, nodeName_):
+        obj_ = investmentYearlyCostsTable.factory()
+        obj_.build(child_)
+        self.InvestmentYearlyCostsTable.append(obj_)
+        obj_.original_tagname_ = 'InvestmentYearlyCostsTable'
+    def buildChild_InvestmentcumulativeYearlyCostsTable(self, child_, node, nodeName_):
+        obj_ = investmentCumulativeYearlyCostsTable.factory()
+        obj_.build(child_)
+        self.InvestmentcumulativeYearlyCostsTable.append(obj_)
+        obj_.original_tagname_ = 'InvestmentcumulativeYearlyCostsTable'
+    childBuilders_ = {
+        'result': buildChild_result,
+        'breakEven': buildChild_breakEven,
+        'totalProfitLoss': buildChild_totalProfitLoss,
+        'downPayment': buildChild_downPayment,
+        'closingCosts': buildChild_closingCosts,
+        'InvestmentYearlyCostsTable': buildChild_InvestmentYearlyCostsTable,
+        'InvestmentcumulativeYearlyCostsTable': buildChild_InvestmentcumulativeYearlyCostsTable
+    }
+# end class Investment
+
+
+class investmentYearlyCostsTable(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, investmentBuyingBlock=None):
+        self.original_tagname_ = None
+        if investmentBuyingBlock is None:
+            self.investmentBuyingBlock = []
+        else:
+            self.investmentBuyingBlock = investmentBuyingBlock
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, investmentYearlyCostsTable)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if investmentYearlyCostsTable.subclass:
+            return investmentYearlyCostsTable.subclass(*args_, **kwargs_)
+        else:
+            return investmentYearlyCostsTable(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_investmentBuyingBlock(self): return self.investmentBuyingBlock
+    def set_investmentBuyingBlock(self, investmentBuyingBlock): self.investmentBuyingBlock = investmentBuyingBlock
+    def add_investmentBuyingBlock(self, value): self.investmentBuyingBlock.append(value)
+    def insert_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock.insert(index, value)
+    def replace_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock[index] = value
+    def hasContent_(self):
+        if (
+            self.investmentBuyingBlock
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='investmentYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentYearlyCostsTable')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentYearlyCostsTable', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentYearlyCostsTable'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='investmentYearlyCostsTable', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for investmentBuyingBlock_ in self.investmentBuyingBlock:
+            investmentBuyingBlock_.export(outfile, level, namespace_, name_='investmentBuyingBlock', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = investmentYearlyCostsTable.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_investmentBuyingBlock(self, child_, node, nodeName_):
+        obj_ = investmentBuyingBlock.factory()
+        obj_.build(child_)
+        self.investmentBuyingBlock.append(obj_)
+        obj_.original_tagname_ = 'investmentBuyingBlock'
+    childBuilders_ = {
+        'investmentBuyingBlock': buildChild_investmentBuyingBlock
+    }
+# end class investmentYearlyCostsTable
+
+
+class investmentCumulativeYearlyCostsTable(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, investmentBuyingBlock=None, sellingBlock=None, investmentreturn=None):
+        self.original_tagname_ = None
+        if investmentBuyingBlock is None:
+            self.investmentBuyingBlock = []
+        else:
+            self.investmentBuyingBlock = investmentBuyingBlock
+        if sellingBlock is None:
+            self.sellingBlock = []
+        else:
+            self.sellingBlock = sellingBlock
+        self.investmentreturn = investmentreturn
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, investmentCumulativeYearlyCostsTable)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if investmentCumulativeYearlyCostsTable.subclass:
+            return investmentCumulativeYearlyCostsTable.subclass(*args_, **kwargs_)
+        else:
+            return investmentCumulativeYearlyCostsTable(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_investmentBuyingBlock(self): return self.investmentBuyingBlock
+    def set_investmentBuyingBlock(self, investmentBuyingBlock): self.investmentBuyingBlock = investmentBuyingBlock
+    def add_investmentBuyingBlock(self, value): self.investmentBuyingBlock.append(value)
+    def insert_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock.insert(index, value)
+    def replace_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock[index] = value
+    def get_sellingBlock(self): return self.sellingBlock
+    def set_sellingBlock(self, sellingBlock): self.sellingBlock = sellingBlock
+    def add_sellingBlock(self, value): self.sellingBlock.append(value)
+    def insert_sellingBlock_at(self, index, value): self.sellingBlock.insert(index, value)
+    def replace_sellingBlock_at(self, index, value): self.sellingBlock[index] = value
+    def get_investmentreturn(self): return self.investmentreturn
+    def set_investmentreturn(self, investmentreturn): self.investmentreturn = investmentreturn
+    def hasContent_(self):
+        if (
+            self.investmentBuyingBlock or
+            self.sellingBlock or
+            self.investmentreturn is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='investmentCumulativeYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentCumulativeYearlyCostsTable')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentCumulativeYearlyCostsTable', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentCumulativeYearlyCostsTable'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='investmentCumulativeYearlyCostsTable', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for investmentBuyingBlock_ in self.investmentBuyingBlock:
+            investmentBuyingBlock_.export(outfile, level, namespace_, name_='investmentBuyingBlock', pretty_print=pretty_print)
+        for sellingBlock_ in self.sellingBlock:
+            sellingBlock_.export(outfile, level, namespace_, name_='sellingBlock', pretty_print=pretty_print)
+        if self.investmentreturn is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinvestmentreturn>%s</%sinvestmentreturn>%s' % (namespace_, self.gds_format_double(self.investmentreturn, input_name='investmentreturn'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = investmentCumulativeYearlyCostsTable.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_investmentBuyingBlock(self, child_, node, nodeName_):
+        obj_ = investmentBuyingBlock.factory()
+        obj_.build(child_)
+        self.investmentBuyingBlock.append(obj_)
+        obj_.original_tagname_ = 'investmentBuyingBlock'
+    def buildChild_sellingBlock(self, child_, node, nodeName_):
+        obj_ = sellingBlock.factory()
+        obj_.build(child_)
+        self.sellingBlock.append(obj_)
+        obj_.original_tagname_ = 'sellingBlock'
+    def buildChild_investmentreturn(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'investmentreturn')
+        self.investmentreturn = fval_
+    childBuilders_ = {
+        'investmentBuyingBlock': buildChild_investmentBuyingBlock,
+        'sellingBlock': buildChild_sellingBlock,
+        'investmentreturn': buildChild_investmentreturn
+    }
+# end class investmentCumulativeYearlyCostsTable
+
+
+class investmentBuyingBlock(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, buying=None):
+        self.original_tagname_ = None
+        if buying is None:
+            self.buying = []
+        else:
+            self.buying = buying
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, investmentBuyingBlock)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if investmentBuyingBlock.subclass:
+            return investmentBuyingBlock.subclass(*args_, **kwargs_)
+        else:
+            return investmentBuyingBlock(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_buying(self): return self.buying
+    def set_buying(self, buying): self.buying = buying
+    def add_buying(self, value): self.buying.append(value)
+    def insert_buying_at(self, index, value): self.buying.insert(index, value)
+    def replace_buying_at(self, index, value): self.buying[index] = value
+    def hasContent_(self):
+        if (
+            self.buying
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='investmentBuyingBlock', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentBuyingBlock')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentBuyingBlock', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentBuyingBlock'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='investmentBuyingBlock', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        for buying_ in self.buying:
+            buying_.export(outfile, level, namespace_, name_='buying', pretty_print=pretty_print)
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = investmentBuyingBlock.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_buying(self, child_, node, nodeName_):
+        obj_ = buying.factory()
+        obj_.build(child_)
+        self.buying.append(obj_)
+        obj_.original_tagname_ = 'buying'
+    childBuilders_ = {
+        'buying': buildChild_buying
+    }
+# end class investmentBuyingBlock
+
+
+class buying(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, year=None, rentalIncome=None, otherIncome=None, mortgagePayment=None, principal=None, interest=None, hoaFees=None, propertyTaxes=None, utilities=None, renovations=None, maintainCosts=None, homeOwnerInsurance=None, managementFees=None, advertisingCosts=None, otherExpenses=None, totalExpenses=None, opportunityCostInitial=None, opportunityCostYearly=None, depreciationBuilding=None, depreciationrenovation=None, totalBenefit=None, totalProfitLoss=None):
+        self.original_tagname_ = None
+        self.year = year
+        self.rentalIncome = rentalIncome
+        self.otherIncome = otherIncome
+        self.mortgagePayment = mortgagePayment
+        self.principal = principal
+        self.interest = interest
+        self.hoaFees = hoaFees
+        self.propertyTaxes = propertyTaxes
+        self.utilities = utilities
+        self.renovations = renovations
+        self.maintainCosts = maintainCosts
+        self.homeOwnerInsurance = homeOwnerInsurance
+        self.managementFees = managementFees
+        self.advertisingCosts = advertisingCosts
+        self.otherExpenses = otherExpenses
+        self.totalExpenses = totalExpenses
+        self.opportunityCostInitial = opportunityCostInitial
+        self.opportunityCostYearly = opportunityCostYearly
+        self.depreciationBuilding = depreciationBuilding
+        self.depreciationrenovation = depreciationrenovation
+        self.totalBenefit = totalBenefit
+        self.totalProfitLoss = totalProfitLoss
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, buying)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if buying.subclass:
+            return buying.subclass(*args_, **kwargs_)
+        else:
+            return buying(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_year(self): return self.year
+    def set_year(self, year): self.year = year
+    def get_rentalIncome(self): return self.rentalIncome
+    def set_rentalIncome(self, rentalIncome): self.rentalIncome = rentalIncome
+    def get_otherIncome(self): return self.otherIncome
+    def set_otherIncome(self, otherIncome): self.otherIncome = otherIncome
+    def get_mortgagePayment(self): return self.mortgagePayment
+    def set_mortgagePayment(self, mortgagePayment): self.mortgagePayment = mortgagePayment
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_hoaFees(self): return self.hoaFees
+    def set_hoaFees(self, hoaFees): self.hoaFees = hoaFees
+    def get_propertyTaxes(self): return self.propertyTaxes
+    def set_propertyTaxes(self, propertyTaxes): self.propertyTaxes = propertyTaxes
+    def get_utilities(self): return self.utilities
+    def set_utilities(self, utilities): self.utilities = utilities
+    def get_renovations(self): return self.renovations
+    def set_renovations(self, renovations): self.renovations = renovations
+    def get_maintainCosts(self): return self.maintainCosts
+    def set_maintainCosts(self, maintainCosts): self.maintainCosts = maintainCosts
+    def get_homeOwnerInsurance(self): return self.homeOwnerInsurance
+    def set_homeOwnerInsurance(self, homeOwnerInsurance): self.homeOwnerInsurance = homeOwnerInsurance
+    def get_managementFees(self): return self.managementFees
+    def set_managementFees(self, managementFees): self.managementFees = managementFees
+    def get_advertisingCosts(self): return self.advertisingCosts
+    def set_advertisingCosts(self, advertisingCosts): self.advertisingCosts = advertisingCosts
+    def get_otherExpenses(self): return self.otherExpenses
+    def set_otherExpenses(self, otherExpenses): self.otherExpenses = otherExpenses
+    def get_totalExpenses(self): return self.totalExpenses
+    def set_totalExpenses(self, totalExpenses): self.totalExpenses = totalExpenses
+    def get_opportunityCostInitial(self): return self.opportunityCostInitial
+    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
+    def get_opportunityCostYearly(self): return self.opportunityCostYearly
+    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
+    def get_depreciationBuilding(self): return self.depreciationBuilding
+    def set_depreciationBuilding(self, depreciationBuilding): self.depreciationBuilding = depreciationBuilding
+    def get_depreciationrenovation(self): return self.depreciationrenovation
+    def set_depreciationrenovation(self, depreciationrenovation): self.depreciationrenovation = depreciationrenovation
+    def get_totalBenefit(self): return self.totalBenefit
+    def set_totalBenefit(self, totalBenefit): self.totalBenefit = totalBenefit
+    def get_totalProfitLoss(self): return self.totalProfitLoss
+    def set_totalProfitLoss(self, totalProfitLoss): self.totalProfitLoss = totalProfitLoss
+    def hasContent_(self):
+        if (
+            self.year is not None or
+            self.rentalIncome is not None or
+            self.otherIncome is not None or
+            self.mortgagePayment is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.hoaFees is not None or
+            self.propertyTaxes is not None or
+            self.utilities is not None or
+            self.renovations is not None or
+            self.maintainCosts is not None or
+            self.homeOwnerInsurance is not None or
+            self.managementFees is not None or
+            self.advertisingCosts is not None or
+            self.otherExpenses is not None or
+            self.totalExpenses is not None or
+            self.opportunityCostInitial is not None or
+            self.opportunityCostYearly is not None or
+            self.depreciationBuilding is not None or
+            self.depreciationrenovation is not None or
+            self.totalBenefit is not None or
+            self.totalProfitLoss is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='buying', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buying')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='buying', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buying'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='buying', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.year is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
+        if self.rentalIncome is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srentalIncome>%s</%srentalIncome>%s' % (namespace_, self.gds_format_integer(self.rentalIncome, input_name='rentalIncome'), namespace_, eol_))
+        if self.otherIncome is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sotherIncome>%s</%sotherIncome>%s' % (namespace_, self.gds_format_integer(self.otherIncome, input_name='otherIncome'), namespace_, eol_))
+        if self.mortgagePayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smortgagePayment>%s</%smortgagePayment>%s' % (namespace_, self.gds_format_integer(self.mortgagePayment, input_name='mortgagePayment'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.hoaFees is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%shoaFees>%s</%shoaFees>%s' % (namespace_, self.gds_format_integer(self.hoaFees, input_name='hoaFees'), namespace_, eol_))
+        if self.propertyTaxes is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spropertyTaxes>%s</%spropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.propertyTaxes, input_name='propertyTaxes'), namespace_, eol_))
+        if self.utilities is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sutilities>%s</%sutilities>%s' % (namespace_, self.gds_format_integer(self.utilities, input_name='utilities'), namespace_, eol_))
+        if self.renovations is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srenovations>%s</%srenovations>%s' % (namespace_, self.gds_format_integer(self.renovations, input_name='renovations'), namespace_, eol_))
+        if self.maintainCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smaintainCosts>%s</%smaintainCosts>%s' % (namespace_, self.gds_format_integer(self.maintainCosts, input_name='maintainCosts'), namespace_, eol_))
+        if self.homeOwnerInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%shomeOwnerInsurance>%s</%shomeOwnerInsurance>%s' % (namespace_, self.gds_format_integer(self.homeOwnerInsurance, input_name='homeOwnerInsurance'), namespace_, eol_))
+        if self.managementFees is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smanagementFees>%s</%smanagementFees>%s' % (namespace_, self.gds_format_integer(self.managementFees, input_name='managementFees'), namespace_, eol_))
+        if self.advertisingCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadvertisingCosts>%s</%sadvertisingCosts>%s' % (namespace_, self.gds_format_integer(self.advertisingCosts, input_name='advertisingCosts'), namespace_, eol_))
+        if self.otherExpenses is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sotherExpenses>%s</%sotherExpenses>%s' % (namespace_, self.gds_format_integer(self.otherExpenses, input_name='otherExpenses'), namespace_, eol_))
+        if self.totalExpenses is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalExpenses>%s</%stotalExpenses>%s' % (namespace_, self.gds_format_integer(self.totalExpenses, input_name='totalExpenses'), namespace_, eol_))
+        if self.opportunityCostInitial is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
+        if self.opportunityCostYearly is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
+        if self.depreciationBuilding is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdepreciationBuilding>%s</%sdepreciationBuilding>%s' % (namespace_, self.gds_format_integer(self.depreciationBuilding, input_name='depreciationBuilding'), namespace_, eol_))
+        if self.depreciationrenovation is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sdepreciationrenovation>%s</%sdepreciationrenovation>%s' % (namespace_, self.gds_format_integer(self.depreciationrenovation, input_name='depreciationrenovation'), namespace_, eol_))
+        if self.totalBenefit is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalBenefit>%s</%stotalBenefit>%s' % (namespace_, self.gds_format_integer(self.totalBenefit, input_name='totalBenefit'), namespace_, eol_))
+        if self.totalProfitLoss is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalProfitLoss>%s</%stotalProfitLoss>%s' % (namespace_, self.gds_format_integer(self.totalProfitLoss, input_name='totalProfitLoss'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = buying.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_year(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'year')
+        self.year = ival_
+    def buildChild_rentalIncome(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rentalIncome')
+        self.rentalIncome = ival_
+    def buildChild_otherIncome(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'otherIncome')
+        self.otherIncome = ival_
+    def buildChild_mortgagePayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'mortgagePayment')
+        self.mortgagePayment = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_hoaFees(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'hoaFees')
+        self.hoaFees = ival_
+    def buildChild_propertyTaxes(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'propertyTaxes')
+        self.propertyTaxes = ival_
+    def buildChild_utilities(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'utilities')
+        self.utilities = ival_
+    def buildChild_renovations(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'renovations')
+        self.renovations = ival_
+    def buildChild_maintainCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'maintainCosts')
+        self.maintainCosts = ival_
+    def buildChild_homeOwnerInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'homeOwnerInsurance')
+        self.homeOwnerInsurance = ival_
+    def buildChild_managementFees(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'managementFees')
+        self.managementFees = ival_
+    def buildChild_advertisingCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'advertisingCosts')
+        self.advertisingCosts = ival_
+    def buildChild_otherExpenses(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'otherExpenses')
+        self.otherExpenses = ival_
+    def buildChild_totalExpenses(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalExpenses')
+        self.totalExpenses = ival_
+    def buildChild_opportunityCostInitial(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
+        self.opportunityCostInitial = ival_
+    def buildChild_opportunityCostYearly(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
+        self.opportunityCostYearly = ival_
+    def buildChild_depreciationBuilding(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'depreciationBuilding')
+        self.depreciationBuilding = ival_
+    def buildChild_depreciationrenovation(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'depreciationrenovation')
+        self.depreciationrenovation = ival_
+    def buildChild_totalBenefit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalBenefit')
+        self.totalBenefit = ival_
+    def buildChild_totalProfitLoss(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalProfitLoss')
+        self.totalProfitLoss = ival_
+    childBuilders_ = {
+        'year': buildChild_year,
+        'rentalIncome': buildChild_rentalIncome,
+        'otherIncome': buildChild_otherIncome,
+        'mortgagePayment': buildChild_mortgagePayment,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'hoaFees': buildChild_hoaFees,
+        'propertyTaxes': buildChild_propertyTaxes,
+        'utilities': buildChild_utilities,
+        'renovations': buildChild_renovations,
+        'maintainCosts': buildChild_maintainCosts,
+        'homeOwnerInsurance': buildChild_homeOwnerInsurance,
+        'managementFees': buildChild_managementFees,
+        'advertisingCosts': buildChild_advertisingCosts,
+        'otherExpenses': buildChild_otherExpenses,
+        'totalExpenses': buildChild_totalExpenses,
+        'opportunityCostInitial': buildChild_opportunityCostInitial,
+        'opportunityCostYearly': buildChild_opportunityCostYearly,
+        'depreciationBuilding': buildChild_depreciationBuilding,
+        'depreciationrenovation': buildChild_depreciationrenovation,
+        'totalBenefit': buildChild_totalBenefit,
+        'totalProfitLoss': buildChild_totalProfitLoss
+    }
+# end class buying
+
+
+class paymentType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, beginningBalance=None, amount=None, principal=None, interest=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.beginningBalance = beginningBalance
+        self.amount = amount
+        self.principal = principal
+        self.interest = interest
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, paymentType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if paymentType.subclass:
+            return paymentType.subclass(*args_, **kwargs_)
+        else:
+            return paymentType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_amount(self): return self.amount
+    def set_amount(self, amount): self.amount = amount
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.beginningBalance is not None or
+            self.amount is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='paymentType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='paymentType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='paymentType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='paymentType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='paymentType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.amount is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%samount>%s</%samount>%s' % (namespace_, self.gds_format_integer(self.amount, input_name='amount'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = paymentType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_amount(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'amount')
+        self.amount = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'beginningBalance': buildChild_beginningBalance,
+        'amount': buildChild_amount,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class paymentType
+
+
+class paymentType2(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, monthlySavings=None, cumulativeSavings=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.monthlySavings = monthlySavings
+        self.cumulativeSavings = cumulativeSavings
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, paymentType2)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if paymentType2.subclass:
+            return paymentType2.subclass(*args_, **kwargs_)
+        else:
+            return paymentType2(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_monthlySavings(self): return self.monthlySavings
+    def set_monthlySavings(self, monthlySavings): self.monthlySavings = monthlySavings
+    def get_cumulativeSavings(self): return self.cumulativeSavings
+    def set_cumulativeSavings(self, cumulativeSavings): self.cumulativeSavings = cumulativeSavings
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.monthlySavings is not None or
+            self.cumulativeSavings is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='paymentType2', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='paymentType2')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='paymentType2', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='paymentType2'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='paymentType2', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.monthlySavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smonthlySavings>%s</%smonthlySavings>%s' % (namespace_, self.gds_format_integer(self.monthlySavings, input_name='monthlySavings'), namespace_, eol_))
+        if self.cumulativeSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%scumulativeSavings>%s</%scumulativeSavings>%s' % (namespace_, self.gds_format_integer(self.cumulativeSavings, input_name='cumulativeSavings'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = paymentType2.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_monthlySavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'monthlySavings')
+        self.monthlySavings = ival_
+    def buildChild_cumulativeSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'cumulativeSavings')
+        self.cumulativeSavings = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'monthlySavings': buildChild_monthlySavings,
+        'cumulativeSavings': buildChild_cumulativeSavings,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class paymentType2
+
+
+class PaymentType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, fixedPayment=None, fixedBalance=None, adjustablePayment=None, adjustableBalance=None, adjustableRate=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.fixedPayment = fixedPayment
+        self.fixedBalance = fixedBalance
+        self.adjustablePayment = adjustablePayment
+        self.adjustableBalance = adjustableBalance
+        self.adjustableRate = adjustableRate
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType.subclass:
+            return PaymentType.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_fixedPayment(self): return self.fixedPayment
+    def set_fixedPayment(self, fixedPayment): self.fixedPayment = fixedPayment
+    def get_fixedBalance(self): return self.fixedBalance
+    def set_fixedBalance(self, fixedBalance): self.fixedBalance = fixedBalance
+    def get_adjustablePayment(self): return self.adjustablePayment
+    def set_adjustablePayment(self, adjustablePayment): self.adjustablePayment = adjustablePayment
+    def get_adjustableBalance(self): return self.adjustableBalance
+    def set_adjustableBalance(self, adjustableBalance): self.adjustableBalance = adjustableBalance
+    def get_adjustableRate(self): return self.adjustableRate
+    def set_adjustableRate(self, adjustableRate): self.adjustableRate = adjustableRate
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.fixedPayment is not None or
+            self.fixedBalance is not None or
+            self.adjustablePayment is not None or
+            self.adjustableBalance is not None or
+            self.adjustableRate is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.fixedPayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedPayment>%s</%sfixedPayment>%s' % (namespace_, self.gds_format_integer(self.fixedPayment, input_name='fixedPayment'), namespace_, eol_))
+        if self.fixedBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sfixedBalance>%s</%sfixedBalance>%s' % (namespace_, self.gds_format_integer(self.fixedBalance, input_name='fixedBalance'), namespace_, eol_))
+        if self.adjustablePayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustablePayment>%s</%sadjustablePayment>%s' % (namespace_, self.gds_format_integer(self.adjustablePayment, input_name='adjustablePayment'), namespace_, eol_))
+        if self.adjustableBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableBalance>%s</%sadjustableBalance>%s' % (namespace_, self.gds_format_integer(self.adjustableBalance, input_name='adjustableBalance'), namespace_, eol_))
+        if self.adjustableRate is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sadjustableRate>%s</%sadjustableRate>%s' % (namespace_, self.gds_format_integer(self.adjustableRate, input_name='adjustableRate'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_fixedPayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedPayment')
+        self.fixedPayment = ival_
+    def buildChild_fixedBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'fixedBalance')
+        self.fixedBalance = ival_
+    def buildChild_adjustablePayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustablePayment')
+        self.adjustablePayment = ival_
+    def buildChild_adjustableBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableBalance')
+        self.adjustableBalance = ival_
+    def buildChild_adjustableRate(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'adjustableRate')
+        self.adjustableRate = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'fixedPayment': buildChild_fixedPayment,
+        'fixedBalance': buildChild_fixedBalance,
+        'adjustablePayment': buildChild_adjustablePayment,
+        'adjustableBalance': buildChild_adjustableBalance,
+        'adjustableRate': buildChild_adjustableRate
+    }
+# end class PaymentType
+
+
+class PaymentType3(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None, rate=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.principal = principal
+        self.interest = interest
+        self.endingBalance = endingBalance
+        self.rate = rate
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType3)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType3.subclass:
+            return PaymentType3.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType3(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def get_rate(self): return self.rate
+    def set_rate(self, rate): self.rate = rate
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.endingBalance is not None or
+            self.rate is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType3', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType3')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType3', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType3'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType3', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+        if self.rate is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srate>%s</%srate>%s' % (namespace_, self.gds_format_double(self.rate, input_name='rate'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType3.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    def buildChild_rate(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'rate')
+        self.rate = fval_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance,
+        'rate': buildChild_rate
+    }
+# end class PaymentType3
+
+
+class PaymentType4(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.principal = principal
+        self.interest = interest
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType4)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType4.subclass:
+            return PaymentType4.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType4(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType4', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType4')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType4', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType4'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType4', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType4.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class PaymentType4
+
+
+class PaymentType5(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.principal = principal
+        self.interest = interest
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType5)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType5.subclass:
+            return PaymentType5.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType5(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType5', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType5')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType5', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType5'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType5', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType5.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class PaymentType5
+
+
+class PaymentType6(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None, taxSavings=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.interest = interest
+        self.endingBalance = endingBalance
+        self.taxSavings = taxSavings
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType6)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType6.subclass:
+            return PaymentType6.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType6(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def get_taxSavings(self): return self.taxSavings
+    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.interest is not None or
+            self.endingBalance is not None or
+            self.taxSavings is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType6', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType6')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType6', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType6'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType6', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+        if self.taxSavings is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType6.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    def buildChild_taxSavings(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
+        self.taxSavings = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance,
+        'taxSavings': buildChild_taxSavings
+    }
+# end class PaymentType6
+
+
+class PaymentType7(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.interest = interest
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType7)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType7.subclass:
+            return PaymentType7.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType7(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.interest is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType7', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType7')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType7', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType7'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType7', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType7.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class PaymentType7
+
+
+class PaymentType8(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None):
+        self.original_tagname_ = None
+        self.period = period
+        self.beginningBalance = beginningBalance
+        self.payment = payment
+        self.interest = interest
+        self.endingBalance = endingBalance
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, PaymentType8)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if PaymentType8.subclass:
+            return PaymentType8.subclass(*args_, **kwargs_)
+        else:
+            return PaymentType8(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_period(self): return self.period
+    def set_period(self, period): self.period = period
+    def get_beginningBalance(self): return self.beginningBalance
+    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
+    def get_payment(self): return self.payment
+    def set_payment(self, payment): self.payment = payment
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_endingBalance(self): return self.endingBalance
+    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
+    def hasContent_(self):
+        if (
+            self.period is not None or
+            self.beginningBalance is not None or
+            self.payment is not None or
+            self.interest is not None or
+            self.endingBalance is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='PaymentType8', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType8')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType8', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType8'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType8', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.period is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
+        if self.beginningBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
+        if self.payment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.endingBalance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = PaymentType8.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_period(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'period')
+        self.period = ival_
+    def buildChild_beginningBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
+        self.beginningBalance = ival_
+    def buildChild_payment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'payment')
+        self.payment = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_endingBalance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
+        self.endingBalance = ival_
+    childBuilders_ = {
+        'period': buildChild_period,
+        'beginningBalance': buildChild_beginningBalance,
+        'payment': buildChild_payment,
+        'interest': buildChild_interest,
+        'endingBalance': buildChild_endingBalance
+    }
+# end class PaymentType8
+
+
+class pairsType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, ltv=None, loanAmount=None):
+        self.original_tagname_ = None
+        self.ltv = ltv
+        self.loanAmount = loanAmount
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, pairsType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if pairsType.subclass:
+            return pairsType.subclass(*args_, **kwargs_)
+        else:
+            return pairsType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_ltv(self): return self.ltv
+    def set_ltv(self, ltv): self.ltv = ltv
+    def get_loanAmount(self): return self.loanAmount
+    def set_loanAmount(self, loanAmount): self.loanAmount = loanAmount
+    def hasContent_(self):
+        if (
+            self.ltv is not None or
+            self.loanAmount is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='pairsType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='pairsType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='pairsType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='pairsType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='pairsType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.ltv is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sltv>%s</%sltv>%s' % (namespace_, self.gds_format_double(self.ltv, input_name='ltv'), namespace_, eol_))
+        if self.loanAmount is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sloanAmount>%s</%sloanAmount>%s' % (namespace_, self.gds_format_integer(self.loanAmount, input_name='loanAmount'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = pairsType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_ltv(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'ltv')
+        self.ltv = fval_
+    def buildChild_loanAmount(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'loanAmount')
+        self.loanAmount = ival_
+    childBuilders_ = {
+        'ltv': buildChild_ltv,
+        'loanAmount': buildChild_loanAmount
+    }
+# end class pairsType
+
+
+class buyingType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, mortgagePayment=None, principal=None, interest=None, hoaFees=None, propertyTaxes=None, utilities=None, renovations=None, maintainCosts=None, homeOwnerInsurance=None, opportunityCostInitial=None, opportunityCostYearly=None, totalBenefit=None, totalCost=None):
+        self.original_tagname_ = None
+        self.mortgagePayment = mortgagePayment
+        self.principal = principal
+        self.interest = interest
+        self.hoaFees = hoaFees
+        self.propertyTaxes = propertyTaxes
+        self.utilities = utilities
+        self.renovations = renovations
+        self.maintainCosts = maintainCosts
+        self.homeOwnerInsurance = homeOwnerInsurance
+        self.opportunityCostInitial = opportunityCostInitial
+        self.opportunityCostYearly = opportunityCostYearly
+        self.totalBenefit = totalBenefit
+        self.totalCost = totalCost
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, buyingType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if buyingType.subclass:
+            return buyingType.subclass(*args_, **kwargs_)
+        else:
+            return buyingType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_mortgagePayment(self): return self.mortgagePayment
+    def set_mortgagePayment(self, mortgagePayment): self.mortgagePayment = mortgagePayment
+    def get_principal(self): return self.principal
+    def set_principal(self, principal): self.principal = principal
+    def get_interest(self): return self.interest
+    def set_interest(self, interest): self.interest = interest
+    def get_hoaFees(self): return self.hoaFees
+    def set_hoaFees(self, hoaFees): self.hoaFees = hoaFees
+    def get_propertyTaxes(self): return self.propertyTaxes
+    def set_propertyTaxes(self, propertyTaxes): self.propertyTaxes = propertyTaxes
+    def get_utilities(self): return self.utilities
+    def set_utilities(self, utilities): self.utilities = utilities
+    def get_renovations(self): return self.renovations
+    def set_renovations(self, renovations): self.renovations = renovations
+    def get_maintainCosts(self): return self.maintainCosts
+    def set_maintainCosts(self, maintainCosts): self.maintainCosts = maintainCosts
+    def get_homeOwnerInsurance(self): return self.homeOwnerInsurance
+    def set_homeOwnerInsurance(self, homeOwnerInsurance): self.homeOwnerInsurance = homeOwnerInsurance
+    def get_opportunityCostInitial(self): return self.opportunityCostInitial
+    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
+    def get_opportunityCostYearly(self): return self.opportunityCostYearly
+    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
+    def get_totalBenefit(self): return self.totalBenefit
+    def set_totalBenefit(self, totalBenefit): self.totalBenefit = totalBenefit
+    def get_totalCost(self): return self.totalCost
+    def set_totalCost(self, totalCost): self.totalCost = totalCost
+    def hasContent_(self):
+        if (
+            self.mortgagePayment is not None or
+            self.principal is not None or
+            self.interest is not None or
+            self.hoaFees is not None or
+            self.propertyTaxes is not None or
+            self.utilities is not None or
+            self.renovations is not None or
+            self.maintainCosts is not None or
+            self.homeOwnerInsurance is not None or
+            self.opportunityCostInitial is not None or
+            self.opportunityCostYearly is not None or
+            self.totalBenefit is not None or
+            self.totalCost is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='buyingType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buyingType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='buyingType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buyingType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='buyingType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.mortgagePayment is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smortgagePayment>%s</%smortgagePayment>%s' % (namespace_, self.gds_format_integer(self.mortgagePayment, input_name='mortgagePayment'), namespace_, eol_))
+        if self.principal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
+        if self.interest is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
+        if self.hoaFees is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%shoaFees>%s</%shoaFees>%s' % (namespace_, self.gds_format_integer(self.hoaFees, input_name='hoaFees'), namespace_, eol_))
+        if self.propertyTaxes is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%spropertyTaxes>%s</%spropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.propertyTaxes, input_name='propertyTaxes'), namespace_, eol_))
+        if self.utilities is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sutilities>%s</%sutilities>%s' % (namespace_, self.gds_format_integer(self.utilities, input_name='utilities'), namespace_, eol_))
+        if self.renovations is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srenovations>%s</%srenovations>%s' % (namespace_, self.gds_format_integer(self.renovations, input_name='renovations'), namespace_, eol_))
+        if self.maintainCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%smaintainCosts>%s</%smaintainCosts>%s' % (namespace_, self.gds_format_integer(self.maintainCosts, input_name='maintainCosts'), namespace_, eol_))
+        if self.homeOwnerInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%shomeOwnerInsurance>%s</%shomeOwnerInsurance>%s' % (namespace_, self.gds_format_integer(self.homeOwnerInsurance, input_name='homeOwnerInsurance'), namespace_, eol_))
+        if self.opportunityCostInitial is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
+        if self.opportunityCostYearly is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
+        if self.totalBenefit is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalBenefit>%s</%stotalBenefit>%s' % (namespace_, self.gds_format_integer(self.totalBenefit, input_name='totalBenefit'), namespace_, eol_))
+        if self.totalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = buyingType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_mortgagePayment(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'mortgagePayment')
+        self.mortgagePayment = ival_
+    def buildChild_principal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'principal')
+        self.principal = ival_
+    def buildChild_interest(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'interest')
+        self.interest = ival_
+    def buildChild_hoaFees(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'hoaFees')
+        self.hoaFees = ival_
+    def buildChild_propertyTaxes(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'propertyTaxes')
+        self.propertyTaxes = ival_
+    def buildChild_utilities(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'utilities')
+        self.utilities = ival_
+    def buildChild_renovations(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'renovations')
+        self.renovations = ival_
+    def buildChild_maintainCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'maintainCosts')
+        self.maintainCosts = ival_
+    def buildChild_homeOwnerInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'homeOwnerInsurance')
+        self.homeOwnerInsurance = ival_
+    def buildChild_opportunityCostInitial(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
+        self.opportunityCostInitial = ival_
+    def buildChild_opportunityCostYearly(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
+        self.opportunityCostYearly = ival_
+    def buildChild_totalBenefit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalBenefit')
+        self.totalBenefit = ival_
+    def buildChild_totalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
+        self.totalCost = ival_
+    childBuilders_ = {
+        'mortgagePayment': buildChild_mortgagePayment,
+        'principal': buildChild_principal,
+        'interest': buildChild_interest,
+        'hoaFees': buildChild_hoaFees,
+        'propertyTaxes': buildChild_propertyTaxes,
+        'utilities': buildChild_utilities,
+        'renovations': buildChild_renovations,
+        'maintainCosts': buildChild_maintainCosts,
+        'homeOwnerInsurance': buildChild_homeOwnerInsurance,
+        'opportunityCostInitial': buildChild_opportunityCostInitial,
+        'opportunityCostYearly': buildChild_opportunityCostYearly,
+        'totalBenefit': buildChild_totalBenefit,
+        'totalCost': buildChild_totalCost
+    }
+# end class buyingType
+
+
+class rentingType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, rent=None, rentersInsurance=None, opportunityCostInitial=None, opportunityCostYearly=None, totalCost=None):
+        self.original_tagname_ = None
+        self.rent = rent
+        self.rentersInsurance = rentersInsurance
+        self.opportunityCostInitial = opportunityCostInitial
+        self.opportunityCostYearly = opportunityCostYearly
+        self.totalCost = totalCost
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, rentingType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if rentingType.subclass:
+            return rentingType.subclass(*args_, **kwargs_)
+        else:
+            return rentingType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_rent(self): return self.rent
+    def set_rent(self, rent): self.rent = rent
+    def get_rentersInsurance(self): return self.rentersInsurance
+    def set_rentersInsurance(self, rentersInsurance): self.rentersInsurance = rentersInsurance
+    def get_opportunityCostInitial(self): return self.opportunityCostInitial
+    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
+    def get_opportunityCostYearly(self): return self.opportunityCostYearly
+    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
+    def get_totalCost(self): return self.totalCost
+    def set_totalCost(self, totalCost): self.totalCost = totalCost
+    def hasContent_(self):
+        if (
+            self.rent is not None or
+            self.rentersInsurance is not None or
+            self.opportunityCostInitial is not None or
+            self.opportunityCostYearly is not None or
+            self.totalCost is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='rentingType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='rentingType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='rentingType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='rentingType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='rentingType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.rent is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srent>%s</%srent>%s' % (namespace_, self.gds_format_integer(self.rent, input_name='rent'), namespace_, eol_))
+        if self.rentersInsurance is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%srentersInsurance>%s</%srentersInsurance>%s' % (namespace_, self.gds_format_integer(self.rentersInsurance, input_name='rentersInsurance'), namespace_, eol_))
+        if self.opportunityCostInitial is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
+        if self.opportunityCostYearly is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
+        if self.totalCost is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = rentingType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_rent(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rent')
+        self.rent = ival_
+    def buildChild_rentersInsurance(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'rentersInsurance')
+        self.rentersInsurance = ival_
+    def buildChild_opportunityCostInitial(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
+        self.opportunityCostInitial = ival_
+    def buildChild_opportunityCostYearly(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
+        self.opportunityCostYearly = ival_
+    def buildChild_totalCost(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
+        self.totalCost = ival_
+    childBuilders_ = {
+        'rent': buildChild_rent,
+        'rentersInsurance': buildChild_rentersInsurance,
+        'opportunityCostInitial': buildChild_opportunityCostInitial,
+        'opportunityCostYearly': buildChild_opportunityCostYearly,
+        'totalCost': buildChild_totalCost
+    }
+# end class rentingType
+
+
+class sellingType(GeneratedsSuper):
+    subclass = None
+    superclass = None
+    def __init__(self, sellingCosts=None, remainingPrincipal=None, homeValue=None, tax=None):
+        self.original_tagname_ = None
+        self.sellingCosts = sellingCosts
+        self.remainingPrincipal = remainingPrincipal
+        self.homeValue = homeValue
+        self.tax = tax
+    def factory(*args_, **kwargs_):
+        if searchresults_.CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(
+                searchresults_.CurrentSubclassModule_, sellingType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if sellingType.subclass:
+            return sellingType.subclass(*args_, **kwargs_)
+        else:
+            return sellingType(*args_, **kwargs_)
+    factory = staticmethod(factory)
+    def get_sellingCosts(self): return self.sellingCosts
+    def set_sellingCosts(self, sellingCosts): self.sellingCosts = sellingCosts
+    def get_remainingPrincipal(self): return self.remainingPrincipal
+    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
+    def get_homeValue(self): return self.homeValue
+    def set_homeValue(self, homeValue): self.homeValue = homeValue
+    def get_tax(self): return self.tax
+    def set_tax(self, tax): self.tax = tax
+    def hasContent_(self):
+        if (
+            self.sellingCosts is not None or
+            self.remainingPrincipal is not None or
+            self.homeValue is not None or
+            self.tax is not None
+        ):
+            return True
+        else:
+            return False
+    def export(self, outfile, level, namespace_='', name_='sellingType', namespacedef_='', pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.original_tagname_ is not None:
+            name_ = self.original_tagname_
+        showIndent(outfile, level, pretty_print)
+        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
+        already_processed = set()
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='sellingType')
+        if self.hasContent_():
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='sellingType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
+            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
+        else:
+            outfile.write('/>%s' % (eol_, ))
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='sellingType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='sellingType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.sellingCosts is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%ssellingCosts>%s</%ssellingCosts>%s' % (namespace_, self.gds_format_integer(self.sellingCosts, input_name='sellingCosts'), namespace_, eol_))
+        if self.remainingPrincipal is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
+        if self.homeValue is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%shomeValue>%s</%shomeValue>%s' % (namespace_, self.gds_format_integer(self.homeValue, input_name='homeValue'), namespace_, eol_))
+        if self.tax is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%stax>%s</%stax>%s' % (namespace_, self.gds_format_integer(self.tax, input_name='tax'), namespace_, eol_))
+    def build(self, node):
+        already_processed = set()
+        self.buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
+            self.buildChildren(child, node, nodeName_)
+        return self
+    def buildAttributes(self, node, attrs, already_processed):
+        pass
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = sellingType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_sellingCosts(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'sellingCosts')
+        self.sellingCosts = ival_
+    def buildChild_remainingPrincipal(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
+        self.remainingPrincipal = ival_
+    def buildChild_homeValue(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'homeValue')
+        self.homeValue = ival_
+    def buildChild_tax(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'tax')
+        self.tax = ival_
+    childBuilders_ = {
+        'sellingCosts': buildChild_sellingCosts,
+        'remainingPrincipal': buildChild_remainingPrincipal,
+        'homeValue': buildChild_homeValue,
+        'tax': buildChild_tax
+    }
+# end class sellingType
+
+
+GDSClassesMapping = {
+    'AmortizationSchedule': annualAmortizationSchedule,
+    'InterestOnlyAmortizationSchedule': annualInterestOnlyAmortizationSchedule,
+    'InvestmentYearlyCostsTable': investmentYearlyCostsTable,
+    'InvestmentcumulativeYearlyCostsTable': investmentCumulativeYearlyCostsTable,
+    'Payment': PaymentType8,
+    'amortizationSchedule': TaxSavingsAmortizationSchedule,
+    'biWeeklyAmortizationSchedule': BiWeeklyPaymentAmortizationSchedule2,
+    'buying': buyingType,
+    'lastWeek': MortgageRateList,
+    'pairs': pairsType,
+    'payment': paymentType2,
+    'rate': MortgageInterestRate,
+    'renting': rentingType,
+    'savingsTableSchedule': SavingsTableSchedule,
+    'selling': sellingType,
+    'today': MortgageRateList,
+}
+
+
+__all__ = [
+    "AdjustableMortgage",
+    "AdjustableMortgageAmortizationSchedule",
+    "AmortizationSchedule",
+    "BiWeeklyPayment",
+    "BiWeeklyPaymentAmortizationSchedule",
+    "BiWeeklyPaymentAmortizationSchedule2",
+    "DiscountPoints",
+    "FixedVsAdjustableRate",
+    "FixedVsAdjustableRateAmortizationSchedule",
+    "Heloc",
+    "InterstOnlyVsTraditional",
+    "Investment",
+    "LenderAccountStatus",
+    "MonthlyPaymentData",
+    "MonthlyPaymentsDetails",
+    "MonthlyPaymentsSummary",
+    "MortgageInterestRate",
+    "MortgageRateList",
+    "MortgageRateSummary",
+    "MortgageTerms",
+    "NoCostVsTraditional",
+    "PaymentType",
+    "PaymentType3",
+    "PaymentType4",
+    "PaymentType5",
+    "PaymentType6",
+    "PaymentType7",
+    "PaymentType8",
+    "Refinance",
+    "RentVsBuy",
+    "SavingsTableSchedule",
+    "TaxSavings",
+    "TaxSavingsAmortizationSchedule",
+    "annualAmortizationSchedule",
+    "annualInterestOnlyAmortizationSchedule",
+    "buying",
+    "buyingBlock",
+    "buyingType",
+    "cumulativeYearlyCostsTable",
+    "investmentBuyingBlock",
+    "investmentCumulativeYearlyCostsTable",
+    "investmentYearlyCostsTable",
+    "loanAmountPairs",
+    "pairsType",
+    "paymentType",
+    "paymentType2",
+    "rentingBlock",
+    "rentingType",
+    "sellingBlock",
+    "sellingType",
+    "yearlyCostsTable"
+]
+
+
+# Make the calculator classes available from searchresults again, for
+# get_root_tag() and for code that used them from there
+searchresults_.GDSClassesMapping.update(GDSClassesMapping)
+for name_ in __all__:
+    setattr(searchresults_, name_, globals()[name_])
@@ -0,0 +1,72 @@
+# coerce.py
+#
+# Schema-driven coercion of Redfin CSV fields to Listing attribute values.
+# Each field is parsed at most once; empty strings, the most common value in
+# a Redfin download, are passed through without a conversion attempt.
+
+
+def to_float(value):
+    """
+    value as a float; None, empty strings and values that are not numbers
+    are returned unchanged
+    """
+    if value is None or value.__class__ is float or value == '':
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class FieldSchema(object):
+    """
+    Maps CSV headers to attributes and their coercion
+
+    fields is a sequence of (attribute, header, coerce), coerce being a
+    function of one value such as to_float, or None to keep the field as
+    read. Rows missing one of the headers are skipped.
+    """
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        # (indexes, fields by column) of the last coerce_list, in one
+        # attribute so that threads sharing the schema see a consistent pair
+        self._columns = (None, ())
+
+    @staticmethod
+    def _coerce(row, fields):
+        """
+        attribute -> value for fields of (attribute, key, coerce), reading
+        each value as row[key]; raises KeyError if a key is missing
+        """
+        values = {}
+        for attribute, key, coerce in fields:
+            value = row[key]
+            if coerce is not None and value != '':
+                value = coerce(value)
+            values[attribute] = value
+        return values
+
+    def coerce_rows(self, rows):
+        """
+        Yield attribute -> value for each row keyed by header, skipping rows
+        missing a header
+        """
+        fields = self.fields
+        for row in rows:
+            try:
+                values = FieldSchema._coerce(row, fields)
+            except KeyError:
+                continue
+            yield values
+
+    def coerce_list(self, row, indexes):
+        """
+        attribute -> value for a CSV row read as a list, indexes mapping
+        each attribute to its column
+        """
+        columns = self._columns
+        if columns[0] is not indexes:
+            # The rows of a page share their indexes
+            columns = (indexes, tuple((attribute, indexes[attribute], coerce) for attribute, header, coerce in self.fields))
+            self._columns = columns
+        return FieldSchema._coerce(row, columns[1])
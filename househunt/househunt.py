@@ -3,23 +3,61 @@
 import os
 import hashlib
 import urllib
-import urllib2
-import StringIO
+import urlparse
 import csv
-import requests
 import xmltodict
-import searchresults
 
-from tinydb import TinyDB, Query
+from storage import TinyDBStorage, SQLiteStorage, LRUStorage, FingerprintStore
+from ratelimit import QuotaExceeded
+from httppool import default_pool, HostLimiter
+from archive import ResponseArchive, ArchiveMiss
+from httpcache import CacheMiss
+from coerce import to_float, FieldSchema
+from lazy import LazyImport
 
 from datetime import datetime, timedelta
 
+from multiprocessing.pool import ThreadPool
+
 from fake_useragent import UserAgent
 
-class House(object):
+# numpy is only needed by ListingFrame; importing it costs every user of
+# the scalar classes
+np = LazyImport('numpy')
+
+class Slotted(object):
+    """
+    Base of the slotted record classes; slotted classes need __getstate__
+    and __setstate__ to pickle with protocols 0 and 1
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return dict((slot, getattr(self, slot, None)) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+class House(Slotted):
     """
     House class
     """
+    __slots__ = (
+        '_street_address',
+        '_city',
+        '_state',
+        '_zip_code',
+        '_beds',
+        '_baths',
+        '_sq_ft',
+        '_parking',
+        '_parking_type',
+        '_lot_size',
+        '_home_type'
+    )
+
     def __init__(
         self,
         street_address=None,
@@ -101,11 +139,7 @@ class House(object):
 
     @beds.setter
     def beds(self, beds):
-        if is_float(beds):
-            beds = float(beds)
-        elif is_int(beds):
-            beds = int(beds)
-        self._beds = beds
+        self._beds = to_float(beds)
 
     @property
     def baths(self):
@@ -113,11 +147,7 @@ class House(object):
 
     @baths.setter
     def baths(self, baths):
-        if is_float(baths):
-            baths = float(baths)
-        elif is_int(baths):
-            baths = int(baths)
-        self._baths = baths
+        self._baths = to_float(baths)
 
     @property
     def sq_ft(self):
@@ -125,11 +155,7 @@ class House(object):
 
     @sq_ft.setter
     def sq_ft(self, sq_ft):
-        if is_float(sq_ft):
-            sq_ft = float(sq_ft)
-        elif is_int(sq_ft):
-            sq_ft = int(sq_ft)
-        self._sq_ft = sq_ft
+        self._sq_ft = to_float(sq_ft)
 
     @property
     def parking(self):
@@ -137,11 +163,7 @@ class House(object):
 
     @parking.setter
     def parking(self, parking):
-        if is_float(parking):
-            parking = float(parking)
-        elif is_int(parking):
-            parking = int(parking)
-        self._parking = parking
+        self._parking = to_float(parking)
 
     @property
     def parking_type(self):
@@ -157,11 +179,7 @@ class House(object):
 
     @lot_size.setter
     def lot_size(self, lot_size):
-        if is_float(lot_size):
-            lot_size = float(lot_size)
-        elif is_int(lot_size):
-            lot_size = int(lot_size)
-        self._lot_size = lot_size
+        self._lot_size = to_float(lot_size)
 
     @property
     def home_type(self):
@@ -177,6 +195,26 @@ class House(object):
         m.update(str(self))
         return m.hexdigest()
 
+    @classmethod
+    def from_fields(cls, fields):
+        """
+        House from attribute values already coerced by RFAPI.SCHEMA,
+        assigned without going through the setters
+        """
+        h = cls.__new__(cls)
+        h._street_address = fields['street_address']
+        h._city = fields['city']
+        h._state = fields['state']
+        h._zip_code = fields['zip_code']
+        h._beds = fields['beds']
+        h._baths = fields['baths']
+        h._sq_ft = fields['sq_ft']
+        h._parking = fields['parking']
+        h._parking_type = fields['parking_type']
+        h._lot_size = fields['lot_size']
+        h._home_type = fields['home_type']
+        return h
+
     @classmethod
     def from_dict(cls, dictionary):
         try:
@@ -226,10 +264,23 @@ class House(object):
             return False
 
 
-class Listing(object):
+class Listing(Slotted):
     """
     Listing class
     """
+    __slots__ = (
+        '_house',
+        '_list_price',
+        '_zestimate',
+        '_days_on_market',
+        '_original_list_price',
+        '_status',
+        '_mls_id',
+        '_open_house_date',
+        '_open_house_start_time',
+        '_open_house_end_time'
+    )
+
     def __init__(
         self,
         house=None,
@@ -287,11 +338,7 @@ class Listing(object):
 
     @list_price.setter
     def list_price(self, list_price):
-        if is_float(list_price):
-            list_price = float(list_price)
-        elif is_int(list_price):
-            list_price = int(list_price)
-        self._list_price = list_price
+        self._list_price = to_float(list_price)
 
     @property
     def zestimate(self):
@@ -299,11 +346,7 @@ class Listing(object):
 
     @zestimate.setter
     def zestimate(self, zestimate):
-        if is_float(zestimate):
-            zestimate = float(zestimate)
-        elif is_int(zestimate):
-            zestimate = int(zestimaet)
-        self._zestimate = zestimate
+        self._zestimate = to_float(zestimate)
 
     @property
     def days_on_market(self):
@@ -311,11 +354,7 @@ class Listing(object):
 
     @days_on_market.setter
     def days_on_market(self, days_on_market):
-        if is_float(days_on_market):
-            days_on_market = float(days_on_market)
-        elif is_int(days_on_market):
-            days_on_market = int(days_on_market)
-        self._days_on_market = days_on_market
+        self._days_on_market = to_float(days_on_market)
 
     @property
     def original_list_price(self):
@@ -323,11 +362,7 @@ class Listing(object):
 
     @original_list_price.setter
     def original_list_price(self, original_list_price):
-        if is_float(original_list_price):
-            original_list_price = float(original_list_price)
-        elif is_int(original_list_price):
-            original_list_price = int(original_list_price)
-        self._original_list_price = original_list_price
+        self._original_list_price = to_float(original_list_price)
 
     @property
     def status(self):
@@ -373,6 +408,25 @@ class Listing(object):
     def hsh(self):
         return self.house.hsh
 
+    @classmethod
+    def from_fields(cls, house, fields):
+        """
+        Listing of house from attribute values already coerced by
+        RFAPI.SCHEMA, assigned without going through the setters
+        """
+        l = cls.__new__(cls)
+        l._house = house
+        l._list_price = fields['list_price']
+        l._zestimate = None
+        l._days_on_market = fields['days_on_market']
+        l._original_list_price = fields['original_list_price']
+        l._status = fields['status']
+        l._mls_id = fields['mls_id']
+        l._open_house_date = fields['open_house_date']
+        l._open_house_start_time = fields['open_house_start_time']
+        l._open_house_end_time = fields['open_house_end_time']
+        return l
+
     @classmethod
     def from_dict(cls, dictionary):
         try:
@@ -407,17 +461,12 @@ class Listing(object):
         }
         return d
 
-    def get_zestimate(self):
-        lc = ListCache()
-        lc.remove_old_listings()
-        if lc.listing_in_cache(self):
-            c_list = lc.retrieve_listing(self)
-            self.zestimate = c_list.zestimate
+    def get_zestimate(self, session=None):
+        if session is None:
+            with EnrichmentSession() as session:
+                session.get_zestimate(self)
         else:
-            z_api = ZillAPI()
-            z_list = z_api.get_from_zillow(self.house)
-            self.zestimate = z_api.get_zestimate(z_list)
-            lc.insert_listing(self)
+            session.get_zestimate(self)
 
     def matches_search(
         self,
@@ -462,14 +511,403 @@ class Listing(object):
         html_string += "</tr>"
         return html_string
 
+class ListingFrame(object):
+    """
+    Columnar (struct of arrays) store of listings, backed by NumPy
+
+    Numeric fields are kept in float64 arrays (beds in an int32 array), with
+    NaN (or -1 for beds) marking missing values, and a boolean mask of the
+    rows whose value was text rather than a number (blank CSV fields). City, state, zip, status,
+    home type and parking type are stored as categorical codes. Listing
+    objects are only built when a row is accessed.
+    """
+    FLOAT_COLUMNS = (
+        'baths',
+        'sq_ft',
+        'parking',
+        'lot_size',
+        'list_price',
+        'zestimate',
+        'days_on_market',
+        'original_list_price'
+    )
+    INT_COLUMNS = (
+        'beds',
+    )
+    CATEGORICAL_COLUMNS = (
+        'city',
+        'state',
+        'zip_code',
+        'parking_type',
+        'home_type',
+        'status'
+    )
+    OBJECT_COLUMNS = (
+        'street_address',
+        'mls_id',
+        'open_house_date',
+        'open_house_start_time',
+        'open_house_end_time'
+    )
+    HOUSE_COLUMNS = (
+        'street_address',
+        'city',
+        'state',
+        'zip_code',
+        'beds',
+        'baths',
+        'sq_ft',
+        'parking',
+        'parking_type',
+        'lot_size',
+        'home_type'
+    )
+    # Redfin CSV header for each column, as used by RFAPI.dataset_to_listings
+    DATASET_COLUMNS = {
+        'street_address': 'ADDRESS',
+        'city': 'CITY',
+        'state': 'STATE',
+        'zip_code': 'ZIP',
+        'beds': 'BEDS',
+        'baths': 'BATHS',
+        'parking': 'PARKING SPOTS',
+        'parking_type': 'PARKING TYPE',
+        'sq_ft': 'SQFT',
+        'lot_size': 'LOT SIZE',
+        'home_type': 'HOME TYPE',
+        'list_price': 'LIST PRICE',
+        'days_on_market': 'DAYS ON MARKET',
+        'original_list_price': 'ORIGINAL LIST PRICE',
+        'status': 'STATUS',
+        'mls_id': 'LISTING ID',
+        'open_house_date': 'NEXT OPEN HOUSE DATE',
+        'open_house_start_time': 'NEXT OPEN HOUSE START TIME',
+        'open_house_end_time': 'NEXT OPEN HOUSE END TIME'
+    }
+    MISSING_INT = -1
+    AGGREGATES = ('count', 'sum', 'mean', 'median', 'min', 'max')
+
+    def __init__(self, columns=None):
+        if np.load() is None:
+            raise ImportError("ListingFrame requires numpy")
+        columns = columns or {}
+        length = 0
+        for values in columns.values():
+            length = max(length, len(values))
+        self._length = length
+        self._arrays = {}
+        self._categories = {}
+        self._text = {}
+        for name in self.column_names():
+            values = columns.get(name)
+            if values is None:
+                values = [None] * length
+            elif len(values) != length:
+                raise ValueError("Column %s has %d values, expected %d" % (name, len(values), length))
+            if name in ListingFrame.FLOAT_COLUMNS:
+                self._arrays[name] = np.array([ListingFrame.to_float(v) for v in values], dtype=np.float64)
+                self._text[name] = np.array([ListingFrame.is_text(v) for v in values], dtype=bool)
+            elif name in ListingFrame.INT_COLUMNS:
+                self._arrays[name] = np.array([ListingFrame.to_int(v) for v in values], dtype=np.int32)
+                self._text[name] = np.array([ListingFrame.is_text(v) for v in values], dtype=bool)
+            elif name in ListingFrame.CATEGORICAL_COLUMNS:
+                categories = sorted(set(v for v in values if v is not None))
+                lookup = dict((c, i) for i, c in enumerate(categories))
+                self._categories[name] = categories
+                self._arrays[name] = np.array([lookup.get(v, ListingFrame.MISSING_INT) for v in values], dtype=np.int32)
+            else:
+                arr = np.empty(length, dtype=object)
+                arr[:] = values
+                self._arrays[name] = arr
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._length
+        if i < 0 or i >= self._length:
+            raise IndexError("ListingFrame index out of range")
+        row = dict((name, self.value(i, name)) for name in self.column_names())
+        h = House(**dict((name, row.pop(name)) for name in ListingFrame.HOUSE_COLUMNS))
+        return Listing(house=h, **row)
+
+    def __repr__(self):
+        return "<ListingFrame: %d listings>" % self._length
+
+    @classmethod
+    def column_names(cls):
+        return cls.FLOAT_COLUMNS + cls.INT_COLUMNS + cls.CATEGORICAL_COLUMNS + cls.OBJECT_COLUMNS
+
+    @classmethod
+    def from_result_sets(cls, result_sets):
+        columns = dict((name, []) for name in cls.DATASET_COLUMNS)
+        for rs in result_sets:
+            try:
+                row = [(name, rs[key]) for name, key in cls.DATASET_COLUMNS.items()]
+            except KeyError:
+                continue
+            for name, value in row:
+                columns[name].append(value)
+        return cls(columns)
+
+    @classmethod
+    def from_listings(cls, listings):
+        columns = dict((name, []) for name in cls.column_names())
+        for listing in listings:
+            list_dict = listing.as_dict()
+            list_dict.update(list_dict.pop('house'))
+            for name in columns:
+                columns[name].append(list_dict[name])
+        return cls(columns)
+
+    @classmethod
+    def _from_arrays(cls, arrays, categories, text):
+        frame = cls.__new__(cls)
+        frame._arrays = arrays
+        frame._categories = categories
+        frame._text = text
+        frame._length = len(arrays['list_price'])
+        return frame
+
+    @staticmethod
+    def to_float(f):
+        try:
+            return float(f)
+        except (TypeError, ValueError):
+            return np.nan
+
+    @staticmethod
+    def to_int(i):
+        try:
+            return int(float(i))
+        except (TypeError, ValueError):
+            return ListingFrame.MISSING_INT
+
+    @staticmethod
+    def is_text(v):
+        """
+        Whether v is text that is not a number, such as a blank CSV field
+        """
+        if not isinstance(v, basestring):
+            return False
+        try:
+            float(v)
+        except ValueError:
+            return True
+        return False
+
+    def _missing(self, i, name):
+        # Text comes back blank, which the scalar searches compare the same
+        # way as any other text
+        return '' if self._text[name][i] else None
+
+    def value(self, i, name):
+        v = self._arrays[name][i]
+        if name in ListingFrame.FLOAT_COLUMNS:
+            return self._missing(i, name) if np.isnan(v) else float(v)
+        elif name in ListingFrame.INT_COLUMNS:
+            return self._missing(i, name) if v == ListingFrame.MISSING_INT else int(v)
+        elif name in ListingFrame.CATEGORICAL_COLUMNS:
+            return None if v == ListingFrame.MISSING_INT else self._categories[name][v]
+        return v
+
+    def set_value(self, i, name, value):
+        if name in ListingFrame.FLOAT_COLUMNS:
+            self._arrays[name][i] = ListingFrame.to_float(value)
+            self._text[name][i] = ListingFrame.is_text(value)
+        elif name in ListingFrame.INT_COLUMNS:
+            self._arrays[name][i] = ListingFrame.to_int(value)
+            self._text[name][i] = ListingFrame.is_text(value)
+        elif name in ListingFrame.CATEGORICAL_COLUMNS:
+            categories = self._categories[name]
+            if value is None:
+                self._arrays[name][i] = ListingFrame.MISSING_INT
+            elif value in categories:
+                self._arrays[name][i] = categories.index(value)
+            else:
+                # Appending keeps existing codes valid, at the cost of the
+                # categories no longer being sorted
+                categories.append(value)
+                self._arrays[name][i] = len(categories) - 1
+        else:
+            self._arrays[name][i] = value
+
+    def column(self, name):
+        """
+        Values of a column as an array; categorical columns are decoded
+        """
+        if name in ListingFrame.CATEGORICAL_COLUMNS:
+            lookup = np.empty(len(self._categories[name]) + 1, dtype=object)
+            lookup[:-1] = self._categories[name]
+            lookup[-1] = None
+            return lookup[self._arrays[name]]
+        return self._arrays[name]
+
+    def codes(self, name):
+        return self._arrays[name]
+
+    def categories(self, name):
+        return list(self._categories[name])
+
+    def category_mask(self, name, value):
+        categories = self._categories[name]
+        if value not in categories:
+            return np.zeros(self._length, dtype=bool)
+        return self._arrays[name] == categories.index(value)
+
+    def take(self, indexes):
+        """
+        New ListingFrame holding the rows selected by an index array or boolean mask
+        """
+        indexes = np.asarray(indexes)
+        arrays = dict((name, arr[indexes]) for name, arr in self._arrays.items())
+        categories = dict((name, list(c)) for name, c in self._categories.items())
+        text = dict((name, mask[indexes]) for name, mask in self._text.items())
+        return ListingFrame._from_arrays(arrays, categories, text)
+
+    def sort(self, name, descending=False):
+        """
+        New ListingFrame ordered by a column; missing values sort last
+        """
+        arr = self._arrays[name]
+        if name in ListingFrame.OBJECT_COLUMNS:
+            present = [i for i in range(self._length) if arr[i] is not None]
+            missing = [i for i in range(self._length) if arr[i] is None]
+            present.sort(key=lambda i: arr[i], reverse=descending)
+            return self.take(np.array(present + missing, dtype=np.intp))
+        if name in ListingFrame.FLOAT_COLUMNS:
+            key = arr
+        elif name in ListingFrame.INT_COLUMNS:
+            key = np.where(arr == ListingFrame.MISSING_INT, np.nan, arr)
+        else:
+            # set_value can append categories out of order, so rank them
+            # rather than trusting the codes; the extra slot is for missing
+            categories = self._categories[name]
+            ranks = np.empty(len(categories) + 1, dtype=np.float64)
+            ranks[:-1] = np.argsort(np.argsort(np.array(categories, dtype=object), kind='mergesort'))
+            ranks[-1] = np.nan
+            key = ranks[arr]
+        if descending:
+            key = -key
+        # argsort places NaN last
+        return self.take(np.argsort(key, kind='mergesort'))
+
+    def aggregate(self, name, how='mean', by=None):
+        """
+        Aggregate a numeric column, ignoring missing values. With by set to a
+        categorical column, returns a dictionary of category to result.
+        """
+        if how not in ListingFrame.AGGREGATES:
+            raise ValueError("Unknown aggregate %s, expected one of %s" % (how, ', '.join(ListingFrame.AGGREGATES)))
+        values = self.numeric(name)
+        if by is None:
+            return ListingFrame._reduce(values, how)
+        results = {}
+        codes = self._arrays[by]
+        for code, category in enumerate(self._categories[by]):
+            results[category] = ListingFrame._reduce(values[codes == code], how)
+        return results
+
+    @staticmethod
+    def _reduce(values, how):
+        values = values[~np.isnan(values)]
+        if how == 'count':
+            return int(len(values))
+        if len(values) == 0:
+            return None
+        return float(getattr(np, how)(values))
+
+    def numeric(self, name):
+        """
+        Numeric column as float64, with NaN for missing values
+        """
+        values = self._arrays[name]
+        if name in ListingFrame.INT_COLUMNS:
+            return np.where(values == ListingFrame.MISSING_INT, np.nan, values)
+        elif name not in ListingFrame.FLOAT_COLUMNS:
+            raise ValueError("Column %s is not numeric" % name)
+        return values
+
+    def matches_search(
+        self,
+        beds=None,
+        baths=None,
+        sq_ft=None,
+        parking=None,
+        lot_size=None,
+        list_price=None,
+        zestimate=None,
+        days_on_market=None,
+        status=None
+    ):
+        """
+        Boolean mask of the rows matching House.matches_search and
+        Listing.matches_search with the same criteria
+
+        As with the scalar methods under Python 2 ordering, a missing value
+        (None) never meets a minimum and always meets a maximum, while text
+        such as a blank CSV field sorts above every number, so it always
+        meets a minimum and never meets a maximum.
+        """
+        mask = np.ones(self._length, dtype=bool)
+        minimums = (
+            ('beds', beds),
+            ('baths', baths),
+            ('sq_ft', sq_ft),
+            ('parking', parking),
+            ('lot_size', lot_size)
+        )
+        maximums = (
+            ('list_price', list_price),
+            ('zestimate', zestimate),
+            ('days_on_market', days_on_market)
+        )
+        with np.errstate(invalid='ignore'):
+            for name, minimum in minimums:
+                if minimum is not None:
+                    mask &= (self.numeric(name) >= minimum) | self._text[name]
+            for name, maximum in maximums:
+                if maximum is not None:
+                    values = self.numeric(name)
+                    mask &= (values <= maximum) | (np.isnan(values) & ~self._text[name])
+        if status:
+            mask &= self.category_mask('status', status)
+        return mask
+
+    def search(self, **criteria):
+        """
+        New ListingFrame holding the rows that match the criteria of matches_search
+        """
+        return self.take(self.matches_search(**criteria))
+
+    def to_listings(self):
+        return [self[i] for i in range(self._length)]
+
 
 class ListCache(object):
 
     DB_FILE = 'listing_db.json'
+    SQLITE_FILE = 'listing_db.sqlite'
     DB_TTL = timedelta(hours=12)
+    # Most expired listings removed by the sweep in Listing.get_zestimate
+    SWEEP_LIMIT = 500
+    BACKENDS = {
+        'tinydb': (TinyDBStorage, DB_FILE),
+        'sqlite': (SQLiteStorage, SQLITE_FILE)
+    }
 
-    def __init__(self):
-        self.db = TinyDB(os.path.join(os.path.join(os.getcwd(), os.path.dirname(__file__)), ListCache.DB_FILE))
+    def __init__(self, backend='tinydb', db_file=None, lru_size=0, lru_ttl=None, flush_size=100):
+        if backend not in ListCache.BACKENDS:
+            raise ValueError("Unknown ListCache backend %s, expected one of %s" % (backend, ', '.join(sorted(ListCache.BACKENDS))))
+        storage_cls, default_file = ListCache.BACKENDS[backend]
+        self.db = storage_cls(db_file or ListCache.db_path(default_file))
+        if lru_size:
+            self.db = LRUStorage(self.db, max_size=lru_size, ttl=lru_ttl, flush_size=flush_size)
 
     @property
     def db(self):
@@ -479,39 +917,142 @@ class ListCache(object):
     def db(self, db):
         self._db = db
 
+    @staticmethod
+    def db_path(db_file):
+        return os.path.join(os.path.join(os.getcwd(), os.path.dirname(__file__)), db_file)
+
+    @classmethod
+    def migrate_to_sqlite(cls, db_file=None, sqlite_file=None):
+        """
+        Copy a TinyDB cache file into the SQLite backend, returning the number of listings copied
+        """
+        storage = SQLiteStorage(sqlite_file or cls.db_path(cls.SQLITE_FILE))
+        try:
+            return storage.migrate_from_tinydb(db_file or cls.db_path(cls.DB_FILE))
+        finally:
+            storage.close()
+
+    @staticmethod
+    def cutoff():
+        return (datetime.now() - ListCache.DB_TTL).isoformat()
+
     def listing_in_cache(self, listing):
-        lquery = Query()
-        return self.db.contains(lquery.hsh == listing.hsh)
+        return self.db.contains(listing.hsh, since=ListCache.cutoff())
 
     def retrieve_listing(self, listing):
-        lquery = Query()
-        list_dict = self.db.get(lquery.hsh == listing.hsh)
+        list_dict = self.db.get(listing.hsh, since=ListCache.cutoff())
+        return Listing.from_dict(list_dict)
+
+    def lookup_listing(self, listing):
+        """
+        The cached copy of listing, or None; a single lookup, so the
+        in-memory tier counts one hit or miss
+        """
+        list_dict = self.db.get(listing.hsh, since=ListCache.cutoff())
+        if list_dict is None:
+            return None
         return Listing.from_dict(list_dict)
 
     def insert_listing(self, listing):
-        if self.listing_in_cache(listing):
-            self.update_listing(listing)
-        else:
-            list_dict = listing.as_dict()
-            list_dict['last_updated'] = datetime.now().isoformat()
-            list_dict['hsh'] = listing.hsh
-            self.db.insert(list_dict)
+        list_dict = listing.as_dict()
+        list_dict['last_updated'] = datetime.now().isoformat()
+        list_dict['hsh'] = listing.hsh
+        self.db.insert(list_dict)
 
     def remove_listing(self, listing):
-        lquery = Query()
-        self.db.remove(lquery.hsh == listing.hsh)
+        self.db.remove(listing.hsh)
 
     def update_listing(self, listing):
-        lquery = Query()
-        if self.listing_in_cache(listing):
-            self.remove_listing(listing)
         self.insert_listing(listing)
 
-    def remove_old_listings(self):
-        list_ar = self.db.all()
-        for listing in list_ar:
-            if datetime.strptime(listing['last_updated'], '%Y-%m-%dT%H:%M:%S.%f') < datetime.now() - ListCache.DB_TTL:
-                self.remove_listing(Listing.from_dict(listing))
+    def remove_old_listings(self, limit=None):
+        """
+        Remove expired listings, oldest first, stopping after limit listings
+        if given. Expired listings that are left behind are already ignored
+        by listing_in_cache and retrieve_listing.
+        """
+        return self.db.remove_older_than(ListCache.cutoff(), limit=limit)
+
+    @property
+    def stats(self):
+        """
+        Hit, miss and eviction counters of the in-memory tier, if there is one
+        """
+        return getattr(self.db, 'stats', None)
+
+    def flush(self):
+        """
+        Write any batched inserts through to disk
+        """
+        if hasattr(self.db, 'flush'):
+            self.db.flush()
+
+    def close(self):
+        self.db.close()
+
+class ListingDelta(object):
+    """
+    ListingDelta class
+
+    Compares a crawl with the fingerprints stored by the previous one. A
+    listing is keyed on its MLS id, or its hsh when it has none, and its
+    fingerprint is the values of FIELDS.
+    """
+    DB_FILE = 'listing_fingerprints.sqlite'
+    FIELDS = ('list_price', 'status', 'days_on_market')
+    ADDED = 'added'
+    CHANGED = 'changed'
+    REMOVED = 'removed'
+
+    def __init__(self, db_file=None, fields=None):
+        self.store = FingerprintStore(db_file or ListCache.db_path(ListingDelta.DB_FILE))
+        self.fields = tuple(fields or ListingDelta.FIELDS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def key(listing):
+        return listing.mls_id or listing.hsh
+
+    def fingerprint(self, listing):
+        return '|'.join('' if v is None else repr(v) for v in (getattr(listing, f) for f in self.fields))
+
+    def diff(self, listings, removals=True):
+        """
+        Yield (ListingDelta.ADDED or CHANGED, listing) for each new or
+        changed listing, then (ListingDelta.REMOVED, listing) for each stored
+        listing that was not seen. The fingerprints are saved once listings
+        is exhausted; stopping early saves nothing. With removals=False (e.g.
+        after a partial crawl) unseen listings are kept and not reported.
+        """
+        previous = self.store.fingerprints()
+        seen = set()
+        upserts = []
+        for listing in listings:
+            key = ListingDelta.key(listing)
+            if key in seen:
+                continue
+            seen.add(key)
+            fingerprint = self.fingerprint(listing)
+            old = previous.get(key)
+            if old == fingerprint:
+                continue
+            upserts.append((key, fingerprint, listing.as_dict()))
+            yield (ListingDelta.ADDED if old is None else ListingDelta.CHANGED), listing
+        removed = []
+        if removals:
+            removed = [key for key in previous if key not in seen]
+            for key in removed:
+                yield ListingDelta.REMOVED, Listing.from_dict(self.store.get(key))
+        self.store.apply(upserts, removed, datetime.now().isoformat())
+
+    def close(self):
+        self.store.close()
+
 
 class ZillAPI(object):
 
@@ -520,7 +1061,14 @@ class ZillAPI(object):
     # Moved ZWSID to an external file to avoid committing to source control. Should be placed in file named 'ZWSID' with the value on the first line
     ZWSID = ''
 
-    def __init__(self, zwsid=None, zwsid_filename=None, save_zwsid=False):
+    def __init__(self, zwsid=None, zwsid_filename=None, save_zwsid=False, timeout=None, http_pool=None, validate=True, archive=None):
+        self.timeout = timeout
+        self.http_pool = http_pool or default_pool()
+        # archive.ResponseArchive recording the responses, or replaying them
+        # in place of the network
+        self.archive = archive
+        # validate=False skips the enumeration checks in get_from_zillow
+        self.validate = validate
         if zwsid:
             ZillAPI.set_zwsid(zwsid)
             if save_zwsid and zwsid_filename:
@@ -546,23 +1094,53 @@ class ZillAPI(object):
         pass
 
 
-    def get_from_zillow(self, h):
+    def close(self):
+        # The HTTP pool is shared and outlives the client
+        pass
+
+    def request_zillow(self, h):
         params = (('zws-id', ZillAPI.ZWSID), ('address', h.street_address), ('citystatezip', h.zip_code))
         urlparams = urllib.urlencode(params)
-        zurl = "%s?%s" % (ZillAPI.ZIL_URL, urlparams)
-        req = requests.get(zurl)
-        req_content = req.content
-        req_content_str = StringIO.StringIO(req_content)
-        sr = searchresults.parse(req_content_str, silence=True)
+        zurl = "%s?%s" % (self.ZIL_URL, urlparams)
+        if self.archive is not None and self.archive.replaying:
+            return self.archive.get(ResponseArchive.ZILLOW, zurl)
+        req = self.http_pool.get(zurl, timeout=self.timeout)
+        if self.archive is not None:
+            self.archive.add(ResponseArchive.ZILLOW, zurl, req.content)
+        return req.content
+
+    def get_from_zillow(self, h, validate=None):
+        # The generated bindings are large; only load them when needed
+        import searchresults
+        if validate is None:
+            validate = self.validate
+        req_content = self.request_zillow(h)
+        sr = searchresults.parseBytes(req_content, silence=True, validate=validate)
         return sr
 
+    def get_results(self, h):
+        """
+        Zestimate fields of each search result, as dictionaries (see
+        zillowparse.iter_results), without building the full object model
+        """
+        import zillowparse
+        return zillowparse.parse_results(self.request_zillow(h))
+
     def get_zestimate(self, sr):
-        zestimates = []
+        values = []
         if sr.response:
-            for prop in sr.response.results.result:
-                value = prop.zestimate.amount.valueOf_
-                if value not in zestimates:
-                    zestimates.append(value)
+            values = [prop.zestimate.amount.valueOf_ for prop in sr.response.results.result]
+        return ZillAPI.pick_zestimate(values)
+
+    def zestimate_from_results(self, results):
+        return ZillAPI.pick_zestimate([r['amount'] for r in results if r['amount'] is not None])
+
+    @staticmethod
+    def pick_zestimate(values):
+        zestimates = []
+        for value in values:
+            if value not in zestimates:
+                zestimates.append(value)
         if len(zestimates) == 1:
             return zestimates[0]
         elif len(zestimates) == 0:
@@ -570,8 +1148,126 @@ class ZillAPI(object):
         else:
             return max(zestimates)
 
+class EnrichmentSession(object):
+    """
+    Shared ListCache and ZillAPI for looking up the zestimates of many listings
+
+    The cache is opened and swept once, and the ZWSID is only loaded on the
+    first cache miss. Zillow calls go
+    through rate_limiter, if given. Use it as a context manager, or call
+    close() when done.
+    """
+    def __init__(self, cache=None, z_api=None, backend='tinydb', zwsid=None, zwsid_filename=None, rate_limiter=None):
+        self.cache = cache or ListCache(backend=backend)
+        self.cache.remove_old_listings(limit=ListCache.SWEEP_LIMIT)
+        self.rate_limiter = rate_limiter
+        # hsh -> exception for the lookups that failed in get_zestimates
+        self.errors = {}
+        self._z_api = z_api
+        self._zwsid = zwsid
+        self._zwsid_filename = zwsid_filename
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def z_api(self):
+        if self._z_api is None:
+            self._z_api = ZillAPI(zwsid=self._zwsid, zwsid_filename=self._zwsid_filename)
+        return self._z_api
+
+    def fetch_zestimate(self, house):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.z_api.zestimate_from_results(self.z_api.get_results(house))
+
+    def get_zestimate(self, listing):
+        c_list = self.cache.lookup_listing(listing)
+        if c_list is not None:
+            listing.zestimate = c_list.zestimate
+        else:
+            listing.zestimate = self.fetch_zestimate(listing.house)
+            self.cache.insert_listing(listing)
+
+    def get_zestimates(self, listings, workers=1):
+        """
+        Set the zestimate of every listing, fetching cache misses from Zillow
+        on a pool of workers threads
+
+        Only the Zillow requests run on the pool; the cache is read and
+        written from the calling thread, each result as it arrives. Listings
+        sharing a hsh are fetched once. A failed lookup leaves its listings
+        without a zestimate and is recorded in errors (hsh -> exception). If
+        the rate limiter's daily budget runs out, the remaining listings are
+        left without a zestimate.
+        """
+        self.errors = {}
+        if workers <= 1:
+            for listing in listings:
+                try:
+                    self.get_zestimate(listing)
+                except QuotaExceeded:
+                    break
+                except Exception as e:
+                    self.errors[listing.hsh] = e
+            return
+        misses = {}
+        for listing in listings:
+            c_list = self.cache.lookup_listing(listing)
+            if c_list is not None:
+                listing.zestimate = c_list.zestimate
+            else:
+                misses.setdefault(listing.hsh, []).append(listing)
+        if not misses:
+            return
+        # Create the ZillAPI before the workers race to do so
+        self.z_api
+
+        def fetch(hsh):
+            try:
+                return hsh, self.fetch_zestimate(misses[hsh][0].house), None
+            except Exception as e:
+                return hsh, None, e
+
+        pool = ThreadPool(workers)
+        try:
+            for hsh, zestimate, error in pool.imap_unordered(fetch, list(misses)):
+                if isinstance(error, QuotaExceeded):
+                    continue
+                if error is not None:
+                    self.errors[hsh] = error
+                    continue
+                for listing in misses[hsh]:
+                    listing.zestimate = zestimate
+                self.cache.insert_listing(misses[hsh][0])
+        except BaseException:
+            # Drop the queued lookups rather than make calls nobody reads
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+            self.cache.flush()
+
+    def close(self):
+        self.cache.close()
+        if self._z_api is not None:
+            self._z_api.close()
+
+
 class RFAPI(object):
 
+    # Listing attribute, Redfin CSV header and coercion of each downloaded
+    # field; numeric fields become floats, as the Listing setters store them
+    SCHEMA = FieldSchema(
+        (name, header, to_float if name in ListingFrame.FLOAT_COLUMNS + ListingFrame.INT_COLUMNS else None)
+        for name, header in sorted(ListingFrame.DATASET_COLUMNS.items())
+    )
+
     DL_URL = 'https://www.redfin.com/stingray/do/gis-search'
 
     DL_PARAMS = {
@@ -597,11 +1293,38 @@ class RFAPI(object):
         self,
         region_ids=[],
         load_listings=False,
-        get_zestimates=False
+        get_zestimates=False,
+        columnar=False,
+        http_pool=None,
+        workers=1,
+        host_limit=4,
+        paginate=True,
+        page_workers=4,
+        response_cache=None,
+        archive=None
     ):
         self.region_ids = region_ids
+        self.columnar = columnar
+        self.http_pool = http_pool or default_pool()
+        # With workers > 1, regions download in parallel, at most host_limit
+        # at a time per host, and a failing region is recorded in errors
+        # instead of aborting the rest
+        self.workers = workers
+        self.host_limiter = HostLimiter(host_limit)
+        self.errors = {}
+        # A page holding num_homes rows may be truncated; with paginate the
+        # following pages are fetched, page_workers at a time, and rows seen
+        # before are dropped
+        self.paginate = paginate
+        self.page_workers = page_workers
+        # httpcache.ResponseCache for the downloads, if any
+        self.response_cache = response_cache
+        # archive.ResponseArchive recording the downloads, or replaying them
+        # in place of the network
+        self.archive = archive
         self.result_sets = []
         self.listings = []
+        self.frame = None
         self.dl_urls = []
         if region_ids:
             self.build_dl_urls()
@@ -626,6 +1349,16 @@ class RFAPI(object):
     def dl_urls(self, dl_urls):
         self._dl_urls = dl_urls
 
+    @property
+    def columnar(self):
+        return self._columnar
+
+    @columnar.setter
+    def columnar(self, columnar):
+        if columnar and np.load() is None:
+            raise ImportError("columnar mode requires numpy")
+        self._columnar = columnar
+
     @property
     def result_sets(self):
         return self._result_sets
@@ -640,7 +1373,7 @@ class RFAPI(object):
             params = RFAPI.DL_PARAMS
             params['region_id'] = region_id
             url_params = urllib.urlencode(params, doseq=True)
-            dl_url = "%s?%s" % (RFAPI.DL_URL, url_params)
+            dl_url = "%s?%s" % (self.DL_URL, url_params)
             self.dl_urls.append(dl_url)
 
     def add_region_id(self, region_id):
@@ -648,76 +1381,328 @@ class RFAPI(object):
             self.region_ids.append(region_id)
             self.build_dl_urls()
 
-    def retrieve_dls(self):
+    @staticmethod
+    def random_user_agent():
         ua = UserAgent()
         ua.update
-        user_agent = ua.random
-        for dl_url in self.dl_urls:
+        return ua.random
+
+    CHUNK_SIZE = 64 * 1024
+
+    def stream_dl(self, dl_url, user_agent, timeout=None):
+        """
+        Yield the CSV rows of a download as lists, header row first, reading
+        the response body CHUNK_SIZE bytes at a time
+        """
+        chunks = self.download_chunks(dl_url, user_agent, timeout)
+        try:
+            for row in csv.reader(iter_lines(chunks), delimiter=','):
+                yield row
+        finally:
+            chunks.close()
+
+    def download_chunks(self, dl_url, user_agent, timeout=None):
+        """
+        Body of a download as a generator of chunks: replayed from the
+        archive, read through the response cache or from the network, and
+        recorded when the archive is recording
+        """
+        try:
+            if self.archive is not None and self.archive.replaying:
+                return self.archive.chunks(ResponseArchive.REDFIN, dl_url)
             headers = { 'User-Agent': user_agent }
-            req = urllib2.Request(dl_url, headers=headers)
-            browse = urllib2.urlopen(req)
-            csv_str = browse.read()
-            csv_f = StringIO.StringIO(csv_str)
-            reader = csv.reader(csv_f, delimiter=',')
-            headers = reader.next()
-            for row in reader:
-                ds = zip(headers, row)
-                self.result_sets.append(dict(ds))
+            if self.response_cache is not None:
+                chunks = self.response_cache.get(self.http_pool, dl_url, headers=headers, timeout=timeout, chunk_size=RFAPI.CHUNK_SIZE)
+            else:
+                chunks = self.network_chunks(dl_url, headers, timeout)
+        except (ArchiveMiss, CacheMiss):
+            # Pages are fetched ahead page_workers at a time, so a replay or
+            # an offline run may ask for pages the recording never needed;
+            # past the first page, a page that was not kept ends the region
+            if RFAPI.page_number(dl_url) <= 1:
+                raise
+            return (chunk for chunk in ())
+        if self.archive is not None:
+            chunks = self.archive.record(ResponseArchive.REDFIN, dl_url, chunks)
+        return chunks
+
+    def network_chunks(self, dl_url, headers, timeout=None):
+        browse = self.http_pool.get(dl_url, headers=headers, timeout=timeout, stream=True)
+        try:
+            browse.raise_for_status()
+            for chunk in browse.iter_content(RFAPI.CHUNK_SIZE):
+                yield chunk
+        finally:
+            browse.close()
+
+    def fetch_dl(self, dl_url, user_agent, timeout=None):
+        rows = self.stream_dl(dl_url, user_agent, timeout)
+        headers = next(rows, [])
+        return [dict(zip(headers, row)) for row in rows]
+
+    @staticmethod
+    def header_indexes(headers):
+        """
+        Column index of each Listing field (ListingFrame.DATASET_COLUMNS) in
+        a CSV header row, or None if any of them is missing
+        """
+        positions = dict((header, i) for i, header in enumerate(headers))
+        try:
+            return dict((name, positions[key]) for name, key in ListingFrame.DATASET_COLUMNS.items())
+        except KeyError:
+            return None
 
-    def dataset_to_listings(self):
-        for rs in self.result_sets:
+    def iter_rows(self, user_agent=None):
+        """
+        Yield (row, indexes) for every data row of every download, where
+        indexes maps each Listing field to its column in row. Downloads
+        missing a column and rows too short to fill them are skipped, as in
+        dataset_to_listings.
+        """
+        user_agent = user_agent or RFAPI.random_user_agent()
+        seen = set()
+        for dl_url in self.dl_urls:
+            page_url = dl_url
+            page_size = RFAPI.page_size(dl_url)
+            page_number = RFAPI.page_number(dl_url)
+            region_keys = set()
+            for page in range(RFAPI.MAX_PAGES):
+                rows = self.stream_dl(page_url, user_agent)
+                indexes = RFAPI.header_indexes(next(rows, []))
+                if indexes is None:
+                    rows.close()
+                    break
+                width = max(indexes.values()) + 1
+                count = 0
+                new_keys = 0
+                for row in rows:
+                    count += 1
+                    if len(row) < width:
+                        continue
+                    if self.paginate:
+                        key = RFAPI.row_key(lambda name: row[indexes[name]])
+                        if key not in region_keys:
+                            region_keys.add(key)
+                            new_keys += 1
+                        if key is not None and key in seen:
+                            continue
+                        seen.add(key)
+                    yield row, indexes
+                # Streamed pages are walked one at a time, to keep memory
+                # flat; stop at a short page, or one the region already had
+                if not self.paginate or count < page_size or not new_keys:
+                    break
+                page_number += 1
+                page_url = RFAPI.page_url(dl_url, page_number)
+
+    def iter_listings(self, user_agent=None):
+        """
+        Yield a Listing per downloaded row without holding the downloads in
+        memory; result_sets and listings are left untouched
+        """
+        for row, indexes in self.iter_rows(user_agent):
+            fields = RFAPI.SCHEMA.coerce_list(row, indexes)
+            yield Listing.from_fields(House.from_fields(fields), fields)
+
+    def iter_changes(self, delta, user_agent=None):
+        """
+        Yield (kind, listing) for the listings added, changed or removed
+        since the last crawl recorded by delta (a ListingDelta); listings are
+        streamed, so unchanged ones cost no more than a comparison
+        """
+        return delta.diff(self.iter_listings(user_agent))
+
+    def iter_frames(self, batch_size=1000, user_agent=None):
+        """
+        Yield the downloaded rows as ListingFrames of up to batch_size
+        listings each
+        """
+        if np.load() is None:
+            raise ImportError("iter_frames requires numpy")
+        columns = dict((name, []) for name in ListingFrame.DATASET_COLUMNS)
+        count = 0
+        for row, indexes in self.iter_rows(user_agent):
+            for name, i in indexes.items():
+                columns[name].append(row[i])
+            count += 1
+            if count == batch_size:
+                yield ListingFrame(columns)
+                columns = dict((name, []) for name in ListingFrame.DATASET_COLUMNS)
+                count = 0
+        if count:
+            yield ListingFrame(columns)
+
+    MAX_PAGES = 100
+
+    @staticmethod
+    def page_url(dl_url, page_number):
+        parts = urlparse.urlsplit(dl_url)
+        params = [(k, v) for k, v in urlparse.parse_qsl(parts.query, keep_blank_values=True) if k != 'page_number']
+        params.append(('page_number', page_number))
+        return urlparse.urlunsplit(parts._replace(query=urllib.urlencode(params)))
+
+    @staticmethod
+    def page_size(dl_url):
+        params = urlparse.parse_qs(urlparse.urlsplit(dl_url).query)
+        try:
+            return int(params['num_homes'][0])
+        except (KeyError, ValueError):
+            return RFAPI.DL_PARAMS['num_homes']
+
+    @staticmethod
+    def page_number(dl_url):
+        params = urlparse.parse_qs(urlparse.urlsplit(dl_url).query)
+        try:
+            return int(params['page_number'][0])
+        except (KeyError, ValueError):
+            return 1
+
+    @staticmethod
+    def row_key(get):
+        """
+        Identity of a listing row for deduplication: its MLS id, else its
+        address; None if it has neither. get(name) reads a Listing field.
+        """
+        mls_id = get('mls_id')
+        if mls_id:
+            return ('mls', mls_id)
+        address = get('street_address')
+        if address:
+            return ('address', address, get('city'), get('state'), get('zip_code'))
+        return None
+
+    @staticmethod
+    def dict_row_key(rs):
+        return RFAPI.row_key(lambda name: rs.get(ListingFrame.DATASET_COLUMNS[name]))
+
+    def fetch_page(self, dl_url, user_agent, timeout=None):
+        with self.host_limiter.slot(dl_url):
+            return self.fetch_dl(dl_url, user_agent, timeout)
+
+    def fetch_pages(self, dl_url, user_agent, timeout=None):
+        """
+        Rows of a download and, while pages come back full, of the pages
+        after it; up to page_workers pages are fetched at once
+        """
+        rows = self.fetch_page(dl_url, user_agent, timeout)
+        page_size = RFAPI.page_size(dl_url)
+        if not self.paginate or len(rows) < page_size:
+            return rows
+        first = RFAPI.page_number(dl_url)
+        keys = set(RFAPI.dict_row_key(rs) for rs in rows)
+        pool = ThreadPool(self.page_workers)
+        try:
+            next_page = first + 1
+            while next_page < first + RFAPI.MAX_PAGES:
+                urls = [RFAPI.page_url(dl_url, n) for n in range(next_page, next_page + self.page_workers)]
+                for page in pool.map(lambda url: self.fetch_page(url, user_agent, timeout), urls):
+                    new_keys = set(RFAPI.dict_row_key(rs) for rs in page) - keys
+                    rows.extend(page)
+                    keys |= new_keys
+                    # A short page is the last; a page of rows already seen
+                    # means the server is not paging
+                    if len(page) < page_size or not new_keys:
+                        return rows
+                next_page += self.page_workers
+        finally:
+            pool.close()
+            pool.join()
+        return rows
+
+    def fetch_region(self, dl_url, user_agent, timeout=None):
+        """
+        fetch_pages within the per-host cap; returns (rows, None), or (None,
+        error) if the download failed
+        """
+        try:
+            return self.fetch_pages(dl_url, user_agent, timeout), None
+        except Exception as e:
+            return None, e
+
+    def add_result_sets(self, rows, seen):
+        """
+        Extend result_sets with rows, dropping those already in seen when
+        paginating
+        """
+        if not self.paginate:
+            self.result_sets.extend(rows)
+            return
+        for rs in rows:
+            key = RFAPI.dict_row_key(rs)
+            if key is None or key not in seen:
+                seen.add(key)
+                self.result_sets.append(rs)
+
+    def merge_regions(self, results):
+        """
+        Extend result_sets with the rows of each region, in dl_urls order;
+        failed regions are recorded in errors
+        """
+        self.errors = {}
+        seen = set()
+        for dl_url, (rows, error) in zip(self.dl_urls, results):
+            if error is not None:
+                self.errors[dl_url] = error
+            else:
+                self.add_result_sets(rows, seen)
+
+    def retrieve_dls(self):
+        user_agent = RFAPI.random_user_agent()
+        if self.workers > 1:
+            pool = ThreadPool(min(self.workers, max(1, len(self.dl_urls))))
             try:
-                h = House(
-                    street_address=rs['ADDRESS'],
-                    city=rs['CITY'],
-                    state=rs['STATE'],
-                    zip_code=rs['ZIP'],
-                    beds=rs['BEDS'],
-                    baths=rs['BATHS'],
-                    parking=rs['PARKING SPOTS'],
-                    parking_type=rs['PARKING TYPE'],
-                    sq_ft=rs['SQFT'],
-                    lot_size=rs['LOT SIZE'],
-                    home_type=rs['HOME TYPE']
-                )
-                l = Listing(
-                    house=h,
-                    list_price=rs['LIST PRICE'],
-                    days_on_market=rs['DAYS ON MARKET'],
-                    original_list_price=rs['ORIGINAL LIST PRICE'],
-                    status=rs['STATUS'],
-                    mls_id=rs['LISTING ID'],
-                    open_house_date=rs['NEXT OPEN HOUSE DATE'],
-                    open_house_start_time=rs['NEXT OPEN HOUSE START TIME'],
-                    open_house_end_time=rs['NEXT OPEN HOUSE END TIME']
-                )
-                self.listings.append(l)
-            except KeyError:
-                pass
+                results = pool.map(lambda dl_url: self.fetch_region(dl_url, user_agent), self.dl_urls)
+            finally:
+                pool.close()
+                pool.join()
+            self.merge_regions(results)
+            return
+        seen = set()
+        for dl_url in self.dl_urls:
+            self.add_result_sets(self.fetch_pages(dl_url, user_agent), seen)
+
+    def dataset_to_listings(self):
+        for fields in RFAPI.SCHEMA.coerce_rows(self.result_sets):
+            self.listings.append(Listing.from_fields(House.from_fields(fields), fields))
+
+    def dataset_to_frame(self):
+        self.frame = ListingFrame.from_result_sets(self.result_sets)
 
     def load_listings(self):
         self.retrieve_dls()
-        self.dataset_to_listings()
-
-    def get_zestimates(self):
-        for listing in self.listings:
-            listing.get_zestimate()
+        if self.columnar:
+            self.dataset_to_frame()
+        else:
+            self.dataset_to_listings()
 
+    def get_zestimates(self, session=None, workers=1):
+        if session is None:
+            with EnrichmentSession() as session:
+                return self.get_zestimates(session, workers)
+        session.get_zestimates(self.listings, workers=workers)
+        if self.frame is not None:
+            views = self.frame.to_listings()
+            session.get_zestimates(views, workers=workers)
+            for i, listing in enumerate(views):
+                self.frame.set_value(i, 'zestimate', listing.zestimate)
 
 
-def is_int(i):
-    try:
-        int(i)
-        return True
-    except (TypeError, ValueError):
-        return False
 
-def is_float(f):
-    try:
-        float(f)
-        return True
-    except (TypeError, ValueError):
-        return False
+def iter_lines(chunks):
+    """
+    Split an iterable of byte chunks into lines, keeping the line endings so
+    the csv module still sees newlines inside quoted fields
+    """
+    pending = ''
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        lines = chunk.split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    if pending:
+        yield pending
 
 def email_matches(matches):
     pass
@@ -725,12 +1710,13 @@ def email_matches(matches):
 def main():
     matches = []
     rf_api = RFAPI(region_ids=[9614,20294,10229], load_listings=True, get_zestimates=False)
-    for listing in rf_api.listings:
-        if listing.house.matches_search(beds=2, baths=1.0, sq_ft=900):
-            if listing.matches_search(list_price=500000):
-                listing.get_zestimate()
-                if listing.matches_search(list_price=360000, zestimate=360000):
-                    matches.append(listing)
+    with EnrichmentSession() as session:
+        for listing in rf_api.listings:
+            if listing.house.matches_search(beds=2, baths=1.0, sq_ft=900):
+                if listing.matches_search(list_price=500000):
+                    listing.get_zestimate(session)
+                    if listing.matches_search(list_price=360000, zestimate=360000):
+                        matches.append(listing)
     email_matches(matches)
 
 if __name__ == '__main__':
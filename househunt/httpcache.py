@@ -0,0 +1,218 @@
+# httpcache.py
+#
+# On-disk cache of HTTP response bodies for the Redfin downloads. Bodies are
+# stored gzipped, one file per normalized URL, with an SQLite index of their
+# validators (ETag/Last-Modified), age and size.
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import urllib
+import urlparse
+
+
+class CacheMiss(KeyError):
+    """
+    Raised in offline mode for a URL that is not in the cache
+    """
+    pass
+
+
+class ResponseCache(object):
+    """
+    Compressed response cache in directory
+
+    A response younger than max_age seconds is served without a request.
+    An older one is revalidated with a conditional GET and served again if
+    the server answers 304 Not Modified. Once the bodies take more than
+    max_size bytes, the least recently used are evicted. With offline=True,
+    every response comes from the cache, whatever its age.
+    """
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS responses ('
+        'key TEXT PRIMARY KEY, '
+        'url TEXT NOT NULL, '
+        'etag TEXT, '
+        'last_modified TEXT, '
+        'fetched REAL NOT NULL, '
+        'used REAL NOT NULL, '
+        'size INTEGER NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS responses_used ON responses (used)'
+    )
+    INDEX_FILE = 'index.sqlite'
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, directory, max_age=3600, max_size=256 * 1024 * 1024, offline=False):
+        self.directory = directory
+        self.max_age = max_age
+        self.max_size = max_size
+        self.offline = offline
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        # Shared by the download threads, under _lock
+        self.conn = sqlite3.connect(os.path.join(directory, ResponseCache.INDEX_FILE), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            for statement in ResponseCache.SCHEMA:
+                self.conn.execute(statement)
+
+    @staticmethod
+    def normalize_url(url):
+        """
+        url with a lower-case scheme and host, its query parameters sorted
+        and no fragment, so equivalent download URLs share an entry
+        """
+        parts = urlparse.urlsplit(url)
+        query = urllib.urlencode(sorted(urlparse.parse_qsl(parts.query, keep_blank_values=True)))
+        return urlparse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha1(ResponseCache.normalize_url(url)).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.gz')
+
+    def entry(self, key):
+        with self._lock:
+            return self.conn.execute(
+                'SELECT etag, last_modified, fetched FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+
+    def read(self, key):
+        """
+        Yield the cached body of key in chunks
+        """
+        with self._lock:
+            with self.conn:
+                self.conn.execute('UPDATE responses SET used = ? WHERE key = ?', (time.time(), key))
+        f = gzip.open(self.path(key), 'rb')
+        try:
+            while True:
+                chunk = f.read(ResponseCache.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+    def store(self, key, url, response, chunks):
+        """
+        Yield chunks while writing them to the cache; the entry is only
+        added once every chunk has been read
+        """
+        path = self.path(key)
+        tmp_path = "%s.%d.%d.tmp" % (path, os.getpid(), threading.current_thread().ident)
+        complete = False
+        f = gzip.open(tmp_path, 'wb')
+        try:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+            complete = True
+        finally:
+            f.close()
+            if complete:
+                os.rename(tmp_path, path)
+                now = time.time()
+                with self._lock:
+                    with self.conn:
+                        self.conn.execute(
+                            'INSERT OR REPLACE INTO responses (key, url, etag, last_modified, fetched, used, size) '
+                            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                            (key, url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                             now, now, os.path.getsize(path))
+                        )
+                self.evict()
+            else:
+                os.remove(tmp_path)
+
+    def get(self, http_pool, url, headers=None, timeout=None, chunk_size=None):
+        """
+        Yield the body of url in chunks, from the cache when it is fresh or
+        still valid, otherwise from http_pool (caching it on the way)
+        """
+        key = ResponseCache.key(url)
+        entry = self.entry(key)
+        if entry is not None and not os.path.exists(self.path(key)):
+            entry = None
+        if self.offline:
+            if entry is None:
+                raise CacheMiss(url)
+            return self.read(key)
+        if entry is not None and time.time() - entry[2] < self.max_age:
+            return self.read(key)
+        headers = dict(headers or {})
+        if entry is not None:
+            etag, last_modified, fetched = entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        response = http_pool.get(url, headers=headers, timeout=timeout, stream=True)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            with self._lock:
+                with self.conn:
+                    self.conn.execute('UPDATE responses SET fetched = ? WHERE key = ?', (time.time(), key))
+            return self.read(key)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return self._stream(key, url, response, chunk_size or ResponseCache.CHUNK_SIZE)
+
+    def _stream(self, key, url, response, chunk_size):
+        try:
+            for chunk in self.store(key, url, response, response.iter_content(chunk_size)):
+                yield chunk
+        finally:
+            response.close()
+
+    @property
+    def size(self):
+        with self._lock:
+            return self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def evict(self):
+        """
+        Remove the least recently used responses until the cache holds at
+        most max_size bytes; returns the number removed
+        """
+        with self._lock:
+            total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if total <= self.max_size:
+                return 0
+            victims = []
+            for key, size in self.conn.execute('SELECT key, size FROM responses ORDER BY used'):
+                if total <= self.max_size:
+                    break
+                victims.append(key)
+                total -= size
+            with self.conn:
+                self.conn.executemany('DELETE FROM responses WHERE key = ?', [(key,) for key in victims])
+        for key in victims:
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+        return len(victims)
+
+    def clear(self):
+        with self._lock:
+            keys = [row[0] for row in self.conn.execute('SELECT key FROM responses')]
+            with self.conn:
+                self.conn.execute('DELETE FROM responses')
+        for key in keys:
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+
+    def close(self):
+        self.conn.close()
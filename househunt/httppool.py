@@ -0,0 +1,106 @@
+# httppool.py
+#
+# Shared keep-alive HTTP connection pool for the Zillow and Redfin clients.
+
+import threading
+import urlparse
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+
+class HTTPPool(object):
+    """
+    requests Session with pooled keep-alive connections, gzip responses and
+    default connect/read timeouts
+
+    pool_maxsize connections are kept open per host; host_maxsize overrides
+    that for particular hosts, e.g. {'https://www.redfin.com': 20}.
+    """
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        host_maxsize=None,
+        connect_timeout=5,
+        read_timeout=30,
+        gzip=True
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate' if gzip else 'identity'
+        self.session.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        for prefix, maxsize in (host_maxsize or {}).items():
+            self.session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=maxsize))
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        return self.session.get(url, headers=headers, timeout=timeout or self.timeout, **kwargs)
+
+    @property
+    def stats(self):
+        """
+        Requests sent, connections opened and requests that reused an open
+        connection, over the hosts currently in the pool
+        """
+        num_requests = 0
+        num_connections = 0
+        adapters = set(self.session.adapters.values())
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    num_requests += pool.num_requests
+                    num_connections += pool.num_connections
+        return {
+            'requests': num_requests,
+            'connections': num_connections,
+            'reused': num_requests - num_connections
+        }
+
+    def close(self):
+        self.session.close()
+
+
+class HostLimiter(object):
+    """
+    Caps the number of requests in flight to each host at limit; use as
+    `with limiter.slot(url): ...`
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url):
+        host = urlparse.urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return semaphore
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool():
+    """
+    The HTTPPool shared by every client that is not given one
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPPool()
+        return _default_pool
+
+
+def set_default_pool(pool):
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
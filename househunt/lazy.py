@@ -0,0 +1,63 @@
+# lazy.py
+#
+# Module attributes and optional modules that are only imported on first
+# access.
+
+import importlib
+import sys
+import types
+
+
+def lazy_attributes(module_name, loaders):
+    """
+    Replace a module in sys.modules with a copy whose attributes named in
+    loaders (name -> function returning the value) are loaded on first access
+
+    The attributes are properties of the copy's class, so they win over
+    the submodule entries that the import system writes into the module.
+    """
+    module = sys.modules[module_name]
+    values = {}
+
+    def make_property(name, loader):
+        def get(self):
+            if name not in values:
+                values[name] = loader()
+            return values[name]
+        return property(get)
+
+    properties = dict((name, make_property(name, loader)) for name, loader in loaders.items())
+    lazy_cls = type('LazyModule', (types.ModuleType,), properties)
+    lazy = lazy_cls(module_name, module.__doc__)
+    lazy.__dict__.update(module.__dict__)
+    # Python 2 clears the globals of a module once it is garbage collected,
+    # which would break the functions defined in it
+    lazy.__dict__['_module_'] = module
+    sys.modules[module_name] = lazy
+    return lazy
+
+
+class LazyImport(object):
+    """
+    Stand-in for an optional module, imported on first attribute access
+
+    load() returns the module, or None if it is not installed; attribute
+    access on a missing module raises ImportError.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                return None
+        return self._module
+
+    def __getattr__(self, attr):
+        module = self.load()
+        if module is None:
+            raise ImportError("%s is not installed" % self._name)
+        return getattr(module, attr)
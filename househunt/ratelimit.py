@@ -0,0 +1,117 @@
+# ratelimit.py
+#
+# Token bucket rate limiting for API calls, with a daily call budget. The
+# calls made each day are counted in an SQLite database, so the budget holds
+# across processes.
+
+import os
+import sqlite3
+import threading
+import time
+
+from datetime import date
+
+
+class QuotaExceeded(Exception):
+    pass
+
+
+class RateLimiter(object):
+    """
+    Thread-safe token bucket allowing rate calls per second on average (in
+    bursts of up to burst calls), and at most daily_limit calls per day
+
+    The daily count of the budget called name is kept in db_file (by default
+    RateLimiter.DB_FILE next to the package; ':memory:' keeps it in this
+    process only).
+    """
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS daily_calls ('
+        'name TEXT NOT NULL, '
+        'day TEXT NOT NULL, '
+        'calls INTEGER NOT NULL, '
+        'PRIMARY KEY (name, day))'
+    )
+    DB_FILE = 'rate_limits.sqlite'
+
+    def __init__(self, rate=None, burst=1, daily_limit=None, db_file=None, name='zillow'):
+        self.rate = rate
+        self.burst = burst
+        self.daily_limit = daily_limit
+        self.name = name
+        self.calls_today = 0
+        self._day = date.today()
+        self._tokens = float(burst)
+        self._last = time.time()
+        self._lock = threading.Lock()
+        self.conn = None
+        if daily_limit is not None:
+            db_file = db_file or os.path.join(os.path.dirname(os.path.abspath(__file__)), RateLimiter.DB_FILE)
+            # Shared by the calling threads, under _lock; transactions are
+            # managed by hand so the count is claimed with BEGIN IMMEDIATE
+            self.conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+            self.conn.execute(RateLimiter.SCHEMA)
+            self.conn.execute('DELETE FROM daily_calls WHERE name = ? AND day < ?', (name, self._day.isoformat()))
+            self.calls_today = self._stored_calls(self._day)
+
+    @property
+    def remaining_today(self):
+        if self.daily_limit is None:
+            return None
+        return max(self.daily_limit - self.calls_today, 0)
+
+    def _stored_calls(self, day):
+        row = self.conn.execute(
+            'SELECT calls FROM daily_calls WHERE name = ? AND day = ?', (self.name, day.isoformat())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _count_call(self, day):
+        """
+        Count a call against the daily budget of day, shared with every
+        other process using the same database
+        """
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            calls = self._stored_calls(day)
+            if calls >= self.daily_limit:
+                self.calls_today = calls
+                raise QuotaExceeded("Daily limit of %d calls reached" % self.daily_limit)
+            self.conn.execute(
+                'INSERT OR REPLACE INTO daily_calls (name, day, calls) VALUES (?, ?, ?)',
+                (self.name, day.isoformat(), calls + 1)
+            )
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.calls_today = calls + 1
+
+    def acquire(self):
+        """
+        Block until a call is allowed. Raises QuotaExceeded once the daily
+        budget is spent.
+        """
+        wait = 0
+        with self._lock:
+            today = date.today()
+            if today != self._day:
+                self._day = today
+                self.calls_today = 0
+            if self.daily_limit is not None:
+                self._count_call(today)
+            if self.rate:
+                now = time.time()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                # Take the token now, even if that leaves the bucket in debt,
+                # so that callers queue up in order while sleeping unlocked
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = -self._tokens / self.rate
+        if wait:
+            time.sleep(wait)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
@@ -22,6 +22,7 @@ import re as re_
 import base64
 import datetime as datetime_
 import warnings as warnings_
+import threading
 from lxml import etree as etree_
 
 
@@ -32,6 +33,42 @@ else:
     BaseStrType_ = str
 
 
+# Per-thread parse options, set by the validate argument of the parse
+# functions; Validate_simpletypes_ is the default
+ParseOptions_ = threading.local()
+
+
+def validating_():
+    return getattr(ParseOptions_, 'validate', Validate_simpletypes_)
+
+
+class parse_options_(object):
+    def __init__(self, validate):
+        self.validate = validate
+    def __enter__(self):
+        self.previous = getattr(ParseOptions_, 'validate', None)
+        ParseOptions_.validate = self.validate
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.previous is None:
+            del ParseOptions_.validate
+        else:
+            ParseOptions_.validate = self.previous
+
+
+# One reusable parser per thread; lxml parsers are not thread-safe
+ParserLocal_ = threading.local()
+
+
+def get_parser_():
+    parser = getattr(ParserLocal_, 'parser', None)
+    if parser is None:
+        # Use the lxml ElementTree compatible parser so that, e.g.,
+        #   we ignore comments.
+        parser = etree_.ETCompatXMLParser()
+        ParserLocal_.parser = parser
+    return parser
+
+
 def parsexml_(infile, parser=None, **kwargs):
     if parser is None:
         # Use the lxml ElementTree compatible parser so that, e.g.,
@@ -399,10 +436,56 @@ CurrentSubclassModule_ = None
 #
 
 
+# Local names of element tags, so each distinct tag goes through
+# Tag_pattern_ only once
+LocalNames_ = {}
+
+
+def local_name_(tag):
+    name = LocalNames_.get(tag)
+    if name is None:
+        name = Tag_pattern_.match(tag).groups()[-1]
+        LocalNames_[tag] = name
+    return name
+
+
 def showIndent(outfile, level, pretty_print=True):
-    if pretty_print:
-        for idx in range(level):
-            outfile.write('    ')
+    if pretty_print and level > 0:
+        outfile.write('    ' * level)
+    if level < BufferedWriter_.FLUSH_LEVEL and outfile.__class__ is BufferedWriter_:
+        outfile.flush_full()
+
+
+class BufferedWriter_(object):
+    """
+    Collects the many small writes made by export() and passes them on to
+    outfile joined. write is list.append itself, so each fragment costs no
+    Python-level call; showIndent flushes once buffer_size fragments are
+    held, between elements near the root.
+    """
+    FLUSH_LEVEL = 4
+    def __init__(self, outfile, buffer_size=8192):
+        self.outfile = outfile
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.write = self.chunks.append
+    def flush_full(self):
+        if len(self.chunks) >= self.buffer_size:
+            self.flush()
+    def flush(self):
+        chunks = self.chunks
+        if not chunks:
+            return
+        try:
+            data = ''.join(chunks)
+        except UnicodeDecodeError:
+            # Encoded text mixed with unicode; write the fragments as
+            # export() would have
+            for chunk in chunks:
+                self.outfile.write(chunk)
+        else:
+            self.outfile.write(data)
+        del chunks[:]
 
 
 def quote_xml(inStr):
@@ -410,6 +493,8 @@ def quote_xml(inStr):
     if not inStr:
         return ''
     s1 = (isinstance(inStr, BaseStrType_) and inStr or '%s' % inStr)
+    if '<![CDATA[' not in s1:
+        return quote_xml_aux(s1)
     s2 = ''
     pos = 0
     matchobjects = CDATA_pattern_.finditer(s1)
@@ -705,27 +790,35 @@ class searchresults(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'request':
-            obj_ = requestType.factory()
-            obj_.build(child_)
-            self.request = obj_
-            obj_.original_tagname_ = 'request'
-        elif nodeName_ == 'message':
-            obj_ = Message.factory()
-            obj_.build(child_)
-            self.message = obj_
-            obj_.original_tagname_ = 'message'
-        elif nodeName_ == 'response':
-            obj_ = responseType.factory()
-            obj_.build(child_)
-            self.response = obj_
-            obj_.original_tagname_ = 'response'
+        builder_ = searchresults.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_request(self, child_, node, nodeName_):
+        obj_ = requestType.factory()
+        obj_.build(child_)
+        self.request = obj_
+        obj_.original_tagname_ = 'request'
+    def buildChild_message(self, child_, node, nodeName_):
+        obj_ = Message.factory()
+        obj_.build(child_)
+        self.message = obj_
+        obj_.original_tagname_ = 'message'
+    def buildChild_response(self, child_, node, nodeName_):
+        obj_ = responseType.factory()
+        obj_.build(child_)
+        self.response = obj_
+        obj_.original_tagname_ = 'response'
+    childBuilders_ = {
+        'request': buildChild_request,
+        'message': buildChild_message,
+        'response': buildChild_response
+    }
 # end class searchresults
 
 
@@ -787,7 +880,7 @@ class Amount(GeneratedsSuper):
         self.buildAttributes(node, node.attrib, already_processed)
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -893,44 +986,55 @@ class Address(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'street':
-            street_ = child_.text
-            street_ = self.gds_validate_string(street_, node, 'street')
-            self.street = street_
-        elif nodeName_ == 'zipcode':
-            zipcode_ = child_.text
-            zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
-            self.zipcode = zipcode_
-        elif nodeName_ == 'city':
-            city_ = child_.text
-            city_ = self.gds_validate_string(city_, node, 'city')
-            self.city = city_
-        elif nodeName_ == 'state':
-            state_ = child_.text
-            state_ = self.gds_validate_string(state_, node, 'state')
-            self.state = state_
-        elif nodeName_ == 'latitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'latitude')
-            self.latitude = fval_
-        elif nodeName_ == 'longitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'longitude')
-            self.longitude = fval_
+        builder_ = Address.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_street(self, child_, node, nodeName_):
+        street_ = child_.text
+        street_ = self.gds_validate_string(street_, node, 'street')
+        self.street = street_
+    def buildChild_zipcode(self, child_, node, nodeName_):
+        zipcode_ = child_.text
+        zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
+        self.zipcode = zipcode_
+    def buildChild_city(self, child_, node, nodeName_):
+        city_ = child_.text
+        city_ = self.gds_validate_string(city_, node, 'city')
+        self.city = city_
+    def buildChild_state(self, child_, node, nodeName_):
+        state_ = child_.text
+        state_ = self.gds_validate_string(state_, node, 'state')
+        self.state = state_
+    def buildChild_latitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'latitude')
+        self.latitude = fval_
+    def buildChild_longitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'longitude')
+        self.longitude = fval_
+    childBuilders_ = {
+        'street': buildChild_street,
+        'zipcode': buildChild_zipcode,
+        'city': buildChild_city,
+        'state': buildChild_state,
+        'latitude': buildChild_latitude,
+        'longitude': buildChild_longitude
+    }
 # end class Address
 
 
@@ -1027,44 +1131,55 @@ class RestrictedAddress(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'street':
-            street_ = child_.text
-            street_ = self.gds_validate_string(street_, node, 'street')
-            self.street = street_
-        elif nodeName_ == 'zipcode':
-            zipcode_ = child_.text
-            zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
-            self.zipcode = zipcode_
-        elif nodeName_ == 'city':
-            city_ = child_.text
-            city_ = self.gds_validate_string(city_, node, 'city')
-            self.city = city_
-        elif nodeName_ == 'state':
-            state_ = child_.text
-            state_ = self.gds_validate_string(state_, node, 'state')
-            self.state = state_
-        elif nodeName_ == 'latitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'latitude')
-            self.latitude = fval_
-        elif nodeName_ == 'longitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'longitude')
-            self.longitude = fval_
+        builder_ = RestrictedAddress.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_street(self, child_, node, nodeName_):
+        street_ = child_.text
+        street_ = self.gds_validate_string(street_, node, 'street')
+        self.street = street_
+    def buildChild_zipcode(self, child_, node, nodeName_):
+        zipcode_ = child_.text
+        zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
+        self.zipcode = zipcode_
+    def buildChild_city(self, child_, node, nodeName_):
+        city_ = child_.text
+        city_ = self.gds_validate_string(city_, node, 'city')
+        self.city = city_
+    def buildChild_state(self, child_, node, nodeName_):
+        state_ = child_.text
+        state_ = self.gds_validate_string(state_, node, 'state')
+        self.state = state_
+    def buildChild_latitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'latitude')
+        self.latitude = fval_
+    def buildChild_longitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'longitude')
+        self.longitude = fval_
+    childBuilders_ = {
+        'street': buildChild_street,
+        'zipcode': buildChild_zipcode,
+        'city': buildChild_city,
+        'state': buildChild_state,
+        'latitude': buildChild_latitude,
+        'longitude': buildChild_longitude
+    }
 # end class RestrictedAddress
 
 
@@ -1140,34 +1255,42 @@ class Message(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'text':
-            text_ = child_.text
-            text_ = self.gds_validate_string(text_, node, 'text')
-            self.text = text_
-        elif nodeName_ == 'code':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'code')
-            self.code = ival_
-        elif nodeName_ == 'limit-warning':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'limit_warning')
-            self.limit_warning = ival_
+        builder_ = Message.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_text(self, child_, node, nodeName_):
+        text_ = child_.text
+        text_ = self.gds_validate_string(text_, node, 'text')
+        self.text = text_
+    def buildChild_code(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'code')
+        self.code = ival_
+    def buildChild_limit_warning(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'limit_warning')
+        self.limit_warning = ival_
+    childBuilders_ = {
+        'text': buildChild_text,
+        'code': buildChild_code,
+        'limit-warning': buildChild_limit_warning
+    }
 # end class Message
 
 
@@ -1250,44 +1373,53 @@ class Regions(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'zipcode-id':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'zipcode_id')
-            self.zipcode_id = ival_
-        elif nodeName_ == 'city-id':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'city_id')
-            self.city_id = ival_
-        elif nodeName_ == 'county-id':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'county_id')
-            self.county_id = ival_
-        elif nodeName_ == 'state-id':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'state_id')
-            self.state_id = ival_
+        builder_ = Regions.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_zipcode_id(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'zipcode_id')
+        self.zipcode_id = ival_
+    def buildChild_city_id(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'city_id')
+        self.city_id = ival_
+    def buildChild_county_id(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'county_id')
+        self.county_id = ival_
+    def buildChild_state_id(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'state_id')
+        self.state_id = ival_
+    childBuilders_ = {
+        'zipcode-id': buildChild_zipcode_id,
+        'city-id': buildChild_city_id,
+        'county-id': buildChild_county_id,
+        'state-id': buildChild_state_id
+    }
 # end class Regions
 
 
@@ -1419,64 +1551,80 @@ class RegionNames(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'id':
-            id_ = child_.text
-            id_ = self.gds_validate_string(id_, node, 'id')
-            self.id = id_
-        elif nodeName_ == 'country':
-            country_ = child_.text
-            country_ = self.gds_validate_string(country_, node, 'country')
-            self.country = country_
-        elif nodeName_ == 'state':
-            state_ = child_.text
-            state_ = self.gds_validate_string(state_, node, 'state')
-            self.state = state_
-        elif nodeName_ == 'county':
-            county_ = child_.text
-            county_ = self.gds_validate_string(county_, node, 'county')
-            self.county = county_
-        elif nodeName_ == 'city':
-            city_ = child_.text
-            city_ = self.gds_validate_string(city_, node, 'city')
-            self.city = city_
-        elif nodeName_ == 'cityurl':
-            cityurl_ = child_.text
-            cityurl_ = self.gds_validate_string(cityurl_, node, 'cityurl')
-            self.cityurl = cityurl_
-        elif nodeName_ == 'zipcode':
-            zipcode_ = child_.text
-            zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
-            self.zipcode = zipcode_
-        elif nodeName_ == 'neighborhood':
-            neighborhood_ = child_.text
-            neighborhood_ = self.gds_validate_string(neighborhood_, node, 'neighborhood')
-            self.neighborhood = neighborhood_
-        elif nodeName_ == 'neighborhoodurl':
-            neighborhoodurl_ = child_.text
-            neighborhoodurl_ = self.gds_validate_string(neighborhoodurl_, node, 'neighborhoodurl')
-            self.neighborhoodurl = neighborhoodurl_
-        elif nodeName_ == 'latitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'latitude')
-            self.latitude = fval_
-        elif nodeName_ == 'longitude':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'longitude')
-            self.longitude = fval_
+        builder_ = RegionNames.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_id(self, child_, node, nodeName_):
+        id_ = child_.text
+        id_ = self.gds_validate_string(id_, node, 'id')
+        self.id = id_
+    def buildChild_country(self, child_, node, nodeName_):
+        country_ = child_.text
+        country_ = self.gds_validate_string(country_, node, 'country')
+        self.country = country_
+    def buildChild_state(self, child_, node, nodeName_):
+        state_ = child_.text
+        state_ = self.gds_validate_string(state_, node, 'state')
+        self.state = state_
+    def buildChild_county(self, child_, node, nodeName_):
+        county_ = child_.text
+        county_ = self.gds_validate_string(county_, node, 'county')
+        self.county = county_
+    def buildChild_city(self, child_, node, nodeName_):
+        city_ = child_.text
+        city_ = self.gds_validate_string(city_, node, 'city')
+        self.city = city_
+    def buildChild_cityurl(self, child_, node, nodeName_):
+        cityurl_ = child_.text
+        cityurl_ = self.gds_validate_string(cityurl_, node, 'cityurl')
+        self.cityurl = cityurl_
+    def buildChild_zipcode(self, child_, node, nodeName_):
+        zipcode_ = child_.text
+        zipcode_ = self.gds_validate_string(zipcode_, node, 'zipcode')
+        self.zipcode = zipcode_
+    def buildChild_neighborhood(self, child_, node, nodeName_):
+        neighborhood_ = child_.text
+        neighborhood_ = self.gds_validate_string(neighborhood_, node, 'neighborhood')
+        self.neighborhood = neighborhood_
+    def buildChild_neighborhoodurl(self, child_, node, nodeName_):
+        neighborhoodurl_ = child_.text
+        neighborhoodurl_ = self.gds_validate_string(neighborhoodurl_, node, 'neighborhoodurl')
+        self.neighborhoodurl = neighborhoodurl_
+    def buildChild_latitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'latitude')
+        self.latitude = fval_
+    def buildChild_longitude(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'longitude')
+        self.longitude = fval_
+    childBuilders_ = {
+        'id': buildChild_id,
+        'country': buildChild_country,
+        'state': buildChild_state,
+        'county': buildChild_county,
+        'city': buildChild_city,
+        'cityurl': buildChild_cityurl,
+        'zipcode': buildChild_zipcode,
+        'neighborhood': buildChild_neighborhood,
+        'neighborhoodurl': buildChild_neighborhoodurl,
+        'latitude': buildChild_latitude,
+        'longitude': buildChild_longitude
+    }
 # end class RegionNames
 
 
@@ -1569,40 +1717,51 @@ class Zestimate(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'amount':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.amount = obj_
-            obj_.original_tagname_ = 'amount'
-        elif nodeName_ == 'last-updated':
-            last_updated_ = child_.text
-            last_updated_ = self.gds_validate_string(last_updated_, node, 'last_updated')
-            self.last_updated = last_updated_
-        elif nodeName_ == 'oneWeekChange':
-            obj_ = AmountOptional.factory()
-            obj_.build(child_)
-            self.oneWeekChange = obj_
-            obj_.original_tagname_ = 'oneWeekChange'
-        elif nodeName_ == 'valueChange':
-            obj_ = AmountOptional.factory()
-            obj_.build(child_)
-            self.valueChange = obj_
-            obj_.original_tagname_ = 'valueChange'
-        elif nodeName_ == 'valuationRange':
-            obj_ = valuationRangeType.factory()
-            obj_.build(child_)
-            self.valuationRange = obj_
-            obj_.original_tagname_ = 'valuationRange'
-        elif nodeName_ == 'percentile':
-            percentile_ = child_.text
-            percentile_ = self.gds_validate_string(percentile_, node, 'percentile')
-            self.percentile = percentile_
+        builder_ = Zestimate.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_amount(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.amount = obj_
+        obj_.original_tagname_ = 'amount'
+    def buildChild_last_updated(self, child_, node, nodeName_):
+        last_updated_ = child_.text
+        last_updated_ = self.gds_validate_string(last_updated_, node, 'last_updated')
+        self.last_updated = last_updated_
+    def buildChild_oneWeekChange(self, child_, node, nodeName_):
+        obj_ = AmountOptional.factory()
+        obj_.build(child_)
+        self.oneWeekChange = obj_
+        obj_.original_tagname_ = 'oneWeekChange'
+    def buildChild_valueChange(self, child_, node, nodeName_):
+        obj_ = AmountOptional.factory()
+        obj_.build(child_)
+        self.valueChange = obj_
+        obj_.original_tagname_ = 'valueChange'
+    def buildChild_valuationRange(self, child_, node, nodeName_):
+        obj_ = valuationRangeType.factory()
+        obj_.build(child_)
+        self.valuationRange = obj_
+        obj_.original_tagname_ = 'valuationRange'
+    def buildChild_percentile(self, child_, node, nodeName_):
+        percentile_ = child_.text
+        percentile_ = self.gds_validate_string(percentile_, node, 'percentile')
+        self.percentile = percentile_
+    childBuilders_ = {
+        'amount': buildChild_amount,
+        'last-updated': buildChild_last_updated,
+        'oneWeekChange': buildChild_oneWeekChange,
+        'valueChange': buildChild_valueChange,
+        'valuationRange': buildChild_valuationRange,
+        'percentile': buildChild_percentile
+    }
 # end class Zestimate
 
 
@@ -1669,22 +1828,29 @@ class SimpleZestimate(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'amount':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.amount = obj_
-            obj_.original_tagname_ = 'amount'
-        elif nodeName_ == 'valuationRange':
-            obj_ = valuationRangeType1.factory()
-            obj_.build(child_)
-            self.valuationRange = obj_
-            obj_.original_tagname_ = 'valuationRange'
+        builder_ = SimpleZestimate.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_amount(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.amount = obj_
+        obj_.original_tagname_ = 'amount'
+    def buildChild_valuationRange(self, child_, node, nodeName_):
+        obj_ = valuationRangeType1.factory()
+        obj_.build(child_)
+        self.valuationRange = obj_
+        obj_.original_tagname_ = 'valuationRange'
+    childBuilders_ = {
+        'amount': buildChild_amount,
+        'valuationRange': buildChild_valuationRange
+    }
 # end class SimpleZestimate
 
 
@@ -1751,17 +1917,23 @@ class LocalRealEstate(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'region':
-            obj_ = regionType.factory()
-            obj_.build(child_)
-            self.region.append(obj_)
-            obj_.original_tagname_ = 'region'
+        builder_ = LocalRealEstate.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_region(self, child_, node, nodeName_):
+        obj_ = regionType.factory()
+        obj_.build(child_)
+        self.region.append(obj_)
+        obj_.original_tagname_ = 'region'
+    childBuilders_ = {
+        'region': buildChild_region
+    }
 # end class LocalRealEstate
 
 
@@ -1857,37 +2029,48 @@ class Links(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'homedetails':
-            homedetails_ = child_.text
-            homedetails_ = self.gds_validate_string(homedetails_, node, 'homedetails')
-            self.homedetails = homedetails_
-        elif nodeName_ == 'graphsanddata':
-            graphsanddata_ = child_.text
-            graphsanddata_ = self.gds_validate_string(graphsanddata_, node, 'graphsanddata')
-            self.graphsanddata = graphsanddata_
-        elif nodeName_ == 'mapthishome':
-            mapthishome_ = child_.text
-            mapthishome_ = self.gds_validate_string(mapthishome_, node, 'mapthishome')
-            self.mapthishome = mapthishome_
-        elif nodeName_ == 'myestimator':
-            myestimator_ = child_.text
-            myestimator_ = self.gds_validate_string(myestimator_, node, 'myestimator')
-            self.myestimator = myestimator_
-        elif nodeName_ == 'myzestimator':
-            obj_ = DeprecatedType.factory()
-            obj_.build(child_)
-            self.myzestimator = obj_
-            obj_.original_tagname_ = 'myzestimator'
-        elif nodeName_ == 'comparables':
-            comparables_ = child_.text
-            comparables_ = self.gds_validate_string(comparables_, node, 'comparables')
-            self.comparables = comparables_
+        builder_ = Links.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_homedetails(self, child_, node, nodeName_):
+        homedetails_ = child_.text
+        homedetails_ = self.gds_validate_string(homedetails_, node, 'homedetails')
+        self.homedetails = homedetails_
+    def buildChild_graphsanddata(self, child_, node, nodeName_):
+        graphsanddata_ = child_.text
+        graphsanddata_ = self.gds_validate_string(graphsanddata_, node, 'graphsanddata')
+        self.graphsanddata = graphsanddata_
+    def buildChild_mapthishome(self, child_, node, nodeName_):
+        mapthishome_ = child_.text
+        mapthishome_ = self.gds_validate_string(mapthishome_, node, 'mapthishome')
+        self.mapthishome = mapthishome_
+    def buildChild_myestimator(self, child_, node, nodeName_):
+        myestimator_ = child_.text
+        myestimator_ = self.gds_validate_string(myestimator_, node, 'myestimator')
+        self.myestimator = myestimator_
+    def buildChild_myzestimator(self, child_, node, nodeName_):
+        obj_ = DeprecatedType.factory()
+        obj_.build(child_)
+        self.myzestimator = obj_
+        obj_.original_tagname_ = 'myzestimator'
+    def buildChild_comparables(self, child_, node, nodeName_):
+        comparables_ = child_.text
+        comparables_ = self.gds_validate_string(comparables_, node, 'comparables')
+        self.comparables = comparables_
+    childBuilders_ = {
+        'homedetails': buildChild_homedetails,
+        'graphsanddata': buildChild_graphsanddata,
+        'mapthishome': buildChild_mapthishome,
+        'myestimator': buildChild_myestimator,
+        'myzestimator': buildChild_myzestimator,
+        'comparables': buildChild_comparables
+    }
 # end class Links
 
 
@@ -2051,7 +2234,7 @@ class Property(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -2060,73 +2243,93 @@ class Property(GeneratedsSuper):
             already_processed.add('xsi:type')
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'zpid':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'zpid')
-            self.zpid = ival_
-        elif nodeName_ == 'links':
-            obj_ = Links.factory()
-            obj_.build(child_)
-            self.links = obj_
-            obj_.original_tagname_ = 'links'
-        elif nodeName_ == 'address':
-            obj_ = Address.factory()
-            obj_.build(child_)
-            self.address = obj_
-            obj_.original_tagname_ = 'address'
-        elif nodeName_ == 'FIPScounty':
-            FIPScounty_ = child_.text
-            FIPScounty_ = self.gds_validate_string(FIPScounty_, node, 'FIPScounty')
-            self.FIPScounty = FIPScounty_
-        elif nodeName_ == 'useCode':
-            useCode_ = child_.text
-            useCode_ = self.gds_validate_string(useCode_, node, 'useCode')
-            self.useCode = useCode_
-        elif nodeName_ == 'taxAssessmentYear':
-            taxAssessmentYear_ = child_.text
-            taxAssessmentYear_ = self.gds_validate_string(taxAssessmentYear_, node, 'taxAssessmentYear')
-            self.taxAssessmentYear = taxAssessmentYear_
-        elif nodeName_ == 'taxAssessment':
-            taxAssessment_ = child_.text
-            taxAssessment_ = self.gds_validate_string(taxAssessment_, node, 'taxAssessment')
-            self.taxAssessment = taxAssessment_
-        elif nodeName_ == 'yearBuilt':
-            yearBuilt_ = child_.text
-            yearBuilt_ = self.gds_validate_string(yearBuilt_, node, 'yearBuilt')
-            self.yearBuilt = yearBuilt_
-        elif nodeName_ == 'lotSizeSqFt':
-            lotSizeSqFt_ = child_.text
-            lotSizeSqFt_ = self.gds_validate_string(lotSizeSqFt_, node, 'lotSizeSqFt')
-            self.lotSizeSqFt = lotSizeSqFt_
-        elif nodeName_ == 'finishedSqFt':
-            finishedSqFt_ = child_.text
-            finishedSqFt_ = self.gds_validate_string(finishedSqFt_, node, 'finishedSqFt')
-            self.finishedSqFt = finishedSqFt_
-        elif nodeName_ == 'bathrooms':
-            bathrooms_ = child_.text
-            bathrooms_ = self.gds_validate_string(bathrooms_, node, 'bathrooms')
-            self.bathrooms = bathrooms_
-        elif nodeName_ == 'bedrooms':
-            bedrooms_ = child_.text
-            bedrooms_ = self.gds_validate_string(bedrooms_, node, 'bedrooms')
-            self.bedrooms = bedrooms_
-        elif nodeName_ == 'totalRooms':
-            totalRooms_ = child_.text
-            totalRooms_ = self.gds_validate_string(totalRooms_, node, 'totalRooms')
-            self.totalRooms = totalRooms_
-        elif nodeName_ == 'lastSoldDate':
-            lastSoldDate_ = child_.text
-            lastSoldDate_ = self.gds_validate_string(lastSoldDate_, node, 'lastSoldDate')
-            self.lastSoldDate = lastSoldDate_
-        elif nodeName_ == 'lastSoldPrice':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.lastSoldPrice = obj_
-            obj_.original_tagname_ = 'lastSoldPrice'
+        builder_ = Property.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_zpid(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'zpid')
+        self.zpid = ival_
+    def buildChild_links(self, child_, node, nodeName_):
+        obj_ = Links.factory()
+        obj_.build(child_)
+        self.links = obj_
+        obj_.original_tagname_ = 'links'
+    def buildChild_address(self, child_, node, nodeName_):
+        obj_ = Address.factory()
+        obj_.build(child_)
+        self.address = obj_
+        obj_.original_tagname_ = 'address'
+    def buildChild_FIPScounty(self, child_, node, nodeName_):
+        FIPScounty_ = child_.text
+        FIPScounty_ = self.gds_validate_string(FIPScounty_, node, 'FIPScounty')
+        self.FIPScounty = FIPScounty_
+    def buildChild_useCode(self, child_, node, nodeName_):
+        useCode_ = child_.text
+        useCode_ = self.gds_validate_string(useCode_, node, 'useCode')
+        self.useCode = useCode_
+    def buildChild_taxAssessmentYear(self, child_, node, nodeName_):
+        taxAssessmentYear_ = child_.text
+        taxAssessmentYear_ = self.gds_validate_string(taxAssessmentYear_, node, 'taxAssessmentYear')
+        self.taxAssessmentYear = taxAssessmentYear_
+    def buildChild_taxAssessment(self, child_, node, nodeName_):
+        taxAssessment_ = child_.text
+        taxAssessment_ = self.gds_validate_string(taxAssessment_, node, 'taxAssessment')
+        self.taxAssessment = taxAssessment_
+    def buildChild_yearBuilt(self, child_, node, nodeName_):
+        yearBuilt_ = child_.text
+        yearBuilt_ = self.gds_validate_string(yearBuilt_, node, 'yearBuilt')
+        self.yearBuilt = yearBuilt_
+    def buildChild_lotSizeSqFt(self, child_, node, nodeName_):
+        lotSizeSqFt_ = child_.text
+        lotSizeSqFt_ = self.gds_validate_string(lotSizeSqFt_, node, 'lotSizeSqFt')
+        self.lotSizeSqFt = lotSizeSqFt_
+    def buildChild_finishedSqFt(self, child_, node, nodeName_):
+        finishedSqFt_ = child_.text
+        finishedSqFt_ = self.gds_validate_string(finishedSqFt_, node, 'finishedSqFt')
+        self.finishedSqFt = finishedSqFt_
+    def buildChild_bathrooms(self, child_, node, nodeName_):
+        bathrooms_ = child_.text
+        bathrooms_ = self.gds_validate_string(bathrooms_, node, 'bathrooms')
+        self.bathrooms = bathrooms_
+    def buildChild_bedrooms(self, child_, node, nodeName_):
+        bedrooms_ = child_.text
+        bedrooms_ = self.gds_validate_string(bedrooms_, node, 'bedrooms')
+        self.bedrooms = bedrooms_
+    def buildChild_totalRooms(self, child_, node, nodeName_):
+        totalRooms_ = child_.text
+        totalRooms_ = self.gds_validate_string(totalRooms_, node, 'totalRooms')
+        self.totalRooms = totalRooms_
+    def buildChild_lastSoldDate(self, child_, node, nodeName_):
+        lastSoldDate_ = child_.text
+        lastSoldDate_ = self.gds_validate_string(lastSoldDate_, node, 'lastSoldDate')
+        self.lastSoldDate = lastSoldDate_
+    def buildChild_lastSoldPrice(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.lastSoldPrice = obj_
+        obj_.original_tagname_ = 'lastSoldPrice'
+    childBuilders_ = {
+        'zpid': buildChild_zpid,
+        'links': buildChild_links,
+        'address': buildChild_address,
+        'FIPScounty': buildChild_FIPScounty,
+        'useCode': buildChild_useCode,
+        'taxAssessmentYear': buildChild_taxAssessmentYear,
+        'taxAssessment': buildChild_taxAssessment,
+        'yearBuilt': buildChild_yearBuilt,
+        'lotSizeSqFt': buildChild_lotSizeSqFt,
+        'finishedSqFt': buildChild_finishedSqFt,
+        'bathrooms': buildChild_bathrooms,
+        'bedrooms': buildChild_bedrooms,
+        'totalRooms': buildChild_totalRooms,
+        'lastSoldDate': buildChild_lastSoldDate,
+        'lastSoldPrice': buildChild_lastSoldPrice
+    }
 # end class Property
 
 
@@ -2209,7 +2412,7 @@ class SimpleProperty(Property):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -2219,22 +2422,30 @@ class SimpleProperty(Property):
             self.extensiontype_ = value
         super(SimpleProperty, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'zestimate':
-            obj_ = Zestimate.factory()
-            obj_.build(child_)
-            self.zestimate = obj_
-            obj_.original_tagname_ = 'zestimate'
-        elif nodeName_ == 'rentzestimate':
-            obj_ = Zestimate.factory()
-            obj_.build(child_)
-            self.rentzestimate = obj_
-            obj_.original_tagname_ = 'rentzestimate'
-        elif nodeName_ == 'localRealEstate':
-            obj_ = LocalRealEstate.factory()
-            obj_.build(child_)
-            self.localRealEstate = obj_
-            obj_.original_tagname_ = 'localRealEstate'
+        builder_ = SimpleProperty.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
         super(SimpleProperty, self).buildChildren(child_, node, nodeName_, True)
+    def buildChild_zestimate(self, child_, node, nodeName_):
+        obj_ = Zestimate.factory()
+        obj_.build(child_)
+        self.zestimate = obj_
+        obj_.original_tagname_ = 'zestimate'
+    def buildChild_rentzestimate(self, child_, node, nodeName_):
+        obj_ = Zestimate.factory()
+        obj_.build(child_)
+        self.rentzestimate = obj_
+        obj_.original_tagname_ = 'rentzestimate'
+    def buildChild_localRealEstate(self, child_, node, nodeName_):
+        obj_ = LocalRealEstate.factory()
+        obj_.build(child_)
+        self.localRealEstate = obj_
+        obj_.original_tagname_ = 'localRealEstate'
+    childBuilders_ = {
+        'zestimate': buildChild_zestimate,
+        'rentzestimate': buildChild_rentzestimate,
+        'localRealEstate': buildChild_localRealEstate
+    }
 # end class SimpleProperty
 
 
@@ -2331,44 +2542,55 @@ class TerseAddress(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'st':
-            st_ = child_.text
-            st_ = self.gds_validate_string(st_, node, 'st')
-            self.st = st_
-        elif nodeName_ == 'zc':
-            zc_ = child_.text
-            zc_ = self.gds_validate_string(zc_, node, 'zc')
-            self.zc = zc_
-        elif nodeName_ == 'cy':
-            cy_ = child_.text
-            cy_ = self.gds_validate_string(cy_, node, 'cy')
-            self.cy = cy_
-        elif nodeName_ == 'et':
-            et_ = child_.text
-            et_ = self.gds_validate_string(et_, node, 'et')
-            self.et = et_
-        elif nodeName_ == 'la':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'la')
-            self.la = fval_
-        elif nodeName_ == 'lo':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'lo')
-            self.lo = fval_
+        builder_ = TerseAddress.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_st(self, child_, node, nodeName_):
+        st_ = child_.text
+        st_ = self.gds_validate_string(st_, node, 'st')
+        self.st = st_
+    def buildChild_zc(self, child_, node, nodeName_):
+        zc_ = child_.text
+        zc_ = self.gds_validate_string(zc_, node, 'zc')
+        self.zc = zc_
+    def buildChild_cy(self, child_, node, nodeName_):
+        cy_ = child_.text
+        cy_ = self.gds_validate_string(cy_, node, 'cy')
+        self.cy = cy_
+    def buildChild_et(self, child_, node, nodeName_):
+        et_ = child_.text
+        et_ = self.gds_validate_string(et_, node, 'et')
+        self.et = et_
+    def buildChild_la(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'la')
+        self.la = fval_
+    def buildChild_lo(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'lo')
+        self.lo = fval_
+    childBuilders_ = {
+        'st': buildChild_st,
+        'zc': buildChild_zc,
+        'cy': buildChild_cy,
+        'et': buildChild_et,
+        'la': buildChild_la,
+        'lo': buildChild_lo
+    }
 # end class TerseAddress
 
 
@@ -2434,7 +2656,7 @@ class ReallySimpleProperty(GeneratedsSuper):
     def set_pc(self, pc): self.pc = pc
     def validate_HomeType(self, value):
         # Validate type HomeType, a restriction on xsd:string.
-        if value is not None and Validate_simpletypes_:
+        if value is not None and validating_():
             value = str(value)
             enumerations = ['singleFamily', 'condo', 'multiFamily', 'manufactured', 'lot', 'unknown']
             enumeration_respectee = False
@@ -2446,7 +2668,7 @@ class ReallySimpleProperty(GeneratedsSuper):
                 warnings_.warn('Value "%(value)s" does not match xsd enumeration restriction on HomeType' % {"value" : value.encode("utf-8")} )
     def validate_HomeStatus(self, value):
         # Validate type HomeStatus, a restriction on xsd:string.
-        if value is not None and Validate_simpletypes_:
+        if value is not None and validating_():
             value = str(value)
             enumerations = ['forSale', 'makeMeMove', 'recentlySold', 'other']
             enumeration_respectee = False
@@ -2546,109 +2768,128 @@ class ReallySimpleProperty(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'id':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'id')
-            self.id = ival_
-        elif nodeName_ == 'ad':
-            obj_ = TerseAddress.factory()
-            obj_.build(child_)
-            self.ad = obj_
-            obj_.original_tagname_ = 'ad'
-        elif nodeName_ == 'pr':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'pr')
-            self.pr = ival_
-        elif nodeName_ == 'ba':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'ba')
-            self.ba = fval_
-        elif nodeName_ == 'be':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'be')
-            self.be = ival_
-        elif nodeName_ == 'sf':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'sf')
-            self.sf = ival_
-        elif nodeName_ == 'ht':
-            ht_ = child_.text
-            ht_ = self.gds_validate_string(ht_, node, 'ht')
-            self.ht = ht_
-            # validate type HomeType
-            self.validate_HomeType(self.ht)
-        elif nodeName_ == 'hs':
-            hs_ = child_.text
-            hs_ = self.gds_validate_string(hs_, node, 'hs')
-            self.hs = hs_
-            # validate type HomeStatus
-            self.validate_HomeStatus(self.hs)
-        elif nodeName_ == 'il':
-            il_ = child_.text
-            il_ = self.gds_validate_string(il_, node, 'il')
-            self.il = il_
-        elif nodeName_ == 'fl':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'fl')
-            self.fl = ival_
-        elif nodeName_ == 'cp':
-            cp_ = child_.text
-            cp_ = self.gds_validate_string(cp_, node, 'cp')
-            self.cp = cp_
-        elif nodeName_ == 'ce':
-            ce_ = child_.text
-            ce_ = self.gds_validate_string(ce_, node, 'ce')
-            self.ce = ce_
-        elif nodeName_ == 'hi':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'hi')
-            self.hi = ival_
-        elif nodeName_ == 'pc':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'pc')
-            self.pc = ival_
+        builder_ = ReallySimpleProperty.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_id(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'id')
+        self.id = ival_
+    def buildChild_ad(self, child_, node, nodeName_):
+        obj_ = TerseAddress.factory()
+        obj_.build(child_)
+        self.ad = obj_
+        obj_.original_tagname_ = 'ad'
+    def buildChild_pr(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'pr')
+        self.pr = ival_
+    def buildChild_ba(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'ba')
+        self.ba = fval_
+    def buildChild_be(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'be')
+        self.be = ival_
+    def buildChild_sf(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'sf')
+        self.sf = ival_
+    def buildChild_ht(self, child_, node, nodeName_):
+        ht_ = child_.text
+        ht_ = self.gds_validate_string(ht_, node, 'ht')
+        self.ht = ht_
+        # validate type HomeType
+        self.validate_HomeType(self.ht)
+    def buildChild_hs(self, child_, node, nodeName_):
+        hs_ = child_.text
+        hs_ = self.gds_validate_string(hs_, node, 'hs')
+        self.hs = hs_
+        # validate type HomeStatus
+        self.validate_HomeStatus(self.hs)
+    def buildChild_il(self, child_, node, nodeName_):
+        il_ = child_.text
+        il_ = self.gds_validate_string(il_, node, 'il')
+        self.il = il_
+    def buildChild_fl(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'fl')
+        self.fl = ival_
+    def buildChild_cp(self, child_, node, nodeName_):
+        cp_ = child_.text
+        cp_ = self.gds_validate_string(cp_, node, 'cp')
+        self.cp = cp_
+    def buildChild_ce(self, child_, node, nodeName_):
+        ce_ = child_.text
+        ce_ = self.gds_validate_string(ce_, node, 'ce')
+        self.ce = ce_
+    def buildChild_hi(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'hi')
+        self.hi = ival_
+    def buildChild_pc(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'pc')
+        self.pc = ival_
+    childBuilders_ = {
+        'id': buildChild_id,
+        'ad': buildChild_ad,
+        'pr': buildChild_pr,
+        'ba': buildChild_ba,
+        'be': buildChild_be,
+        'sf': buildChild_sf,
+        'ht': buildChild_ht,
+        'hs': buildChild_hs,
+        'il': buildChild_il,
+        'fl': buildChild_fl,
+        'cp': buildChild_cp,
+        'ce': buildChild_ce,
+        'hi': buildChild_hi,
+        'pc': buildChild_pc
+    }
 # end class ReallySimpleProperty
 
 
@@ -2732,7 +2973,7 @@ class FMRProperty(GeneratedsSuper):
     def set_neighborhood(self, neighborhood): self.neighborhood = neighborhood
     def validate_HomeType(self, value):
         # Validate type HomeType, a restriction on xsd:string.
-        if value is not None and Validate_simpletypes_:
+        if value is not None and validating_():
             value = str(value)
             enumerations = ['singleFamily', 'condo', 'multiFamily', 'manufactured', 'lot', 'unknown']
             enumeration_respectee = False
@@ -2744,7 +2985,7 @@ class FMRProperty(GeneratedsSuper):
                 warnings_.warn('Value "%(value)s" does not match xsd enumeration restriction on HomeType' % {"value" : value.encode("utf-8")} )
     def validate_HomeStatus(self, value):
         # Validate type HomeStatus, a restriction on xsd:string.
-        if value is not None and Validate_simpletypes_:
+        if value is not None and validating_():
             value = str(value)
             enumerations = ['forSale', 'makeMeMove', 'recentlySold', 'other']
             enumeration_respectee = False
@@ -2867,122 +3108,147 @@ class FMRProperty(GeneratedsSuper):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'address':
-            obj_ = RestrictedAddress.factory()
-            obj_.build(child_)
-            self.address = obj_
-            obj_.original_tagname_ = 'address'
-        elif nodeName_ == 'detailPageLink':
-            detailPageLink_ = child_.text
-            detailPageLink_ = self.gds_validate_string(detailPageLink_, node, 'detailPageLink')
-            self.detailPageLink = detailPageLink_
-        elif nodeName_ == 'price':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'price')
-            self.price = ival_
-        elif nodeName_ == 'lastSoldDate':
-            lastSoldDate_ = child_.text
-            lastSoldDate_ = self.gds_validate_string(lastSoldDate_, node, 'lastSoldDate')
-            self.lastSoldDate = lastSoldDate_
-        elif nodeName_ == 'lastSoldPrice':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'lastSoldPrice')
-            self.lastSoldPrice = ival_
-        elif nodeName_ == 'zestimate':
-            obj_ = SimpleZestimate.factory()
-            obj_.build(child_)
-            self.zestimate = obj_
-            obj_.original_tagname_ = 'zestimate'
-        elif nodeName_ == 'bathrooms':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'bathrooms')
-            self.bathrooms = fval_
-        elif nodeName_ == 'bedrooms':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'bedrooms')
-            self.bedrooms = ival_
-        elif nodeName_ == 'finishedSqFt':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'finishedSqFt')
-            self.finishedSqFt = ival_
-        elif nodeName_ == 'lotSqFt':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'lotSqFt')
-            self.lotSqFt = ival_
-        elif nodeName_ == 'homeType':
-            homeType_ = child_.text
-            homeType_ = self.gds_validate_string(homeType_, node, 'homeType')
-            self.homeType = homeType_
-            # validate type HomeType
-            self.validate_HomeType(self.homeType)
-        elif nodeName_ == 'homeStatus':
-            homeStatus_ = child_.text
-            homeStatus_ = self.gds_validate_string(homeStatus_, node, 'homeStatus')
-            self.homeStatus = homeStatus_
-            # validate type HomeStatus
-            self.validate_HomeStatus(self.homeStatus)
-        elif nodeName_ == 'imageLink':
-            imageLink_ = child_.text
-            imageLink_ = self.gds_validate_string(imageLink_, node, 'imageLink')
-            self.imageLink = imageLink_
-        elif nodeName_ == 'largeImageLink':
-            largeImageLink_ = child_.text
-            largeImageLink_ = self.gds_validate_string(largeImageLink_, node, 'largeImageLink')
-            self.largeImageLink = largeImageLink_
-        elif nodeName_ == 'fsboLink':
-            fsboLink_ = child_.text
-            fsboLink_ = self.gds_validate_string(fsboLink_, node, 'fsboLink')
-            self.fsboLink = fsboLink_
-        elif nodeName_ == 'forSaleLink':
-            forSaleLink_ = child_.text
-            forSaleLink_ = self.gds_validate_string(forSaleLink_, node, 'forSaleLink')
-            self.forSaleLink = forSaleLink_
-        elif nodeName_ == 'makeMeMoveLink':
-            makeMeMoveLink_ = child_.text
-            makeMeMoveLink_ = self.gds_validate_string(makeMeMoveLink_, node, 'makeMeMoveLink')
-            self.makeMeMoveLink = makeMeMoveLink_
-        elif nodeName_ == 'recentlySoldLink':
-            recentlySoldLink_ = child_.text
-            recentlySoldLink_ = self.gds_validate_string(recentlySoldLink_, node, 'recentlySoldLink')
-            self.recentlySoldLink = recentlySoldLink_
-        elif nodeName_ == 'localPageLink':
-            localPageLink_ = child_.text
-            localPageLink_ = self.gds_validate_string(localPageLink_, node, 'localPageLink')
-            self.localPageLink = localPageLink_
-        elif nodeName_ == 'neighborhood':
-            neighborhood_ = child_.text
-            neighborhood_ = self.gds_validate_string(neighborhood_, node, 'neighborhood')
-            self.neighborhood = neighborhood_
+        builder_ = FMRProperty.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_address(self, child_, node, nodeName_):
+        obj_ = RestrictedAddress.factory()
+        obj_.build(child_)
+        self.address = obj_
+        obj_.original_tagname_ = 'address'
+    def buildChild_detailPageLink(self, child_, node, nodeName_):
+        detailPageLink_ = child_.text
+        detailPageLink_ = self.gds_validate_string(detailPageLink_, node, 'detailPageLink')
+        self.detailPageLink = detailPageLink_
+    def buildChild_price(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'price')
+        self.price = ival_
+    def buildChild_lastSoldDate(self, child_, node, nodeName_):
+        lastSoldDate_ = child_.text
+        lastSoldDate_ = self.gds_validate_string(lastSoldDate_, node, 'lastSoldDate')
+        self.lastSoldDate = lastSoldDate_
+    def buildChild_lastSoldPrice(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'lastSoldPrice')
+        self.lastSoldPrice = ival_
+    def buildChild_zestimate(self, child_, node, nodeName_):
+        obj_ = SimpleZestimate.factory()
+        obj_.build(child_)
+        self.zestimate = obj_
+        obj_.original_tagname_ = 'zestimate'
+    def buildChild_bathrooms(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            fval_ = float(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires float or double: %s' % exp)
+        fval_ = self.gds_validate_float(fval_, node, 'bathrooms')
+        self.bathrooms = fval_
+    def buildChild_bedrooms(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'bedrooms')
+        self.bedrooms = ival_
+    def buildChild_finishedSqFt(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'finishedSqFt')
+        self.finishedSqFt = ival_
+    def buildChild_lotSqFt(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'lotSqFt')
+        self.lotSqFt = ival_
+    def buildChild_homeType(self, child_, node, nodeName_):
+        homeType_ = child_.text
+        homeType_ = self.gds_validate_string(homeType_, node, 'homeType')
+        self.homeType = homeType_
+        # validate type HomeType
+        self.validate_HomeType(self.homeType)
+    def buildChild_homeStatus(self, child_, node, nodeName_):
+        homeStatus_ = child_.text
+        homeStatus_ = self.gds_validate_string(homeStatus_, node, 'homeStatus')
+        self.homeStatus = homeStatus_
+        # validate type HomeStatus
+        self.validate_HomeStatus(self.homeStatus)
+    def buildChild_imageLink(self, child_, node, nodeName_):
+        imageLink_ = child_.text
+        imageLink_ = self.gds_validate_string(imageLink_, node, 'imageLink')
+        self.imageLink = imageLink_
+    def buildChild_largeImageLink(self, child_, node, nodeName_):
+        largeImageLink_ = child_.text
+        largeImageLink_ = self.gds_validate_string(largeImageLink_, node, 'largeImageLink')
+        self.largeImageLink = largeImageLink_
+    def buildChild_fsboLink(self, child_, node, nodeName_):
+        fsboLink_ = child_.text
+        fsboLink_ = self.gds_validate_string(fsboLink_, node, 'fsboLink')
+        self.fsboLink = fsboLink_
+    def buildChild_forSaleLink(self, child_, node, nodeName_):
+        forSaleLink_ = child_.text
+        forSaleLink_ = self.gds_validate_string(forSaleLink_, node, 'forSaleLink')
+        self.forSaleLink = forSaleLink_
+    def buildChild_makeMeMoveLink(self, child_, node, nodeName_):
+        makeMeMoveLink_ = child_.text
+        makeMeMoveLink_ = self.gds_validate_string(makeMeMoveLink_, node, 'makeMeMoveLink')
+        self.makeMeMoveLink = makeMeMoveLink_
+    def buildChild_recentlySoldLink(self, child_, node, nodeName_):
+        recentlySoldLink_ = child_.text
+        recentlySoldLink_ = self.gds_validate_string(recentlySoldLink_, node, 'recentlySoldLink')
+        self.recentlySoldLink = recentlySoldLink_
+    def buildChild_localPageLink(self, child_, node, nodeName_):
+        localPageLink_ = child_.text
+        localPageLink_ = self.gds_validate_string(localPageLink_, node, 'localPageLink')
+        self.localPageLink = localPageLink_
+    def buildChild_neighborhood(self, child_, node, nodeName_):
+        neighborhood_ = child_.text
+        neighborhood_ = self.gds_validate_string(neighborhood_, node, 'neighborhood')
+        self.neighborhood = neighborhood_
+    childBuilders_ = {
+        'address': buildChild_address,
+        'detailPageLink': buildChild_detailPageLink,
+        'price': buildChild_price,
+        'lastSoldDate': buildChild_lastSoldDate,
+        'lastSoldPrice': buildChild_lastSoldPrice,
+        'zestimate': buildChild_zestimate,
+        'bathrooms': buildChild_bathrooms,
+        'bedrooms': buildChild_bedrooms,
+        'finishedSqFt': buildChild_finishedSqFt,
+        'lotSqFt': buildChild_lotSqFt,
+        'homeType': buildChild_homeType,
+        'homeStatus': buildChild_homeStatus,
+        'imageLink': buildChild_imageLink,
+        'largeImageLink': buildChild_largeImageLink,
+        'fsboLink': buildChild_fsboLink,
+        'forSaleLink': buildChild_forSaleLink,
+        'makeMeMoveLink': buildChild_makeMeMoveLink,
+        'recentlySoldLink': buildChild_recentlySoldLink,
+        'localPageLink': buildChild_localPageLink,
+        'neighborhood': buildChild_neighborhood
+    }
 # end class FMRProperty
 
 
@@ -3042,7 +3308,7 @@ class ComparableProperty(SimpleProperty):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -3120,18 +3386,24 @@ class DetailedProperty(SimpleProperty):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         super(DetailedProperty, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'regions':
-            obj_ = Regions.factory()
-            obj_.build(child_)
-            self.regions = obj_
-            obj_.original_tagname_ = 'regions'
+        builder_ = DetailedProperty.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
         super(DetailedProperty, self).buildChildren(child_, node, nodeName_, True)
+    def buildChild_regions(self, child_, node, nodeName_):
+        obj_ = Regions.factory()
+        obj_.build(child_)
+        self.regions = obj_
+        obj_.original_tagname_ = 'regions'
+    childBuilders_ = {
+        'regions': buildChild_regions
+    }
 # end class DetailedProperty
 
 
@@ -3193,7 +3465,7 @@ class DeprecatedType(GeneratedsSuper):
         self.buildAttributes(node, node.attrib, already_processed)
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -3281,7 +3553,7 @@ class AmountOptional(GeneratedsSuper):
         self.buildAttributes(node, node.attrib, already_processed)
         self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
@@ -3310,39 +3582,37 @@ class AmountOptional(GeneratedsSuper):
 # end class AmountOptional
 
 
-class MortgageInterestRate(GeneratedsSuper):
+class requestType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, loanType=None, count=None, valueOf_=None):
+    def __init__(self, address=None, citystatezip=None):
         self.original_tagname_ = None
-        self.loanType = _cast(None, loanType)
-        self.count = _cast(int, count)
-        self.valueOf_ = valueOf_
+        self.address = address
+        self.citystatezip = citystatezip
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MortgageInterestRate)
+                CurrentSubclassModule_, requestType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MortgageInterestRate.subclass:
-            return MortgageInterestRate.subclass(*args_, **kwargs_)
+        if requestType.subclass:
+            return requestType.subclass(*args_, **kwargs_)
         else:
-            return MortgageInterestRate(*args_, **kwargs_)
+            return requestType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_loanType(self): return self.loanType
-    def set_loanType(self, loanType): self.loanType = loanType
-    def get_count(self): return self.count
-    def set_count(self, count): self.count = count
-    def get_valueOf_(self): return self.valueOf_
-    def set_valueOf_(self, valueOf_): self.valueOf_ = valueOf_
+    def get_address(self): return self.address
+    def set_address(self, address): self.address = address
+    def get_citystatezip(self): return self.citystatezip
+    def set_citystatezip(self, citystatezip): self.citystatezip = citystatezip
     def hasContent_(self):
         if (
-            1 if type(self.valueOf_) in [int,float] else self.valueOf_
+            self.address is not None or
+            self.citystatezip is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MortgageInterestRate', namespacedef_='', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='requestType', namespacedef_='', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3352,81 +3622,82 @@ class MortgageInterestRate(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageInterestRate')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='requestType')
         if self.hasContent_():
-            outfile.write('>')
-            outfile.write((quote_xml(self.valueOf_) if type(self.valueOf_) is str else self.gds_encode(str(self.valueOf_))))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageInterestRate', pretty_print=pretty_print)
+            outfile.write('>%s' % (eol_, ))
+            self.exportChildren(outfile, level + 1, namespace_='', name_='requestType', pretty_print=pretty_print)
+            showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageInterestRate'):
-        if self.loanType is not None and 'loanType' not in already_processed:
-            already_processed.add('loanType')
-            outfile.write(' loanType=%s' % (quote_attrib(self.loanType), ))
-        if self.count is not None and 'count' not in already_processed:
-            already_processed.add('count')
-            outfile.write(' count="%s"' % self.gds_format_integer(self.count, input_name='count'))
-    def exportChildren(self, outfile, level, namespace_='', name_='MortgageInterestRate', fromsubclass_=False, pretty_print=True):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='requestType'):
         pass
+    def exportChildren(self, outfile, level, namespace_='', name_='requestType', fromsubclass_=False, pretty_print=True):
+        if pretty_print:
+            eol_ = '\n'
+        else:
+            eol_ = ''
+        if self.address is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%saddress>%s</%saddress>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.address), input_name='address')), namespace_, eol_))
+        if self.citystatezip is not None:
+            showIndent(outfile, level, pretty_print)
+            outfile.write('<%scitystatezip>%s</%scitystatezip>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.citystatezip), input_name='citystatezip')), namespace_, eol_))
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
-        self.valueOf_ = get_all_text_(node)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('loanType', node)
-        if value is not None and 'loanType' not in already_processed:
-            already_processed.add('loanType')
-            self.loanType = value
-        value = find_attr_value_('count', node)
-        if value is not None and 'count' not in already_processed:
-            already_processed.add('count')
-            try:
-                self.count = int(value)
-            except ValueError as exp:
-                raise_parse_error(node, 'Bad integer attribute: %s' % exp)
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
         pass
-# end class MortgageInterestRate
+    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
+        builder_ = requestType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_address(self, child_, node, nodeName_):
+        address_ = child_.text
+        address_ = self.gds_validate_string(address_, node, 'address')
+        self.address = address_
+    def buildChild_citystatezip(self, child_, node, nodeName_):
+        citystatezip_ = child_.text
+        citystatezip_ = self.gds_validate_string(citystatezip_, node, 'citystatezip')
+        self.citystatezip = citystatezip_
+    childBuilders_ = {
+        'address': buildChild_address,
+        'citystatezip': buildChild_citystatezip
+    }
+# end class requestType
 
 
-class MortgageRateList(GeneratedsSuper):
+class responseType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, rate=None):
+    def __init__(self, results=None):
         self.original_tagname_ = None
-        if rate is None:
-            self.rate = []
-        else:
-            self.rate = rate
+        self.results = results
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MortgageRateList)
+                CurrentSubclassModule_, responseType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MortgageRateList.subclass:
-            return MortgageRateList.subclass(*args_, **kwargs_)
+        if responseType.subclass:
+            return responseType.subclass(*args_, **kwargs_)
         else:
-            return MortgageRateList(*args_, **kwargs_)
+            return responseType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_rate(self): return self.rate
-    def set_rate(self, rate): self.rate = rate
-    def add_rate(self, value): self.rate.append(value)
-    def insert_rate_at(self, index, value): self.rate.insert(index, value)
-    def replace_rate_at(self, index, value): self.rate[index] = value
+    def get_results(self): return self.results
+    def set_results(self, results): self.results = results
     def hasContent_(self):
         if (
-            self.rate
+            self.results is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MortgageRateList', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='responseType', namespacedef_='', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3436,72 +3707,80 @@ class MortgageRateList(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageRateList')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='responseType')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageRateList', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='responseType', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageRateList'):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='responseType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MortgageRateList', fromsubclass_=False, pretty_print=True):
+    def exportChildren(self, outfile, level, namespace_='', name_='responseType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        for rate_ in self.rate:
-            rate_.export(outfile, level, namespace_, name_='rate', pretty_print=pretty_print)
+        if self.results is not None:
+            self.results.export(outfile, level, namespace_, name_='results', pretty_print=pretty_print)
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'rate':
-            obj_ = MortgageInterestRate.factory()
-            obj_.build(child_)
-            self.rate.append(obj_)
-            obj_.original_tagname_ = 'rate'
-# end class MortgageRateList
+        builder_ = responseType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_results(self, child_, node, nodeName_):
+        obj_ = resultsType.factory()
+        obj_.build(child_)
+        self.results = obj_
+        obj_.original_tagname_ = 'results'
+    childBuilders_ = {
+        'results': buildChild_results
+    }
+# end class responseType
 
 
-class MortgageRateSummary(GeneratedsSuper):
+class resultsType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, today=None, lastWeek=None):
+    def __init__(self, result=None):
         self.original_tagname_ = None
-        self.today = today
-        self.lastWeek = lastWeek
+        if result is None:
+            self.result = []
+        else:
+            self.result = result
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MortgageRateSummary)
+                CurrentSubclassModule_, resultsType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MortgageRateSummary.subclass:
-            return MortgageRateSummary.subclass(*args_, **kwargs_)
+        if resultsType.subclass:
+            return resultsType.subclass(*args_, **kwargs_)
         else:
-            return MortgageRateSummary(*args_, **kwargs_)
+            return resultsType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_today(self): return self.today
-    def set_today(self, today): self.today = today
-    def get_lastWeek(self): return self.lastWeek
-    def set_lastWeek(self, lastWeek): self.lastWeek = lastWeek
+    def get_result(self): return self.result
+    def set_result(self, result): self.result = result
+    def add_result(self, value): self.result.append(value)
+    def insert_result_at(self, index, value): self.result.insert(index, value)
+    def replace_result_at(self, index, value): self.result[index] = value
     def hasContent_(self):
         if (
-            self.today is not None or
-            self.lastWeek is not None
+            self.result
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MortgageRateSummary', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='resultsType', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3511,86 +3790,79 @@ class MortgageRateSummary(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageRateSummary')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='resultsType')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageRateSummary', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='resultsType', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageRateSummary'):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='resultsType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MortgageRateSummary', fromsubclass_=False, pretty_print=True):
+    def exportChildren(self, outfile, level, namespace_='', name_='resultsType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        if self.today is not None:
-            self.today.export(outfile, level, namespace_, name_='today', pretty_print=pretty_print)
-        if self.lastWeek is not None:
-            self.lastWeek.export(outfile, level, namespace_, name_='lastWeek', pretty_print=pretty_print)
+        for result_ in self.result:
+            result_.export(outfile, level, namespace_, name_='result', pretty_print=pretty_print)
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'today':
-            obj_ = MortgageRateList.factory()
-            obj_.build(child_)
-            self.today = obj_
-            obj_.original_tagname_ = 'today'
-        elif nodeName_ == 'lastWeek':
-            obj_ = MortgageRateList.factory()
-            obj_.build(child_)
-            self.lastWeek = obj_
-            obj_.original_tagname_ = 'lastWeek'
-# end class MortgageRateSummary
-
-
-class MonthlyPaymentData(GeneratedsSuper):
+        builder_ = resultsType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_result(self, child_, node, nodeName_):
+        class_obj_ = self.get_class_obj_(child_, SimpleProperty)
+        obj_ = class_obj_.factory()
+        obj_.build(child_)
+        self.result.append(obj_)
+        obj_.original_tagname_ = 'result'
+    childBuilders_ = {
+        'result': buildChild_result
+    }
+# end class resultsType
+
+
+class valuationRangeType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, loanType=None, rate=None, monthlyPrincipalAndInterest=None, monthlyMortgageInsurance=None):
+    def __init__(self, low=None, high=None):
         self.original_tagname_ = None
-        self.loanType = _cast(None, loanType)
-        self.rate = rate
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyMortgageInsurance = monthlyMortgageInsurance
+        self.low = low
+        self.high = high
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MonthlyPaymentData)
+                CurrentSubclassModule_, valuationRangeType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MonthlyPaymentData.subclass:
-            return MonthlyPaymentData.subclass(*args_, **kwargs_)
+        if valuationRangeType.subclass:
+            return valuationRangeType.subclass(*args_, **kwargs_)
         else:
-            return MonthlyPaymentData(*args_, **kwargs_)
+            return valuationRangeType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_rate(self): return self.rate
-    def set_rate(self, rate): self.rate = rate
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyMortgageInsurance(self): return self.monthlyMortgageInsurance
-    def set_monthlyMortgageInsurance(self, monthlyMortgageInsurance): self.monthlyMortgageInsurance = monthlyMortgageInsurance
-    def get_loanType(self): return self.loanType
-    def set_loanType(self, loanType): self.loanType = loanType
+    def get_low(self): return self.low
+    def set_low(self, low): self.low = low
+    def get_high(self): return self.high
+    def set_high(self, high): self.high = high
     def hasContent_(self):
         if (
-            self.rate is not None or
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyMortgageInsurance is not None
+            self.low is not None or
+            self.high is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentData', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='valuationRangeType', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3600,113 +3872,86 @@ class MonthlyPaymentData(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentData')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='valuationRangeType')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentData', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='valuationRangeType', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentData'):
-        if self.loanType is not None and 'loanType' not in already_processed:
-            already_processed.add('loanType')
-            outfile.write(' loanType=%s' % (quote_attrib(self.loanType), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentData', fromsubclass_=False, pretty_print=True):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='valuationRangeType'):
+        pass
+    def exportChildren(self, outfile, level, namespace_='', name_='valuationRangeType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        if self.rate is not None:
-            self.rate.export(outfile, level, namespace_, name_='rate', pretty_print=pretty_print)
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyMortgageInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyMortgageInsurance>%s</%smonthlyMortgageInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyMortgageInsurance, input_name='monthlyMortgageInsurance'), namespace_, eol_))
+        if self.low is not None:
+            self.low.export(outfile, level, namespace_, name_='low', pretty_print=pretty_print)
+        if self.high is not None:
+            self.high.export(outfile, level, namespace_, name_='high', pretty_print=pretty_print)
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('loanType', node)
-        if value is not None and 'loanType' not in already_processed:
-            already_processed.add('loanType')
-            self.loanType = value
+        pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'rate':
-            obj_ = MortgageInterestRate.factory()
-            obj_.build(child_)
-            self.rate = obj_
-            obj_.original_tagname_ = 'rate'
-        elif nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyMortgageInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyMortgageInsurance')
-            self.monthlyMortgageInsurance = ival_
-# end class MonthlyPaymentData
+        builder_ = valuationRangeType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_low(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.low = obj_
+        obj_.original_tagname_ = 'low'
+    def buildChild_high(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.high = obj_
+        obj_.original_tagname_ = 'high'
+    childBuilders_ = {
+        'low': buildChild_low,
+        'high': buildChild_high
+    }
+# end class valuationRangeType
 
 
-class MonthlyPaymentsSummary(GeneratedsSuper):
+class valuationRangeType1(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, payment=None, downPayment=None, monthlyPropertyTaxes=None, monthlyHazardInsurance=None):
+    def __init__(self, low=None, high=None):
         self.original_tagname_ = None
-        if payment is None:
-            self.payment = []
-        else:
-            self.payment = payment
-        self.downPayment = downPayment
-        self.monthlyPropertyTaxes = monthlyPropertyTaxes
-        self.monthlyHazardInsurance = monthlyHazardInsurance
+        self.low = low
+        self.high = high
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MonthlyPaymentsSummary)
+                CurrentSubclassModule_, valuationRangeType1)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MonthlyPaymentsSummary.subclass:
-            return MonthlyPaymentsSummary.subclass(*args_, **kwargs_)
+        if valuationRangeType1.subclass:
+            return valuationRangeType1.subclass(*args_, **kwargs_)
         else:
-            return MonthlyPaymentsSummary(*args_, **kwargs_)
+            return valuationRangeType1(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def add_payment(self, value): self.payment.append(value)
-    def insert_payment_at(self, index, value): self.payment.insert(index, value)
-    def replace_payment_at(self, index, value): self.payment[index] = value
-    def get_downPayment(self): return self.downPayment
-    def set_downPayment(self, downPayment): self.downPayment = downPayment
-    def get_monthlyPropertyTaxes(self): return self.monthlyPropertyTaxes
-    def set_monthlyPropertyTaxes(self, monthlyPropertyTaxes): self.monthlyPropertyTaxes = monthlyPropertyTaxes
-    def get_monthlyHazardInsurance(self): return self.monthlyHazardInsurance
-    def set_monthlyHazardInsurance(self, monthlyHazardInsurance): self.monthlyHazardInsurance = monthlyHazardInsurance
+    def get_low(self): return self.low
+    def set_low(self, low): self.low = low
+    def get_high(self): return self.high
+    def set_high(self, high): self.high = high
     def hasContent_(self):
         if (
-            self.payment or
-            self.downPayment is not None or
-            self.monthlyPropertyTaxes is not None or
-            self.monthlyHazardInsurance is not None
+            self.low is not None or
+            self.high is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentsSummary', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='valuationRangeType1', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3716,147 +3961,99 @@ class MonthlyPaymentsSummary(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentsSummary')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='valuationRangeType1')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentsSummary', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='valuationRangeType1', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentsSummary'):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='valuationRangeType1'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentsSummary', fromsubclass_=False, pretty_print=True):
+    def exportChildren(self, outfile, level, namespace_='', name_='valuationRangeType1', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        for payment_ in self.payment:
-            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
-        if self.downPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
-        if self.monthlyPropertyTaxes is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPropertyTaxes>%s</%smonthlyPropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.monthlyPropertyTaxes, input_name='monthlyPropertyTaxes'), namespace_, eol_))
-        if self.monthlyHazardInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyHazardInsurance>%s</%smonthlyHazardInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyHazardInsurance, input_name='monthlyHazardInsurance'), namespace_, eol_))
+        if self.low is not None:
+            self.low.export(outfile, level, namespace_, name_='low', pretty_print=pretty_print)
+        if self.high is not None:
+            self.high.export(outfile, level, namespace_, name_='high', pretty_print=pretty_print)
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'payment':
-            obj_ = MonthlyPaymentData.factory()
-            obj_.build(child_)
-            self.payment.append(obj_)
-            obj_.original_tagname_ = 'payment'
-        elif nodeName_ == 'downPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
-            self.downPayment = ival_
-        elif nodeName_ == 'monthlyPropertyTaxes':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPropertyTaxes')
-            self.monthlyPropertyTaxes = ival_
-        elif nodeName_ == 'monthlyHazardInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyHazardInsurance')
-            self.monthlyHazardInsurance = ival_
-# end class MonthlyPaymentsSummary
+        builder_ = valuationRangeType1.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_low(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.low = obj_
+        obj_.original_tagname_ = 'low'
+    def buildChild_high(self, child_, node, nodeName_):
+        obj_ = Amount.factory()
+        obj_.build(child_)
+        self.high = obj_
+        obj_.original_tagname_ = 'high'
+    childBuilders_ = {
+        'low': buildChild_low,
+        'high': buildChild_high
+    }
+# end class valuationRangeType1
 
 
-class MonthlyPaymentsDetails(GeneratedsSuper):
+class regionType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPropertyTaxes=None, monthlyHazardInsurance=None, monthlyPmi=None, monthlyHoaDues=None, totalMonthlyPayment=None, totalPayments=None, totalInterest=None, totalPrincipal=None, totalTaxesFeesAndInsurance=None, amortizationSchedule=None):
+    def __init__(self, name=None, type_=None, id=None, zindexValue=None, zindexOneYearChange=None, links=None):
         self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPropertyTaxes = monthlyPropertyTaxes
-        self.monthlyHazardInsurance = monthlyHazardInsurance
-        self.monthlyPmi = monthlyPmi
-        self.monthlyHoaDues = monthlyHoaDues
-        self.totalMonthlyPayment = totalMonthlyPayment
-        self.totalPayments = totalPayments
-        self.totalInterest = totalInterest
-        self.totalPrincipal = totalPrincipal
-        self.totalTaxesFeesAndInsurance = totalTaxesFeesAndInsurance
-        if amortizationSchedule is None:
-            self.amortizationSchedule = []
-        else:
-            self.amortizationSchedule = amortizationSchedule
+        self.name = _cast(None, name)
+        self.type_ = _cast(None, type_)
+        self.id = _cast(int, id)
+        self.zindexValue = zindexValue
+        self.zindexOneYearChange = zindexOneYearChange
+        self.links = links
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MonthlyPaymentsDetails)
+                CurrentSubclassModule_, regionType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if MonthlyPaymentsDetails.subclass:
-            return MonthlyPaymentsDetails.subclass(*args_, **kwargs_)
+        if regionType.subclass:
+            return regionType.subclass(*args_, **kwargs_)
         else:
-            return MonthlyPaymentsDetails(*args_, **kwargs_)
+            return regionType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPropertyTaxes(self): return self.monthlyPropertyTaxes
-    def set_monthlyPropertyTaxes(self, monthlyPropertyTaxes): self.monthlyPropertyTaxes = monthlyPropertyTaxes
-    def get_monthlyHazardInsurance(self): return self.monthlyHazardInsurance
-    def set_monthlyHazardInsurance(self, monthlyHazardInsurance): self.monthlyHazardInsurance = monthlyHazardInsurance
-    def get_monthlyPmi(self): return self.monthlyPmi
-    def set_monthlyPmi(self, monthlyPmi): self.monthlyPmi = monthlyPmi
-    def get_monthlyHoaDues(self): return self.monthlyHoaDues
-    def set_monthlyHoaDues(self, monthlyHoaDues): self.monthlyHoaDues = monthlyHoaDues
-    def get_totalMonthlyPayment(self): return self.totalMonthlyPayment
-    def set_totalMonthlyPayment(self, totalMonthlyPayment): self.totalMonthlyPayment = totalMonthlyPayment
-    def get_totalPayments(self): return self.totalPayments
-    def set_totalPayments(self, totalPayments): self.totalPayments = totalPayments
-    def get_totalInterest(self): return self.totalInterest
-    def set_totalInterest(self, totalInterest): self.totalInterest = totalInterest
-    def get_totalPrincipal(self): return self.totalPrincipal
-    def set_totalPrincipal(self, totalPrincipal): self.totalPrincipal = totalPrincipal
-    def get_totalTaxesFeesAndInsurance(self): return self.totalTaxesFeesAndInsurance
-    def set_totalTaxesFeesAndInsurance(self, totalTaxesFeesAndInsurance): self.totalTaxesFeesAndInsurance = totalTaxesFeesAndInsurance
-    def get_amortizationSchedule(self): return self.amortizationSchedule
-    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
-    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
-    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
-    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
+    def get_zindexValue(self): return self.zindexValue
+    def set_zindexValue(self, zindexValue): self.zindexValue = zindexValue
+    def get_zindexOneYearChange(self): return self.zindexOneYearChange
+    def set_zindexOneYearChange(self, zindexOneYearChange): self.zindexOneYearChange = zindexOneYearChange
+    def get_links(self): return self.links
+    def set_links(self, links): self.links = links
+    def get_name(self): return self.name
+    def set_name(self, name): self.name = name
+    def get_type(self): return self.type_
+    def set_type(self, type_): self.type_ = type_
+    def get_id(self): return self.id
+    def set_id(self, id): self.id = id
     def hasContent_(self):
         if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPropertyTaxes is not None or
-            self.monthlyHazardInsurance is not None or
-            self.monthlyPmi is not None or
-            self.monthlyHoaDues is not None or
-            self.totalMonthlyPayment is not None or
-            self.totalPayments is not None or
-            self.totalInterest is not None or
-            self.totalPrincipal is not None or
-            self.totalTaxesFeesAndInsurance is not None or
-            self.amortizationSchedule
+            self.zindexValue is not None or
+            self.zindexOneYearChange is not None or
+            self.links is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='MonthlyPaymentsDetails', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='regionType', namespacedef_='', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -3866,6795 +4063,120 @@ class MonthlyPaymentsDetails(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MonthlyPaymentsDetails')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='regionType')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MonthlyPaymentsDetails', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='regionType', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MonthlyPaymentsDetails'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MonthlyPaymentsDetails', fromsubclass_=False, pretty_print=True):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='regionType'):
+        if self.name is not None and 'name' not in already_processed:
+            already_processed.add('name')
+            outfile.write(' name=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.name), input_name='name')), ))
+        if self.type_ is not None and 'type_' not in already_processed:
+            already_processed.add('type_')
+            outfile.write(' type=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.type_), input_name='type')), ))
+        if self.id is not None and 'id' not in already_processed:
+            already_processed.add('id')
+            outfile.write(' id="%s"' % self.gds_format_integer(self.id, input_name='id'))
+    def exportChildren(self, outfile, level, namespace_='', name_='regionType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPropertyTaxes is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPropertyTaxes>%s</%smonthlyPropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.monthlyPropertyTaxes, input_name='monthlyPropertyTaxes'), namespace_, eol_))
-        if self.monthlyHazardInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyHazardInsurance>%s</%smonthlyHazardInsurance>%s' % (namespace_, self.gds_format_integer(self.monthlyHazardInsurance, input_name='monthlyHazardInsurance'), namespace_, eol_))
-        if self.monthlyPmi is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPmi>%s</%smonthlyPmi>%s' % (namespace_, self.gds_format_integer(self.monthlyPmi, input_name='monthlyPmi'), namespace_, eol_))
-        if self.monthlyHoaDues is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyHoaDues>%s</%smonthlyHoaDues>%s' % (namespace_, self.gds_format_integer(self.monthlyHoaDues, input_name='monthlyHoaDues'), namespace_, eol_))
-        if self.totalMonthlyPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalMonthlyPayment>%s</%stotalMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.totalMonthlyPayment, input_name='totalMonthlyPayment'), namespace_, eol_))
-        if self.totalPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalPayments>%s</%stotalPayments>%s' % (namespace_, self.gds_format_integer(self.totalPayments, input_name='totalPayments'), namespace_, eol_))
-        if self.totalInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalInterest>%s</%stotalInterest>%s' % (namespace_, self.gds_format_integer(self.totalInterest, input_name='totalInterest'), namespace_, eol_))
-        if self.totalPrincipal is not None:
+        if self.zindexValue is not None:
             showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalPrincipal>%s</%stotalPrincipal>%s' % (namespace_, self.gds_format_integer(self.totalPrincipal, input_name='totalPrincipal'), namespace_, eol_))
-        if self.totalTaxesFeesAndInsurance is not None:
+            outfile.write('<%szindexValue>%s</%szindexValue>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.zindexValue), input_name='zindexValue')), namespace_, eol_))
+        if self.zindexOneYearChange is not None:
             showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalTaxesFeesAndInsurance>%s</%stotalTaxesFeesAndInsurance>%s' % (namespace_, self.gds_format_integer(self.totalTaxesFeesAndInsurance, input_name='totalTaxesFeesAndInsurance'), namespace_, eol_))
-        for amortizationSchedule_ in self.amortizationSchedule:
-            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPropertyTaxes':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPropertyTaxes')
-            self.monthlyPropertyTaxes = ival_
-        elif nodeName_ == 'monthlyHazardInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyHazardInsurance')
-            self.monthlyHazardInsurance = ival_
-        elif nodeName_ == 'monthlyPmi':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPmi')
-            self.monthlyPmi = ival_
-        elif nodeName_ == 'monthlyHoaDues':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyHoaDues')
-            self.monthlyHoaDues = ival_
-        elif nodeName_ == 'totalMonthlyPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalMonthlyPayment')
-            self.totalMonthlyPayment = ival_
-        elif nodeName_ == 'totalPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalPayments')
-            self.totalPayments = ival_
-        elif nodeName_ == 'totalInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalInterest')
-            self.totalInterest = ival_
-        elif nodeName_ == 'totalPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalPrincipal')
-            self.totalPrincipal = ival_
-        elif nodeName_ == 'totalTaxesFeesAndInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalTaxesFeesAndInsurance')
-            self.totalTaxesFeesAndInsurance = ival_
-        elif nodeName_ == 'amortizationSchedule':
-            obj_ = AmortizationSchedule.factory()
-            obj_.build(child_)
-            self.amortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'amortizationSchedule'
-# end class MonthlyPaymentsDetails
-
-
-class AmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if payment is None:
-            self.payment = []
-        else:
-            self.payment = payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, AmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if AmortizationSchedule.subclass:
-            return AmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return AmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def add_payment(self, value): self.payment.append(value)
-    def insert_payment_at(self, index, value): self.payment.insert(index, value)
-    def replace_payment_at(self, index, value): self.payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='AmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='AmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='AmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for payment_ in self.payment:
-            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'payment':
-            obj_ = paymentType.factory()
-            obj_.build(child_)
-            self.payment.append(obj_)
-            obj_.original_tagname_ = 'payment'
-# end class AmortizationSchedule
-
-
-class Refinance(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, totalMonthlySavings=None, currentMonthlyPayment=None, newMonthlyPayment=None, breakEven=None, lifetimeSavings=None, savingsTableSchedule=None):
-        self.original_tagname_ = None
-        self.totalMonthlySavings = totalMonthlySavings
-        self.currentMonthlyPayment = currentMonthlyPayment
-        self.newMonthlyPayment = newMonthlyPayment
-        self.breakEven = breakEven
-        self.lifetimeSavings = lifetimeSavings
-        if savingsTableSchedule is None:
-            self.savingsTableSchedule = []
-        else:
-            self.savingsTableSchedule = savingsTableSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, Refinance)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if Refinance.subclass:
-            return Refinance.subclass(*args_, **kwargs_)
-        else:
-            return Refinance(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_totalMonthlySavings(self): return self.totalMonthlySavings
-    def set_totalMonthlySavings(self, totalMonthlySavings): self.totalMonthlySavings = totalMonthlySavings
-    def get_currentMonthlyPayment(self): return self.currentMonthlyPayment
-    def set_currentMonthlyPayment(self, currentMonthlyPayment): self.currentMonthlyPayment = currentMonthlyPayment
-    def get_newMonthlyPayment(self): return self.newMonthlyPayment
-    def set_newMonthlyPayment(self, newMonthlyPayment): self.newMonthlyPayment = newMonthlyPayment
-    def get_breakEven(self): return self.breakEven
-    def set_breakEven(self, breakEven): self.breakEven = breakEven
-    def get_lifetimeSavings(self): return self.lifetimeSavings
-    def set_lifetimeSavings(self, lifetimeSavings): self.lifetimeSavings = lifetimeSavings
-    def get_savingsTableSchedule(self): return self.savingsTableSchedule
-    def set_savingsTableSchedule(self, savingsTableSchedule): self.savingsTableSchedule = savingsTableSchedule
-    def add_savingsTableSchedule(self, value): self.savingsTableSchedule.append(value)
-    def insert_savingsTableSchedule_at(self, index, value): self.savingsTableSchedule.insert(index, value)
-    def replace_savingsTableSchedule_at(self, index, value): self.savingsTableSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.totalMonthlySavings is not None or
-            self.currentMonthlyPayment is not None or
-            self.newMonthlyPayment is not None or
-            self.breakEven is not None or
-            self.lifetimeSavings is not None or
-            self.savingsTableSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='Refinance', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Refinance')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='Refinance', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Refinance'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='Refinance', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.totalMonthlySavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalMonthlySavings>%s</%stotalMonthlySavings>%s' % (namespace_, self.gds_format_integer(self.totalMonthlySavings, input_name='totalMonthlySavings'), namespace_, eol_))
-        if self.currentMonthlyPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%scurrentMonthlyPayment>%s</%scurrentMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.currentMonthlyPayment, input_name='currentMonthlyPayment'), namespace_, eol_))
-        if self.newMonthlyPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%snewMonthlyPayment>%s</%snewMonthlyPayment>%s' % (namespace_, self.gds_format_integer(self.newMonthlyPayment, input_name='newMonthlyPayment'), namespace_, eol_))
-        if self.breakEven is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
-        if self.lifetimeSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%slifetimeSavings>%s</%slifetimeSavings>%s' % (namespace_, self.gds_format_integer(self.lifetimeSavings, input_name='lifetimeSavings'), namespace_, eol_))
-        for savingsTableSchedule_ in self.savingsTableSchedule:
-            savingsTableSchedule_.export(outfile, level, namespace_, name_='savingsTableSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'totalMonthlySavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalMonthlySavings')
-            self.totalMonthlySavings = ival_
-        elif nodeName_ == 'currentMonthlyPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'currentMonthlyPayment')
-            self.currentMonthlyPayment = ival_
-        elif nodeName_ == 'newMonthlyPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'newMonthlyPayment')
-            self.newMonthlyPayment = ival_
-        elif nodeName_ == 'breakEven':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
-            self.breakEven = ival_
-        elif nodeName_ == 'lifetimeSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'lifetimeSavings')
-            self.lifetimeSavings = ival_
-        elif nodeName_ == 'savingsTableSchedule':
-            obj_ = SavingsTableSchedule.factory()
-            obj_.build(child_)
-            self.savingsTableSchedule.append(obj_)
-            obj_.original_tagname_ = 'savingsTableSchedule'
-# end class Refinance
-
-
-class SavingsTableSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if payment is None:
-            self.payment = []
-        else:
-            self.payment = payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, SavingsTableSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if SavingsTableSchedule.subclass:
-            return SavingsTableSchedule.subclass(*args_, **kwargs_)
-        else:
-            return SavingsTableSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def add_payment(self, value): self.payment.append(value)
-    def insert_payment_at(self, index, value): self.payment.insert(index, value)
-    def replace_payment_at(self, index, value): self.payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='SavingsTableSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='SavingsTableSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='SavingsTableSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='SavingsTableSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='SavingsTableSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for payment_ in self.payment:
-            payment_.export(outfile, level, namespace_, name_='payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'payment':
-            obj_ = paymentType2.factory()
-            obj_.build(child_)
-            self.payment.append(obj_)
-            obj_.original_tagname_ = 'payment'
-# end class SavingsTableSchedule
-
-
-class LenderAccountStatus(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, balance=None):
-        self.original_tagname_ = None
-        self.balance = balance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, LenderAccountStatus)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if LenderAccountStatus.subclass:
-            return LenderAccountStatus.subclass(*args_, **kwargs_)
-        else:
-            return LenderAccountStatus(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_balance(self): return self.balance
-    def set_balance(self, balance): self.balance = balance
-    def hasContent_(self):
-        if (
-            self.balance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='LenderAccountStatus', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='LenderAccountStatus')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='LenderAccountStatus', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='LenderAccountStatus'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='LenderAccountStatus', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.balance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbalance>%s</%sbalance>%s' % (namespace_, self.gds_format_float(self.balance, input_name='balance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'balance':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'balance')
-            self.balance = fval_
-# end class LenderAccountStatus
-
-
-class DiscountPoints(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterest2=None, costOfPoints=None, costOfPoints2=None, monthlySavings=None, result=None, breakEven=None, totalSavings=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
-        self.costOfPoints = costOfPoints
-        self.costOfPoints2 = costOfPoints2
-        self.monthlySavings = monthlySavings
-        self.result = result
-        self.breakEven = breakEven
-        self.totalSavings = totalSavings
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, DiscountPoints)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if DiscountPoints.subclass:
-            return DiscountPoints.subclass(*args_, **kwargs_)
-        else:
-            return DiscountPoints(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterest2(self): return self.monthlyPrincipalAndInterest2
-    def set_monthlyPrincipalAndInterest2(self, monthlyPrincipalAndInterest2): self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
-    def get_costOfPoints(self): return self.costOfPoints
-    def set_costOfPoints(self, costOfPoints): self.costOfPoints = costOfPoints
-    def get_costOfPoints2(self): return self.costOfPoints2
-    def set_costOfPoints2(self, costOfPoints2): self.costOfPoints2 = costOfPoints2
-    def get_monthlySavings(self): return self.monthlySavings
-    def set_monthlySavings(self, monthlySavings): self.monthlySavings = monthlySavings
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_breakEven(self): return self.breakEven
-    def set_breakEven(self, breakEven): self.breakEven = breakEven
-    def get_totalSavings(self): return self.totalSavings
-    def set_totalSavings(self, totalSavings): self.totalSavings = totalSavings
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterest2 is not None or
-            self.costOfPoints is not None or
-            self.costOfPoints2 is not None or
-            self.monthlySavings is not None or
-            self.result is not None or
-            self.breakEven is not None or
-            self.totalSavings is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='DiscountPoints', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='DiscountPoints')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='DiscountPoints', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='DiscountPoints'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='DiscountPoints', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterest2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest2>%s</%smonthlyPrincipalAndInterest2>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest2, input_name='monthlyPrincipalAndInterest2'), namespace_, eol_))
-        if self.costOfPoints is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%scostOfPoints>%s</%scostOfPoints>%s' % (namespace_, self.gds_format_integer(self.costOfPoints, input_name='costOfPoints'), namespace_, eol_))
-        if self.costOfPoints2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%scostOfPoints2>%s</%scostOfPoints2>%s' % (namespace_, self.gds_format_integer(self.costOfPoints2, input_name='costOfPoints2'), namespace_, eol_))
-        if self.monthlySavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlySavings>%s</%smonthlySavings>%s' % (namespace_, self.gds_format_integer(self.monthlySavings, input_name='monthlySavings'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        if self.breakEven is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
-        if self.totalSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalSavings>%s</%stotalSavings>%s' % (namespace_, self.gds_format_integer(self.totalSavings, input_name='totalSavings'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterest2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest2')
-            self.monthlyPrincipalAndInterest2 = ival_
-        elif nodeName_ == 'costOfPoints':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'costOfPoints')
-            self.costOfPoints = ival_
-        elif nodeName_ == 'costOfPoints2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'costOfPoints2')
-            self.costOfPoints2 = ival_
-        elif nodeName_ == 'monthlySavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlySavings')
-            self.monthlySavings = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'breakEven':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
-            self.breakEven = ival_
-        elif nodeName_ == 'totalSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalSavings')
-            self.totalSavings = ival_
-# end class DiscountPoints
-
-
-class FixedVsAdjustableRate(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestAdjustable=None, fixedDiscountedPayments=None, adjustableDiscountedPayments=None, fixedRemainingPrincipal=None, adjustableRemainingPrincipal=None, fixedTaxSavings=None, adjustableTaxSavings=None, fixedTotalCost=None, adjustableTotalCost=None, result=None, amortizationSchedule=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterestAdjustable = monthlyPrincipalAndInterestAdjustable
-        self.fixedDiscountedPayments = fixedDiscountedPayments
-        self.adjustableDiscountedPayments = adjustableDiscountedPayments
-        self.fixedRemainingPrincipal = fixedRemainingPrincipal
-        self.adjustableRemainingPrincipal = adjustableRemainingPrincipal
-        self.fixedTaxSavings = fixedTaxSavings
-        self.adjustableTaxSavings = adjustableTaxSavings
-        self.fixedTotalCost = fixedTotalCost
-        self.adjustableTotalCost = adjustableTotalCost
-        self.result = result
-        if amortizationSchedule is None:
-            self.amortizationSchedule = []
-        else:
-            self.amortizationSchedule = amortizationSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, FixedVsAdjustableRate)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if FixedVsAdjustableRate.subclass:
-            return FixedVsAdjustableRate.subclass(*args_, **kwargs_)
-        else:
-            return FixedVsAdjustableRate(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterestAdjustable(self): return self.monthlyPrincipalAndInterestAdjustable
-    def set_monthlyPrincipalAndInterestAdjustable(self, monthlyPrincipalAndInterestAdjustable): self.monthlyPrincipalAndInterestAdjustable = monthlyPrincipalAndInterestAdjustable
-    def get_fixedDiscountedPayments(self): return self.fixedDiscountedPayments
-    def set_fixedDiscountedPayments(self, fixedDiscountedPayments): self.fixedDiscountedPayments = fixedDiscountedPayments
-    def get_adjustableDiscountedPayments(self): return self.adjustableDiscountedPayments
-    def set_adjustableDiscountedPayments(self, adjustableDiscountedPayments): self.adjustableDiscountedPayments = adjustableDiscountedPayments
-    def get_fixedRemainingPrincipal(self): return self.fixedRemainingPrincipal
-    def set_fixedRemainingPrincipal(self, fixedRemainingPrincipal): self.fixedRemainingPrincipal = fixedRemainingPrincipal
-    def get_adjustableRemainingPrincipal(self): return self.adjustableRemainingPrincipal
-    def set_adjustableRemainingPrincipal(self, adjustableRemainingPrincipal): self.adjustableRemainingPrincipal = adjustableRemainingPrincipal
-    def get_fixedTaxSavings(self): return self.fixedTaxSavings
-    def set_fixedTaxSavings(self, fixedTaxSavings): self.fixedTaxSavings = fixedTaxSavings
-    def get_adjustableTaxSavings(self): return self.adjustableTaxSavings
-    def set_adjustableTaxSavings(self, adjustableTaxSavings): self.adjustableTaxSavings = adjustableTaxSavings
-    def get_fixedTotalCost(self): return self.fixedTotalCost
-    def set_fixedTotalCost(self, fixedTotalCost): self.fixedTotalCost = fixedTotalCost
-    def get_adjustableTotalCost(self): return self.adjustableTotalCost
-    def set_adjustableTotalCost(self, adjustableTotalCost): self.adjustableTotalCost = adjustableTotalCost
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_amortizationSchedule(self): return self.amortizationSchedule
-    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
-    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
-    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
-    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterestAdjustable is not None or
-            self.fixedDiscountedPayments is not None or
-            self.adjustableDiscountedPayments is not None or
-            self.fixedRemainingPrincipal is not None or
-            self.adjustableRemainingPrincipal is not None or
-            self.fixedTaxSavings is not None or
-            self.adjustableTaxSavings is not None or
-            self.fixedTotalCost is not None or
-            self.adjustableTotalCost is not None or
-            self.result is not None or
-            self.amortizationSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='FixedVsAdjustableRate', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='FixedVsAdjustableRate')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='FixedVsAdjustableRate', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='FixedVsAdjustableRate'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='FixedVsAdjustableRate', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterestAdjustable is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterestAdjustable>%s</%smonthlyPrincipalAndInterestAdjustable>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjustable, input_name='monthlyPrincipalAndInterestAdjustable'), namespace_, eol_))
-        if self.fixedDiscountedPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedDiscountedPayments>%s</%sfixedDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.fixedDiscountedPayments, input_name='fixedDiscountedPayments'), namespace_, eol_))
-        if self.adjustableDiscountedPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableDiscountedPayments>%s</%sadjustableDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.adjustableDiscountedPayments, input_name='adjustableDiscountedPayments'), namespace_, eol_))
-        if self.fixedRemainingPrincipal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedRemainingPrincipal>%s</%sfixedRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.fixedRemainingPrincipal, input_name='fixedRemainingPrincipal'), namespace_, eol_))
-        if self.adjustableRemainingPrincipal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableRemainingPrincipal>%s</%sadjustableRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.adjustableRemainingPrincipal, input_name='adjustableRemainingPrincipal'), namespace_, eol_))
-        if self.fixedTaxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedTaxSavings>%s</%sfixedTaxSavings>%s' % (namespace_, self.gds_format_integer(self.fixedTaxSavings, input_name='fixedTaxSavings'), namespace_, eol_))
-        if self.adjustableTaxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableTaxSavings>%s</%sadjustableTaxSavings>%s' % (namespace_, self.gds_format_integer(self.adjustableTaxSavings, input_name='adjustableTaxSavings'), namespace_, eol_))
-        if self.fixedTotalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedTotalCost>%s</%sfixedTotalCost>%s' % (namespace_, self.gds_format_integer(self.fixedTotalCost, input_name='fixedTotalCost'), namespace_, eol_))
-        if self.adjustableTotalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableTotalCost>%s</%sadjustableTotalCost>%s' % (namespace_, self.gds_format_integer(self.adjustableTotalCost, input_name='adjustableTotalCost'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        for amortizationSchedule_ in self.amortizationSchedule:
-            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterestAdjustable':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjustable')
-            self.monthlyPrincipalAndInterestAdjustable = ival_
-        elif nodeName_ == 'fixedDiscountedPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedDiscountedPayments')
-            self.fixedDiscountedPayments = ival_
-        elif nodeName_ == 'adjustableDiscountedPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableDiscountedPayments')
-            self.adjustableDiscountedPayments = ival_
-        elif nodeName_ == 'fixedRemainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedRemainingPrincipal')
-            self.fixedRemainingPrincipal = ival_
-        elif nodeName_ == 'adjustableRemainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableRemainingPrincipal')
-            self.adjustableRemainingPrincipal = ival_
-        elif nodeName_ == 'fixedTaxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedTaxSavings')
-            self.fixedTaxSavings = ival_
-        elif nodeName_ == 'adjustableTaxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableTaxSavings')
-            self.adjustableTaxSavings = ival_
-        elif nodeName_ == 'fixedTotalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedTotalCost')
-            self.fixedTotalCost = ival_
-        elif nodeName_ == 'adjustableTotalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableTotalCost')
-            self.adjustableTotalCost = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'amortizationSchedule':
-            obj_ = FixedVsAdjustableRateAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.amortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'amortizationSchedule'
-# end class FixedVsAdjustableRate
-
-
-class FixedVsAdjustableRateAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, FixedVsAdjustableRateAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if FixedVsAdjustableRateAmortizationSchedule.subclass:
-            return FixedVsAdjustableRateAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return FixedVsAdjustableRateAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='FixedVsAdjustableRateAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='FixedVsAdjustableRateAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class FixedVsAdjustableRateAmortizationSchedule
-
-
-class AdjustableMortgage(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestAdjusted=None, maximumPayment=None, totalPayments=None, totalInterestPayments=None, amortizationSchedule=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
-        self.maximumPayment = maximumPayment
-        self.totalPayments = totalPayments
-        self.totalInterestPayments = totalInterestPayments
-        if amortizationSchedule is None:
-            self.amortizationSchedule = []
-        else:
-            self.amortizationSchedule = amortizationSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, AdjustableMortgage)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if AdjustableMortgage.subclass:
-            return AdjustableMortgage.subclass(*args_, **kwargs_)
-        else:
-            return AdjustableMortgage(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterestAdjusted(self): return self.monthlyPrincipalAndInterestAdjusted
-    def set_monthlyPrincipalAndInterestAdjusted(self, monthlyPrincipalAndInterestAdjusted): self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
-    def get_maximumPayment(self): return self.maximumPayment
-    def set_maximumPayment(self, maximumPayment): self.maximumPayment = maximumPayment
-    def get_totalPayments(self): return self.totalPayments
-    def set_totalPayments(self, totalPayments): self.totalPayments = totalPayments
-    def get_totalInterestPayments(self): return self.totalInterestPayments
-    def set_totalInterestPayments(self, totalInterestPayments): self.totalInterestPayments = totalInterestPayments
-    def get_amortizationSchedule(self): return self.amortizationSchedule
-    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
-    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
-    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
-    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterestAdjusted is not None or
-            self.maximumPayment is not None or
-            self.totalPayments is not None or
-            self.totalInterestPayments is not None or
-            self.amortizationSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='AdjustableMortgage', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AdjustableMortgage')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='AdjustableMortgage', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AdjustableMortgage'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='AdjustableMortgage', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterestAdjusted is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterestAdjusted>%s</%smonthlyPrincipalAndInterestAdjusted>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjusted, input_name='monthlyPrincipalAndInterestAdjusted'), namespace_, eol_))
-        if self.maximumPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smaximumPayment>%s</%smaximumPayment>%s' % (namespace_, self.gds_format_integer(self.maximumPayment, input_name='maximumPayment'), namespace_, eol_))
-        if self.totalPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalPayments>%s</%stotalPayments>%s' % (namespace_, self.gds_format_integer(self.totalPayments, input_name='totalPayments'), namespace_, eol_))
-        if self.totalInterestPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalInterestPayments>%s</%stotalInterestPayments>%s' % (namespace_, self.gds_format_integer(self.totalInterestPayments, input_name='totalInterestPayments'), namespace_, eol_))
-        for amortizationSchedule_ in self.amortizationSchedule:
-            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterestAdjusted':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjusted')
-            self.monthlyPrincipalAndInterestAdjusted = ival_
-        elif nodeName_ == 'maximumPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'maximumPayment')
-            self.maximumPayment = ival_
-        elif nodeName_ == 'totalPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalPayments')
-            self.totalPayments = ival_
-        elif nodeName_ == 'totalInterestPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPayments')
-            self.totalInterestPayments = ival_
-        elif nodeName_ == 'amortizationSchedule':
-            obj_ = AdjustableMortgageAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.amortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'amortizationSchedule'
-# end class AdjustableMortgage
-
-
-class AdjustableMortgageAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, AdjustableMortgageAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if AdjustableMortgageAmortizationSchedule.subclass:
-            return AdjustableMortgageAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return AdjustableMortgageAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='AdjustableMortgageAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='AdjustableMortgageAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='AdjustableMortgageAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='AdjustableMortgageAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='AdjustableMortgageAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType3.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class AdjustableMortgageAmortizationSchedule
-
-
-class MortgageTerms(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterest2=None, monthlyPrincipalAndInterest3=None, discountedCost=None, discountedCost2=None, discountedCost3=None, remainingPrincipal=None, remainingPrincipal2=None, remainingPrincipal3=None, taxSavings=None, taxSavings2=None, taxSavings3=None, totalCost=None, totalCost2=None, totalCost3=None, result=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
-        self.monthlyPrincipalAndInterest3 = monthlyPrincipalAndInterest3
-        self.discountedCost = discountedCost
-        self.discountedCost2 = discountedCost2
-        self.discountedCost3 = discountedCost3
-        self.remainingPrincipal = remainingPrincipal
-        self.remainingPrincipal2 = remainingPrincipal2
-        self.remainingPrincipal3 = remainingPrincipal3
-        self.taxSavings = taxSavings
-        self.taxSavings2 = taxSavings2
-        self.taxSavings3 = taxSavings3
-        self.totalCost = totalCost
-        self.totalCost2 = totalCost2
-        self.totalCost3 = totalCost3
-        self.result = result
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, MortgageTerms)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if MortgageTerms.subclass:
-            return MortgageTerms.subclass(*args_, **kwargs_)
-        else:
-            return MortgageTerms(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterest2(self): return self.monthlyPrincipalAndInterest2
-    def set_monthlyPrincipalAndInterest2(self, monthlyPrincipalAndInterest2): self.monthlyPrincipalAndInterest2 = monthlyPrincipalAndInterest2
-    def get_monthlyPrincipalAndInterest3(self): return self.monthlyPrincipalAndInterest3
-    def set_monthlyPrincipalAndInterest3(self, monthlyPrincipalAndInterest3): self.monthlyPrincipalAndInterest3 = monthlyPrincipalAndInterest3
-    def get_discountedCost(self): return self.discountedCost
-    def set_discountedCost(self, discountedCost): self.discountedCost = discountedCost
-    def get_discountedCost2(self): return self.discountedCost2
-    def set_discountedCost2(self, discountedCost2): self.discountedCost2 = discountedCost2
-    def get_discountedCost3(self): return self.discountedCost3
-    def set_discountedCost3(self, discountedCost3): self.discountedCost3 = discountedCost3
-    def get_remainingPrincipal(self): return self.remainingPrincipal
-    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
-    def get_remainingPrincipal2(self): return self.remainingPrincipal2
-    def set_remainingPrincipal2(self, remainingPrincipal2): self.remainingPrincipal2 = remainingPrincipal2
-    def get_remainingPrincipal3(self): return self.remainingPrincipal3
-    def set_remainingPrincipal3(self, remainingPrincipal3): self.remainingPrincipal3 = remainingPrincipal3
-    def get_taxSavings(self): return self.taxSavings
-    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
-    def get_taxSavings2(self): return self.taxSavings2
-    def set_taxSavings2(self, taxSavings2): self.taxSavings2 = taxSavings2
-    def get_taxSavings3(self): return self.taxSavings3
-    def set_taxSavings3(self, taxSavings3): self.taxSavings3 = taxSavings3
-    def get_totalCost(self): return self.totalCost
-    def set_totalCost(self, totalCost): self.totalCost = totalCost
-    def get_totalCost2(self): return self.totalCost2
-    def set_totalCost2(self, totalCost2): self.totalCost2 = totalCost2
-    def get_totalCost3(self): return self.totalCost3
-    def set_totalCost3(self, totalCost3): self.totalCost3 = totalCost3
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterest2 is not None or
-            self.monthlyPrincipalAndInterest3 is not None or
-            self.discountedCost is not None or
-            self.discountedCost2 is not None or
-            self.discountedCost3 is not None or
-            self.remainingPrincipal is not None or
-            self.remainingPrincipal2 is not None or
-            self.remainingPrincipal3 is not None or
-            self.taxSavings is not None or
-            self.taxSavings2 is not None or
-            self.taxSavings3 is not None or
-            self.totalCost is not None or
-            self.totalCost2 is not None or
-            self.totalCost3 is not None or
-            self.result is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='MortgageTerms', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='MortgageTerms')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='MortgageTerms', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='MortgageTerms'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='MortgageTerms', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterest2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest2>%s</%smonthlyPrincipalAndInterest2>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest2, input_name='monthlyPrincipalAndInterest2'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterest3 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest3>%s</%smonthlyPrincipalAndInterest3>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest3, input_name='monthlyPrincipalAndInterest3'), namespace_, eol_))
-        if self.discountedCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdiscountedCost>%s</%sdiscountedCost>%s' % (namespace_, self.gds_format_integer(self.discountedCost, input_name='discountedCost'), namespace_, eol_))
-        if self.discountedCost2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdiscountedCost2>%s</%sdiscountedCost2>%s' % (namespace_, self.gds_format_integer(self.discountedCost2, input_name='discountedCost2'), namespace_, eol_))
-        if self.discountedCost3 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdiscountedCost3>%s</%sdiscountedCost3>%s' % (namespace_, self.gds_format_integer(self.discountedCost3, input_name='discountedCost3'), namespace_, eol_))
-        if self.remainingPrincipal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
-        if self.remainingPrincipal2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sremainingPrincipal2>%s</%sremainingPrincipal2>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal2, input_name='remainingPrincipal2'), namespace_, eol_))
-        if self.remainingPrincipal3 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sremainingPrincipal3>%s</%sremainingPrincipal3>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal3, input_name='remainingPrincipal3'), namespace_, eol_))
-        if self.taxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
-        if self.taxSavings2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings2>%s</%staxSavings2>%s' % (namespace_, self.gds_format_integer(self.taxSavings2, input_name='taxSavings2'), namespace_, eol_))
-        if self.taxSavings3 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings3>%s</%staxSavings3>%s' % (namespace_, self.gds_format_integer(self.taxSavings3, input_name='taxSavings3'), namespace_, eol_))
-        if self.totalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
-        if self.totalCost2 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost2>%s</%stotalCost2>%s' % (namespace_, self.gds_format_integer(self.totalCost2, input_name='totalCost2'), namespace_, eol_))
-        if self.totalCost3 is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost3>%s</%stotalCost3>%s' % (namespace_, self.gds_format_integer(self.totalCost3, input_name='totalCost3'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterest2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest2')
-            self.monthlyPrincipalAndInterest2 = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterest3':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest3')
-            self.monthlyPrincipalAndInterest3 = ival_
-        elif nodeName_ == 'discountedCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'discountedCost')
-            self.discountedCost = ival_
-        elif nodeName_ == 'discountedCost2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'discountedCost2')
-            self.discountedCost2 = ival_
-        elif nodeName_ == 'discountedCost3':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'discountedCost3')
-            self.discountedCost3 = ival_
-        elif nodeName_ == 'remainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
-            self.remainingPrincipal = ival_
-        elif nodeName_ == 'remainingPrincipal2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal2')
-            self.remainingPrincipal2 = ival_
-        elif nodeName_ == 'remainingPrincipal3':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal3')
-            self.remainingPrincipal3 = ival_
-        elif nodeName_ == 'taxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
-            self.taxSavings = ival_
-        elif nodeName_ == 'taxSavings2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings2')
-            self.taxSavings2 = ival_
-        elif nodeName_ == 'taxSavings3':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings3')
-            self.taxSavings3 = ival_
-        elif nodeName_ == 'totalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
-            self.totalCost = ival_
-        elif nodeName_ == 'totalCost2':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost2')
-            self.totalCost2 = ival_
-        elif nodeName_ == 'totalCost3':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost3')
-            self.totalCost3 = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-# end class MortgageTerms
-
-
-class BiWeeklyPayment(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, interestSavings=None, payOffInYears=None, result=None, amortizationSchedule=None, biWeeklyAmortizationSchedule=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.interestSavings = interestSavings
-        self.payOffInYears = payOffInYears
-        self.result = result
-        if amortizationSchedule is None:
-            self.amortizationSchedule = []
-        else:
-            self.amortizationSchedule = amortizationSchedule
-        if biWeeklyAmortizationSchedule is None:
-            self.biWeeklyAmortizationSchedule = []
-        else:
-            self.biWeeklyAmortizationSchedule = biWeeklyAmortizationSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, BiWeeklyPayment)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if BiWeeklyPayment.subclass:
-            return BiWeeklyPayment.subclass(*args_, **kwargs_)
-        else:
-            return BiWeeklyPayment(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_interestSavings(self): return self.interestSavings
-    def set_interestSavings(self, interestSavings): self.interestSavings = interestSavings
-    def get_payOffInYears(self): return self.payOffInYears
-    def set_payOffInYears(self, payOffInYears): self.payOffInYears = payOffInYears
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_amortizationSchedule(self): return self.amortizationSchedule
-    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
-    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
-    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
-    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
-    def get_biWeeklyAmortizationSchedule(self): return self.biWeeklyAmortizationSchedule
-    def set_biWeeklyAmortizationSchedule(self, biWeeklyAmortizationSchedule): self.biWeeklyAmortizationSchedule = biWeeklyAmortizationSchedule
-    def add_biWeeklyAmortizationSchedule(self, value): self.biWeeklyAmortizationSchedule.append(value)
-    def insert_biWeeklyAmortizationSchedule_at(self, index, value): self.biWeeklyAmortizationSchedule.insert(index, value)
-    def replace_biWeeklyAmortizationSchedule_at(self, index, value): self.biWeeklyAmortizationSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.interestSavings is not None or
-            self.payOffInYears is not None or
-            self.result is not None or
-            self.amortizationSchedule or
-            self.biWeeklyAmortizationSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='BiWeeklyPayment', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPayment')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPayment', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPayment'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPayment', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.interestSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterestSavings>%s</%sinterestSavings>%s' % (namespace_, self.gds_format_integer(self.interestSavings, input_name='interestSavings'), namespace_, eol_))
-        if self.payOffInYears is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayOffInYears>%s</%spayOffInYears>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.payOffInYears), input_name='payOffInYears')), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        for amortizationSchedule_ in self.amortizationSchedule:
-            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
-        for biWeeklyAmortizationSchedule_ in self.biWeeklyAmortizationSchedule:
-            biWeeklyAmortizationSchedule_.export(outfile, level, namespace_, name_='biWeeklyAmortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'interestSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interestSavings')
-            self.interestSavings = ival_
-        elif nodeName_ == 'payOffInYears':
-            payOffInYears_ = child_.text
-            payOffInYears_ = self.gds_validate_string(payOffInYears_, node, 'payOffInYears')
-            self.payOffInYears = payOffInYears_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'amortizationSchedule':
-            obj_ = BiWeeklyPaymentAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.amortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'amortizationSchedule'
-        elif nodeName_ == 'biWeeklyAmortizationSchedule':
-            obj_ = BiWeeklyPaymentAmortizationSchedule2.factory()
-            obj_.build(child_)
-            self.biWeeklyAmortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'biWeeklyAmortizationSchedule'
-# end class BiWeeklyPayment
-
-
-class BiWeeklyPaymentAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, BiWeeklyPaymentAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if BiWeeklyPaymentAmortizationSchedule.subclass:
-            return BiWeeklyPaymentAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return BiWeeklyPaymentAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPaymentAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType4.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class BiWeeklyPaymentAmortizationSchedule
-
-
-class BiWeeklyPaymentAmortizationSchedule2(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, BiWeeklyPaymentAmortizationSchedule2)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if BiWeeklyPaymentAmortizationSchedule2.subclass:
-            return BiWeeklyPaymentAmortizationSchedule2.subclass(*args_, **kwargs_)
-        else:
-            return BiWeeklyPaymentAmortizationSchedule2(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='BiWeeklyPaymentAmortizationSchedule2')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='BiWeeklyPaymentAmortizationSchedule2', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType5.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class BiWeeklyPaymentAmortizationSchedule2
-
-
-class TaxSavings(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, taxSavings=None, result=None, amortizationSchedule=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.taxSavings = taxSavings
-        self.result = result
-        if amortizationSchedule is None:
-            self.amortizationSchedule = []
-        else:
-            self.amortizationSchedule = amortizationSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, TaxSavings)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if TaxSavings.subclass:
-            return TaxSavings.subclass(*args_, **kwargs_)
-        else:
-            return TaxSavings(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_taxSavings(self): return self.taxSavings
-    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_amortizationSchedule(self): return self.amortizationSchedule
-    def set_amortizationSchedule(self, amortizationSchedule): self.amortizationSchedule = amortizationSchedule
-    def add_amortizationSchedule(self, value): self.amortizationSchedule.append(value)
-    def insert_amortizationSchedule_at(self, index, value): self.amortizationSchedule.insert(index, value)
-    def replace_amortizationSchedule_at(self, index, value): self.amortizationSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.taxSavings is not None or
-            self.result is not None or
-            self.amortizationSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='TaxSavings', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='TaxSavings')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='TaxSavings', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TaxSavings'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='TaxSavings', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.taxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        for amortizationSchedule_ in self.amortizationSchedule:
-            amortizationSchedule_.export(outfile, level, namespace_, name_='amortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'taxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
-            self.taxSavings = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'amortizationSchedule':
-            obj_ = TaxSavingsAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.amortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'amortizationSchedule'
-# end class TaxSavings
-
-
-class TaxSavingsAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, TaxSavingsAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if TaxSavingsAmortizationSchedule.subclass:
-            return TaxSavingsAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return TaxSavingsAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='TaxSavingsAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='TaxSavingsAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='TaxSavingsAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='TaxSavingsAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='TaxSavingsAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType6.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class TaxSavingsAmortizationSchedule
-
-
-class InterstOnlyVsTraditional(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestInterestOnly=None, monthlyPrincipalAndInterestAdjusted=None, totalInterestPayments=None, totalInterestPaymentsInterestOnly=None, result=None, AmortizationSchedule=None, InterestOnlyAmortizationSchedule=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterestInterestOnly = monthlyPrincipalAndInterestInterestOnly
-        self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
-        self.totalInterestPayments = totalInterestPayments
-        self.totalInterestPaymentsInterestOnly = totalInterestPaymentsInterestOnly
-        self.result = result
-        if AmortizationSchedule is None:
-            self.AmortizationSchedule = []
-        else:
-            self.AmortizationSchedule = AmortizationSchedule
-        if InterestOnlyAmortizationSchedule is None:
-            self.InterestOnlyAmortizationSchedule = []
-        else:
-            self.InterestOnlyAmortizationSchedule = InterestOnlyAmortizationSchedule
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, InterstOnlyVsTraditional)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if InterstOnlyVsTraditional.subclass:
-            return InterstOnlyVsTraditional.subclass(*args_, **kwargs_)
-        else:
-            return InterstOnlyVsTraditional(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterestInterestOnly(self): return self.monthlyPrincipalAndInterestInterestOnly
-    def set_monthlyPrincipalAndInterestInterestOnly(self, monthlyPrincipalAndInterestInterestOnly): self.monthlyPrincipalAndInterestInterestOnly = monthlyPrincipalAndInterestInterestOnly
-    def get_monthlyPrincipalAndInterestAdjusted(self): return self.monthlyPrincipalAndInterestAdjusted
-    def set_monthlyPrincipalAndInterestAdjusted(self, monthlyPrincipalAndInterestAdjusted): self.monthlyPrincipalAndInterestAdjusted = monthlyPrincipalAndInterestAdjusted
-    def get_totalInterestPayments(self): return self.totalInterestPayments
-    def set_totalInterestPayments(self, totalInterestPayments): self.totalInterestPayments = totalInterestPayments
-    def get_totalInterestPaymentsInterestOnly(self): return self.totalInterestPaymentsInterestOnly
-    def set_totalInterestPaymentsInterestOnly(self, totalInterestPaymentsInterestOnly): self.totalInterestPaymentsInterestOnly = totalInterestPaymentsInterestOnly
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_AmortizationSchedule(self): return self.AmortizationSchedule
-    def set_AmortizationSchedule(self, AmortizationSchedule): self.AmortizationSchedule = AmortizationSchedule
-    def add_AmortizationSchedule(self, value): self.AmortizationSchedule.append(value)
-    def insert_AmortizationSchedule_at(self, index, value): self.AmortizationSchedule.insert(index, value)
-    def replace_AmortizationSchedule_at(self, index, value): self.AmortizationSchedule[index] = value
-    def get_InterestOnlyAmortizationSchedule(self): return self.InterestOnlyAmortizationSchedule
-    def set_InterestOnlyAmortizationSchedule(self, InterestOnlyAmortizationSchedule): self.InterestOnlyAmortizationSchedule = InterestOnlyAmortizationSchedule
-    def add_InterestOnlyAmortizationSchedule(self, value): self.InterestOnlyAmortizationSchedule.append(value)
-    def insert_InterestOnlyAmortizationSchedule_at(self, index, value): self.InterestOnlyAmortizationSchedule.insert(index, value)
-    def replace_InterestOnlyAmortizationSchedule_at(self, index, value): self.InterestOnlyAmortizationSchedule[index] = value
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterestInterestOnly is not None or
-            self.monthlyPrincipalAndInterestAdjusted is not None or
-            self.totalInterestPayments is not None or
-            self.totalInterestPaymentsInterestOnly is not None or
-            self.result is not None or
-            self.AmortizationSchedule or
-            self.InterestOnlyAmortizationSchedule
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='InterstOnlyVsTraditional', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='InterstOnlyVsTraditional')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='InterstOnlyVsTraditional', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='InterstOnlyVsTraditional'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='InterstOnlyVsTraditional', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterestInterestOnly is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterestInterestOnly>%s</%smonthlyPrincipalAndInterestInterestOnly>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestInterestOnly, input_name='monthlyPrincipalAndInterestInterestOnly'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterestAdjusted is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterestAdjusted>%s</%smonthlyPrincipalAndInterestAdjusted>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestAdjusted, input_name='monthlyPrincipalAndInterestAdjusted'), namespace_, eol_))
-        if self.totalInterestPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalInterestPayments>%s</%stotalInterestPayments>%s' % (namespace_, self.gds_format_integer(self.totalInterestPayments, input_name='totalInterestPayments'), namespace_, eol_))
-        if self.totalInterestPaymentsInterestOnly is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalInterestPaymentsInterestOnly>%s</%stotalInterestPaymentsInterestOnly>%s' % (namespace_, self.gds_format_integer(self.totalInterestPaymentsInterestOnly, input_name='totalInterestPaymentsInterestOnly'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        for AmortizationSchedule_ in self.AmortizationSchedule:
-            AmortizationSchedule_.export(outfile, level, namespace_, name_='AmortizationSchedule', pretty_print=pretty_print)
-        for InterestOnlyAmortizationSchedule_ in self.InterestOnlyAmortizationSchedule:
-            InterestOnlyAmortizationSchedule_.export(outfile, level, namespace_, name_='InterestOnlyAmortizationSchedule', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterestInterestOnly':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestInterestOnly')
-            self.monthlyPrincipalAndInterestInterestOnly = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterestAdjusted':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestAdjusted')
-            self.monthlyPrincipalAndInterestAdjusted = ival_
-        elif nodeName_ == 'totalInterestPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPayments')
-            self.totalInterestPayments = ival_
-        elif nodeName_ == 'totalInterestPaymentsInterestOnly':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalInterestPaymentsInterestOnly')
-            self.totalInterestPaymentsInterestOnly = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'AmortizationSchedule':
-            obj_ = annualAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.AmortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'AmortizationSchedule'
-        elif nodeName_ == 'InterestOnlyAmortizationSchedule':
-            obj_ = annualInterestOnlyAmortizationSchedule.factory()
-            obj_.build(child_)
-            self.InterestOnlyAmortizationSchedule.append(obj_)
-            obj_.original_tagname_ = 'InterestOnlyAmortizationSchedule'
-# end class InterstOnlyVsTraditional
-
-
-class annualAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, annualAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if annualAmortizationSchedule.subclass:
-            return annualAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return annualAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='annualAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='annualAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='annualAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='annualAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='annualAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType7.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class annualAmortizationSchedule
-
-
-class annualInterestOnlyAmortizationSchedule(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, frequency=None, Payment=None):
-        self.original_tagname_ = None
-        self.frequency = _cast(None, frequency)
-        if Payment is None:
-            self.Payment = []
-        else:
-            self.Payment = Payment
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, annualInterestOnlyAmortizationSchedule)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if annualInterestOnlyAmortizationSchedule.subclass:
-            return annualInterestOnlyAmortizationSchedule.subclass(*args_, **kwargs_)
-        else:
-            return annualInterestOnlyAmortizationSchedule(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_Payment(self): return self.Payment
-    def set_Payment(self, Payment): self.Payment = Payment
-    def add_Payment(self, value): self.Payment.append(value)
-    def insert_Payment_at(self, index, value): self.Payment.insert(index, value)
-    def replace_Payment_at(self, index, value): self.Payment[index] = value
-    def get_frequency(self): return self.frequency
-    def set_frequency(self, frequency): self.frequency = frequency
-    def hasContent_(self):
-        if (
-            self.Payment
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='annualInterestOnlyAmortizationSchedule', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='annualInterestOnlyAmortizationSchedule')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='annualInterestOnlyAmortizationSchedule', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='annualInterestOnlyAmortizationSchedule'):
-        if self.frequency is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            outfile.write(' frequency=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.frequency), input_name='frequency')), ))
-    def exportChildren(self, outfile, level, namespace_='', name_='annualInterestOnlyAmortizationSchedule', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for Payment_ in self.Payment:
-            Payment_.export(outfile, level, namespace_, name_='Payment', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('frequency', node)
-        if value is not None and 'frequency' not in already_processed:
-            already_processed.add('frequency')
-            self.frequency = value
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Payment':
-            obj_ = PaymentType8.factory()
-            obj_.build(child_)
-            self.Payment.append(obj_)
-            obj_.original_tagname_ = 'Payment'
-# end class annualInterestOnlyAmortizationSchedule
-
-
-class NoCostVsTraditional(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, monthlyPrincipalAndInterest=None, monthlyPrincipalAndInterestNoCost=None, discountedPayments=None, noCostDiscountedPayments=None, remainingPrincipal=None, noCostRemainingPrincipal=None, taxSavings=None, noCostTaxSavings=None, paidAtClose=None, totalCost=None, noCostTotalCost=None, result=None):
-        self.original_tagname_ = None
-        self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-        self.monthlyPrincipalAndInterestNoCost = monthlyPrincipalAndInterestNoCost
-        self.discountedPayments = discountedPayments
-        self.noCostDiscountedPayments = noCostDiscountedPayments
-        self.remainingPrincipal = remainingPrincipal
-        self.noCostRemainingPrincipal = noCostRemainingPrincipal
-        self.taxSavings = taxSavings
-        self.noCostTaxSavings = noCostTaxSavings
-        self.paidAtClose = paidAtClose
-        self.totalCost = totalCost
-        self.noCostTotalCost = noCostTotalCost
-        self.result = result
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, NoCostVsTraditional)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if NoCostVsTraditional.subclass:
-            return NoCostVsTraditional.subclass(*args_, **kwargs_)
-        else:
-            return NoCostVsTraditional(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_monthlyPrincipalAndInterest(self): return self.monthlyPrincipalAndInterest
-    def set_monthlyPrincipalAndInterest(self, monthlyPrincipalAndInterest): self.monthlyPrincipalAndInterest = monthlyPrincipalAndInterest
-    def get_monthlyPrincipalAndInterestNoCost(self): return self.monthlyPrincipalAndInterestNoCost
-    def set_monthlyPrincipalAndInterestNoCost(self, monthlyPrincipalAndInterestNoCost): self.monthlyPrincipalAndInterestNoCost = monthlyPrincipalAndInterestNoCost
-    def get_discountedPayments(self): return self.discountedPayments
-    def set_discountedPayments(self, discountedPayments): self.discountedPayments = discountedPayments
-    def get_noCostDiscountedPayments(self): return self.noCostDiscountedPayments
-    def set_noCostDiscountedPayments(self, noCostDiscountedPayments): self.noCostDiscountedPayments = noCostDiscountedPayments
-    def get_remainingPrincipal(self): return self.remainingPrincipal
-    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
-    def get_noCostRemainingPrincipal(self): return self.noCostRemainingPrincipal
-    def set_noCostRemainingPrincipal(self, noCostRemainingPrincipal): self.noCostRemainingPrincipal = noCostRemainingPrincipal
-    def get_taxSavings(self): return self.taxSavings
-    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
-    def get_noCostTaxSavings(self): return self.noCostTaxSavings
-    def set_noCostTaxSavings(self, noCostTaxSavings): self.noCostTaxSavings = noCostTaxSavings
-    def get_paidAtClose(self): return self.paidAtClose
-    def set_paidAtClose(self, paidAtClose): self.paidAtClose = paidAtClose
-    def get_totalCost(self): return self.totalCost
-    def set_totalCost(self, totalCost): self.totalCost = totalCost
-    def get_noCostTotalCost(self): return self.noCostTotalCost
-    def set_noCostTotalCost(self, noCostTotalCost): self.noCostTotalCost = noCostTotalCost
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def hasContent_(self):
-        if (
-            self.monthlyPrincipalAndInterest is not None or
-            self.monthlyPrincipalAndInterestNoCost is not None or
-            self.discountedPayments is not None or
-            self.noCostDiscountedPayments is not None or
-            self.remainingPrincipal is not None or
-            self.noCostRemainingPrincipal is not None or
-            self.taxSavings is not None or
-            self.noCostTaxSavings is not None or
-            self.paidAtClose is not None or
-            self.totalCost is not None or
-            self.noCostTotalCost is not None or
-            self.result is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='NoCostVsTraditional', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='NoCostVsTraditional')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='NoCostVsTraditional', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='NoCostVsTraditional'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='NoCostVsTraditional', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.monthlyPrincipalAndInterest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterest>%s</%smonthlyPrincipalAndInterest>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterest, input_name='monthlyPrincipalAndInterest'), namespace_, eol_))
-        if self.monthlyPrincipalAndInterestNoCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlyPrincipalAndInterestNoCost>%s</%smonthlyPrincipalAndInterestNoCost>%s' % (namespace_, self.gds_format_integer(self.monthlyPrincipalAndInterestNoCost, input_name='monthlyPrincipalAndInterestNoCost'), namespace_, eol_))
-        if self.discountedPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdiscountedPayments>%s</%sdiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.discountedPayments, input_name='discountedPayments'), namespace_, eol_))
-        if self.noCostDiscountedPayments is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%snoCostDiscountedPayments>%s</%snoCostDiscountedPayments>%s' % (namespace_, self.gds_format_integer(self.noCostDiscountedPayments, input_name='noCostDiscountedPayments'), namespace_, eol_))
-        if self.remainingPrincipal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
-        if self.noCostRemainingPrincipal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%snoCostRemainingPrincipal>%s</%snoCostRemainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.noCostRemainingPrincipal, input_name='noCostRemainingPrincipal'), namespace_, eol_))
-        if self.taxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
-        if self.noCostTaxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%snoCostTaxSavings>%s</%snoCostTaxSavings>%s' % (namespace_, self.gds_format_integer(self.noCostTaxSavings, input_name='noCostTaxSavings'), namespace_, eol_))
-        if self.paidAtClose is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spaidAtClose>%s</%spaidAtClose>%s' % (namespace_, self.gds_format_integer(self.paidAtClose, input_name='paidAtClose'), namespace_, eol_))
-        if self.totalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
-        if self.noCostTotalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%snoCostTotalCost>%s</%snoCostTotalCost>%s' % (namespace_, self.gds_format_integer(self.noCostTotalCost, input_name='noCostTotalCost'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'monthlyPrincipalAndInterest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterest')
-            self.monthlyPrincipalAndInterest = ival_
-        elif nodeName_ == 'monthlyPrincipalAndInterestNoCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlyPrincipalAndInterestNoCost')
-            self.monthlyPrincipalAndInterestNoCost = ival_
-        elif nodeName_ == 'discountedPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'discountedPayments')
-            self.discountedPayments = ival_
-        elif nodeName_ == 'noCostDiscountedPayments':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'noCostDiscountedPayments')
-            self.noCostDiscountedPayments = ival_
-        elif nodeName_ == 'remainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
-            self.remainingPrincipal = ival_
-        elif nodeName_ == 'noCostRemainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'noCostRemainingPrincipal')
-            self.noCostRemainingPrincipal = ival_
-        elif nodeName_ == 'taxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
-            self.taxSavings = ival_
-        elif nodeName_ == 'noCostTaxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'noCostTaxSavings')
-            self.noCostTaxSavings = ival_
-        elif nodeName_ == 'paidAtClose':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'paidAtClose')
-            self.paidAtClose = ival_
-        elif nodeName_ == 'totalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
-            self.totalCost = ival_
-        elif nodeName_ == 'noCostTotalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'noCostTotalCost')
-            self.noCostTotalCost = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-# end class NoCostVsTraditional
-
-
-class Heloc(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, loanAmount=None, result=None, loanAmountPairs=None):
-        self.original_tagname_ = None
-        self.loanAmount = loanAmount
-        self.result = result
-        if loanAmountPairs is None:
-            self.loanAmountPairs = []
-        else:
-            self.loanAmountPairs = loanAmountPairs
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, Heloc)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if Heloc.subclass:
-            return Heloc.subclass(*args_, **kwargs_)
-        else:
-            return Heloc(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_loanAmount(self): return self.loanAmount
-    def set_loanAmount(self, loanAmount): self.loanAmount = loanAmount
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_loanAmountPairs(self): return self.loanAmountPairs
-    def set_loanAmountPairs(self, loanAmountPairs): self.loanAmountPairs = loanAmountPairs
-    def add_loanAmountPairs(self, value): self.loanAmountPairs.append(value)
-    def insert_loanAmountPairs_at(self, index, value): self.loanAmountPairs.insert(index, value)
-    def replace_loanAmountPairs_at(self, index, value): self.loanAmountPairs[index] = value
-    def hasContent_(self):
-        if (
-            self.loanAmount is not None or
-            self.result is not None or
-            self.loanAmountPairs
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='Heloc', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Heloc')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='Heloc', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Heloc'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='Heloc', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.loanAmount is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sloanAmount>%s</%sloanAmount>%s' % (namespace_, self.gds_format_integer(self.loanAmount, input_name='loanAmount'), namespace_, eol_))
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        for loanAmountPairs_ in self.loanAmountPairs:
-            loanAmountPairs_.export(outfile, level, namespace_, name_='loanAmountPairs', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'loanAmount':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'loanAmount')
-            self.loanAmount = ival_
-        elif nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'loanAmountPairs':
-            obj_ = loanAmountPairs.factory()
-            obj_.build(child_)
-            self.loanAmountPairs.append(obj_)
-            obj_.original_tagname_ = 'loanAmountPairs'
-# end class Heloc
-
-
-class loanAmountPairs(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, pairs=None):
-        self.original_tagname_ = None
-        if pairs is None:
-            self.pairs = []
-        else:
-            self.pairs = pairs
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, loanAmountPairs)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if loanAmountPairs.subclass:
-            return loanAmountPairs.subclass(*args_, **kwargs_)
-        else:
-            return loanAmountPairs(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_pairs(self): return self.pairs
-    def set_pairs(self, pairs): self.pairs = pairs
-    def add_pairs(self, value): self.pairs.append(value)
-    def insert_pairs_at(self, index, value): self.pairs.insert(index, value)
-    def replace_pairs_at(self, index, value): self.pairs[index] = value
-    def hasContent_(self):
-        if (
-            self.pairs
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='loanAmountPairs', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='loanAmountPairs')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='loanAmountPairs', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='loanAmountPairs'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='loanAmountPairs', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for pairs_ in self.pairs:
-            pairs_.export(outfile, level, namespace_, name_='pairs', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'pairs':
-            obj_ = pairsType.factory()
-            obj_.build(child_)
-            self.pairs.append(obj_)
-            obj_.original_tagname_ = 'pairs'
-# end class loanAmountPairs
-
-
-class RentVsBuy(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, result=None, breakEven=None, totalSavings=None, downPayment=None, closingCosts=None, rentDeposit=None, rentDepositReturn=None, rentBrokerFee=None, yearlyCostsTable=None, cumulativeYearlyCostsTable=None):
-        self.original_tagname_ = None
-        self.result = result
-        self.breakEven = breakEven
-        self.totalSavings = totalSavings
-        self.downPayment = downPayment
-        self.closingCosts = closingCosts
-        self.rentDeposit = rentDeposit
-        self.rentDepositReturn = rentDepositReturn
-        self.rentBrokerFee = rentBrokerFee
-        if yearlyCostsTable is None:
-            self.yearlyCostsTable = []
-        else:
-            self.yearlyCostsTable = yearlyCostsTable
-        if cumulativeYearlyCostsTable is None:
-            self.cumulativeYearlyCostsTable = []
-        else:
-            self.cumulativeYearlyCostsTable = cumulativeYearlyCostsTable
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, RentVsBuy)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if RentVsBuy.subclass:
-            return RentVsBuy.subclass(*args_, **kwargs_)
-        else:
-            return RentVsBuy(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_breakEven(self): return self.breakEven
-    def set_breakEven(self, breakEven): self.breakEven = breakEven
-    def get_totalSavings(self): return self.totalSavings
-    def set_totalSavings(self, totalSavings): self.totalSavings = totalSavings
-    def get_downPayment(self): return self.downPayment
-    def set_downPayment(self, downPayment): self.downPayment = downPayment
-    def get_closingCosts(self): return self.closingCosts
-    def set_closingCosts(self, closingCosts): self.closingCosts = closingCosts
-    def get_rentDeposit(self): return self.rentDeposit
-    def set_rentDeposit(self, rentDeposit): self.rentDeposit = rentDeposit
-    def get_rentDepositReturn(self): return self.rentDepositReturn
-    def set_rentDepositReturn(self, rentDepositReturn): self.rentDepositReturn = rentDepositReturn
-    def get_rentBrokerFee(self): return self.rentBrokerFee
-    def set_rentBrokerFee(self, rentBrokerFee): self.rentBrokerFee = rentBrokerFee
-    def get_yearlyCostsTable(self): return self.yearlyCostsTable
-    def set_yearlyCostsTable(self, yearlyCostsTable): self.yearlyCostsTable = yearlyCostsTable
-    def add_yearlyCostsTable(self, value): self.yearlyCostsTable.append(value)
-    def insert_yearlyCostsTable_at(self, index, value): self.yearlyCostsTable.insert(index, value)
-    def replace_yearlyCostsTable_at(self, index, value): self.yearlyCostsTable[index] = value
-    def get_cumulativeYearlyCostsTable(self): return self.cumulativeYearlyCostsTable
-    def set_cumulativeYearlyCostsTable(self, cumulativeYearlyCostsTable): self.cumulativeYearlyCostsTable = cumulativeYearlyCostsTable
-    def add_cumulativeYearlyCostsTable(self, value): self.cumulativeYearlyCostsTable.append(value)
-    def insert_cumulativeYearlyCostsTable_at(self, index, value): self.cumulativeYearlyCostsTable.insert(index, value)
-    def replace_cumulativeYearlyCostsTable_at(self, index, value): self.cumulativeYearlyCostsTable[index] = value
-    def hasContent_(self):
-        if (
-            self.result is not None or
-            self.breakEven is not None or
-            self.totalSavings is not None or
-            self.downPayment is not None or
-            self.closingCosts is not None or
-            self.rentDeposit is not None or
-            self.rentDepositReturn is not None or
-            self.rentBrokerFee is not None or
-            self.yearlyCostsTable or
-            self.cumulativeYearlyCostsTable
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='RentVsBuy', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='RentVsBuy')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='RentVsBuy', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='RentVsBuy'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='RentVsBuy', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        if self.breakEven is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
-        if self.totalSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalSavings>%s</%stotalSavings>%s' % (namespace_, self.gds_format_integer(self.totalSavings, input_name='totalSavings'), namespace_, eol_))
-        if self.downPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
-        if self.closingCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sclosingCosts>%s</%sclosingCosts>%s' % (namespace_, self.gds_format_integer(self.closingCosts, input_name='closingCosts'), namespace_, eol_))
-        if self.rentDeposit is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srentDeposit>%s</%srentDeposit>%s' % (namespace_, self.gds_format_integer(self.rentDeposit, input_name='rentDeposit'), namespace_, eol_))
-        if self.rentDepositReturn is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srentDepositReturn>%s</%srentDepositReturn>%s' % (namespace_, self.gds_format_integer(self.rentDepositReturn, input_name='rentDepositReturn'), namespace_, eol_))
-        if self.rentBrokerFee is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srentBrokerFee>%s</%srentBrokerFee>%s' % (namespace_, self.gds_format_integer(self.rentBrokerFee, input_name='rentBrokerFee'), namespace_, eol_))
-        for yearlyCostsTable_ in self.yearlyCostsTable:
-            yearlyCostsTable_.export(outfile, level, namespace_, name_='yearlyCostsTable', pretty_print=pretty_print)
-        for cumulativeYearlyCostsTable_ in self.cumulativeYearlyCostsTable:
-            cumulativeYearlyCostsTable_.export(outfile, level, namespace_, name_='cumulativeYearlyCostsTable', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'breakEven':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
-            self.breakEven = ival_
-        elif nodeName_ == 'totalSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalSavings')
-            self.totalSavings = ival_
-        elif nodeName_ == 'downPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
-            self.downPayment = ival_
-        elif nodeName_ == 'closingCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'closingCosts')
-            self.closingCosts = ival_
-        elif nodeName_ == 'rentDeposit':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rentDeposit')
-            self.rentDeposit = ival_
-        elif nodeName_ == 'rentDepositReturn':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rentDepositReturn')
-            self.rentDepositReturn = ival_
-        elif nodeName_ == 'rentBrokerFee':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rentBrokerFee')
-            self.rentBrokerFee = ival_
-        elif nodeName_ == 'yearlyCostsTable':
-            obj_ = yearlyCostsTable.factory()
-            obj_.build(child_)
-            self.yearlyCostsTable.append(obj_)
-            obj_.original_tagname_ = 'yearlyCostsTable'
-        elif nodeName_ == 'cumulativeYearlyCostsTable':
-            obj_ = cumulativeYearlyCostsTable.factory()
-            obj_.build(child_)
-            self.cumulativeYearlyCostsTable.append(obj_)
-            obj_.original_tagname_ = 'cumulativeYearlyCostsTable'
-# end class RentVsBuy
-
-
-class yearlyCostsTable(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, year=None, buyingBlock=None, rentingBlock=None):
-        self.original_tagname_ = None
-        self.year = year
-        if buyingBlock is None:
-            self.buyingBlock = []
-        else:
-            self.buyingBlock = buyingBlock
-        if rentingBlock is None:
-            self.rentingBlock = []
-        else:
-            self.rentingBlock = rentingBlock
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, yearlyCostsTable)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if yearlyCostsTable.subclass:
-            return yearlyCostsTable.subclass(*args_, **kwargs_)
-        else:
-            return yearlyCostsTable(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_year(self): return self.year
-    def set_year(self, year): self.year = year
-    def get_buyingBlock(self): return self.buyingBlock
-    def set_buyingBlock(self, buyingBlock): self.buyingBlock = buyingBlock
-    def add_buyingBlock(self, value): self.buyingBlock.append(value)
-    def insert_buyingBlock_at(self, index, value): self.buyingBlock.insert(index, value)
-    def replace_buyingBlock_at(self, index, value): self.buyingBlock[index] = value
-    def get_rentingBlock(self): return self.rentingBlock
-    def set_rentingBlock(self, rentingBlock): self.rentingBlock = rentingBlock
-    def add_rentingBlock(self, value): self.rentingBlock.append(value)
-    def insert_rentingBlock_at(self, index, value): self.rentingBlock.insert(index, value)
-    def replace_rentingBlock_at(self, index, value): self.rentingBlock[index] = value
-    def hasContent_(self):
-        if (
-            self.year is not None or
-            self.buyingBlock or
-            self.rentingBlock
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='yearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='yearlyCostsTable')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='yearlyCostsTable', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='yearlyCostsTable'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='yearlyCostsTable', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.year is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
-        for buyingBlock_ in self.buyingBlock:
-            buyingBlock_.export(outfile, level, namespace_, name_='buyingBlock', pretty_print=pretty_print)
-        for rentingBlock_ in self.rentingBlock:
-            rentingBlock_.export(outfile, level, namespace_, name_='rentingBlock', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'year':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'year')
-            self.year = ival_
-        elif nodeName_ == 'buyingBlock':
-            obj_ = buyingBlock.factory()
-            obj_.build(child_)
-            self.buyingBlock.append(obj_)
-            obj_.original_tagname_ = 'buyingBlock'
-        elif nodeName_ == 'rentingBlock':
-            obj_ = rentingBlock.factory()
-            obj_.build(child_)
-            self.rentingBlock.append(obj_)
-            obj_.original_tagname_ = 'rentingBlock'
-# end class yearlyCostsTable
-
-
-class cumulativeYearlyCostsTable(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, year=None, savings=None, buyingBlock=None, sellingBlock=None, rentingBlock=None):
-        self.original_tagname_ = None
-        self.year = year
-        self.savings = savings
-        if buyingBlock is None:
-            self.buyingBlock = []
-        else:
-            self.buyingBlock = buyingBlock
-        if sellingBlock is None:
-            self.sellingBlock = []
-        else:
-            self.sellingBlock = sellingBlock
-        if rentingBlock is None:
-            self.rentingBlock = []
-        else:
-            self.rentingBlock = rentingBlock
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, cumulativeYearlyCostsTable)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if cumulativeYearlyCostsTable.subclass:
-            return cumulativeYearlyCostsTable.subclass(*args_, **kwargs_)
-        else:
-            return cumulativeYearlyCostsTable(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_year(self): return self.year
-    def set_year(self, year): self.year = year
-    def get_savings(self): return self.savings
-    def set_savings(self, savings): self.savings = savings
-    def get_buyingBlock(self): return self.buyingBlock
-    def set_buyingBlock(self, buyingBlock): self.buyingBlock = buyingBlock
-    def add_buyingBlock(self, value): self.buyingBlock.append(value)
-    def insert_buyingBlock_at(self, index, value): self.buyingBlock.insert(index, value)
-    def replace_buyingBlock_at(self, index, value): self.buyingBlock[index] = value
-    def get_sellingBlock(self): return self.sellingBlock
-    def set_sellingBlock(self, sellingBlock): self.sellingBlock = sellingBlock
-    def add_sellingBlock(self, value): self.sellingBlock.append(value)
-    def insert_sellingBlock_at(self, index, value): self.sellingBlock.insert(index, value)
-    def replace_sellingBlock_at(self, index, value): self.sellingBlock[index] = value
-    def get_rentingBlock(self): return self.rentingBlock
-    def set_rentingBlock(self, rentingBlock): self.rentingBlock = rentingBlock
-    def add_rentingBlock(self, value): self.rentingBlock.append(value)
-    def insert_rentingBlock_at(self, index, value): self.rentingBlock.insert(index, value)
-    def replace_rentingBlock_at(self, index, value): self.rentingBlock[index] = value
-    def hasContent_(self):
-        if (
-            self.year is not None or
-            self.savings is not None or
-            self.buyingBlock or
-            self.sellingBlock or
-            self.rentingBlock
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='cumulativeYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='cumulativeYearlyCostsTable')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='cumulativeYearlyCostsTable', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='cumulativeYearlyCostsTable'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='cumulativeYearlyCostsTable', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.year is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
-        if self.savings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%ssavings>%s</%ssavings>%s' % (namespace_, self.gds_format_integer(self.savings, input_name='savings'), namespace_, eol_))
-        for buyingBlock_ in self.buyingBlock:
-            buyingBlock_.export(outfile, level, namespace_, name_='buyingBlock', pretty_print=pretty_print)
-        for sellingBlock_ in self.sellingBlock:
-            sellingBlock_.export(outfile, level, namespace_, name_='sellingBlock', pretty_print=pretty_print)
-        for rentingBlock_ in self.rentingBlock:
-            rentingBlock_.export(outfile, level, namespace_, name_='rentingBlock', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'year':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'year')
-            self.year = ival_
-        elif nodeName_ == 'savings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'savings')
-            self.savings = ival_
-        elif nodeName_ == 'buyingBlock':
-            obj_ = buyingBlock.factory()
-            obj_.build(child_)
-            self.buyingBlock.append(obj_)
-            obj_.original_tagname_ = 'buyingBlock'
-        elif nodeName_ == 'sellingBlock':
-            obj_ = sellingBlock.factory()
-            obj_.build(child_)
-            self.sellingBlock.append(obj_)
-            obj_.original_tagname_ = 'sellingBlock'
-        elif nodeName_ == 'rentingBlock':
-            obj_ = rentingBlock.factory()
-            obj_.build(child_)
-            self.rentingBlock.append(obj_)
-            obj_.original_tagname_ = 'rentingBlock'
-# end class cumulativeYearlyCostsTable
-
-
-class buyingBlock(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, buying=None):
-        self.original_tagname_ = None
-        if buying is None:
-            self.buying = []
-        else:
-            self.buying = buying
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, buyingBlock)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if buyingBlock.subclass:
-            return buyingBlock.subclass(*args_, **kwargs_)
-        else:
-            return buyingBlock(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_buying(self): return self.buying
-    def set_buying(self, buying): self.buying = buying
-    def add_buying(self, value): self.buying.append(value)
-    def insert_buying_at(self, index, value): self.buying.insert(index, value)
-    def replace_buying_at(self, index, value): self.buying[index] = value
-    def hasContent_(self):
-        if (
-            self.buying
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='buyingBlock', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buyingBlock')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='buyingBlock', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buyingBlock'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='buyingBlock', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for buying_ in self.buying:
-            buying_.export(outfile, level, namespace_, name_='buying', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'buying':
-            obj_ = buyingType.factory()
-            obj_.build(child_)
-            self.buying.append(obj_)
-            obj_.original_tagname_ = 'buying'
-# end class buyingBlock
-
-
-class rentingBlock(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, renting=None):
-        self.original_tagname_ = None
-        if renting is None:
-            self.renting = []
-        else:
-            self.renting = renting
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, rentingBlock)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if rentingBlock.subclass:
-            return rentingBlock.subclass(*args_, **kwargs_)
-        else:
-            return rentingBlock(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_renting(self): return self.renting
-    def set_renting(self, renting): self.renting = renting
-    def add_renting(self, value): self.renting.append(value)
-    def insert_renting_at(self, index, value): self.renting.insert(index, value)
-    def replace_renting_at(self, index, value): self.renting[index] = value
-    def hasContent_(self):
-        if (
-            self.renting
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='rentingBlock', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='rentingBlock')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='rentingBlock', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='rentingBlock'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='rentingBlock', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for renting_ in self.renting:
-            renting_.export(outfile, level, namespace_, name_='renting', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'renting':
-            obj_ = rentingType.factory()
-            obj_.build(child_)
-            self.renting.append(obj_)
-            obj_.original_tagname_ = 'renting'
-# end class rentingBlock
-
-
-class sellingBlock(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, selling=None):
-        self.original_tagname_ = None
-        if selling is None:
-            self.selling = []
-        else:
-            self.selling = selling
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, sellingBlock)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if sellingBlock.subclass:
-            return sellingBlock.subclass(*args_, **kwargs_)
-        else:
-            return sellingBlock(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_selling(self): return self.selling
-    def set_selling(self, selling): self.selling = selling
-    def add_selling(self, value): self.selling.append(value)
-    def insert_selling_at(self, index, value): self.selling.insert(index, value)
-    def replace_selling_at(self, index, value): self.selling[index] = value
-    def hasContent_(self):
-        if (
-            self.selling
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='sellingBlock', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='sellingBlock')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='sellingBlock', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='sellingBlock'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='sellingBlock', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for selling_ in self.selling:
-            selling_.export(outfile, level, namespace_, name_='selling', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'selling':
-            obj_ = sellingType.factory()
-            obj_.build(child_)
-            self.selling.append(obj_)
-            obj_.original_tagname_ = 'selling'
-# end class sellingBlock
-
-
-class Investment(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, result=None, breakEven=None, totalProfitLoss=None, downPayment=None, closingCosts=None, InvestmentYearlyCostsTable=None, InvestmentcumulativeYearlyCostsTable=None):
-        self.original_tagname_ = None
-        self.result = result
-        self.breakEven = breakEven
-        self.totalProfitLoss = totalProfitLoss
-        self.downPayment = downPayment
-        self.closingCosts = closingCosts
-        if InvestmentYearlyCostsTable is None:
-            self.InvestmentYearlyCostsTable = []
-        else:
-            self.InvestmentYearlyCostsTable = InvestmentYearlyCostsTable
-        if InvestmentcumulativeYearlyCostsTable is None:
-            self.InvestmentcumulativeYearlyCostsTable = []
-        else:
-            self.InvestmentcumulativeYearlyCostsTable = InvestmentcumulativeYearlyCostsTable
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, Investment)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if Investment.subclass:
-            return Investment.subclass(*args_, **kwargs_)
-        else:
-            return Investment(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def get_breakEven(self): return self.breakEven
-    def set_breakEven(self, breakEven): self.breakEven = breakEven
-    def get_totalProfitLoss(self): return self.totalProfitLoss
-    def set_totalProfitLoss(self, totalProfitLoss): self.totalProfitLoss = totalProfitLoss
-    def get_downPayment(self): return self.downPayment
-    def set_downPayment(self, downPayment): self.downPayment = downPayment
-    def get_closingCosts(self): return self.closingCosts
-    def set_closingCosts(self, closingCosts): self.closingCosts = closingCosts
-    def get_InvestmentYearlyCostsTable(self): return self.InvestmentYearlyCostsTable
-    def set_InvestmentYearlyCostsTable(self, InvestmentYearlyCostsTable): self.InvestmentYearlyCostsTable = InvestmentYearlyCostsTable
-    def add_InvestmentYearlyCostsTable(self, value): self.InvestmentYearlyCostsTable.append(value)
-    def insert_InvestmentYearlyCostsTable_at(self, index, value): self.InvestmentYearlyCostsTable.insert(index, value)
-    def replace_InvestmentYearlyCostsTable_at(self, index, value): self.InvestmentYearlyCostsTable[index] = value
-    def get_InvestmentcumulativeYearlyCostsTable(self): return self.InvestmentcumulativeYearlyCostsTable
-    def set_InvestmentcumulativeYearlyCostsTable(self, InvestmentcumulativeYearlyCostsTable): self.InvestmentcumulativeYearlyCostsTable = InvestmentcumulativeYearlyCostsTable
-    def add_InvestmentcumulativeYearlyCostsTable(self, value): self.InvestmentcumulativeYearlyCostsTable.append(value)
-    def insert_InvestmentcumulativeYearlyCostsTable_at(self, index, value): self.InvestmentcumulativeYearlyCostsTable.insert(index, value)
-    def replace_InvestmentcumulativeYearlyCostsTable_at(self, index, value): self.InvestmentcumulativeYearlyCostsTable[index] = value
-    def hasContent_(self):
-        if (
-            self.result is not None or
-            self.breakEven is not None or
-            self.totalProfitLoss is not None or
-            self.downPayment is not None or
-            self.closingCosts is not None or
-            self.InvestmentYearlyCostsTable or
-            self.InvestmentcumulativeYearlyCostsTable
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='Investment', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='Investment')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='Investment', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='Investment'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='Investment', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.result is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sresult>%s</%sresult>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.result), input_name='result')), namespace_, eol_))
-        if self.breakEven is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbreakEven>%s</%sbreakEven>%s' % (namespace_, self.gds_format_integer(self.breakEven, input_name='breakEven'), namespace_, eol_))
-        if self.totalProfitLoss is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalProfitLoss>%s</%stotalProfitLoss>%s' % (namespace_, self.gds_format_integer(self.totalProfitLoss, input_name='totalProfitLoss'), namespace_, eol_))
-        if self.downPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdownPayment>%s</%sdownPayment>%s' % (namespace_, self.gds_format_integer(self.downPayment, input_name='downPayment'), namespace_, eol_))
-        if self.closingCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sclosingCosts>%s</%sclosingCosts>%s' % (namespace_, self.gds_format_integer(self.closingCosts, input_name='closingCosts'), namespace_, eol_))
-        for InvestmentYearlyCostsTable_ in self.InvestmentYearlyCostsTable:
-            InvestmentYearlyCostsTable_.export(outfile, level, namespace_, name_='InvestmentYearlyCostsTable', pretty_print=pretty_print)
-        for InvestmentcumulativeYearlyCostsTable_ in self.InvestmentcumulativeYearlyCostsTable:
-            InvestmentcumulativeYearlyCostsTable_.export(outfile, level, namespace_, name_='InvestmentcumulativeYearlyCostsTable', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'result':
-            result_ = child_.text
-            result_ = self.gds_validate_string(result_, node, 'result')
-            self.result = result_
-        elif nodeName_ == 'breakEven':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'breakEven')
-            self.breakEven = ival_
-        elif nodeName_ == 'totalProfitLoss':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalProfitLoss')
-            self.totalProfitLoss = ival_
-        elif nodeName_ == 'downPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'downPayment')
-            self.downPayment = ival_
-        elif nodeName_ == 'closingCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'closingCosts')
-            self.closingCosts = ival_
-        elif nodeName_ == 'InvestmentYearlyCostsTable':
-            obj_ = investmentYearlyCostsTable.factory()
-            obj_.build(child_)
-            self.InvestmentYearlyCostsTable.append(obj_)
-            obj_.original_tagname_ = 'InvestmentYearlyCostsTable'
-        elif nodeName_ == 'InvestmentcumulativeYearlyCostsTable':
-            obj_ = investmentCumulativeYearlyCostsTable.factory()
-            obj_.build(child_)
-            self.InvestmentcumulativeYearlyCostsTable.append(obj_)
-            obj_.original_tagname_ = 'InvestmentcumulativeYearlyCostsTable'
-# end class Investment
-
-
-class investmentYearlyCostsTable(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, investmentBuyingBlock=None):
-        self.original_tagname_ = None
-        if investmentBuyingBlock is None:
-            self.investmentBuyingBlock = []
-        else:
-            self.investmentBuyingBlock = investmentBuyingBlock
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, investmentYearlyCostsTable)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if investmentYearlyCostsTable.subclass:
-            return investmentYearlyCostsTable.subclass(*args_, **kwargs_)
-        else:
-            return investmentYearlyCostsTable(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_investmentBuyingBlock(self): return self.investmentBuyingBlock
-    def set_investmentBuyingBlock(self, investmentBuyingBlock): self.investmentBuyingBlock = investmentBuyingBlock
-    def add_investmentBuyingBlock(self, value): self.investmentBuyingBlock.append(value)
-    def insert_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock.insert(index, value)
-    def replace_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock[index] = value
-    def hasContent_(self):
-        if (
-            self.investmentBuyingBlock
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='investmentYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentYearlyCostsTable')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentYearlyCostsTable', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentYearlyCostsTable'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='investmentYearlyCostsTable', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for investmentBuyingBlock_ in self.investmentBuyingBlock:
-            investmentBuyingBlock_.export(outfile, level, namespace_, name_='investmentBuyingBlock', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'investmentBuyingBlock':
-            obj_ = investmentBuyingBlock.factory()
-            obj_.build(child_)
-            self.investmentBuyingBlock.append(obj_)
-            obj_.original_tagname_ = 'investmentBuyingBlock'
-# end class investmentYearlyCostsTable
-
-
-class investmentCumulativeYearlyCostsTable(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, investmentBuyingBlock=None, sellingBlock=None, investmentreturn=None):
-        self.original_tagname_ = None
-        if investmentBuyingBlock is None:
-            self.investmentBuyingBlock = []
-        else:
-            self.investmentBuyingBlock = investmentBuyingBlock
-        if sellingBlock is None:
-            self.sellingBlock = []
-        else:
-            self.sellingBlock = sellingBlock
-        self.investmentreturn = investmentreturn
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, investmentCumulativeYearlyCostsTable)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if investmentCumulativeYearlyCostsTable.subclass:
-            return investmentCumulativeYearlyCostsTable.subclass(*args_, **kwargs_)
-        else:
-            return investmentCumulativeYearlyCostsTable(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_investmentBuyingBlock(self): return self.investmentBuyingBlock
-    def set_investmentBuyingBlock(self, investmentBuyingBlock): self.investmentBuyingBlock = investmentBuyingBlock
-    def add_investmentBuyingBlock(self, value): self.investmentBuyingBlock.append(value)
-    def insert_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock.insert(index, value)
-    def replace_investmentBuyingBlock_at(self, index, value): self.investmentBuyingBlock[index] = value
-    def get_sellingBlock(self): return self.sellingBlock
-    def set_sellingBlock(self, sellingBlock): self.sellingBlock = sellingBlock
-    def add_sellingBlock(self, value): self.sellingBlock.append(value)
-    def insert_sellingBlock_at(self, index, value): self.sellingBlock.insert(index, value)
-    def replace_sellingBlock_at(self, index, value): self.sellingBlock[index] = value
-    def get_investmentreturn(self): return self.investmentreturn
-    def set_investmentreturn(self, investmentreturn): self.investmentreturn = investmentreturn
-    def hasContent_(self):
-        if (
-            self.investmentBuyingBlock or
-            self.sellingBlock or
-            self.investmentreturn is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='investmentCumulativeYearlyCostsTable', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentCumulativeYearlyCostsTable')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentCumulativeYearlyCostsTable', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentCumulativeYearlyCostsTable'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='investmentCumulativeYearlyCostsTable', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for investmentBuyingBlock_ in self.investmentBuyingBlock:
-            investmentBuyingBlock_.export(outfile, level, namespace_, name_='investmentBuyingBlock', pretty_print=pretty_print)
-        for sellingBlock_ in self.sellingBlock:
-            sellingBlock_.export(outfile, level, namespace_, name_='sellingBlock', pretty_print=pretty_print)
-        if self.investmentreturn is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinvestmentreturn>%s</%sinvestmentreturn>%s' % (namespace_, self.gds_format_double(self.investmentreturn, input_name='investmentreturn'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'investmentBuyingBlock':
-            obj_ = investmentBuyingBlock.factory()
-            obj_.build(child_)
-            self.investmentBuyingBlock.append(obj_)
-            obj_.original_tagname_ = 'investmentBuyingBlock'
-        elif nodeName_ == 'sellingBlock':
-            obj_ = sellingBlock.factory()
-            obj_.build(child_)
-            self.sellingBlock.append(obj_)
-            obj_.original_tagname_ = 'sellingBlock'
-        elif nodeName_ == 'investmentreturn':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'investmentreturn')
-            self.investmentreturn = fval_
-# end class investmentCumulativeYearlyCostsTable
-
-
-class investmentBuyingBlock(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, buying=None):
-        self.original_tagname_ = None
-        if buying is None:
-            self.buying = []
-        else:
-            self.buying = buying
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, investmentBuyingBlock)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if investmentBuyingBlock.subclass:
-            return investmentBuyingBlock.subclass(*args_, **kwargs_)
-        else:
-            return investmentBuyingBlock(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_buying(self): return self.buying
-    def set_buying(self, buying): self.buying = buying
-    def add_buying(self, value): self.buying.append(value)
-    def insert_buying_at(self, index, value): self.buying.insert(index, value)
-    def replace_buying_at(self, index, value): self.buying[index] = value
-    def hasContent_(self):
-        if (
-            self.buying
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='investmentBuyingBlock', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='investmentBuyingBlock')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='investmentBuyingBlock', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='investmentBuyingBlock'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='investmentBuyingBlock', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for buying_ in self.buying:
-            buying_.export(outfile, level, namespace_, name_='buying', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'buying':
-            obj_ = buying.factory()
-            obj_.build(child_)
-            self.buying.append(obj_)
-            obj_.original_tagname_ = 'buying'
-# end class investmentBuyingBlock
-
-
-class buying(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, year=None, rentalIncome=None, otherIncome=None, mortgagePayment=None, principal=None, interest=None, hoaFees=None, propertyTaxes=None, utilities=None, renovations=None, maintainCosts=None, homeOwnerInsurance=None, managementFees=None, advertisingCosts=None, otherExpenses=None, totalExpenses=None, opportunityCostInitial=None, opportunityCostYearly=None, depreciationBuilding=None, depreciationrenovation=None, totalBenefit=None, totalProfitLoss=None):
-        self.original_tagname_ = None
-        self.year = year
-        self.rentalIncome = rentalIncome
-        self.otherIncome = otherIncome
-        self.mortgagePayment = mortgagePayment
-        self.principal = principal
-        self.interest = interest
-        self.hoaFees = hoaFees
-        self.propertyTaxes = propertyTaxes
-        self.utilities = utilities
-        self.renovations = renovations
-        self.maintainCosts = maintainCosts
-        self.homeOwnerInsurance = homeOwnerInsurance
-        self.managementFees = managementFees
-        self.advertisingCosts = advertisingCosts
-        self.otherExpenses = otherExpenses
-        self.totalExpenses = totalExpenses
-        self.opportunityCostInitial = opportunityCostInitial
-        self.opportunityCostYearly = opportunityCostYearly
-        self.depreciationBuilding = depreciationBuilding
-        self.depreciationrenovation = depreciationrenovation
-        self.totalBenefit = totalBenefit
-        self.totalProfitLoss = totalProfitLoss
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, buying)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if buying.subclass:
-            return buying.subclass(*args_, **kwargs_)
-        else:
-            return buying(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_year(self): return self.year
-    def set_year(self, year): self.year = year
-    def get_rentalIncome(self): return self.rentalIncome
-    def set_rentalIncome(self, rentalIncome): self.rentalIncome = rentalIncome
-    def get_otherIncome(self): return self.otherIncome
-    def set_otherIncome(self, otherIncome): self.otherIncome = otherIncome
-    def get_mortgagePayment(self): return self.mortgagePayment
-    def set_mortgagePayment(self, mortgagePayment): self.mortgagePayment = mortgagePayment
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_hoaFees(self): return self.hoaFees
-    def set_hoaFees(self, hoaFees): self.hoaFees = hoaFees
-    def get_propertyTaxes(self): return self.propertyTaxes
-    def set_propertyTaxes(self, propertyTaxes): self.propertyTaxes = propertyTaxes
-    def get_utilities(self): return self.utilities
-    def set_utilities(self, utilities): self.utilities = utilities
-    def get_renovations(self): return self.renovations
-    def set_renovations(self, renovations): self.renovations = renovations
-    def get_maintainCosts(self): return self.maintainCosts
-    def set_maintainCosts(self, maintainCosts): self.maintainCosts = maintainCosts
-    def get_homeOwnerInsurance(self): return self.homeOwnerInsurance
-    def set_homeOwnerInsurance(self, homeOwnerInsurance): self.homeOwnerInsurance = homeOwnerInsurance
-    def get_managementFees(self): return self.managementFees
-    def set_managementFees(self, managementFees): self.managementFees = managementFees
-    def get_advertisingCosts(self): return self.advertisingCosts
-    def set_advertisingCosts(self, advertisingCosts): self.advertisingCosts = advertisingCosts
-    def get_otherExpenses(self): return self.otherExpenses
-    def set_otherExpenses(self, otherExpenses): self.otherExpenses = otherExpenses
-    def get_totalExpenses(self): return self.totalExpenses
-    def set_totalExpenses(self, totalExpenses): self.totalExpenses = totalExpenses
-    def get_opportunityCostInitial(self): return self.opportunityCostInitial
-    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
-    def get_opportunityCostYearly(self): return self.opportunityCostYearly
-    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
-    def get_depreciationBuilding(self): return self.depreciationBuilding
-    def set_depreciationBuilding(self, depreciationBuilding): self.depreciationBuilding = depreciationBuilding
-    def get_depreciationrenovation(self): return self.depreciationrenovation
-    def set_depreciationrenovation(self, depreciationrenovation): self.depreciationrenovation = depreciationrenovation
-    def get_totalBenefit(self): return self.totalBenefit
-    def set_totalBenefit(self, totalBenefit): self.totalBenefit = totalBenefit
-    def get_totalProfitLoss(self): return self.totalProfitLoss
-    def set_totalProfitLoss(self, totalProfitLoss): self.totalProfitLoss = totalProfitLoss
-    def hasContent_(self):
-        if (
-            self.year is not None or
-            self.rentalIncome is not None or
-            self.otherIncome is not None or
-            self.mortgagePayment is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.hoaFees is not None or
-            self.propertyTaxes is not None or
-            self.utilities is not None or
-            self.renovations is not None or
-            self.maintainCosts is not None or
-            self.homeOwnerInsurance is not None or
-            self.managementFees is not None or
-            self.advertisingCosts is not None or
-            self.otherExpenses is not None or
-            self.totalExpenses is not None or
-            self.opportunityCostInitial is not None or
-            self.opportunityCostYearly is not None or
-            self.depreciationBuilding is not None or
-            self.depreciationrenovation is not None or
-            self.totalBenefit is not None or
-            self.totalProfitLoss is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='buying', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buying')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='buying', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buying'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='buying', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.year is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%syear>%s</%syear>%s' % (namespace_, self.gds_format_integer(self.year, input_name='year'), namespace_, eol_))
-        if self.rentalIncome is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srentalIncome>%s</%srentalIncome>%s' % (namespace_, self.gds_format_integer(self.rentalIncome, input_name='rentalIncome'), namespace_, eol_))
-        if self.otherIncome is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sotherIncome>%s</%sotherIncome>%s' % (namespace_, self.gds_format_integer(self.otherIncome, input_name='otherIncome'), namespace_, eol_))
-        if self.mortgagePayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smortgagePayment>%s</%smortgagePayment>%s' % (namespace_, self.gds_format_integer(self.mortgagePayment, input_name='mortgagePayment'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.hoaFees is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%shoaFees>%s</%shoaFees>%s' % (namespace_, self.gds_format_integer(self.hoaFees, input_name='hoaFees'), namespace_, eol_))
-        if self.propertyTaxes is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spropertyTaxes>%s</%spropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.propertyTaxes, input_name='propertyTaxes'), namespace_, eol_))
-        if self.utilities is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sutilities>%s</%sutilities>%s' % (namespace_, self.gds_format_integer(self.utilities, input_name='utilities'), namespace_, eol_))
-        if self.renovations is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srenovations>%s</%srenovations>%s' % (namespace_, self.gds_format_integer(self.renovations, input_name='renovations'), namespace_, eol_))
-        if self.maintainCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smaintainCosts>%s</%smaintainCosts>%s' % (namespace_, self.gds_format_integer(self.maintainCosts, input_name='maintainCosts'), namespace_, eol_))
-        if self.homeOwnerInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%shomeOwnerInsurance>%s</%shomeOwnerInsurance>%s' % (namespace_, self.gds_format_integer(self.homeOwnerInsurance, input_name='homeOwnerInsurance'), namespace_, eol_))
-        if self.managementFees is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smanagementFees>%s</%smanagementFees>%s' % (namespace_, self.gds_format_integer(self.managementFees, input_name='managementFees'), namespace_, eol_))
-        if self.advertisingCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadvertisingCosts>%s</%sadvertisingCosts>%s' % (namespace_, self.gds_format_integer(self.advertisingCosts, input_name='advertisingCosts'), namespace_, eol_))
-        if self.otherExpenses is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sotherExpenses>%s</%sotherExpenses>%s' % (namespace_, self.gds_format_integer(self.otherExpenses, input_name='otherExpenses'), namespace_, eol_))
-        if self.totalExpenses is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalExpenses>%s</%stotalExpenses>%s' % (namespace_, self.gds_format_integer(self.totalExpenses, input_name='totalExpenses'), namespace_, eol_))
-        if self.opportunityCostInitial is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
-        if self.opportunityCostYearly is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
-        if self.depreciationBuilding is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdepreciationBuilding>%s</%sdepreciationBuilding>%s' % (namespace_, self.gds_format_integer(self.depreciationBuilding, input_name='depreciationBuilding'), namespace_, eol_))
-        if self.depreciationrenovation is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sdepreciationrenovation>%s</%sdepreciationrenovation>%s' % (namespace_, self.gds_format_integer(self.depreciationrenovation, input_name='depreciationrenovation'), namespace_, eol_))
-        if self.totalBenefit is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalBenefit>%s</%stotalBenefit>%s' % (namespace_, self.gds_format_integer(self.totalBenefit, input_name='totalBenefit'), namespace_, eol_))
-        if self.totalProfitLoss is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalProfitLoss>%s</%stotalProfitLoss>%s' % (namespace_, self.gds_format_integer(self.totalProfitLoss, input_name='totalProfitLoss'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'year':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'year')
-            self.year = ival_
-        elif nodeName_ == 'rentalIncome':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rentalIncome')
-            self.rentalIncome = ival_
-        elif nodeName_ == 'otherIncome':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'otherIncome')
-            self.otherIncome = ival_
-        elif nodeName_ == 'mortgagePayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'mortgagePayment')
-            self.mortgagePayment = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'hoaFees':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'hoaFees')
-            self.hoaFees = ival_
-        elif nodeName_ == 'propertyTaxes':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'propertyTaxes')
-            self.propertyTaxes = ival_
-        elif nodeName_ == 'utilities':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'utilities')
-            self.utilities = ival_
-        elif nodeName_ == 'renovations':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'renovations')
-            self.renovations = ival_
-        elif nodeName_ == 'maintainCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'maintainCosts')
-            self.maintainCosts = ival_
-        elif nodeName_ == 'homeOwnerInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'homeOwnerInsurance')
-            self.homeOwnerInsurance = ival_
-        elif nodeName_ == 'managementFees':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'managementFees')
-            self.managementFees = ival_
-        elif nodeName_ == 'advertisingCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'advertisingCosts')
-            self.advertisingCosts = ival_
-        elif nodeName_ == 'otherExpenses':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'otherExpenses')
-            self.otherExpenses = ival_
-        elif nodeName_ == 'totalExpenses':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalExpenses')
-            self.totalExpenses = ival_
-        elif nodeName_ == 'opportunityCostInitial':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
-            self.opportunityCostInitial = ival_
-        elif nodeName_ == 'opportunityCostYearly':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
-            self.opportunityCostYearly = ival_
-        elif nodeName_ == 'depreciationBuilding':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'depreciationBuilding')
-            self.depreciationBuilding = ival_
-        elif nodeName_ == 'depreciationrenovation':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'depreciationrenovation')
-            self.depreciationrenovation = ival_
-        elif nodeName_ == 'totalBenefit':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalBenefit')
-            self.totalBenefit = ival_
-        elif nodeName_ == 'totalProfitLoss':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalProfitLoss')
-            self.totalProfitLoss = ival_
-# end class buying
-
-
-class requestType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, address=None, citystatezip=None):
-        self.original_tagname_ = None
-        self.address = address
-        self.citystatezip = citystatezip
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, requestType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if requestType.subclass:
-            return requestType.subclass(*args_, **kwargs_)
-        else:
-            return requestType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_address(self): return self.address
-    def set_address(self, address): self.address = address
-    def get_citystatezip(self): return self.citystatezip
-    def set_citystatezip(self, citystatezip): self.citystatezip = citystatezip
-    def hasContent_(self):
-        if (
-            self.address is not None or
-            self.citystatezip is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='requestType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='requestType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='requestType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='requestType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='requestType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.address is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%saddress>%s</%saddress>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.address), input_name='address')), namespace_, eol_))
-        if self.citystatezip is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%scitystatezip>%s</%scitystatezip>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.citystatezip), input_name='citystatezip')), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'address':
-            address_ = child_.text
-            address_ = self.gds_validate_string(address_, node, 'address')
-            self.address = address_
-        elif nodeName_ == 'citystatezip':
-            citystatezip_ = child_.text
-            citystatezip_ = self.gds_validate_string(citystatezip_, node, 'citystatezip')
-            self.citystatezip = citystatezip_
-# end class requestType
-
-
-class responseType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, results=None):
-        self.original_tagname_ = None
-        self.results = results
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, responseType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if responseType.subclass:
-            return responseType.subclass(*args_, **kwargs_)
-        else:
-            return responseType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_results(self): return self.results
-    def set_results(self, results): self.results = results
-    def hasContent_(self):
-        if (
-            self.results is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='responseType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='responseType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='responseType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='responseType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='responseType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.results is not None:
-            self.results.export(outfile, level, namespace_, name_='results', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'results':
-            obj_ = resultsType.factory()
-            obj_.build(child_)
-            self.results = obj_
-            obj_.original_tagname_ = 'results'
-# end class responseType
-
-
-class resultsType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, result=None):
-        self.original_tagname_ = None
-        if result is None:
-            self.result = []
-        else:
-            self.result = result
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, resultsType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if resultsType.subclass:
-            return resultsType.subclass(*args_, **kwargs_)
-        else:
-            return resultsType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_result(self): return self.result
-    def set_result(self, result): self.result = result
-    def add_result(self, value): self.result.append(value)
-    def insert_result_at(self, index, value): self.result.insert(index, value)
-    def replace_result_at(self, index, value): self.result[index] = value
-    def hasContent_(self):
-        if (
-            self.result
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='resultsType', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='resultsType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='resultsType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='resultsType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='resultsType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        for result_ in self.result:
-            result_.export(outfile, level, namespace_, name_='result', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'result':
-            class_obj_ = self.get_class_obj_(child_, SimpleProperty)
-            obj_ = class_obj_.factory()
-            obj_.build(child_)
-            self.result.append(obj_)
-            obj_.original_tagname_ = 'result'
-# end class resultsType
-
-
-class valuationRangeType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, low=None, high=None):
-        self.original_tagname_ = None
-        self.low = low
-        self.high = high
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, valuationRangeType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if valuationRangeType.subclass:
-            return valuationRangeType.subclass(*args_, **kwargs_)
-        else:
-            return valuationRangeType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_low(self): return self.low
-    def set_low(self, low): self.low = low
-    def get_high(self): return self.high
-    def set_high(self, high): self.high = high
-    def hasContent_(self):
-        if (
-            self.low is not None or
-            self.high is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='valuationRangeType', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='valuationRangeType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='valuationRangeType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='valuationRangeType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='valuationRangeType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.low is not None:
-            self.low.export(outfile, level, namespace_, name_='low', pretty_print=pretty_print)
-        if self.high is not None:
-            self.high.export(outfile, level, namespace_, name_='high', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'low':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.low = obj_
-            obj_.original_tagname_ = 'low'
-        elif nodeName_ == 'high':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.high = obj_
-            obj_.original_tagname_ = 'high'
-# end class valuationRangeType
-
-
-class valuationRangeType1(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, low=None, high=None):
-        self.original_tagname_ = None
-        self.low = low
-        self.high = high
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, valuationRangeType1)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if valuationRangeType1.subclass:
-            return valuationRangeType1.subclass(*args_, **kwargs_)
-        else:
-            return valuationRangeType1(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_low(self): return self.low
-    def set_low(self, low): self.low = low
-    def get_high(self): return self.high
-    def set_high(self, high): self.high = high
-    def hasContent_(self):
-        if (
-            self.low is not None or
-            self.high is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='valuationRangeType1', namespacedef_=' xmlns:ZillowTypes="http://www.zillow.com/static/xsd/ZillowTypes.xsd" ', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='valuationRangeType1')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='valuationRangeType1', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='valuationRangeType1'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='valuationRangeType1', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.low is not None:
-            self.low.export(outfile, level, namespace_, name_='low', pretty_print=pretty_print)
-        if self.high is not None:
-            self.high.export(outfile, level, namespace_, name_='high', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'low':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.low = obj_
-            obj_.original_tagname_ = 'low'
-        elif nodeName_ == 'high':
-            obj_ = Amount.factory()
-            obj_.build(child_)
-            self.high = obj_
-            obj_.original_tagname_ = 'high'
-# end class valuationRangeType1
-
-
-class regionType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, name=None, type_=None, id=None, zindexValue=None, zindexOneYearChange=None, links=None):
-        self.original_tagname_ = None
-        self.name = _cast(None, name)
-        self.type_ = _cast(None, type_)
-        self.id = _cast(int, id)
-        self.zindexValue = zindexValue
-        self.zindexOneYearChange = zindexOneYearChange
-        self.links = links
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, regionType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if regionType.subclass:
-            return regionType.subclass(*args_, **kwargs_)
-        else:
-            return regionType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_zindexValue(self): return self.zindexValue
-    def set_zindexValue(self, zindexValue): self.zindexValue = zindexValue
-    def get_zindexOneYearChange(self): return self.zindexOneYearChange
-    def set_zindexOneYearChange(self, zindexOneYearChange): self.zindexOneYearChange = zindexOneYearChange
-    def get_links(self): return self.links
-    def set_links(self, links): self.links = links
-    def get_name(self): return self.name
-    def set_name(self, name): self.name = name
-    def get_type(self): return self.type_
-    def set_type(self, type_): self.type_ = type_
-    def get_id(self): return self.id
-    def set_id(self, id): self.id = id
-    def hasContent_(self):
-        if (
-            self.zindexValue is not None or
-            self.zindexOneYearChange is not None or
-            self.links is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='regionType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='regionType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='regionType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='regionType'):
-        if self.name is not None and 'name' not in already_processed:
-            already_processed.add('name')
-            outfile.write(' name=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.name), input_name='name')), ))
-        if self.type_ is not None and 'type_' not in already_processed:
-            already_processed.add('type_')
-            outfile.write(' type=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.type_), input_name='type')), ))
-        if self.id is not None and 'id' not in already_processed:
-            already_processed.add('id')
-            outfile.write(' id="%s"' % self.gds_format_integer(self.id, input_name='id'))
-    def exportChildren(self, outfile, level, namespace_='', name_='regionType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.zindexValue is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%szindexValue>%s</%szindexValue>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.zindexValue), input_name='zindexValue')), namespace_, eol_))
-        if self.zindexOneYearChange is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%szindexOneYearChange>%s</%szindexOneYearChange>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.zindexOneYearChange), input_name='zindexOneYearChange')), namespace_, eol_))
-        if self.links is not None:
-            self.links.export(outfile, level, namespace_, name_='links', pretty_print=pretty_print)
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('name', node)
-        if value is not None and 'name' not in already_processed:
-            already_processed.add('name')
-            self.name = value
-        value = find_attr_value_('type', node)
-        if value is not None and 'type' not in already_processed:
-            already_processed.add('type')
-            self.type_ = value
-        value = find_attr_value_('id', node)
-        if value is not None and 'id' not in already_processed:
-            already_processed.add('id')
-            try:
-                self.id = int(value)
-            except ValueError as exp:
-                raise_parse_error(node, 'Bad integer attribute: %s' % exp)
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'zindexValue':
-            zindexValue_ = child_.text
-            zindexValue_ = self.gds_validate_string(zindexValue_, node, 'zindexValue')
-            self.zindexValue = zindexValue_
-        elif nodeName_ == 'zindexOneYearChange':
-            zindexOneYearChange_ = child_.text
-            zindexOneYearChange_ = self.gds_validate_string(zindexOneYearChange_, node, 'zindexOneYearChange')
-            self.zindexOneYearChange = zindexOneYearChange_
-        elif nodeName_ == 'links':
-            obj_ = linksType.factory()
-            obj_.build(child_)
-            self.links = obj_
-            obj_.original_tagname_ = 'links'
-# end class regionType
-
-
-class linksType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, overview=None, forSaleByOwner=None, forSale=None):
-        self.original_tagname_ = None
-        self.overview = overview
-        self.forSaleByOwner = forSaleByOwner
-        self.forSale = forSale
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, linksType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if linksType.subclass:
-            return linksType.subclass(*args_, **kwargs_)
-        else:
-            return linksType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_overview(self): return self.overview
-    def set_overview(self, overview): self.overview = overview
-    def get_forSaleByOwner(self): return self.forSaleByOwner
-    def set_forSaleByOwner(self, forSaleByOwner): self.forSaleByOwner = forSaleByOwner
-    def get_forSale(self): return self.forSale
-    def set_forSale(self, forSale): self.forSale = forSale
-    def hasContent_(self):
-        if (
-            self.overview is not None or
-            self.forSaleByOwner is not None or
-            self.forSale is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='linksType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='linksType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='linksType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='linksType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='linksType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.overview is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%soverview>%s</%soverview>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.overview), input_name='overview')), namespace_, eol_))
-        if self.forSaleByOwner is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sforSaleByOwner>%s</%sforSaleByOwner>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.forSaleByOwner), input_name='forSaleByOwner')), namespace_, eol_))
-        if self.forSale is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sforSale>%s</%sforSale>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.forSale), input_name='forSale')), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'overview':
-            overview_ = child_.text
-            overview_ = self.gds_validate_string(overview_, node, 'overview')
-            self.overview = overview_
-        elif nodeName_ == 'forSaleByOwner':
-            forSaleByOwner_ = child_.text
-            forSaleByOwner_ = self.gds_validate_string(forSaleByOwner_, node, 'forSaleByOwner')
-            self.forSaleByOwner = forSaleByOwner_
-        elif nodeName_ == 'forSale':
-            forSale_ = child_.text
-            forSale_ = self.gds_validate_string(forSale_, node, 'forSale')
-            self.forSale = forSale_
-# end class linksType
-
-
-class paymentType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, beginningBalance=None, amount=None, principal=None, interest=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.beginningBalance = beginningBalance
-        self.amount = amount
-        self.principal = principal
-        self.interest = interest
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, paymentType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if paymentType.subclass:
-            return paymentType.subclass(*args_, **kwargs_)
-        else:
-            return paymentType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_amount(self): return self.amount
-    def set_amount(self, amount): self.amount = amount
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.beginningBalance is not None or
-            self.amount is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='paymentType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='paymentType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='paymentType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='paymentType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='paymentType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.amount is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%samount>%s</%samount>%s' % (namespace_, self.gds_format_integer(self.amount, input_name='amount'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'amount':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'amount')
-            self.amount = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class paymentType
-
-
-class paymentType2(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, monthlySavings=None, cumulativeSavings=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.monthlySavings = monthlySavings
-        self.cumulativeSavings = cumulativeSavings
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, paymentType2)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if paymentType2.subclass:
-            return paymentType2.subclass(*args_, **kwargs_)
-        else:
-            return paymentType2(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_monthlySavings(self): return self.monthlySavings
-    def set_monthlySavings(self, monthlySavings): self.monthlySavings = monthlySavings
-    def get_cumulativeSavings(self): return self.cumulativeSavings
-    def set_cumulativeSavings(self, cumulativeSavings): self.cumulativeSavings = cumulativeSavings
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.monthlySavings is not None or
-            self.cumulativeSavings is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='paymentType2', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='paymentType2')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='paymentType2', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='paymentType2'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='paymentType2', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.monthlySavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smonthlySavings>%s</%smonthlySavings>%s' % (namespace_, self.gds_format_integer(self.monthlySavings, input_name='monthlySavings'), namespace_, eol_))
-        if self.cumulativeSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%scumulativeSavings>%s</%scumulativeSavings>%s' % (namespace_, self.gds_format_integer(self.cumulativeSavings, input_name='cumulativeSavings'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'monthlySavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'monthlySavings')
-            self.monthlySavings = ival_
-        elif nodeName_ == 'cumulativeSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'cumulativeSavings')
-            self.cumulativeSavings = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class paymentType2
-
-
-class PaymentType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, fixedPayment=None, fixedBalance=None, adjustablePayment=None, adjustableBalance=None, adjustableRate=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.fixedPayment = fixedPayment
-        self.fixedBalance = fixedBalance
-        self.adjustablePayment = adjustablePayment
-        self.adjustableBalance = adjustableBalance
-        self.adjustableRate = adjustableRate
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType.subclass:
-            return PaymentType.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_fixedPayment(self): return self.fixedPayment
-    def set_fixedPayment(self, fixedPayment): self.fixedPayment = fixedPayment
-    def get_fixedBalance(self): return self.fixedBalance
-    def set_fixedBalance(self, fixedBalance): self.fixedBalance = fixedBalance
-    def get_adjustablePayment(self): return self.adjustablePayment
-    def set_adjustablePayment(self, adjustablePayment): self.adjustablePayment = adjustablePayment
-    def get_adjustableBalance(self): return self.adjustableBalance
-    def set_adjustableBalance(self, adjustableBalance): self.adjustableBalance = adjustableBalance
-    def get_adjustableRate(self): return self.adjustableRate
-    def set_adjustableRate(self, adjustableRate): self.adjustableRate = adjustableRate
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.fixedPayment is not None or
-            self.fixedBalance is not None or
-            self.adjustablePayment is not None or
-            self.adjustableBalance is not None or
-            self.adjustableRate is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.fixedPayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedPayment>%s</%sfixedPayment>%s' % (namespace_, self.gds_format_integer(self.fixedPayment, input_name='fixedPayment'), namespace_, eol_))
-        if self.fixedBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sfixedBalance>%s</%sfixedBalance>%s' % (namespace_, self.gds_format_integer(self.fixedBalance, input_name='fixedBalance'), namespace_, eol_))
-        if self.adjustablePayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustablePayment>%s</%sadjustablePayment>%s' % (namespace_, self.gds_format_integer(self.adjustablePayment, input_name='adjustablePayment'), namespace_, eol_))
-        if self.adjustableBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableBalance>%s</%sadjustableBalance>%s' % (namespace_, self.gds_format_integer(self.adjustableBalance, input_name='adjustableBalance'), namespace_, eol_))
-        if self.adjustableRate is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sadjustableRate>%s</%sadjustableRate>%s' % (namespace_, self.gds_format_integer(self.adjustableRate, input_name='adjustableRate'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'fixedPayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedPayment')
-            self.fixedPayment = ival_
-        elif nodeName_ == 'fixedBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'fixedBalance')
-            self.fixedBalance = ival_
-        elif nodeName_ == 'adjustablePayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustablePayment')
-            self.adjustablePayment = ival_
-        elif nodeName_ == 'adjustableBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableBalance')
-            self.adjustableBalance = ival_
-        elif nodeName_ == 'adjustableRate':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'adjustableRate')
-            self.adjustableRate = ival_
-# end class PaymentType
-
-
-class PaymentType3(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None, rate=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.principal = principal
-        self.interest = interest
-        self.endingBalance = endingBalance
-        self.rate = rate
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType3)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType3.subclass:
-            return PaymentType3.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType3(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def get_rate(self): return self.rate
-    def set_rate(self, rate): self.rate = rate
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.endingBalance is not None or
-            self.rate is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType3', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType3')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType3', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType3'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType3', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-        if self.rate is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srate>%s</%srate>%s' % (namespace_, self.gds_format_double(self.rate, input_name='rate'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-        elif nodeName_ == 'rate':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'rate')
-            self.rate = fval_
-# end class PaymentType3
-
-
-class PaymentType4(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.principal = principal
-        self.interest = interest
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType4)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType4.subclass:
-            return PaymentType4.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType4(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType4', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType4')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType4', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType4'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType4', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class PaymentType4
-
-
-class PaymentType5(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, principal=None, interest=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.principal = principal
-        self.interest = interest
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType5)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType5.subclass:
-            return PaymentType5.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType5(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType5', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType5')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType5', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType5'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType5', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class PaymentType5
-
-
-class PaymentType6(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None, taxSavings=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.interest = interest
-        self.endingBalance = endingBalance
-        self.taxSavings = taxSavings
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType6)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType6.subclass:
-            return PaymentType6.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType6(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def get_taxSavings(self): return self.taxSavings
-    def set_taxSavings(self, taxSavings): self.taxSavings = taxSavings
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.interest is not None or
-            self.endingBalance is not None or
-            self.taxSavings is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType6', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType6')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType6', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType6'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType6', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-        if self.taxSavings is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%staxSavings>%s</%staxSavings>%s' % (namespace_, self.gds_format_integer(self.taxSavings, input_name='taxSavings'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-        elif nodeName_ == 'taxSavings':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'taxSavings')
-            self.taxSavings = ival_
-# end class PaymentType6
-
-
-class PaymentType7(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.interest = interest
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType7)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType7.subclass:
-            return PaymentType7.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType7(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.interest is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType7', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType7')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType7', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType7'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType7', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class PaymentType7
-
-
-class PaymentType8(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, period=None, beginningBalance=None, payment=None, interest=None, endingBalance=None):
-        self.original_tagname_ = None
-        self.period = period
-        self.beginningBalance = beginningBalance
-        self.payment = payment
-        self.interest = interest
-        self.endingBalance = endingBalance
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, PaymentType8)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if PaymentType8.subclass:
-            return PaymentType8.subclass(*args_, **kwargs_)
-        else:
-            return PaymentType8(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_period(self): return self.period
-    def set_period(self, period): self.period = period
-    def get_beginningBalance(self): return self.beginningBalance
-    def set_beginningBalance(self, beginningBalance): self.beginningBalance = beginningBalance
-    def get_payment(self): return self.payment
-    def set_payment(self, payment): self.payment = payment
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_endingBalance(self): return self.endingBalance
-    def set_endingBalance(self, endingBalance): self.endingBalance = endingBalance
-    def hasContent_(self):
-        if (
-            self.period is not None or
-            self.beginningBalance is not None or
-            self.payment is not None or
-            self.interest is not None or
-            self.endingBalance is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='PaymentType8', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='PaymentType8')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='PaymentType8', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='PaymentType8'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='PaymentType8', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.period is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%speriod>%s</%speriod>%s' % (namespace_, self.gds_format_integer(self.period, input_name='period'), namespace_, eol_))
-        if self.beginningBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sbeginningBalance>%s</%sbeginningBalance>%s' % (namespace_, self.gds_format_integer(self.beginningBalance, input_name='beginningBalance'), namespace_, eol_))
-        if self.payment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spayment>%s</%spayment>%s' % (namespace_, self.gds_format_integer(self.payment, input_name='payment'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.endingBalance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sendingBalance>%s</%sendingBalance>%s' % (namespace_, self.gds_format_integer(self.endingBalance, input_name='endingBalance'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'period':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'period')
-            self.period = ival_
-        elif nodeName_ == 'beginningBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'beginningBalance')
-            self.beginningBalance = ival_
-        elif nodeName_ == 'payment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'payment')
-            self.payment = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'endingBalance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'endingBalance')
-            self.endingBalance = ival_
-# end class PaymentType8
-
-
-class pairsType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, ltv=None, loanAmount=None):
-        self.original_tagname_ = None
-        self.ltv = ltv
-        self.loanAmount = loanAmount
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, pairsType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if pairsType.subclass:
-            return pairsType.subclass(*args_, **kwargs_)
-        else:
-            return pairsType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_ltv(self): return self.ltv
-    def set_ltv(self, ltv): self.ltv = ltv
-    def get_loanAmount(self): return self.loanAmount
-    def set_loanAmount(self, loanAmount): self.loanAmount = loanAmount
-    def hasContent_(self):
-        if (
-            self.ltv is not None or
-            self.loanAmount is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='pairsType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='pairsType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='pairsType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='pairsType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='pairsType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.ltv is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sltv>%s</%sltv>%s' % (namespace_, self.gds_format_double(self.ltv, input_name='ltv'), namespace_, eol_))
-        if self.loanAmount is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sloanAmount>%s</%sloanAmount>%s' % (namespace_, self.gds_format_integer(self.loanAmount, input_name='loanAmount'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ltv':
-            sval_ = child_.text
-            try:
-                fval_ = float(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires float or double: %s' % exp)
-            fval_ = self.gds_validate_float(fval_, node, 'ltv')
-            self.ltv = fval_
-        elif nodeName_ == 'loanAmount':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'loanAmount')
-            self.loanAmount = ival_
-# end class pairsType
-
-
-class buyingType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, mortgagePayment=None, principal=None, interest=None, hoaFees=None, propertyTaxes=None, utilities=None, renovations=None, maintainCosts=None, homeOwnerInsurance=None, opportunityCostInitial=None, opportunityCostYearly=None, totalBenefit=None, totalCost=None):
-        self.original_tagname_ = None
-        self.mortgagePayment = mortgagePayment
-        self.principal = principal
-        self.interest = interest
-        self.hoaFees = hoaFees
-        self.propertyTaxes = propertyTaxes
-        self.utilities = utilities
-        self.renovations = renovations
-        self.maintainCosts = maintainCosts
-        self.homeOwnerInsurance = homeOwnerInsurance
-        self.opportunityCostInitial = opportunityCostInitial
-        self.opportunityCostYearly = opportunityCostYearly
-        self.totalBenefit = totalBenefit
-        self.totalCost = totalCost
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, buyingType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if buyingType.subclass:
-            return buyingType.subclass(*args_, **kwargs_)
-        else:
-            return buyingType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_mortgagePayment(self): return self.mortgagePayment
-    def set_mortgagePayment(self, mortgagePayment): self.mortgagePayment = mortgagePayment
-    def get_principal(self): return self.principal
-    def set_principal(self, principal): self.principal = principal
-    def get_interest(self): return self.interest
-    def set_interest(self, interest): self.interest = interest
-    def get_hoaFees(self): return self.hoaFees
-    def set_hoaFees(self, hoaFees): self.hoaFees = hoaFees
-    def get_propertyTaxes(self): return self.propertyTaxes
-    def set_propertyTaxes(self, propertyTaxes): self.propertyTaxes = propertyTaxes
-    def get_utilities(self): return self.utilities
-    def set_utilities(self, utilities): self.utilities = utilities
-    def get_renovations(self): return self.renovations
-    def set_renovations(self, renovations): self.renovations = renovations
-    def get_maintainCosts(self): return self.maintainCosts
-    def set_maintainCosts(self, maintainCosts): self.maintainCosts = maintainCosts
-    def get_homeOwnerInsurance(self): return self.homeOwnerInsurance
-    def set_homeOwnerInsurance(self, homeOwnerInsurance): self.homeOwnerInsurance = homeOwnerInsurance
-    def get_opportunityCostInitial(self): return self.opportunityCostInitial
-    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
-    def get_opportunityCostYearly(self): return self.opportunityCostYearly
-    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
-    def get_totalBenefit(self): return self.totalBenefit
-    def set_totalBenefit(self, totalBenefit): self.totalBenefit = totalBenefit
-    def get_totalCost(self): return self.totalCost
-    def set_totalCost(self, totalCost): self.totalCost = totalCost
-    def hasContent_(self):
-        if (
-            self.mortgagePayment is not None or
-            self.principal is not None or
-            self.interest is not None or
-            self.hoaFees is not None or
-            self.propertyTaxes is not None or
-            self.utilities is not None or
-            self.renovations is not None or
-            self.maintainCosts is not None or
-            self.homeOwnerInsurance is not None or
-            self.opportunityCostInitial is not None or
-            self.opportunityCostYearly is not None or
-            self.totalBenefit is not None or
-            self.totalCost is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='buyingType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='buyingType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='buyingType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='buyingType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='buyingType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.mortgagePayment is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smortgagePayment>%s</%smortgagePayment>%s' % (namespace_, self.gds_format_integer(self.mortgagePayment, input_name='mortgagePayment'), namespace_, eol_))
-        if self.principal is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sprincipal>%s</%sprincipal>%s' % (namespace_, self.gds_format_integer(self.principal, input_name='principal'), namespace_, eol_))
-        if self.interest is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sinterest>%s</%sinterest>%s' % (namespace_, self.gds_format_integer(self.interest, input_name='interest'), namespace_, eol_))
-        if self.hoaFees is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%shoaFees>%s</%shoaFees>%s' % (namespace_, self.gds_format_integer(self.hoaFees, input_name='hoaFees'), namespace_, eol_))
-        if self.propertyTaxes is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%spropertyTaxes>%s</%spropertyTaxes>%s' % (namespace_, self.gds_format_integer(self.propertyTaxes, input_name='propertyTaxes'), namespace_, eol_))
-        if self.utilities is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sutilities>%s</%sutilities>%s' % (namespace_, self.gds_format_integer(self.utilities, input_name='utilities'), namespace_, eol_))
-        if self.renovations is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srenovations>%s</%srenovations>%s' % (namespace_, self.gds_format_integer(self.renovations, input_name='renovations'), namespace_, eol_))
-        if self.maintainCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%smaintainCosts>%s</%smaintainCosts>%s' % (namespace_, self.gds_format_integer(self.maintainCosts, input_name='maintainCosts'), namespace_, eol_))
-        if self.homeOwnerInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%shomeOwnerInsurance>%s</%shomeOwnerInsurance>%s' % (namespace_, self.gds_format_integer(self.homeOwnerInsurance, input_name='homeOwnerInsurance'), namespace_, eol_))
-        if self.opportunityCostInitial is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
-        if self.opportunityCostYearly is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
-        if self.totalBenefit is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalBenefit>%s</%stotalBenefit>%s' % (namespace_, self.gds_format_integer(self.totalBenefit, input_name='totalBenefit'), namespace_, eol_))
-        if self.totalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
+            outfile.write('<%szindexOneYearChange>%s</%szindexOneYearChange>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.zindexOneYearChange), input_name='zindexOneYearChange')), namespace_, eol_))
+        if self.links is not None:
+            self.links.export(outfile, level, namespace_, name_='links', pretty_print=pretty_print)
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
-        pass
-    def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'mortgagePayment':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'mortgagePayment')
-            self.mortgagePayment = ival_
-        elif nodeName_ == 'principal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'principal')
-            self.principal = ival_
-        elif nodeName_ == 'interest':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'interest')
-            self.interest = ival_
-        elif nodeName_ == 'hoaFees':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'hoaFees')
-            self.hoaFees = ival_
-        elif nodeName_ == 'propertyTaxes':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'propertyTaxes')
-            self.propertyTaxes = ival_
-        elif nodeName_ == 'utilities':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'utilities')
-            self.utilities = ival_
-        elif nodeName_ == 'renovations':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'renovations')
-            self.renovations = ival_
-        elif nodeName_ == 'maintainCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'maintainCosts')
-            self.maintainCosts = ival_
-        elif nodeName_ == 'homeOwnerInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'homeOwnerInsurance')
-            self.homeOwnerInsurance = ival_
-        elif nodeName_ == 'opportunityCostInitial':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
-            self.opportunityCostInitial = ival_
-        elif nodeName_ == 'opportunityCostYearly':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
-            self.opportunityCostYearly = ival_
-        elif nodeName_ == 'totalBenefit':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalBenefit')
-            self.totalBenefit = ival_
-        elif nodeName_ == 'totalCost':
-            sval_ = child_.text
+        value = find_attr_value_('name', node)
+        if value is not None and 'name' not in already_processed:
+            already_processed.add('name')
+            self.name = value
+        value = find_attr_value_('type', node)
+        if value is not None and 'type' not in already_processed:
+            already_processed.add('type')
+            self.type_ = value
+        value = find_attr_value_('id', node)
+        if value is not None and 'id' not in already_processed:
+            already_processed.add('id')
             try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
-            self.totalCost = ival_
-# end class buyingType
-
-
-class rentingType(GeneratedsSuper):
-    subclass = None
-    superclass = None
-    def __init__(self, rent=None, rentersInsurance=None, opportunityCostInitial=None, opportunityCostYearly=None, totalCost=None):
-        self.original_tagname_ = None
-        self.rent = rent
-        self.rentersInsurance = rentersInsurance
-        self.opportunityCostInitial = opportunityCostInitial
-        self.opportunityCostYearly = opportunityCostYearly
-        self.totalCost = totalCost
-    def factory(*args_, **kwargs_):
-        if CurrentSubclassModule_ is not None:
-            subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, rentingType)
-            if subclass is not None:
-                return subclass(*args_, **kwargs_)
-        if rentingType.subclass:
-            return rentingType.subclass(*args_, **kwargs_)
-        else:
-            return rentingType(*args_, **kwargs_)
-    factory = staticmethod(factory)
-    def get_rent(self): return self.rent
-    def set_rent(self, rent): self.rent = rent
-    def get_rentersInsurance(self): return self.rentersInsurance
-    def set_rentersInsurance(self, rentersInsurance): self.rentersInsurance = rentersInsurance
-    def get_opportunityCostInitial(self): return self.opportunityCostInitial
-    def set_opportunityCostInitial(self, opportunityCostInitial): self.opportunityCostInitial = opportunityCostInitial
-    def get_opportunityCostYearly(self): return self.opportunityCostYearly
-    def set_opportunityCostYearly(self, opportunityCostYearly): self.opportunityCostYearly = opportunityCostYearly
-    def get_totalCost(self): return self.totalCost
-    def set_totalCost(self, totalCost): self.totalCost = totalCost
-    def hasContent_(self):
-        if (
-            self.rent is not None or
-            self.rentersInsurance is not None or
-            self.opportunityCostInitial is not None or
-            self.opportunityCostYearly is not None or
-            self.totalCost is not None
-        ):
-            return True
-        else:
-            return False
-    def export(self, outfile, level, namespace_='', name_='rentingType', namespacedef_='', pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.original_tagname_ is not None:
-            name_ = self.original_tagname_
-        showIndent(outfile, level, pretty_print)
-        outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
-        already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='rentingType')
-        if self.hasContent_():
-            outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='rentingType', pretty_print=pretty_print)
-            showIndent(outfile, level, pretty_print)
-            outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
-        else:
-            outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='rentingType'):
-        pass
-    def exportChildren(self, outfile, level, namespace_='', name_='rentingType', fromsubclass_=False, pretty_print=True):
-        if pretty_print:
-            eol_ = '\n'
-        else:
-            eol_ = ''
-        if self.rent is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srent>%s</%srent>%s' % (namespace_, self.gds_format_integer(self.rent, input_name='rent'), namespace_, eol_))
-        if self.rentersInsurance is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%srentersInsurance>%s</%srentersInsurance>%s' % (namespace_, self.gds_format_integer(self.rentersInsurance, input_name='rentersInsurance'), namespace_, eol_))
-        if self.opportunityCostInitial is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostInitial>%s</%sopportunityCostInitial>%s' % (namespace_, self.gds_format_integer(self.opportunityCostInitial, input_name='opportunityCostInitial'), namespace_, eol_))
-        if self.opportunityCostYearly is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%sopportunityCostYearly>%s</%sopportunityCostYearly>%s' % (namespace_, self.gds_format_integer(self.opportunityCostYearly, input_name='opportunityCostYearly'), namespace_, eol_))
-        if self.totalCost is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%stotalCost>%s</%stotalCost>%s' % (namespace_, self.gds_format_integer(self.totalCost, input_name='totalCost'), namespace_, eol_))
-    def build(self, node):
-        already_processed = set()
-        self.buildAttributes(node, node.attrib, already_processed)
-        for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
-            self.buildChildren(child, node, nodeName_)
-        return self
-    def buildAttributes(self, node, attrs, already_processed):
-        pass
+                self.id = int(value)
+            except ValueError as exp:
+                raise_parse_error(node, 'Bad integer attribute: %s' % exp)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'rent':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rent')
-            self.rent = ival_
-        elif nodeName_ == 'rentersInsurance':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'rentersInsurance')
-            self.rentersInsurance = ival_
-        elif nodeName_ == 'opportunityCostInitial':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostInitial')
-            self.opportunityCostInitial = ival_
-        elif nodeName_ == 'opportunityCostYearly':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'opportunityCostYearly')
-            self.opportunityCostYearly = ival_
-        elif nodeName_ == 'totalCost':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'totalCost')
-            self.totalCost = ival_
-# end class rentingType
+        builder_ = regionType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_zindexValue(self, child_, node, nodeName_):
+        zindexValue_ = child_.text
+        zindexValue_ = self.gds_validate_string(zindexValue_, node, 'zindexValue')
+        self.zindexValue = zindexValue_
+    def buildChild_zindexOneYearChange(self, child_, node, nodeName_):
+        zindexOneYearChange_ = child_.text
+        zindexOneYearChange_ = self.gds_validate_string(zindexOneYearChange_, node, 'zindexOneYearChange')
+        self.zindexOneYearChange = zindexOneYearChange_
+    def buildChild_links(self, child_, node, nodeName_):
+        obj_ = linksType.factory()
+        obj_.build(child_)
+        self.links = obj_
+        obj_.original_tagname_ = 'links'
+    childBuilders_ = {
+        'zindexValue': buildChild_zindexValue,
+        'zindexOneYearChange': buildChild_zindexOneYearChange,
+        'links': buildChild_links
+    }
+# end class regionType
 
 
-class sellingType(GeneratedsSuper):
+class linksType(GeneratedsSuper):
     subclass = None
     superclass = None
-    def __init__(self, sellingCosts=None, remainingPrincipal=None, homeValue=None, tax=None):
+    def __init__(self, overview=None, forSaleByOwner=None, forSale=None):
         self.original_tagname_ = None
-        self.sellingCosts = sellingCosts
-        self.remainingPrincipal = remainingPrincipal
-        self.homeValue = homeValue
-        self.tax = tax
+        self.overview = overview
+        self.forSaleByOwner = forSaleByOwner
+        self.forSale = forSale
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
-                CurrentSubclassModule_, sellingType)
+                CurrentSubclassModule_, linksType)
             if subclass is not None:
                 return subclass(*args_, **kwargs_)
-        if sellingType.subclass:
-            return sellingType.subclass(*args_, **kwargs_)
+        if linksType.subclass:
+            return linksType.subclass(*args_, **kwargs_)
         else:
-            return sellingType(*args_, **kwargs_)
+            return linksType(*args_, **kwargs_)
     factory = staticmethod(factory)
-    def get_sellingCosts(self): return self.sellingCosts
-    def set_sellingCosts(self, sellingCosts): self.sellingCosts = sellingCosts
-    def get_remainingPrincipal(self): return self.remainingPrincipal
-    def set_remainingPrincipal(self, remainingPrincipal): self.remainingPrincipal = remainingPrincipal
-    def get_homeValue(self): return self.homeValue
-    def set_homeValue(self, homeValue): self.homeValue = homeValue
-    def get_tax(self): return self.tax
-    def set_tax(self, tax): self.tax = tax
+    def get_overview(self): return self.overview
+    def set_overview(self, overview): self.overview = overview
+    def get_forSaleByOwner(self): return self.forSaleByOwner
+    def set_forSaleByOwner(self, forSaleByOwner): self.forSaleByOwner = forSaleByOwner
+    def get_forSale(self): return self.forSale
+    def set_forSale(self, forSale): self.forSale = forSale
     def hasContent_(self):
         if (
-            self.sellingCosts is not None or
-            self.remainingPrincipal is not None or
-            self.homeValue is not None or
-            self.tax is not None
+            self.overview is not None or
+            self.forSaleByOwner is not None or
+            self.forSale is not None
         ):
             return True
         else:
             return False
-    def export(self, outfile, level, namespace_='', name_='sellingType', namespacedef_='', pretty_print=True):
+    def export(self, outfile, level, namespace_='', name_='linksType', namespacedef_='', pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
@@ -10664,119 +4186,161 @@ class sellingType(GeneratedsSuper):
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespace_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
         already_processed = set()
-        self.exportAttributes(outfile, level, already_processed, namespace_, name_='sellingType')
+        self.exportAttributes(outfile, level, already_processed, namespace_, name_='linksType')
         if self.hasContent_():
             outfile.write('>%s' % (eol_, ))
-            self.exportChildren(outfile, level + 1, namespace_='', name_='sellingType', pretty_print=pretty_print)
+            self.exportChildren(outfile, level + 1, namespace_='', name_='linksType', pretty_print=pretty_print)
             showIndent(outfile, level, pretty_print)
             outfile.write('</%s%s>%s' % (namespace_, name_, eol_))
         else:
             outfile.write('/>%s' % (eol_, ))
-    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='sellingType'):
+    def exportAttributes(self, outfile, level, already_processed, namespace_='', name_='linksType'):
         pass
-    def exportChildren(self, outfile, level, namespace_='', name_='sellingType', fromsubclass_=False, pretty_print=True):
+    def exportChildren(self, outfile, level, namespace_='', name_='linksType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
         else:
             eol_ = ''
-        if self.sellingCosts is not None:
-            showIndent(outfile, level, pretty_print)
-            outfile.write('<%ssellingCosts>%s</%ssellingCosts>%s' % (namespace_, self.gds_format_integer(self.sellingCosts, input_name='sellingCosts'), namespace_, eol_))
-        if self.remainingPrincipal is not None:
+        if self.overview is not None:
             showIndent(outfile, level, pretty_print)
-            outfile.write('<%sremainingPrincipal>%s</%sremainingPrincipal>%s' % (namespace_, self.gds_format_integer(self.remainingPrincipal, input_name='remainingPrincipal'), namespace_, eol_))
-        if self.homeValue is not None:
+            outfile.write('<%soverview>%s</%soverview>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.overview), input_name='overview')), namespace_, eol_))
+        if self.forSaleByOwner is not None:
             showIndent(outfile, level, pretty_print)
-            outfile.write('<%shomeValue>%s</%shomeValue>%s' % (namespace_, self.gds_format_integer(self.homeValue, input_name='homeValue'), namespace_, eol_))
-        if self.tax is not None:
+            outfile.write('<%sforSaleByOwner>%s</%sforSaleByOwner>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.forSaleByOwner), input_name='forSaleByOwner')), namespace_, eol_))
+        if self.forSale is not None:
             showIndent(outfile, level, pretty_print)
-            outfile.write('<%stax>%s</%stax>%s' % (namespace_, self.gds_format_integer(self.tax, input_name='tax'), namespace_, eol_))
+            outfile.write('<%sforSale>%s</%sforSale>%s' % (namespace_, self.gds_encode(self.gds_format_string(quote_xml(self.forSale), input_name='forSale')), namespace_, eol_))
     def build(self, node):
         already_processed = set()
         self.buildAttributes(node, node.attrib, already_processed)
         for child in node:
-            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            nodeName_ = LocalNames_.get(child.tag) or local_name_(child.tag)
             self.buildChildren(child, node, nodeName_)
         return self
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'sellingCosts':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'sellingCosts')
-            self.sellingCosts = ival_
-        elif nodeName_ == 'remainingPrincipal':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'remainingPrincipal')
-            self.remainingPrincipal = ival_
-        elif nodeName_ == 'homeValue':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'homeValue')
-            self.homeValue = ival_
-        elif nodeName_ == 'tax':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'tax')
-            self.tax = ival_
-# end class sellingType
+        builder_ = linksType.childBuilders_.get(nodeName_)
+        if builder_ is not None:
+            builder_(self, child_, node, nodeName_)
+    def buildChild_overview(self, child_, node, nodeName_):
+        overview_ = child_.text
+        overview_ = self.gds_validate_string(overview_, node, 'overview')
+        self.overview = overview_
+    def buildChild_forSaleByOwner(self, child_, node, nodeName_):
+        forSaleByOwner_ = child_.text
+        forSaleByOwner_ = self.gds_validate_string(forSaleByOwner_, node, 'forSaleByOwner')
+        self.forSaleByOwner = forSaleByOwner_
+    def buildChild_forSale(self, child_, node, nodeName_):
+        forSale_ = child_.text
+        forSale_ = self.gds_validate_string(forSale_, node, 'forSale')
+        self.forSale = forSale_
+    childBuilders_ = {
+        'overview': buildChild_overview,
+        'forSaleByOwner': buildChild_forSaleByOwner,
+        'forSale': buildChild_forSale
+    }
+# end class linksType
 
 
 GDSClassesMapping = {
-    'AmortizationSchedule': annualAmortizationSchedule,
-    'InterestOnlyAmortizationSchedule': annualInterestOnlyAmortizationSchedule,
-    'InvestmentYearlyCostsTable': investmentYearlyCostsTable,
-    'InvestmentcumulativeYearlyCostsTable': investmentCumulativeYearlyCostsTable,
-    'Payment': PaymentType8,
     'ad': TerseAddress,
     'address': RestrictedAddress,
-    'amortizationSchedule': TaxSavingsAmortizationSchedule,
     'amount': Amount,
-    'biWeeklyAmortizationSchedule': BiWeeklyPaymentAmortizationSchedule2,
-    'buying': buyingType,
     'high': Amount,
     'lastSoldPrice': Amount,
-    'lastWeek': MortgageRateList,
     'links': linksType,
     'localRealEstate': LocalRealEstate,
     'low': Amount,
     'message': Message,
     'myzestimator': DeprecatedType,
     'oneWeekChange': AmountOptional,
-    'pairs': pairsType,
-    'payment': paymentType2,
-    'rate': MortgageInterestRate,
     'region': regionType,
     'regions': Regions,
-    'renting': rentingType,
     'rentzestimate': Zestimate,
     'request': requestType,
     'response': responseType,
     'result': SimpleProperty,
     'results': resultsType,
-    'savingsTableSchedule': SavingsTableSchedule,
-    'selling': sellingType,
-    'today': MortgageRateList,
     'valuationRange': valuationRangeType1,
     'valueChange': AmountOptional,
     'zestimate': SimpleZestimate,
 }
 
 
+# Elements and classes of the mortgage, refinance and rent vs buy calculator
+# bindings. They live in calculators.py, which is imported the first time one
+# of them is parsed; importing it adds them to GDSClassesMapping and to this
+# module.
+CalculatorElements_ = set([
+    'AdjustableMortgage',
+    'AdjustableMortgageAmortizationSchedule',
+    'AmortizationSchedule',
+    'BiWeeklyPayment',
+    'BiWeeklyPaymentAmortizationSchedule',
+    'BiWeeklyPaymentAmortizationSchedule2',
+    'DiscountPoints',
+    'FixedVsAdjustableRate',
+    'FixedVsAdjustableRateAmortizationSchedule',
+    'Heloc',
+    'InterestOnlyAmortizationSchedule',
+    'InterstOnlyVsTraditional',
+    'Investment',
+    'InvestmentYearlyCostsTable',
+    'InvestmentcumulativeYearlyCostsTable',
+    'LenderAccountStatus',
+    'MonthlyPaymentData',
+    'MonthlyPaymentsDetails',
+    'MonthlyPaymentsSummary',
+    'MortgageInterestRate',
+    'MortgageRateList',
+    'MortgageRateSummary',
+    'MortgageTerms',
+    'NoCostVsTraditional',
+    'Payment',
+    'PaymentType',
+    'PaymentType3',
+    'PaymentType4',
+    'PaymentType5',
+    'PaymentType6',
+    'PaymentType7',
+    'PaymentType8',
+    'Refinance',
+    'RentVsBuy',
+    'SavingsTableSchedule',
+    'TaxSavings',
+    'TaxSavingsAmortizationSchedule',
+    'amortizationSchedule',
+    'annualAmortizationSchedule',
+    'annualInterestOnlyAmortizationSchedule',
+    'biWeeklyAmortizationSchedule',
+    'buying',
+    'buyingBlock',
+    'buyingType',
+    'cumulativeYearlyCostsTable',
+    'investmentBuyingBlock',
+    'investmentCumulativeYearlyCostsTable',
+    'investmentYearlyCostsTable',
+    'lastWeek',
+    'loanAmountPairs',
+    'pairs',
+    'pairsType',
+    'payment',
+    'paymentType',
+    'paymentType2',
+    'rate',
+    'renting',
+    'rentingBlock',
+    'rentingType',
+    'savingsTableSchedule',
+    'selling',
+    'sellingBlock',
+    'sellingType',
+    'today',
+    'yearlyCostsTable'
+])
+
+
 USAGE_TEXT = """
 Usage: python <Parser>.py [ -s ] <in_xml_file>
 """
@@ -10788,14 +4352,16 @@ def usage():
 
 
 def get_root_tag(node):
-    tag = Tag_pattern_.match(node.tag).groups()[-1]
+    tag = local_name_(node.tag)
+    if tag in CalculatorElements_:
+        import calculators
     rootClass = GDSClassesMapping.get(tag)
     if rootClass is None:
         rootClass = globals().get(tag)
     return tag, rootClass
 
 
-def parse(inFileName, silence=False):
+def parse(inFileName, silence=False, validate=True):
     parser = None
     doc = parsexml_(inFileName, parser)
     rootNode = doc.getroot()
@@ -10804,7 +4370,8 @@ def parse(inFileName, silence=False):
         rootTag = 'searchresults'
         rootClass = searchresults
     rootObj = rootClass.factory()
-    rootObj.build(rootNode)
+    with parse_options_(validate):
+        rootObj.build(rootNode)
     # Enable Python to collect the space used by the DOM.
     doc = None
     if not silence:
@@ -10816,7 +4383,7 @@ def parse(inFileName, silence=False):
     return rootObj
 
 
-def parseEtree(inFileName, silence=False):
+def parseEtree(inFileName, silence=False, validate=True):
     parser = None
     doc = parsexml_(inFileName, parser)
     rootNode = doc.getroot()
@@ -10825,7 +4392,8 @@ def parseEtree(inFileName, silence=False):
         rootTag = 'searchresults'
         rootClass = searchresults
     rootObj = rootClass.factory()
-    rootObj.build(rootNode)
+    with parse_options_(validate):
+        rootObj.build(rootNode)
     # Enable Python to collect the space used by the DOM.
     doc = None
     mapping = {}
@@ -10840,7 +4408,7 @@ def parseEtree(inFileName, silence=False):
     return rootObj, rootElement, mapping, reverse_mapping
 
 
-def parseString(inString, silence=False):
+def parseString(inString, silence=False, validate=True):
     from StringIO import StringIO
     parser = None
     doc = parsexml_(StringIO(inString), parser)
@@ -10850,7 +4418,8 @@ def parseString(inString, silence=False):
         rootTag = 'searchresults'
         rootClass = searchresults
     rootObj = rootClass.factory()
-    rootObj.build(rootNode)
+    with parse_options_(validate):
+        rootObj.build(rootNode)
     # Enable Python to collect the space used by the DOM.
     doc = None
     if not silence:
@@ -10861,7 +4430,44 @@ def parseString(inString, silence=False):
     return rootObj
 
 
-def parseLiteral(inFileName, silence=False):
+def parseBytes(inBytes, silence=False, validate=True):
+    """
+    Parse a document held in a byte string, such as a response body, with
+    this thread's reusable parser; no file object or etree mapping is built
+
+    With validate=False (in any of the parse functions) enumerations are not
+    checked
+    """
+    rootNode = etree_.fromstring(inBytes, parser=get_parser_())
+    rootTag, rootClass = get_root_tag(rootNode)
+    if rootClass is None:
+        rootTag = 'searchresults'
+        rootClass = searchresults
+    rootObj = rootClass.factory()
+    with parse_options_(validate):
+        rootObj.build(rootNode)
+    # Enable Python to collect the space used by the DOM.
+    rootNode = None
+    if not silence:
+        sys.stdout.write('<?xml version="1.0" ?>\n')
+        rootObj.export(
+            sys.stdout, 0, name_=rootTag,
+            namespacedef_='',
+            pretty_print=True)
+    return rootObj
+
+
+def exportBuffered(rootObj, outfile, level=0, buffer_size=8192, **kwargs):
+    """
+    rootObj.export(outfile, level, **kwargs) through a BufferedWriter_, so
+    outfile sees a few large writes; the output is byte for byte the same
+    """
+    writer = BufferedWriter_(outfile, buffer_size)
+    rootObj.export(writer, level, **kwargs)
+    writer.flush()
+
+
+def parseLiteral(inFileName, silence=False, validate=True):
     parser = None
     doc = parsexml_(inFileName, parser)
     rootNode = doc.getroot()
@@ -10870,7 +4476,8 @@ def parseLiteral(inFileName, silence=False):
         rootTag = 'searchresults'
         rootClass = searchresults
     rootObj = rootClass.factory()
-    rootObj.build(rootNode)
+    with parse_options_(validate):
+        rootObj.build(rootNode)
     # Enable Python to collect the space used by the DOM.
     doc = None
     if not silence:
@@ -10897,81 +4504,30 @@ if __name__ == '__main__':
 
 __all__ = [
     "Address",
-    "AdjustableMortgage",
-    "AdjustableMortgageAmortizationSchedule",
-    "AmortizationSchedule",
     "Amount",
     "AmountOptional",
-    "BiWeeklyPayment",
-    "BiWeeklyPaymentAmortizationSchedule",
-    "BiWeeklyPaymentAmortizationSchedule2",
     "ComparableProperty",
     "DeprecatedType",
     "DetailedProperty",
-    "DiscountPoints",
     "FMRProperty",
-    "FixedVsAdjustableRate",
-    "FixedVsAdjustableRateAmortizationSchedule",
-    "Heloc",
-    "InterstOnlyVsTraditional",
-    "Investment",
-    "LenderAccountStatus",
     "Links",
     "LocalRealEstate",
     "Message",
-    "MonthlyPaymentData",
-    "MonthlyPaymentsDetails",
-    "MonthlyPaymentsSummary",
-    "MortgageInterestRate",
-    "MortgageRateList",
-    "MortgageRateSummary",
-    "MortgageTerms",
-    "NoCostVsTraditional",
-    "PaymentType",
-    "PaymentType3",
-    "PaymentType4",
-    "PaymentType5",
-    "PaymentType6",
-    "PaymentType7",
-    "PaymentType8",
     "Property",
     "ReallySimpleProperty",
-    "Refinance",
     "RegionNames",
     "Regions",
-    "RentVsBuy",
     "RestrictedAddress",
-    "SavingsTableSchedule",
     "SimpleProperty",
     "SimpleZestimate",
-    "TaxSavings",
-    "TaxSavingsAmortizationSchedule",
     "TerseAddress",
     "Zestimate",
-    "annualAmortizationSchedule",
-    "annualInterestOnlyAmortizationSchedule",
-    "buying",
-    "buyingBlock",
-    "buyingType",
-    "cumulativeYearlyCostsTable",
-    "investmentBuyingBlock",
-    "investmentCumulativeYearlyCostsTable",
-    "investmentYearlyCostsTable",
     "linksType",
-    "loanAmountPairs",
-    "pairsType",
-    "paymentType",
-    "paymentType2",
     "regionType",
-    "rentingBlock",
-    "rentingType",
     "requestType",
     "responseType",
     "resultsType",
     "searchresults",
-    "sellingBlock",
-    "sellingType",
     "valuationRangeType",
-    "valuationRangeType1",
-    "yearlyCostsTable"
+    "valuationRangeType1"
 ]
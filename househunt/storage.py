@@ -0,0 +1,379 @@
+# storage.py
+#
+# Storage backends for ListCache. Each backend keeps one record (a dictionary
+# from Listing.as_dict() plus 'hsh' and 'last_updated') per listing hash.
+# FingerprintStore keeps the listing fingerprints of ListingDelta.
+
+import bisect
+import json
+import sqlite3
+import time
+
+from collections import OrderedDict
+
+from tinydb import TinyDB
+
+
+class TinyDBStorage(object):
+    """
+    ListCache storage on a TinyDB JSON file
+
+    TinyDB has no indexes of its own, so the records are indexed in memory
+    when the file is opened: by hsh for lookups, and by last_updated so
+    that expired records are always a prefix of the expiry list.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.db = TinyDB(path)
+        self._build_index()
+
+    def _build_index(self):
+        # hsh -> (last_updated, doc_id)
+        self._index = {}
+        orphans = []
+        for doc in self.db.all():
+            hsh = doc.get('hsh')
+            last_updated = doc.get('last_updated')
+            if not hsh or not last_updated:
+                continue
+            if hsh in self._index:
+                # Keep only the newest record for a listing
+                if self._index[hsh][0] > last_updated:
+                    orphans.append(doc.doc_id)
+                    continue
+                orphans.append(self._index[hsh][1])
+            self._index[hsh] = (last_updated, doc.doc_id)
+        if orphans:
+            self.db.remove(doc_ids=orphans)
+        # (last_updated, hsh) pairs, oldest first
+        self._expiry = sorted((last_updated, hsh) for hsh, (last_updated, doc_id) in self._index.items())
+
+    def _unindex(self, hsh):
+        last_updated, doc_id = self._index.pop(hsh)
+        i = bisect.bisect_left(self._expiry, (last_updated, hsh))
+        del self._expiry[i]
+        return doc_id
+
+    def contains(self, hsh, since=None):
+        entry = self._index.get(hsh)
+        return entry is not None and (since is None or entry[0] >= since)
+
+    def get(self, hsh, since=None):
+        if not self.contains(hsh, since):
+            return None
+        return self.db.get(doc_id=self._index[hsh][1])
+
+    def insert(self, record):
+        hsh = record['hsh']
+        if hsh in self._index:
+            doc_id = self._unindex(hsh)
+            self.db.update(record, doc_ids=[doc_id])
+        else:
+            doc_id = self.db.insert(record)
+        self._index[hsh] = (record['last_updated'], doc_id)
+        bisect.insort(self._expiry, (record['last_updated'], hsh))
+
+    def insert_many(self, records):
+        # Last record wins if a listing appears more than once
+        records = dict((r['hsh'], r) for r in records).values()
+        replaced = [self._unindex(r['hsh']) for r in records if r['hsh'] in self._index]
+        if replaced:
+            self.db.remove(doc_ids=replaced)
+        doc_ids = self.db.insert_multiple(records)
+        for record, doc_id in zip(records, doc_ids):
+            self._index[record['hsh']] = (record['last_updated'], doc_id)
+            bisect.insort(self._expiry, (record['last_updated'], record['hsh']))
+
+    def remove(self, hsh):
+        if hsh in self._index:
+            self.db.remove(doc_ids=[self._unindex(hsh)])
+
+    def remove_older_than(self, cutoff, limit=None):
+        """
+        Remove up to limit records last updated before cutoff, oldest first,
+        in a single write. Returns the number of records removed.
+        """
+        end = bisect.bisect_left(self._expiry, (cutoff,))
+        if limit is not None:
+            end = min(end, limit)
+        if end == 0:
+            return 0
+        expired = self._expiry[:end]
+        del self._expiry[:end]
+        doc_ids = [self._index.pop(hsh)[1] for last_updated, hsh in expired]
+        self.db.remove(doc_ids=doc_ids)
+        return len(doc_ids)
+
+    def all(self):
+        return self.db.all()
+
+    def close(self):
+        self.db.close()
+
+
+class SQLiteStorage(object):
+    """
+    ListCache storage on a SQLite database in WAL mode, keyed on hsh
+    """
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS listings ('
+        'hsh TEXT PRIMARY KEY, '
+        'last_updated TEXT NOT NULL, '
+        'data TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS listings_last_updated ON listings (last_updated)'
+    )
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # WAL keeps the database consistent with NORMAL; only the most recent
+        # commits can be lost on power failure, which is fine for a cache
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            for statement in SQLiteStorage.SCHEMA:
+                self.conn.execute(statement)
+
+    @staticmethod
+    def _row(record):
+        return (record['hsh'], record['last_updated'], json.dumps(record))
+
+    def contains(self, hsh, since=None):
+        cur = self.conn.execute('SELECT 1 FROM listings WHERE hsh = ? AND last_updated >= ?', (hsh, since or ''))
+        return cur.fetchone() is not None
+
+    def get(self, hsh, since=None):
+        cur = self.conn.execute('SELECT data FROM listings WHERE hsh = ? AND last_updated >= ?', (hsh, since or ''))
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def insert(self, record):
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO listings (hsh, last_updated, data) VALUES (?, ?, ?)', SQLiteStorage._row(record))
+
+    def insert_many(self, records):
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO listings (hsh, last_updated, data) VALUES (?, ?, ?)', [SQLiteStorage._row(r) for r in records])
+
+    def remove(self, hsh):
+        with self.conn:
+            self.conn.execute('DELETE FROM listings WHERE hsh = ?', (hsh,))
+
+    def remove_older_than(self, cutoff, limit=None):
+        """
+        Remove up to limit records last updated before cutoff, oldest first,
+        walking the last_updated index. Returns the number of records removed.
+        """
+        with self.conn:
+            if limit is None:
+                cur = self.conn.execute('DELETE FROM listings WHERE last_updated < ?', (cutoff,))
+            else:
+                cur = self.conn.execute(
+                    'DELETE FROM listings WHERE hsh IN '
+                    '(SELECT hsh FROM listings WHERE last_updated < ? ORDER BY last_updated LIMIT ?)',
+                    (cutoff, limit)
+                )
+        return cur.rowcount
+
+    def all(self):
+        cur = self.conn.execute('SELECT data FROM listings')
+        return [json.loads(row[0]) for row in cur]
+
+    def close(self):
+        self.conn.close()
+
+    def migrate_from_tinydb(self, tinydb_path):
+        """
+        Copy every record of a TinyDB ListCache file into this database and
+        return the number of records copied. Records without a hsh or
+        last_updated are skipped, and of several records for a listing only
+        the newest is copied, as TinyDBStorage would read it.
+        """
+        db = TinyDB(tinydb_path)
+        try:
+            newest = {}
+            for r in db.all():
+                hsh = r.get('hsh')
+                if not hsh or not r.get('last_updated'):
+                    continue
+                if hsh not in newest or newest[hsh]['last_updated'] <= r['last_updated']:
+                    newest[hsh] = r
+        finally:
+            db.close()
+        self.insert_many(newest.values())
+        return len(newest)
+
+
+class FingerprintStore(object):
+    """
+    Fingerprint of every listing seen by the last crawl, keyed on MLS id or
+    hsh, with the listing itself, on a SQLite database
+    """
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS fingerprints ('
+        'key TEXT PRIMARY KEY, '
+        'fingerprint TEXT NOT NULL, '
+        'last_seen TEXT NOT NULL, '
+        'data TEXT NOT NULL)',
+    )
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            for statement in FingerprintStore.SCHEMA:
+                self.conn.execute(statement)
+
+    def fingerprints(self):
+        """
+        Dictionary of key to fingerprint
+        """
+        return dict(self.conn.execute('SELECT key, fingerprint FROM fingerprints'))
+
+    def get(self, key):
+        row = self.conn.execute('SELECT data FROM fingerprints WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def apply(self, upserts, removed, last_seen):
+        """
+        In one transaction, store the (key, fingerprint, record) upserts and
+        delete the removed keys
+        """
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO fingerprints (key, fingerprint, last_seen, data) VALUES (?, ?, ?, ?)',
+                [(key, fingerprint, last_seen, json.dumps(record)) for key, fingerprint, record in upserts]
+            )
+            self.conn.executemany('DELETE FROM fingerprints WHERE key = ?', [(key,) for key in removed])
+
+    def close(self):
+        self.conn.close()
+
+
+class LRUStorage(object):
+    """
+    Bounded in-memory LRU tier in front of another ListCache storage
+
+    Records read from or written to the backing storage are kept in memory
+    (at most max_size of them, each for at most ttl seconds if given).
+    Inserts are held back and written to the backing storage in batches of
+    flush_size, and on flush() and close().
+    """
+    def __init__(self, storage, max_size=1000, ttl=None, flush_size=100):
+        self.storage = storage
+        self.max_size = max_size
+        self.ttl = ttl
+        self.flush_size = flush_size
+        # hsh -> (loaded_at, record), least recently used first
+        self._lru = OrderedDict()
+        # hsh -> record, waiting to be written to storage
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._lru),
+            'pending': len(self._pending)
+        }
+
+    def _remember(self, record):
+        hsh = record['hsh']
+        self._lru.pop(hsh, None)
+        self._lru[hsh] = (time.time(), record)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    def _lookup(self, hsh):
+        """
+        (record, in_memory): the record of hsh or None, and whether it was
+        found without reading the backing storage
+        """
+        entry = self._lru.pop(hsh, None)
+        if entry is not None:
+            loaded_at, record = entry
+            if self.ttl is None or time.time() - loaded_at < self.ttl:
+                self._lru[hsh] = entry
+                return record, True
+            self.evictions += 1
+        # Records evicted before being flushed are still readable
+        record = self._pending.get(hsh)
+        in_memory = record is not None
+        if record is None:
+            record = self.storage.get(hsh)
+        if record is not None:
+            self._remember(record)
+        return record, in_memory
+
+    def contains(self, hsh, since=None):
+        """
+        Whether hsh is cached (updated since since), without counting a hit
+        or a miss or loading the record into memory
+        """
+        entry = self._lru.get(hsh)
+        if entry is not None and (self.ttl is None or time.time() - entry[0] < self.ttl):
+            record = entry[1]
+        else:
+            record = self._pending.get(hsh)
+            if record is None:
+                return self.storage.contains(hsh, since)
+        return since is None or record['last_updated'] >= since
+
+    def get(self, hsh, since=None):
+        record, in_memory = self._lookup(hsh)
+        if record is None or (since is not None and record['last_updated'] < since):
+            self.misses += 1
+            return None
+        if in_memory:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return record
+
+    def insert(self, record):
+        self._remember(record)
+        self._pending[record['hsh']] = record
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def insert_many(self, records):
+        for record in records:
+            self._remember(record)
+            self._pending[record['hsh']] = record
+        self.flush()
+
+    def remove(self, hsh):
+        self._lru.pop(hsh, None)
+        self._pending.pop(hsh, None)
+        self.storage.remove(hsh)
+
+    def remove_older_than(self, cutoff, limit=None):
+        self.flush()
+        for hsh in [h for h, (loaded_at, r) in self._lru.items() if r['last_updated'] < cutoff]:
+            del self._lru[hsh]
+        return self.storage.remove_older_than(cutoff, limit=limit)
+
+    def all(self):
+        self.flush()
+        return self.storage.all()
+
+    def flush(self):
+        if self._pending:
+            self.storage.insert_many(self._pending.values())
+            self._pending = {}
+
+    def close(self):
+        self.flush()
+        self.storage.close()
@@ -0,0 +1,160 @@
+# zestimates.py
+#
+# Zestimate valuation fields from many Zillow responses as typed NumPy
+# columns, one row per listing hsh, so scoring can run vectorized.
+
+import zillowparse
+
+from lazy import LazyImport
+
+np = LazyImport('numpy')
+
+
+class ZestimateFrame(object):
+    """
+    ZestimateFrame class
+
+    Float columns are NaN where the field is missing and int columns are
+    MISSING_INT. Where a response has several results, the one with the
+    largest amount is kept.
+    """
+    FLOAT_COLUMNS = ('amount', 'low', 'high', 'value_change', 'one_week_change', 'percentile')
+    INT_COLUMNS = ('value_change_duration',)
+    OBJECT_COLUMNS = ('zpid',)
+    MISSING_INT = -1
+
+    def __init__(self, results_by_hsh=None):
+        """
+        results_by_hsh is a dictionary or an iterable of (hsh, results) pairs,
+        where results are dictionaries as returned by ZillAPI.get_results
+        """
+        if np.load() is None:
+            raise ImportError("ZestimateFrame requires numpy")
+        if hasattr(results_by_hsh, 'items'):
+            results_by_hsh = results_by_hsh.items()
+        hshes = []
+        rows = []
+        for hsh, results in results_by_hsh or ():
+            hshes.append(hsh)
+            rows.append(ZestimateFrame.pick_result(results))
+        self._hshes = np.empty(len(hshes), dtype=object)
+        self._hshes[:] = hshes
+        self._index = dict((hsh, i) for i, hsh in enumerate(hshes))
+        self._arrays = {}
+        for name in ZestimateFrame.FLOAT_COLUMNS:
+            self._arrays[name] = np.array([ZestimateFrame.to_float(row.get(name)) for row in rows], dtype=np.float64)
+        for name in ZestimateFrame.INT_COLUMNS:
+            self._arrays[name] = np.array([ZestimateFrame.to_int(row.get(name)) for row in rows], dtype=np.int32)
+        for name in ZestimateFrame.OBJECT_COLUMNS:
+            arr = np.empty(len(rows), dtype=object)
+            arr[:] = [row.get(name) for row in rows]
+            self._arrays[name] = arr
+
+    def __len__(self):
+        return len(self._hshes)
+
+    def __contains__(self, hsh):
+        return hsh in self._index
+
+    def __repr__(self):
+        return "<ZestimateFrame: %d listings>" % len(self)
+
+    @classmethod
+    def column_names(cls):
+        return cls.FLOAT_COLUMNS + cls.INT_COLUMNS + cls.OBJECT_COLUMNS
+
+    @classmethod
+    def from_responses(cls, responses):
+        """
+        responses is a dictionary or an iterable of (hsh, response) pairs; a
+        response is the raw GetSearchResults bytes, a file-like object, a
+        searchresults object or a list of result dictionaries
+        """
+        if hasattr(responses, 'items'):
+            responses = responses.items()
+        return cls((hsh, ZestimateFrame.response_results(response)) for hsh, response in responses)
+
+    @staticmethod
+    def response_results(response):
+        if response is None:
+            return []
+        if isinstance(response, list):
+            return response
+        if hasattr(response, 'response'):
+            return zillowparse.object_results(response)
+        return zillowparse.parse_results(response)
+
+    @staticmethod
+    def pick_result(results):
+        best = {}
+        best_amount = None
+        for result in results:
+            amount = ZestimateFrame.to_float(result.get('amount'))
+            if amount != amount:
+                amount = None
+            if not best or (amount is not None and (best_amount is None or amount > best_amount)):
+                best = result
+                best_amount = amount
+        return best
+
+    @staticmethod
+    def to_float(f):
+        try:
+            return float(f)
+        except (TypeError, ValueError):
+            return np.nan
+
+    @staticmethod
+    def to_int(i):
+        try:
+            return int(i)
+        except (TypeError, ValueError):
+            return ZestimateFrame.MISSING_INT
+
+    @property
+    def hshes(self):
+        return self._hshes
+
+    def column(self, name):
+        return self._arrays[name]
+
+    def index(self, hsh):
+        return self._index[hsh]
+
+    def row(self, hsh):
+        i = self._index[hsh]
+        row = {}
+        for name in self.column_names():
+            v = self._arrays[name][i]
+            if name in ZestimateFrame.FLOAT_COLUMNS:
+                v = None if np.isnan(v) else float(v)
+            elif name in ZestimateFrame.INT_COLUMNS:
+                v = None if v == ZestimateFrame.MISSING_INT else int(v)
+            row[name] = v
+        return row
+
+    def align(self, hshes):
+        """
+        New ZestimateFrame with one row per hsh given, in that order, e.g.
+        [listing.hsh for listing in frame]; hshes not held here get missing
+        values
+        """
+        hshes = list(hshes)
+        indexes = np.array([self._index.get(hsh, -1) for hsh in hshes], dtype=np.intp)
+        missing = indexes < 0
+        frame = ZestimateFrame.__new__(ZestimateFrame)
+        frame._hshes = np.empty(len(hshes), dtype=object)
+        frame._hshes[:] = hshes
+        frame._index = dict((hsh, i) for i, hsh in enumerate(hshes))
+        frame._arrays = {}
+        for name, arr in self._arrays.items():
+            # Index with a valid row, then blank the missing ones
+            taken = arr[np.where(missing, 0, indexes)] if len(arr) else np.empty(len(hshes), dtype=arr.dtype)
+            if name in ZestimateFrame.FLOAT_COLUMNS:
+                taken[missing] = np.nan
+            elif name in ZestimateFrame.INT_COLUMNS:
+                taken[missing] = ZestimateFrame.MISSING_INT
+            else:
+                taken[missing] = None
+            frame._arrays[name] = taken
+        return frame
@@ -0,0 +1,104 @@
+# zillowparse.py
+#
+# Fast path for Zillow GetSearchResults responses. Pulls the zestimate fields
+# out of the response with lxml iterparse, without building the generateDS
+# object model in searchresults.py, and frees each <result> once read.
+
+from lxml import etree as etree_
+
+try:
+    # cStringIO reads straight from the string it wraps instead of copying it
+    from cStringIO import StringIO as BytesReader
+except ImportError:
+    from io import BytesIO as BytesReader
+
+
+def _text(node, path):
+    child = node.find(path)
+    if child is None:
+        return None
+    # Same as valueOf_ in the generated bindings: empty elements give ''
+    return child.text or ''
+
+
+def _result_dict(result):
+    zestimate = result.find('zestimate')
+    if zestimate is None:
+        zestimate = etree_.Element('zestimate')
+    amount = zestimate.find('amount')
+    value_change = zestimate.find('valueChange')
+    return {
+        'zpid': _text(result, 'zpid'),
+        'amount': _text(zestimate, 'amount'),
+        'currency': amount.get('currency') if amount is not None else None,
+        'last_updated': _text(zestimate, 'last-updated'),
+        'low': _text(zestimate, 'valuationRange/low'),
+        'high': _text(zestimate, 'valuationRange/high'),
+        'value_change': _text(zestimate, 'valueChange'),
+        'value_change_duration': value_change.get('duration') if value_change is not None else None,
+        'one_week_change': _text(zestimate, 'oneWeekChange'),
+        'percentile': _text(zestimate, 'percentile')
+    }
+
+
+def _value(obj):
+    if obj is None:
+        return None
+    return obj.valueOf_ or ''
+
+
+def _object_dict(result):
+    # Zestimate and SimpleZestimate bindings; the latter has no change fields
+    zestimate = getattr(result, 'zestimate', None)
+    amount = getattr(zestimate, 'amount', None)
+    valuation_range = getattr(zestimate, 'valuationRange', None)
+    value_change = getattr(zestimate, 'valueChange', None)
+    duration = getattr(value_change, 'duration', None)
+    zpid = getattr(result, 'zpid', None)
+    return {
+        'zpid': str(zpid) if zpid is not None else None,
+        'amount': _value(amount),
+        'currency': getattr(amount, 'currency', None),
+        'last_updated': getattr(zestimate, 'last_updated', None),
+        'low': _value(getattr(valuation_range, 'low', None)),
+        'high': _value(getattr(valuation_range, 'high', None)),
+        'value_change': _value(value_change),
+        'value_change_duration': str(duration) if duration is not None else None,
+        'one_week_change': _value(getattr(zestimate, 'oneWeekChange', None)),
+        'percentile': getattr(zestimate, 'percentile', None)
+    }
+
+
+def iter_results(source):
+    """
+    Yield a dictionary per <response>/<results>/<result> with the zpid, the
+    zestimate amount and currency, last_updated, the valuation range low and
+    high, the value change and its duration, the one week change and the
+    percentile, as strings (None where the element is missing). source is
+    the raw response bytes or a file-like object.
+    """
+    if isinstance(source, bytes):
+        source = BytesReader(source)
+    for event, node in etree_.iterparse(source, events=('end',), tag='result'):
+        parent = node.getparent()
+        if parent is None or parent.tag != 'results':
+            continue
+        yield _result_dict(node)
+        node.clear()
+        # Drop the results already read so the tree never grows
+        while node.getprevious() is not None:
+            del parent[0]
+
+
+def parse_results(source):
+    return list(iter_results(source))
+
+
+def object_results(sr):
+    """
+    The same dictionaries as iter_results, from a searchresults object
+    already built by the generated bindings
+    """
+    if not sr.response or not sr.response.results:
+        return []
+    return [_object_dict(result) for result in sr.response.results.result]
@@ -8,6 +8,9 @@ setup(
         'tinydb',
         'lxml',
     ],
+    extras_require={
+        'columnar': ['numpy'],
+    },
     version = '0.6.4',
     description = 'Python module to search Redfin and combine with results from the Zillow API',
     author = 'AlThor880',
@@ -0,0 +1,64 @@
+# helpers.py
+#
+# Shared by the tests: sample listings, a stand-in for ZillAPI, and a fixed
+# RFAPI user agent. Importing it also puts benchmarks/ on the path, for the
+# stub servers and synthetic documents kept there.
+
+import os
+import sys
+import threading
+import time
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks')
+if BENCHMARKS not in sys.path:
+    sys.path.insert(0, BENCHMARKS)
+
+from househunt import House, Listing, RFAPI
+
+
+def listing(i, **fields):
+    """
+    Listing of house number i on Wallaby Way, with fields set on the listing
+    """
+    return Listing(house=House(street_address="%d Wallaby Way" % i, city='Sydney', state='MA', zip_code='02134'), **fields)
+
+
+def house_number(street_address):
+    return int(street_address.split()[0])
+
+
+class FakeZillAPI(object):
+    """
+    Stands in for ZillAPI, counting lookups and taking delay seconds per
+    lookup; lookups of the houses in fail raise IOError. The zestimate of
+    house number i is 100000 + i.
+    """
+    def __init__(self, fail=(), delay=0):
+        self.fail = set(fail)
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_results(self, house):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if house.street_address in self.fail:
+            raise IOError("lookup failed")
+        return [house.street_address]
+
+    def zestimate_from_results(self, results):
+        return 100000.0 + house_number(results[0])
+
+    def close(self):
+        pass
+
+
+def patch_user_agent(test):
+    """
+    Give RFAPI a fixed user agent until test is over; fake_useragent may
+    need the network, and the stubs do not care
+    """
+    test.addCleanup(setattr, RFAPI, 'random_user_agent', RFAPI.__dict__['random_user_agent'])
+    RFAPI.random_user_agent = staticmethod(lambda: 'househunt-test')
@@ -0,0 +1,117 @@
+# test_archive.py
+#
+# ResponseArchive: streaming record and replay, and RFAPI replaying paged
+# downloads with a different page_workers than the recording.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from househunt import RFAPI
+from househunt.archive import ResponseArchive, ArchiveMiss, lzma
+from househunt.httppool import HTTPPool
+from helpers import patch_user_agent
+from redfin_stub import RedfinStub
+
+URL = 'http://www.example.com/data.csv?b=2&a=1'
+
+
+class ResponseArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_streaming_record(self):
+        # Random hex compresses to about half, so the body spans several reads
+        chunks = [os.urandom(4096).encode('hex') for i in range(50)]
+        with ResponseArchive(self.directory, mode='record') as archive:
+            recorder = archive.record(ResponseArchive.REDFIN, URL, iter(chunks))
+            self.assertEqual(next(recorder), chunks[0])
+            # Nothing is indexed until the body is complete
+            self.assertNotIn((ResponseArchive.REDFIN, URL), archive)
+            self.assertEqual(list(recorder), chunks[1:])
+            self.assertIn((ResponseArchive.REDFIN, URL), archive)
+        with ResponseArchive(self.directory) as archive:
+            replayed = list(archive.chunks(ResponseArchive.REDFIN, 'http://WWW.example.com/data.csv?a=1&b=2'))
+            self.assertGreater(len(replayed), 1)
+            self.assertEqual(''.join(replayed), ''.join(chunks))
+            self.assertEqual(archive.entries()[0]['size'], len(''.join(chunks)))
+
+    def test_partial_read_is_not_recorded(self):
+        with ResponseArchive(self.directory, mode='record') as archive:
+            recorder = archive.record(ResponseArchive.REDFIN, URL, iter(['a', 'b', 'c']))
+            next(recorder)
+            recorder.close()
+            self.assertEqual(len(archive), 0)
+        self.assertEqual(sorted(os.listdir(self.directory)), sorted([ResponseArchive.DATA_FILE, ResponseArchive.INDEX_FILE]))
+
+    def test_append_and_private_params(self):
+        url = 'http://www.zillow.com/webservice/GetSearchResults.htm?zws-id=X1-secret&address=1+Main+St'
+        with ResponseArchive(self.directory, mode='record') as archive:
+            archive.add(ResponseArchive.ZILLOW, url, '<old/>')
+        with ResponseArchive(self.directory, mode='record') as archive:
+            archive.add(ResponseArchive.ZILLOW, url, '<new/>')
+            archive.add(ResponseArchive.REDFIN, URL, '')
+        with ResponseArchive(self.directory) as archive:
+            self.assertEqual(archive.get(ResponseArchive.ZILLOW, url.replace('X1-secret', 'X1-other')), '<new/>')
+            self.assertEqual(archive.get(ResponseArchive.REDFIN, URL), '')
+            self.assertRaises(ArchiveMiss, archive.get, ResponseArchive.REDFIN, url)
+        with open(os.path.join(self.directory, ResponseArchive.INDEX_FILE)) as f:
+            self.assertNotIn('X1-secret', f.read())
+
+    @unittest.skipIf(lzma is None, "lzma is not available")
+    def test_lzma(self):
+        with ResponseArchive(self.directory, mode='record', compression='lzma') as archive:
+            archive.add(ResponseArchive.REDFIN, URL, 'x' * 100000)
+        with ResponseArchive(self.directory) as archive:
+            self.assertEqual(archive.get(ResponseArchive.REDFIN, URL), 'x' * 100000)
+
+
+class RFAPIReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.http_pool = HTTPPool()
+        patch_user_agent(self)
+
+    def tearDown(self):
+        self.http_pool.close()
+        shutil.rmtree(self.directory)
+
+    def load(self, dl_url, region_ids, archive, **kwargs):
+        rf_api = RFAPI(http_pool=self.http_pool, archive=archive, **kwargs)
+        rf_api.DL_URL = dl_url
+        rf_api.region_ids = list(region_ids)
+        rf_api.build_dl_urls()
+        rf_api.retrieve_dls()
+        return rf_api
+
+    def test_replay_with_other_page_workers(self):
+        # 1200 rows per region, 500 per page: three pages each
+        with RedfinStub(rows_per_region=1200) as stub:
+            dl_url = stub.url
+            with ResponseArchive(self.directory, mode='record') as archive:
+                recorded = self.load(dl_url, [9000, 9001], archive, page_workers=1)
+            self.http_pool.close()
+        self.assertEqual(len(recorded.result_sets), 2400)
+
+        with ResponseArchive(self.directory) as archive:
+            self.assertEqual(len(archive), 6)
+            for page_workers in (1, 2, 4):
+                replayed = self.load(dl_url, [9000, 9001], archive, page_workers=page_workers)
+                self.assertEqual(replayed.result_sets, recorded.result_sets)
+            streamed = RFAPI(archive=archive)
+            streamed.DL_URL = dl_url
+            streamed.region_ids = [9000, 9001]
+            streamed.build_dl_urls()
+            self.assertEqual(len(list(streamed.iter_listings())), 2400)
+            # The first page of a region is never made up
+            self.assertRaises(ArchiveMiss, self.load, dl_url, [9002], archive)
+
+
+if __name__ == '__main__':
+    unittest.main()
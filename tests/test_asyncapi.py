@@ -0,0 +1,134 @@
+# test_asyncapi.py
+#
+# AsyncZillAPI and AsyncRFAPI against the local Zillow and Redfin stubs, over
+# real sockets.
+
+import time
+import unittest
+
+from househunt import AsyncZillAPI, AsyncRFAPI
+from househunt.httppool import HTTPPool
+from helpers import listing, patch_user_agent
+from redfin_stub import RedfinStub
+from zillow_stub import ZillowStub, zestimate
+
+
+class AsyncZillAPITest(unittest.TestCase):
+
+    def setUp(self):
+        # A pool of its own, closed before the stub's threads go away
+        self.http_pool = HTTPPool()
+
+    def tearDown(self):
+        self.http_pool.close()
+
+    def client(self, stub, **kwargs):
+        z_api = AsyncZillAPI(zwsid='X1-test', http_pool=self.http_pool, **kwargs)
+        z_api.ZIL_URL = stub.url
+        return z_api
+
+    def test_concurrent_zestimates(self):
+        listings = [listing(i) for i in range(1, 17)]
+        with ZillowStub(delay=0.1) as stub:
+            with self.client(stub, max_in_flight=8) as z_api:
+                start = time.time()
+                result = z_api.get_zestimates_async(listings).get(10)
+                elapsed = time.time() - start
+        self.assertEqual(result, listings)
+        self.assertEqual([l.zestimate for l in listings], [zestimate(l.house.street_address) for l in listings])
+        self.assertEqual(stub.requests, 16)
+        # Concurrent, but never more than max_in_flight at once
+        self.assertGreater(stub.max_in_flight, 1)
+        self.assertLessEqual(stub.max_in_flight, 8)
+        # Two rounds of 8, not 16 requests one after the other
+        self.assertLess(elapsed, 1.0)
+
+    def test_get_from_zillow_async(self):
+        with ZillowStub() as stub:
+            with self.client(stub) as z_api:
+                sr = z_api.get_from_zillow_async(listing(3).house).get(10)
+        amounts = [r.zestimate.amount.valueOf_ for r in sr.response.results.result]
+        self.assertEqual(amounts, [str(int(zestimate('3 Wallaby Way')))])
+
+    def test_failure_is_isolated(self):
+        listings = [listing(i) for i in range(1, 5)]
+        with ZillowStub(fail_addresses=['2 Wallaby Way']) as stub:
+            with self.client(stub) as z_api:
+                results = [z_api.get_zestimate_async(l) for l in listings]
+                for i, result in enumerate(results):
+                    if i == 1:
+                        self.assertRaises(Exception, result.get, 10)
+                    else:
+                        self.assertEqual(result.get(10).zestimate, zestimate(listings[i].house.street_address))
+
+    def test_timeout(self):
+        with ZillowStub(delay=1) as stub:
+            with self.client(stub, timeout=0.2) as z_api:
+                result = z_api.get_zestimate_async(listing(1))
+                start = time.time()
+                self.assertRaises(Exception, result.get, 10)
+                self.assertLess(time.time() - start, 0.9)
+
+
+class AsyncRFAPITest(unittest.TestCase):
+
+    def setUp(self):
+        self.http_pool = HTTPPool()
+        patch_user_agent(self)
+
+    def tearDown(self):
+        self.http_pool.close()
+
+    def client(self, stub, region_ids, **kwargs):
+        rf_api = AsyncRFAPI(http_pool=self.http_pool, **kwargs)
+        rf_api.DL_URL = stub.url
+        rf_api.region_ids = list(region_ids)
+        rf_api.build_dl_urls()
+        return rf_api
+
+    def test_concurrent_downloads(self):
+        region_ids = range(9000, 9008)
+        with RedfinStub(rows_per_region=20, delay=0.1, fail_regions=[9003]) as stub:
+            with self.client(stub, region_ids, max_in_flight=8, host_limit=8) as rf_api:
+                start = time.time()
+                results = rf_api.retrieve_dls_async().get(10)
+                elapsed = time.time() - start
+        self.assertEqual(len(results), 8)
+        self.assertEqual([error is None for rows, error in results], [region_id != 9003 for region_id in region_ids])
+        self.assertEqual([len(rows) for rows, error in results if error is None], [20] * 7)
+        # Concurrent, but never more than max_in_flight at once
+        self.assertGreater(stub.max_in_flight, 1)
+        self.assertLessEqual(stub.max_in_flight, 8)
+        self.assertLess(elapsed, 0.6)
+
+    def test_load_listings_async(self):
+        with RedfinStub(rows_per_region=30, delay=0.05) as stub:
+            with self.client(stub, [9000, 9001], max_in_flight=2) as rf_api:
+                loaded = rf_api.load_listings_async().get(10)
+        self.assertIs(loaded, rf_api)
+        self.assertEqual(len(rf_api.listings), 60)
+        self.assertEqual(rf_api.listings[0].mls_id, '9000-00000')
+        self.assertEqual(rf_api.listings[0].list_price, 300000.0)
+
+    def test_pagination(self):
+        # 1200 rows per region, 500 per page: three pages each
+        with RedfinStub(rows_per_region=1200) as stub:
+            with self.client(stub, [9000, 9001], page_workers=2) as rf_api:
+                self.assertEqual((rf_api.paginate, rf_api.page_workers), (True, 2))
+                results = rf_api.retrieve_dls_async().get(10)
+            self.assertEqual([len(rows) for rows, error in results], [1200, 1200])
+            with self.client(stub, [9000], paginate=False) as rf_api:
+                (rows, error), = rf_api.retrieve_dls_async().get(10)
+            self.assertEqual(len(rows), 500)
+
+    def test_timeout(self):
+        with RedfinStub(delay=1) as stub:
+            with self.client(stub, [9000], timeout=0.2) as rf_api:
+                start = time.time()
+                (rows, error), = rf_api.retrieve_dls_async().get(10)
+                self.assertIsNotNone(error)
+                self.assertLess(time.time() - start, 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
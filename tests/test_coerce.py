@@ -0,0 +1,42 @@
+# test_coerce.py
+#
+# FieldSchema: rows read as dicts and as lists coerce alike.
+
+import unittest
+
+from househunt.coerce import FieldSchema, to_float
+
+SCHEMA = FieldSchema([
+    ('price', 'LIST PRICE', to_float),
+    ('beds', 'BEDS', to_float),
+    ('city', 'CITY', None),
+])
+
+
+class FieldSchemaTest(unittest.TestCase):
+
+    def test_rows_and_lists_agree(self):
+        rows = [
+            {'LIST PRICE': '450000', 'BEDS': '', 'CITY': 'Seattle'},
+            {'LIST PRICE': 'n/a', 'BEDS': '3', 'CITY': ''},
+        ]
+        expected = [
+            {'price': 450000.0, 'beds': '', 'city': 'Seattle'},
+            {'price': 'n/a', 'beds': 3.0, 'city': ''},
+        ]
+        self.assertEqual(list(SCHEMA.coerce_rows(rows)), expected)
+        header = ['CITY', 'BEDS', 'LIST PRICE']
+        indexes = {'price': 2, 'beds': 1, 'city': 0}
+        lists = [[row[h] for h in header] for row in rows]
+        self.assertEqual([SCHEMA.coerce_list(row, indexes) for row in lists], expected)
+        # A page with another column order
+        self.assertEqual(SCHEMA.coerce_list(['3', 'Tacoma', '1'], {'price': 0, 'beds': 2, 'city': 1}),
+                         {'price': 3.0, 'beds': 1.0, 'city': 'Tacoma'})
+
+    def test_rows_missing_a_header_are_skipped(self):
+        rows = [{'LIST PRICE': '1', 'CITY': 'Seattle'}, {'LIST PRICE': '2', 'BEDS': '1', 'CITY': 'Kent'}]
+        self.assertEqual([values['city'] for values in SCHEMA.coerce_rows(rows)], ['Kent'])
+
+
+if __name__ == '__main__':
+    unittest.main()
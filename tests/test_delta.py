@@ -0,0 +1,143 @@
+# test_delta.py
+#
+# ListingDelta and its FingerprintStore: what a crawl reports against the
+# last one, and what it saves.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from househunt import ListingDelta, RFAPI
+from househunt.httppool import HTTPPool
+import helpers
+from redfin_stub import RedfinStub
+
+ADDED, CHANGED, REMOVED = ListingDelta.ADDED, ListingDelta.CHANGED, ListingDelta.REMOVED
+
+
+def listing(i, list_price=None, status='Active', mls_id=True):
+    return helpers.listing(
+        i,
+        list_price=list_price or 300000.0 + i,
+        status=status,
+        days_on_market=10.0,
+        mls_id=("7%06d" % i) if mls_id else None
+    )
+
+
+def changes(delta, listings, removals=True):
+    return sorted((kind, ListingDelta.key(l)) for kind, l in delta.diff(listings, removals=removals))
+
+
+class ListingDeltaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.delta = ListingDelta(db_file=os.path.join(self.directory, 'fingerprints.sqlite'))
+
+    def tearDown(self):
+        self.delta.close()
+        shutil.rmtree(self.directory)
+
+    def test_added_changed_unchanged(self):
+        first = [listing(1), listing(2), listing(3, mls_id=False)]
+        self.assertEqual(changes(self.delta, first), sorted((ADDED, ListingDelta.key(l)) for l in first))
+        # Unchanged listings, in another order and with a duplicate
+        self.assertEqual(changes(self.delta, [listing(3, mls_id=False), listing(2), listing(1), listing(1)]), [])
+        second = [listing(1, list_price=250000.0), listing(2, status='Pending'), listing(3, mls_id=False), listing(4)]
+        self.assertEqual(changes(self.delta, second), [
+            (ADDED, '7000004'), (CHANGED, '7000001'), (CHANGED, '7000002')
+        ])
+        stored = self.delta.store.get('7000001')
+        self.assertEqual(stored['list_price'], 250000.0)
+        self.assertEqual(changes(self.delta, second), [])
+
+    def test_removed(self):
+        changes(self.delta, [listing(1), listing(2)])
+        removed = list(self.delta.diff([listing(1)]))
+        self.assertEqual([(kind, l.mls_id) for kind, l in removed], [(REMOVED, '7000002')])
+        # Rebuilt from the stored copy
+        self.assertEqual(removed[0][1].house.street_address, '2 Wallaby Way')
+        self.assertEqual(self.delta.store.fingerprints().keys(), ['7000001'])
+        # Seen again, it is new
+        self.assertEqual(changes(self.delta, [listing(1), listing(2)]), [(ADDED, '7000002')])
+
+    def test_without_removals(self):
+        changes(self.delta, [listing(1), listing(2)])
+        self.assertEqual(changes(self.delta, [listing(1, list_price=1.0)], removals=False), [(CHANGED, '7000001')])
+        self.assertEqual(sorted(self.delta.store.fingerprints()), ['7000001', '7000002'])
+        self.assertEqual(changes(self.delta, [listing(1, list_price=1.0)]), [(REMOVED, '7000002')])
+
+    def test_stopping_early_saves_nothing(self):
+        changes(self.delta, [listing(1)])
+        fingerprints = self.delta.store.fingerprints()
+        diff = self.delta.diff([listing(1, list_price=1.0), listing(2)])
+        self.assertEqual(next(diff)[0], CHANGED)
+        diff.close()
+        self.assertEqual(self.delta.store.fingerprints(), fingerprints)
+
+    def test_fingerprints_persist(self):
+        changes(self.delta, [listing(1)])
+        self.delta.close()
+        self.delta = ListingDelta(db_file=os.path.join(self.directory, 'fingerprints.sqlite'))
+        self.assertEqual(changes(self.delta, [listing(1)]), [])
+
+
+class CrawlTest(unittest.TestCase):
+    """
+    ListingDelta over RFAPI downloads from the Redfin stub, where a region
+    can fail part way through a crawl
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.delta = ListingDelta(db_file=os.path.join(self.directory, 'fingerprints.sqlite'))
+        self.http_pool = HTTPPool()
+        helpers.patch_user_agent(self)
+        self.stub = RedfinStub(rows_per_region=20).start()
+
+    def tearDown(self):
+        self.stub.stop()
+        self.http_pool.close()
+        self.delta.close()
+        shutil.rmtree(self.directory)
+
+    def rf_api(self, region_ids, **kwargs):
+        rf_api = RFAPI(http_pool=self.http_pool, **kwargs)
+        rf_api.DL_URL = self.stub.url
+        rf_api.region_ids = list(region_ids)
+        rf_api.build_dl_urls()
+        return rf_api
+
+    def test_streamed_crawl(self):
+        kinds = [kind for kind, l in self.rf_api([9000, 9001]).iter_changes(self.delta)]
+        self.assertEqual(kinds, [ADDED] * 40)
+        self.assertEqual(list(self.rf_api([9000, 9001]).iter_changes(self.delta)), [])
+
+    def test_failed_streamed_crawl_reports_no_removals(self):
+        list(self.rf_api([9000, 9001]).iter_changes(self.delta))
+        fingerprints = self.delta.store.fingerprints()
+        self.stub.fail_regions.add(9001)
+        seen = []
+        with self.assertRaises(requests.HTTPError):
+            for kind, l in self.rf_api([9000, 9001]).iter_changes(self.delta):
+                seen.append(kind)
+        self.assertNotIn(REMOVED, seen)
+        self.assertEqual(self.delta.store.fingerprints(), fingerprints)
+
+    def test_partial_crawl_reports_no_removals(self):
+        list(self.rf_api([9000, 9001]).iter_changes(self.delta))
+        self.stub.fail_regions.add(9001)
+        rf_api = self.rf_api([9000, 9001], workers=2)
+        rf_api.retrieve_dls()
+        rf_api.dataset_to_listings()
+        self.assertEqual(len(rf_api.errors), 1)
+        self.assertEqual(list(self.delta.diff(rf_api.listings, removals=not rf_api.errors)), [])
+        self.assertEqual(len(self.delta.store.fingerprints()), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
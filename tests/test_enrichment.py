@@ -0,0 +1,107 @@
+# test_enrichment.py
+#
+# EnrichmentSession.get_zestimates with failing lookups, and the persisted
+# daily budget of RateLimiter.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from househunt import ListCache, EnrichmentSession, RateLimiter, QuotaExceeded
+from helpers import FakeZillAPI, listing
+
+
+class GetZestimatesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ListCache(backend='sqlite', db_file=os.path.join(self.directory, 'listings.sqlite'), lru_size=50, flush_size=20)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_worker_failure(self):
+        listings = [listing(i) for i in range(200)]
+        z_api = FakeZillAPI(fail=['7 Wallaby Way'])
+        with EnrichmentSession(cache=self.cache, z_api=z_api) as session:
+            session.get_zestimates(listings, workers=8)
+            self.assertEqual(z_api.calls, 200)
+            self.assertEqual(list(session.errors), [listings[7].hsh])
+            self.assertIsInstance(session.errors[listings[7].hsh], IOError)
+        self.assertIsNone(listings[7].zestimate)
+        self.assertEqual(listings[8].zestimate, 100008.0)
+
+        cache = ListCache(backend='sqlite', db_file=os.path.join(self.directory, 'listings.sqlite'))
+        cached = [l for l in listings if cache.listing_in_cache(l)]
+        self.assertEqual(len(cached), 199)
+        self.assertFalse(cache.listing_in_cache(listings[7]))
+        cache.close()
+
+    def test_sequential_failure(self):
+        listings = [listing(i) for i in range(5)]
+        z_api = FakeZillAPI(fail=['2 Wallaby Way'])
+        with EnrichmentSession(cache=self.cache, z_api=z_api) as session:
+            session.get_zestimates(listings)
+            self.assertEqual(list(session.errors), [listings[2].hsh])
+        self.assertEqual([l.zestimate is None for l in listings], [False, False, True, False, False])
+
+    def test_escaping_error_stops_the_pool(self):
+        listings = [listing(i) for i in range(200)]
+        z_api = FakeZillAPI(delay=0.01)
+
+        def insert_listing(l):
+            raise RuntimeError("cache unavailable")
+        self.cache.insert_listing = insert_listing
+        session = EnrichmentSession(cache=self.cache, z_api=z_api)
+        self.assertRaises(RuntimeError, session.get_zestimates, listings, 2)
+        self.assertLess(z_api.calls, 200)
+
+    def test_daily_budget(self):
+        limiter = RateLimiter(daily_limit=150, db_file=':memory:')
+        z_api = FakeZillAPI()
+        with EnrichmentSession(cache=self.cache, z_api=z_api, rate_limiter=limiter) as session:
+            session.get_zestimates([listing(i) for i in range(200)], workers=8)
+        self.assertEqual(z_api.calls, 150)
+        self.assertEqual(limiter.remaining_today, 0)
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.directory, 'rate_limits.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_daily_count_persists(self):
+        limiter = RateLimiter(daily_limit=3, db_file=self.db_file)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.close()
+
+        # A new process starts from the stored count
+        limiter = RateLimiter(daily_limit=3, db_file=self.db_file)
+        self.assertEqual(limiter.calls_today, 2)
+        self.assertEqual(limiter.remaining_today, 1)
+        limiter.acquire()
+        self.assertRaises(QuotaExceeded, limiter.acquire)
+        limiter.close()
+
+    def test_shared_budget(self):
+        first = RateLimiter(daily_limit=4, db_file=self.db_file)
+        second = RateLimiter(daily_limit=4, db_file=self.db_file)
+        for limiter in (first, second, first, second):
+            limiter.acquire()
+        self.assertRaises(QuotaExceeded, first.acquire)
+        self.assertRaises(QuotaExceeded, second.acquire)
+        # Budgets are kept apart by name
+        other = RateLimiter(daily_limit=4, db_file=self.db_file, name='redfin')
+        other.acquire()
+        for limiter in (first, second, other):
+            limiter.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# test_httpcache.py
+#
+# ResponseCache against the Redfin stub: freshness, revalidation, eviction
+# and offline runs.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from househunt import RFAPI
+from househunt.httpcache import ResponseCache, CacheMiss
+from househunt.httppool import HTTPPool
+from helpers import patch_user_agent
+from redfin_stub import RedfinStub
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.http_pool = HTTPPool()
+        self.stub = RedfinStub(rows_per_region=20).start()
+
+    def tearDown(self):
+        self.http_pool.close()
+        self.stub.stop()
+        shutil.rmtree(self.directory)
+
+    def url(self, region_id):
+        return "%s?region_id=%d&num_homes=500" % (self.stub.url, region_id)
+
+    def get(self, cache, url):
+        return ''.join(cache.get(self.http_pool, url))
+
+    def age(self, cache, seconds):
+        with cache.conn:
+            cache.conn.execute('UPDATE responses SET fetched = fetched - ?', (seconds,))
+
+    def test_fresh_responses_are_not_requested(self):
+        cache = ResponseCache(self.directory, max_age=3600)
+        body = self.get(cache, self.url(9000))
+        # The same download, with its parameters in another order
+        self.assertEqual(self.get(cache, "%s?num_homes=500&region_id=9000" % self.stub.url), body)
+        self.assertEqual(self.stub.requests, 1)
+        cache.close()
+
+    def test_stale_responses_are_revalidated(self):
+        cache = ResponseCache(self.directory, max_age=3600)
+        body = self.get(cache, self.url(9000))
+        self.age(cache, 7200)
+        self.assertEqual(self.get(cache, self.url(9000)), body)
+        self.assertEqual((self.stub.requests, self.stub.not_modified), (2, 1))
+        # A 304 makes the response fresh again
+        self.assertEqual(self.get(cache, self.url(9000)), body)
+        self.assertEqual(self.stub.requests, 2)
+        cache.close()
+
+    def test_changed_responses_are_replaced(self):
+        cache = ResponseCache(self.directory, max_age=0)
+        self.get(cache, self.url(9000))
+        self.stub.rows_per_region = 30
+        body = self.get(cache, self.url(9000))
+        self.assertEqual(len(body.splitlines()), 31)
+        self.assertEqual((self.stub.requests, self.stub.not_modified), (2, 0))
+        self.assertEqual(self.get(cache, self.url(9000)), body)
+        self.assertEqual(self.stub.not_modified, 1)
+        cache.close()
+
+    def test_evict(self):
+        cache = ResponseCache(self.directory, max_age=3600)
+        for region_id in (9000, 9001, 9002):
+            self.get(cache, self.url(region_id))
+        # 9000 becomes the most recently used
+        self.get(cache, self.url(9000))
+        size = os.path.getsize(cache.path(ResponseCache.key(self.url(9001))))
+        cache.max_size = cache.size - size
+        self.assertEqual(cache.evict(), 1)
+        self.assertFalse(os.path.exists(cache.path(ResponseCache.key(self.url(9001)))))
+        self.assertEqual(cache.evict(), 0)
+        self.get(cache, self.url(9000))
+        self.get(cache, self.url(9001))
+        self.assertEqual(self.stub.requests, 4)
+        cache.close()
+
+    def test_offline(self):
+        cache = ResponseCache(self.directory, max_age=0)
+        body = self.get(cache, self.url(9000))
+        cache.close()
+        cache = ResponseCache(self.directory, max_age=0, offline=True)
+        self.assertEqual(self.get(cache, self.url(9000)), body)
+        self.assertRaises(CacheMiss, cache.get, self.http_pool, self.url(9001))
+        self.assertEqual(self.stub.requests, 1)
+        cache.close()
+
+
+class RFAPIOfflineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.http_pool = HTTPPool()
+        patch_user_agent(self)
+
+    def tearDown(self):
+        self.http_pool.close()
+        shutil.rmtree(self.directory)
+
+    def load(self, dl_url, region_ids, cache, **kwargs):
+        rf_api = RFAPI(http_pool=self.http_pool, response_cache=cache, **kwargs)
+        rf_api.DL_URL = dl_url
+        rf_api.region_ids = list(region_ids)
+        rf_api.build_dl_urls()
+        rf_api.retrieve_dls()
+        return rf_api
+
+    def test_offline_with_other_page_workers(self):
+        # 1200 rows per region, 500 per page: three pages each
+        with RedfinStub(rows_per_region=1200) as stub:
+            dl_url = stub.url
+            cache = ResponseCache(self.directory)
+            cached = self.load(dl_url, [9000, 9001], cache, page_workers=1)
+            cache.close()
+        self.assertEqual(len(cached.result_sets), 2400)
+
+        cache = ResponseCache(self.directory, offline=True)
+        for page_workers in (1, 2, 4):
+            offline = self.load(dl_url, [9000, 9001], cache, page_workers=page_workers)
+            self.assertEqual(offline.result_sets, cached.result_sets)
+        # The first page of a region is never made up
+        self.assertRaises(CacheMiss, self.load, dl_url, [9002], cache)
+        failed = self.load(dl_url, [9000, 9002], cache, workers=2)
+        self.assertEqual([type(e) for e in failed.errors.values()], [CacheMiss])
+        self.assertEqual(len(failed.result_sets), 1200)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+# test_imports.py
+#
+# The package import stays cheap: lxml, numpy and the generated bindings are
+# only loaded when first used. Each case runs in a fresh interpreter.
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+HEAVY = ('lxml', 'numpy', 'househunt.searchresults', 'househunt.zestimates', 'househunt.zillowparse')
+
+
+def loaded_after(statement):
+    script = "import sys; %s; print(' '.join(m for m in %r if m in sys.modules))" % (statement, HEAVY)
+    return subprocess.check_output([sys.executable, '-c', script], cwd=ROOT).split()
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_package_import(self):
+        self.assertEqual(loaded_after('import househunt'), [])
+
+    def test_scalar_records(self):
+        self.assertEqual(loaded_after(
+            "from househunt import House, Listing; Listing(house=House(beds='3'), list_price='1').house.beds"
+        ), [])
+
+    def test_zestimate_frame(self):
+        loaded = loaded_after('from househunt import ZestimateFrame')
+        self.assertIn('lxml', loaded)
+        self.assertIn('househunt.zestimates', loaded)
+        self.assertNotIn('househunt.searchresults', loaded)
+
+    def test_listing_frame(self):
+        self.assertIn('numpy', loaded_after('import househunt; househunt.ListingFrame()'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# test_records.py
+#
+# House and Listing records: pickling of the slotted classes.
+
+import cPickle
+import pickle
+import unittest
+
+from househunt import House, Listing
+
+
+def sample_listing():
+    h = House(
+        street_address='42 Wallaby Way',
+        city='Sydney',
+        state='MA',
+        zip_code='02134',
+        beds='3',
+        baths='1.5',
+        sq_ft='',
+        parking='2',
+        parking_type='Garage',
+        lot_size='5000',
+        home_type='Condo/Co-op'
+    )
+    return Listing(house=h, list_price='450000', days_on_market='12', status='Active', mls_id='7000001')
+
+
+class PickleTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        listing = sample_listing()
+        for module in (pickle, cPickle):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                copy = module.loads(module.dumps(listing, protocol))
+                self.assertEqual(copy.as_dict(), listing.as_dict())
+                self.assertEqual(copy.hsh, listing.hsh)
+
+    def test_unset_slots(self):
+        h = House.__new__(House)
+        h._city = 'Boston'
+        copy = pickle.loads(pickle.dumps(h, 0))
+        self.assertEqual(copy.city, 'Boston')
+        self.assertIsNone(copy.zip_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
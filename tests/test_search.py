@@ -0,0 +1,119 @@
+# test_search.py
+#
+# ListingFrame.matches_search against the scalar House/Listing searches over
+# Redfin rows with blank fields.
+
+import itertools
+import unittest
+
+from househunt import House, Listing, ListingFrame, RFAPI
+
+
+def redfin_row(i, **blank):
+    fields = {
+        'street_address': "%d Wallaby Way" % i,
+        'city': 'Boston',
+        'state': 'MA',
+        'zip_code': '02134',
+        'beds': str(1 + i % 4),
+        'baths': str(1 + (i % 3) * 0.5),
+        'sq_ft': str(800 + 100 * i),
+        'parking': str(i % 3),
+        'parking_type': 'Garage',
+        'lot_size': str(2000 + 500 * i),
+        'home_type': 'Condo/Co-op',
+        'list_price': str(300000 + 25000 * i),
+        'days_on_market': str(5 * i),
+        'original_list_price': '',
+        'status': ('Active', 'Pending')[i % 2],
+        'mls_id': "7%06d" % i,
+        'open_house_date': '',
+        'open_house_start_time': '',
+        'open_house_end_time': ''
+    }
+    fields.update(blank)
+    return dict((ListingFrame.DATASET_COLUMNS[name], value) for name, value in fields.items())
+
+
+ROWS = [
+    redfin_row(0),
+    redfin_row(1, sq_ft=''),
+    redfin_row(2, list_price=''),
+    redfin_row(3, beds='', baths='', days_on_market=''),
+    redfin_row(4, parking='', lot_size='', sq_ft='n/a'),
+    redfin_row(5, list_price='', days_on_market='', sq_ft=''),
+]
+
+CRITERIA = (
+    {'beds': 2},
+    {'baths': 1.5},
+    {'sq_ft': 900},
+    {'parking': 1},
+    {'lot_size': 3000},
+    {'list_price': 350000},
+    {'days_on_market': 10},
+    {'status': 'Active'},
+    {'sq_ft': 900, 'list_price': 400000},
+    {'beds': 1, 'days_on_market': 20, 'status': 'Pending'},
+)
+
+HOUSE_CRITERIA = ('beds', 'baths', 'sq_ft', 'parking', 'lot_size')
+
+
+def scalar_matches(listing, criteria):
+    house_criteria = dict((k, v) for k, v in criteria.items() if k in HOUSE_CRITERIA)
+    listing_criteria = dict((k, v) for k, v in criteria.items() if k not in HOUSE_CRITERIA)
+    return listing.house.matches_search(**house_criteria) and listing.matches_search(**listing_criteria)
+
+
+class MatchesSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        rf_api = RFAPI()
+        rf_api.result_sets = ROWS
+        rf_api.dataset_to_listings()
+        self.listings = rf_api.listings
+        self.frame = ListingFrame.from_result_sets(ROWS)
+
+    def test_blank_fields_kept(self):
+        self.assertEqual(self.listings[1].house.sq_ft, '')
+        self.assertEqual(self.listings[2].list_price, '')
+
+    def test_frame_agrees_with_scalar(self):
+        for criteria in CRITERIA:
+            expected = [scalar_matches(listing, criteria) for listing in self.listings]
+            self.assertEqual(list(self.frame.matches_search(**criteria)), expected, criteria)
+
+    def test_blank_fields(self):
+        # Python 2 orders text above every number: a blank field meets any
+        # minimum and no maximum
+        self.assertTrue(self.listings[1].house.matches_search(sq_ft=1))
+        self.assertFalse(self.listings[2].matches_search(list_price=10 ** 9))
+        self.assertTrue(self.listings[4].house.matches_search(sq_ft=10 ** 9))
+        self.assertEqual(list(self.frame.matches_search(sq_ft=10 ** 9)), [False, True, False, False, True, True])
+        self.assertEqual(list(self.frame.matches_search(list_price=10 ** 9)), [True, True, False, True, True, False])
+        taken = self.frame.take([5, 1])
+        self.assertEqual(list(taken.matches_search(list_price=10 ** 9)), [False, True])
+        taken.set_value(0, 'list_price', 350000.0)
+        taken.set_value(1, 'list_price', '')
+        self.assertEqual(list(taken.matches_search(list_price=10 ** 9)), [True, False])
+
+    def test_none_fields(self):
+        # None never meets a minimum and always meets a maximum
+        listings = [Listing(house=House(street_address='1 Main St', beds=3)), Listing(house=House(street_address='2 Main St'))]
+        listings[0].list_price = 400000.0
+        listings[1].house.sq_ft = ''
+        frame = ListingFrame.from_listings(listings)
+        for criteria in CRITERIA:
+            expected = [scalar_matches(listing, criteria) for listing in listings]
+            self.assertEqual(list(frame.matches_search(**criteria)), expected, criteria)
+        self.assertEqual((frame.value(1, 'list_price'), frame.value(1, 'sq_ft')), (None, ''))
+
+    def test_frame_rows_agree_with_scalar(self):
+        views = self.frame.to_listings()
+        for criteria, (listing, view) in itertools.product(CRITERIA, zip(self.listings, views)):
+            self.assertEqual(scalar_matches(view, criteria), scalar_matches(listing, criteria), criteria)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# test_searchresults.py
+#
+# The generated Zillow bindings: parseBytes and the childBuilders_ dispatch
+# against parseString and the zillowparse fast path, exportBuffered against
+# export, bad numeric fields with and without validation, and subclass
+# modules.
+
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+
+from StringIO import StringIO
+
+# For benchmarks/ on the path
+import helpers
+import househunt.searchresults
+from househunt import calculators, zillowparse
+from lxml import etree
+from zillow_docs import document
+
+# househunt.searchresults is the root binding class; the module is here
+searchresults = sys.modules['househunt.searchresults']
+
+# (links, local_real_estate)
+VARIANTS = ((True, True), (False, True), (True, False), (False, False))
+
+
+def export(sr, pretty_print=True):
+    out = StringIO()
+    sr.export(out, 0, name_='searchresults', pretty_print=pretty_print)
+    return out.getvalue()
+
+
+def local_tags(xml):
+    return [etree.QName(node).localname for node in etree.fromstring(xml).iter() if isinstance(node.tag, basestring)]
+
+
+class ParseTest(unittest.TestCase):
+
+    def test_parsers_agree(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for links, local_real_estate in VARIANTS:
+            doc = document(25, links, local_real_estate)
+            path = os.path.join(directory, 'response.xml')
+            with open(path, 'wb') as f:
+                f.write(doc)
+            expected = export(searchresults.parseString(doc, silence=True))
+            self.assertEqual(export(searchresults.parseBytes(doc, silence=True)), expected)
+            self.assertEqual(export(searchresults.parse(path, silence=True)), expected)
+            self.assertEqual(export(searchresults.parseBytes(doc, silence=True, validate=False)), expected)
+
+    def test_every_element_is_built(self):
+        # An element without a builder in childBuilders_ is dropped from the
+        # export
+        for links, local_real_estate in VARIANTS:
+            doc = document(3, links, local_real_estate)
+            self.assertEqual(local_tags(export(searchresults.parseBytes(doc, silence=True))), local_tags(doc))
+
+    def test_agrees_with_fast_path(self):
+        doc = document(25)
+        sr = searchresults.parseBytes(doc, silence=True)
+        self.assertEqual(zillowparse.object_results(sr), zillowparse.parse_results(doc))
+
+    def test_typed_values(self):
+        sr = searchresults.parseBytes(document(2), silence=True)
+        result = sr.response.results.result[1]
+        self.assertEqual(result.zpid, 59000001)
+        self.assertEqual(result.address.latitude, 42.350001)
+        self.assertEqual(result.zestimate.amount.valueOf_, '401000')
+        self.assertEqual(result.zestimate.valueChange.duration, 30)
+        self.assertEqual(result.localRealEstate.region[0].name, 'Allston')
+        self.assertEqual(sr.message.code, 0)
+
+    def test_bad_numeric_field(self):
+        doc = document(2).replace('<zpid>59000001</zpid>', '<zpid>59,000,001</zpid>')
+        for validate in (True, False):
+            self.assertRaises(searchresults.GDSParseError, searchresults.parseBytes, doc, silence=True, validate=validate)
+            self.assertRaises(searchresults.GDSParseError, searchresults.parseString, doc, silence=True, validate=validate)
+
+    def test_validate_is_per_call(self):
+        default = searchresults.validating_()
+        searchresults.parseBytes(document(1), silence=True, validate=not default)
+        self.assertEqual(searchresults.validating_(), default)
+        self.assertRaises(
+            searchresults.GDSParseError,
+            searchresults.parseBytes, '<searchresults><message><code>x</code></message></searchresults>',
+            silence=True, validate=not default
+        )
+        self.assertEqual(searchresults.validating_(), default)
+
+
+class ExportBufferedTest(unittest.TestCase):
+
+    def test_same_bytes(self):
+        for links, local_real_estate in VARIANTS:
+            sr = searchresults.parseBytes(document(40, links, local_real_estate), silence=True)
+            for pretty_print in (True, False):
+                expected = export(sr, pretty_print)
+                # Small buffers flush many times, part way through the tree
+                for buffer_size in (1, 16, 8192):
+                    out = StringIO()
+                    searchresults.exportBuffered(sr, out, buffer_size=buffer_size, name_='searchresults', pretty_print=pretty_print)
+                    self.assertEqual(out.getvalue(), expected)
+
+    def test_unicode(self):
+        self.addCleanup(setattr, searchresults, 'ExternalEncoding', searchresults.ExternalEncoding)
+        searchresults.ExternalEncoding = 'utf-8'
+        doc = document(3).replace('<city>Boston</city>', '<city>S\xc3\xa3o Paulo</city>')
+        sr = searchresults.parseBytes(doc, silence=True)
+        out = StringIO()
+        searchresults.exportBuffered(sr, out, name_='searchresults')
+        self.assertEqual(out.getvalue(), export(sr))
+        self.assertIn('S\xc3\xa3o Paulo', out.getvalue())
+
+
+class SubclassModuleTest(unittest.TestCase):
+
+    def test_set_after_import(self):
+        # calculators is already loaded; the module set now still applies
+        module = types.ModuleType('subclasses')
+        module.AmountSub = type('AmountSub', (searchresults.Amount,), {})
+        module.MortgageInterestRateSub = type('MortgageInterestRateSub', (calculators.MortgageInterestRate,), {})
+        self.addCleanup(setattr, searchresults, 'CurrentSubclassModule_', searchresults.CurrentSubclassModule_)
+        searchresults.CurrentSubclassModule_ = module
+        self.assertIs(type(searchresults.Amount.factory()), module.AmountSub)
+        self.assertIs(type(calculators.MortgageInterestRate.factory()), module.MortgageInterestRateSub)
+        searchresults.CurrentSubclassModule_ = None
+        self.assertIs(type(calculators.MortgageInterestRate.factory()), calculators.MortgageInterestRate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+# test_storage.py
+#
+# The storage backends: TinyDBStorage's in-memory indexes against its file,
+# and ListCache with the in-memory LRU tier: hit and miss counts.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import datetime, timedelta
+
+from househunt import ListCache, EnrichmentSession
+from househunt import storage
+from househunt.storage import TinyDBStorage, SQLiteStorage
+from helpers import FakeZillAPI, listing
+from tinydb import TinyDB
+
+
+class FakeClock(object):
+    """
+    Stands in for the time module in storage
+    """
+    def __init__(self):
+        self.now = 1000000.0
+
+    def time(self):
+        return self.now
+
+
+def record(i, last_updated, **fields):
+    fields.update(hsh="hsh%d" % i, last_updated=last_updated)
+    return fields
+
+
+class TinyDBStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'listings.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertConsistent(self, db):
+        """
+        The index and expiry list of db describe exactly the records in its
+        file, one per hsh, and so do those of the file opened again
+        """
+        raw = TinyDB(self.path)
+        docs = [doc for doc in raw.all() if doc.get('hsh') and doc.get('last_updated')]
+        raw.close()
+        hshes = [doc['hsh'] for doc in docs]
+        self.assertEqual(len(hshes), len(set(hshes)))
+        index = dict((doc['hsh'], (doc['last_updated'], doc.doc_id)) for doc in docs)
+        self.assertEqual(db._index, index)
+        self.assertEqual(db._expiry, sorted((last_updated, hsh) for hsh, (last_updated, doc_id) in index.items()))
+        reopened = TinyDBStorage(self.path)
+        self.assertEqual(reopened._index, index)
+        self.assertEqual(reopened._expiry, db._expiry)
+        reopened.close()
+
+    def test_insert_update_and_expire(self):
+        db = TinyDBStorage(self.path)
+        db.insert(record(1, '2016-01-03', list_price=1.0))
+        db.insert_many([record(2, '2016-01-01'), record(3, '2016-01-02'), record(4, '2016-01-05')])
+        self.assertConsistent(db)
+        # Updating a listing moves it in the expiry list
+        db.insert(record(2, '2016-01-04', list_price=2.0))
+        db.insert_many([record(3, '2016-01-06'), record(3, '2016-01-07', list_price=3.0)])
+        self.assertConsistent(db)
+        self.assertEqual(db.get('hsh2')['list_price'], 2.0)
+        self.assertEqual(db.get('hsh3')['last_updated'], '2016-01-07')
+        self.assertIsNone(db.get('hsh1', since='2016-01-04'))
+        self.assertTrue(db.contains('hsh1', since='2016-01-03'))
+
+        # Oldest first, at most limit of them
+        self.assertEqual(db.remove_older_than('2016-01-06', limit=2), 2)
+        self.assertEqual(sorted(db._index), ['hsh3', 'hsh4'])
+        self.assertConsistent(db)
+        self.assertEqual(db.remove_older_than('2016-01-06'), 1)
+        self.assertEqual(db.remove_older_than('2016-01-06'), 0)
+        db.remove('hsh3')
+        db.remove('hsh3')
+        self.assertEqual(len(db.all()), 0)
+        self.assertConsistent(db)
+        db.close()
+
+    def test_duplicates_are_cleaned_up(self):
+        raw = TinyDB(self.path)
+        raw.insert_multiple([
+            record(1, '2016-01-02', list_price=2.0),
+            record(1, '2016-01-01', list_price=1.0),
+            record(2, '2016-01-01', list_price=1.0),
+            record(2, '2016-01-03', list_price=3.0),
+            record(2, '2016-01-02', list_price=2.0),
+            {'street_address': 'no hsh'}
+        ])
+        raw.close()
+        db = TinyDBStorage(self.path)
+        self.assertEqual(db.get('hsh1')['list_price'], 2.0)
+        self.assertEqual(db.get('hsh2')['list_price'], 3.0)
+        # Records without a hsh are left alone
+        self.assertEqual(len(db.all()), 3)
+        self.assertConsistent(db)
+        self.assertEqual(db.remove_older_than('2016-01-03'), 1)
+        self.assertEqual(db.get('hsh2')['list_price'], 3.0)
+        self.assertConsistent(db)
+        db.close()
+
+
+class MigrationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.tinydb_file = os.path.join(self.directory, 'listings.json')
+        self.sqlite_file = os.path.join(self.directory, 'listings.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_migrate_from_tinydb(self):
+        now = datetime.now()
+        fresh = now.isoformat()
+        older = (now - timedelta(hours=1)).isoformat()
+        expired = (now - timedelta(days=1)).isoformat()
+        records = []
+        for i, last_updated in ((1, fresh), (1, older), (2, expired), (3, older), (3, fresh)):
+            r = listing(i).as_dict()
+            r.update(hsh=listing(i).hsh, last_updated=last_updated, list_price=float(len(records)))
+            records.append(r)
+        raw = TinyDB(self.tinydb_file)
+        raw.insert_multiple(records + [{'street_address': 'no hsh'}])
+        raw.close()
+
+        self.assertEqual(ListCache.migrate_to_sqlite(db_file=self.tinydb_file, sqlite_file=self.sqlite_file), 3)
+        db = SQLiteStorage(self.sqlite_file)
+        cutoff = ListCache.cutoff()
+        # The newest record of each listing, wherever it was in the file
+        self.assertEqual(db.get(listing(1).hsh, since=cutoff)['list_price'], 0.0)
+        self.assertEqual(db.get(listing(3).hsh, since=cutoff)['list_price'], 4.0)
+        self.assertEqual(db.get(listing(1).hsh, since=fresh)['last_updated'], fresh)
+        # Expired records are copied, and are not returned once expired
+        self.assertIsNone(db.get(listing(2).hsh, since=cutoff))
+        self.assertEqual(db.get(listing(2).hsh)['last_updated'], expired)
+        self.assertEqual(db.remove_older_than(cutoff), 1)
+        db.close()
+
+        cache = ListCache(backend='sqlite', db_file=self.sqlite_file)
+        self.assertEqual(cache.lookup_listing(listing(3)).list_price, 4.0)
+        self.assertIsNone(cache.lookup_listing(listing(2)))
+        cache.close()
+
+
+class LRUStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.directory, 'listings.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def cache(self):
+        return ListCache(backend='sqlite', db_file=self.db_file, lru_size=10)
+
+    def test_counts(self):
+        cache = self.cache()
+        cache.insert_listing(listing(1))
+        cache.close()
+
+        cache = self.cache()
+        z_api = FakeZillAPI()
+        with EnrichmentSession(cache=cache, z_api=z_api) as session:
+            # On disk only: one miss, not a miss and a hit
+            session.get_zestimate(listing(1))
+            self.assertEqual((cache.stats['hits'], cache.stats['misses']), (0, 1))
+            # Now in memory
+            session.get_zestimate(listing(1))
+            self.assertEqual((cache.stats['hits'], cache.stats['misses']), (1, 1))
+            # Not cached: one miss, then fetched and inserted
+            session.get_zestimate(listing(2))
+            self.assertEqual((cache.stats['hits'], cache.stats['misses']), (1, 2))
+            session.get_zestimates([listing(2), listing(3), listing(1)], workers=2)
+            self.assertEqual((cache.stats['hits'], cache.stats['misses']), (3, 3))
+            self.assertEqual(z_api.calls, 2)
+
+    def test_contains_does_not_count(self):
+        cache = self.cache()
+        cache.insert_listing(listing(1))
+        self.assertTrue(cache.listing_in_cache(listing(1)))
+        self.assertFalse(cache.listing_in_cache(listing(2)))
+        self.assertEqual((cache.stats['hits'], cache.stats['misses']), (0, 0))
+        self.assertEqual(cache.retrieve_listing(listing(1)).hsh, listing(1).hsh)
+        self.assertEqual((cache.stats['hits'], cache.stats['misses']), (1, 0))
+        cache.close()
+
+    def test_expired_entries_miss(self):
+        clock = FakeClock()
+        self.addCleanup(setattr, storage, 'time', storage.time)
+        storage.time = clock
+        cache = ListCache(backend='sqlite', db_file=self.db_file, lru_size=10, lru_ttl=60)
+        cache.insert_listing(listing(1))
+        cache.retrieve_listing(listing(1))
+        self.assertEqual((cache.stats['hits'], cache.stats['misses']), (1, 0))
+        cache.flush()
+        clock.now += 61
+        # Reloaded from the database: a miss, not a hit
+        self.assertEqual(cache.retrieve_listing(listing(1)).hsh, listing(1).hsh)
+        self.assertEqual((cache.stats['hits'], cache.stats['misses'], cache.stats['evictions']), (1, 1, 1))
+        clock.now += 30
+        cache.retrieve_listing(listing(1))
+        self.assertEqual((cache.stats['hits'], cache.stats['misses']), (2, 1))
+        cache.close()
+
+    def test_pending_records_hit(self):
+        cache = ListCache(backend='sqlite', db_file=self.db_file, lru_size=1, flush_size=100)
+        cache.insert_listing(listing(1))
+        # Pushes listing 1 out of memory before it is written
+        cache.insert_listing(listing(2))
+        self.assertEqual(cache.stats['pending'], 2)
+        self.assertEqual(cache.retrieve_listing(listing(1)).hsh, listing(1).hsh)
+        self.assertEqual((cache.stats['hits'], cache.stats['misses']), (1, 0))
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()